@@ -1,6 +1,13 @@
 """
 Stress testing for Marcus MCP server
 Tests performance limits and degradation patterns
+
+Targets a shared Marcus started with the HTTP transport:
+
+    python marcus.py --http --port 8000
+    python benchmarks/mcp_stress_test.py --quick --url http://127.0.0.1:8000/mcp
+
+Every simulated agent opens its own MCP session to the same server.
 """
 import asyncio
 import time
@@ -8,9 +15,8 @@ import psutil
 import json
 from datetime import datetime
 from typing import Dict, List, Any
-import aiohttp
-from concurrent.futures import ProcessPoolExecutor
-import multiprocessing as mp
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
 import signal
 import sys
 
@@ -18,10 +24,8 @@ import sys
 class StressTestRunner:
     """Run stress tests on Marcus MCP server"""
     
-    def __init__(self, host: str = "localhost", port: int = 3333):
-        self.host = host
-        self.port = port
-        self.base_url = f"http://{host}:{port}"
+    def __init__(self, url: str = "http://127.0.0.1:8000/mcp"):
+        self.url = url
         self.results = {
             "stages": [],
             "system_metrics": [],
@@ -30,22 +34,13 @@ class StressTestRunner:
         self.monitoring = True
         self.start_time = None
     
-    async def send_mcp_request(self, session: aiohttp.ClientSession, method: str, params: Dict) -> Dict:
-        """Send a single MCP request"""
-        command = {
-            "jsonrpc": "2.0",
-            "id": str(time.time()),
-            "method": method,
-            "params": params
-        }
-        
+    async def send_mcp_request(self, session: ClientSession, tool: str, arguments: Dict) -> Dict:
+        """Call a single Marcus tool"""
         try:
-            async with session.post(
-                f"{self.base_url}/mcp",
-                json=command,
-                timeout=aiohttp.ClientTimeout(total=30)
-            ) as response:
-                return await response.json()
+            result = await asyncio.wait_for(session.call_tool(tool, arguments), timeout=30)
+            if result.isError:
+                return {"error": {"message": result.content[0].text if result.content else "Tool error"}}
+            return json.loads(result.content[0].text) if result.content else {}
         except asyncio.TimeoutError:
             return {"error": {"message": "Request timeout"}}
         except Exception as e:
@@ -53,67 +48,73 @@ class StressTestRunner:
     
     async def agent_workload(self, agent_id: str, duration: int, requests_per_second: int):
         """Simulate an agent sending requests at a specific rate"""
-        async with aiohttp.ClientSession() as session:
-            # Register agent
-            await self.send_mcp_request(
-                session,
-                "marcus.register_agent",
-                {
-                    "agent_id": agent_id,
-                    "capabilities": ["python", "testing"],
-                    "capacity": 10
-                }
-            )
-            
-            end_time = time.time() + duration
-            request_interval = 1.0 / requests_per_second if requests_per_second > 0 else 1.0
-            
-            request_count = 0
-            error_count = 0
-            total_latency = 0
-            
-            while time.time() < end_time and self.monitoring:
-                start = time.time()
+        async with streamablehttp_client(self.url) as (read_stream, write_stream, _):
+            async with ClientSession(read_stream, write_stream) as session:
+                await session.initialize()
                 
-                # Request task
-                result = await self.send_mcp_request(
+                # Register agent
+                await self.send_mcp_request(
                     session,
-                    "marcus.request_task",
-                    {"agent_id": agent_id}
+                    "register_agent",
+                    {
+                        "agent_id": agent_id,
+                        "name": agent_id,
+                        "role": "Developer",
+                        "skills": ["python", "testing"]
+                    }
                 )
                 
-                latency = time.time() - start
-                total_latency += latency
-                request_count += 1
+                end_time = time.time() + duration
+                request_interval = 1.0 / requests_per_second if requests_per_second > 0 else 1.0
                 
-                if "error" in result:
-                    error_count += 1
-                else:
-                    # If we got a task, complete it quickly
-                    task_id = result.get("result", {}).get("task_id")
-                    if task_id:
-                        await self.send_mcp_request(
-                            session,
-                            "marcus.complete_task",
-                            {
-                                "task_id": task_id,
-                                "agent_id": agent_id,
-                                "results": {"stress_test": True}
-                            }
-                        )
+                request_count = 0
+                error_count = 0
+                total_latency = 0
                 
-                # Maintain request rate
-                elapsed = time.time() - start
-                if elapsed < request_interval:
-                    await asyncio.sleep(request_interval - elapsed)
-            
-            return {
-                "agent_id": agent_id,
-                "requests": request_count,
-                "errors": error_count,
-                "error_rate": error_count / request_count if request_count > 0 else 0,
-                "avg_latency": total_latency / request_count if request_count > 0 else 0
-            }
+                while time.time() < end_time and self.monitoring:
+                    start = time.time()
+                    
+                    # Request task
+                    result = await self.send_mcp_request(
+                        session,
+                        "request_next_task",
+                        {"agent_id": agent_id}
+                    )
+                    
+                    latency = time.time() - start
+                    total_latency += latency
+                    request_count += 1
+                    
+                    if "error" in result:
+                        error_count += 1
+                    else:
+                        # If we got a task, complete it quickly
+                        task_id = (result.get("task") or {}).get("id")
+                        if task_id:
+                            await self.send_mcp_request(
+                                session,
+                                "report_task_progress",
+                                {
+                                    "agent_id": agent_id,
+                                    "task_id": task_id,
+                                    "status": "completed",
+                                    "progress": 100,
+                                    "message": "stress test"
+                                }
+                            )
+                    
+                    # Maintain request rate
+                    elapsed = time.time() - start
+                    if elapsed < request_interval:
+                        await asyncio.sleep(request_interval - elapsed)
+        
+        return {
+            "agent_id": agent_id,
+            "requests": request_count,
+            "errors": error_count,
+            "error_rate": error_count / request_count if request_count > 0 else 0,
+            "avg_latency": total_latency / request_count if request_count > 0 else 0
+        }
     
     async def monitor_system_resources(self):
         """Monitor system resources during test"""
@@ -234,8 +235,7 @@ class StressTestRunner:
         """Save stress test results"""
         self.results["metadata"] = {
             "timestamp": datetime.now().isoformat(),
-            "host": self.host,
-            "port": self.port,
+            "url": self.url,
             "test_duration": time.time() - self.start_time if self.start_time else 0
         }
         
@@ -270,9 +270,9 @@ class StressTestRunner:
                   f"with {best_stage['num_agents']} agents")
 
 
-async def quick_stress_test():
+async def quick_stress_test(url: str):
     """Run a quick stress test"""
-    tester = StressTestRunner()
+    tester = StressTestRunner(url)
     
     print("Running quick stress test (3 stages)...")
     tester.start_time = time.time()
@@ -306,13 +306,15 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Stress test Marcus MCP server")
     parser.add_argument("--quick", action="store_true", help="Run quick test")
     parser.add_argument("--full", action="store_true", help="Find breaking point")
+    parser.add_argument("--url", default="http://127.0.0.1:8000/mcp",
+                        help="Streamable HTTP endpoint of a Marcus started with --http")
     args = parser.parse_args()
     
     if args.quick:
-        asyncio.run(quick_stress_test())
+        asyncio.run(quick_stress_test(args.url))
     else:
         # Default to full test
-        tester = StressTestRunner()
+        tester = StressTestRunner(args.url)
         asyncio.run(tester.find_breaking_point())
         tester.print_summary()
         tester.save_results("stress_test_results.json")
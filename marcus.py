@@ -4,8 +4,14 @@ Marcus MCP Server - Entry Point
 
 This is the main entry point for the Marcus MCP server.
 It delegates to the modularized implementation in src/marcus_mcp/
+
+By default Marcus serves the process that launched it over stdio. Use
+``--http`` to serve one shared Marcus to many agents over the network:
+
+    python marcus.py --http --port 8000
 """
 
+import argparse
 import asyncio
 import sys
 import os
@@ -76,7 +82,20 @@ def load_config():
 
 from src.marcus_mcp import main
 
+def parse_args():
+    """Parse command line options for the MCP transport"""
+    parser = argparse.ArgumentParser(description="Marcus MCP server")
+    parser.add_argument(
+        "--http", action="store_const", const="http", dest="transport",
+        help="Serve agents over HTTP (Streamable HTTP at /mcp, SSE at /sse) instead of stdio"
+    )
+    parser.add_argument("--host", help="Interface to bind with --http (default: transport.host or 127.0.0.1)")
+    parser.add_argument("--port", type=int, help="Port to listen on with --http (default: advanced.port)")
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
+    args = parse_args()
     # Load configuration before starting
     load_config()
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main(transport=args.transport, host=args.host, port=args.port))
\ No newline at end of file
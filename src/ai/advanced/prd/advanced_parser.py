@@ -6,8 +6,9 @@ deep understanding, intelligent task breakdown, and risk assessment.
 """
 
 import logging
-from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass
+import time
+from typing import Dict, List, Any, Optional, Tuple, Awaitable
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import re
 import json
@@ -46,6 +47,7 @@ class TaskGenerationResult:
     resource_requirements: Dict[str, Any]
     success_criteria: List[str]
     generation_confidence: float
+    stage_timings: Dict[str, float] = field(default_factory=dict)  # stage -> seconds
 
 
 @dataclass
@@ -123,31 +125,55 @@ class AdvancedPRDParser:
             Complete task generation result with breakdown and analysis
         """
         logger.info("Starting advanced PRD parsing and task generation")
+        started = time.perf_counter()
+        timings: Dict[str, float] = {}
         
         # Step 1: Deep PRD analysis
-        prd_analysis = await self._analyze_prd_deeply(prd_content)
+        prd_analysis = await self._run_stage(
+            'analysis', timings, self._analyze_prd_deeply(prd_content)
+        )
         
         # Step 2: Generate task hierarchy
         logger.info(f"PRD analysis found {len(prd_analysis.functional_requirements)} functional requirements")
-        task_hierarchy = await self._generate_task_hierarchy(prd_analysis, constraints)
+        task_hierarchy = await self._run_stage(
+            'hierarchy', timings, self._generate_task_hierarchy(prd_analysis, constraints)
+        )
         
         # Step 3: Create detailed tasks
         logger.info(f"Creating detailed tasks from hierarchy with {len(task_hierarchy)} epics")
-        tasks = await self._create_detailed_tasks(task_hierarchy, prd_analysis, constraints)
+        tasks = await self._run_stage(
+            'tasks', timings, self._create_detailed_tasks(task_hierarchy, prd_analysis, constraints)
+        )
         logger.info(f"Created {len(tasks)} detailed tasks")
         
         # Step 4: AI-powered dependency inference
-        dependencies = await self._infer_smart_dependencies(tasks, prd_analysis)
+        dependencies = await self._run_stage(
+            'dependencies', timings, self._infer_smart_dependencies(tasks, prd_analysis)
+        )
         
         # Step 5: Risk assessment and timeline prediction
-        risk_assessment = await self._assess_implementation_risks(tasks, prd_analysis, constraints)
-        timeline_prediction = await self._predict_timeline(tasks, dependencies, constraints)
+        risk_assessment = await self._run_stage(
+            'risk', timings, self._assess_implementation_risks(tasks, prd_analysis, constraints)
+        )
+        timeline_prediction = await self._run_stage(
+            'timeline', timings, self._predict_timeline(tasks, dependencies, constraints)
+        )
         
         # Step 6: Resource requirement analysis
-        resource_requirements = await self._analyze_resource_requirements(tasks, prd_analysis, constraints)
+        resource_requirements = await self._run_stage(
+            'resources', timings, self._analyze_resource_requirements(tasks, prd_analysis, constraints)
+        )
         
         # Step 7: Generate success criteria
-        success_criteria = await self._generate_success_criteria(prd_analysis, tasks)
+        success_criteria = await self._run_stage(
+            'success_criteria', timings, self._generate_success_criteria(prd_analysis, tasks)
+        )
+        
+        timings['total'] = time.perf_counter() - started
+        logger.info(
+            "PRD parsing stage timings: "
+            + ", ".join(f"{stage}={seconds * 1000:.0f}ms" for stage, seconds in timings.items())
+        )
         
         return TaskGenerationResult(
             tasks=tasks,
@@ -157,9 +183,18 @@ class AdvancedPRDParser:
             estimated_timeline=timeline_prediction,
             resource_requirements=resource_requirements,
             success_criteria=success_criteria,
-            generation_confidence=self._calculate_generation_confidence(prd_analysis, tasks)
+            generation_confidence=self._calculate_generation_confidence(prd_analysis, tasks),
+            stage_timings=timings
         )
     
+    async def _run_stage(self, name: str, timings: Dict[str, float], stage: Awaitable[Any]) -> Any:
+        """Await a parsing stage and record how long it took"""
+        started = time.perf_counter()
+        try:
+            return await stage
+        finally:
+            timings[name] = time.perf_counter() - started
+    
     async def _analyze_prd_deeply(self, prd_content: str) -> PRDAnalysis:
         """Perform deep analysis of PRD using AI"""
         analysis_prompt = f"""
@@ -476,11 +511,11 @@ class AdvancedPRDParser:
             labels=enhanced_details.get('labels', [])
         )
         
-        # Add acceptance criteria as a dynamic attribute
+        # Add acceptance criteria if any were generated
         if enhanced_details.get('acceptance_criteria'):
             task.acceptance_criteria = enhanced_details['acceptance_criteria']
         
-        # Add subtasks as a dynamic attribute
+        # Add subtasks if any were generated
         if enhanced_details.get('subtasks'):
             task.subtasks = enhanced_details['subtasks']
         
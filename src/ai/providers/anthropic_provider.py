@@ -13,6 +13,7 @@ from typing import Dict, List, Any, Optional
 import httpx
 
 from src.core.models import Task, Priority
+from src.core.resilience import ResilientEndpoint
 from .base_provider import BaseLLMProvider, SemanticAnalysis, SemanticDependency, EffortEstimate
 from src.utils.json_parser import parse_ai_json_response
 
@@ -50,6 +51,11 @@ class AnthropicProvider(BaseLLMProvider):
             timeout=self.timeout
         )
         
+        # Fails fast while the API keeps failing, so LLMAbstraction moves on
+        # to the next provider at once; transient errors are retried within
+        # a retry budget
+        self.resilience = ResilientEndpoint("anthropic-api")
+        
         logger.info(f"Anthropic provider initialized with model: {self.model}")
     
     async def analyze_task(self, task: Task, context: Dict[str, Any]) -> SemanticAnalysis:
@@ -72,7 +78,7 @@ class AnthropicProvider(BaseLLMProvider):
         except Exception as e:
             logger.error(f"Anthropic task analysis failed: {e}")
             # Return safe fallback
-            return SemanticAnalysis(
+            return self._degraded(SemanticAnalysis(
                 task_intent="unknown",
                 semantic_dependencies=[],
                 risk_factors=["ai_analysis_failed"],
@@ -80,7 +86,7 @@ class AnthropicProvider(BaseLLMProvider):
                 confidence=0.1,
                 reasoning=f"AI analysis failed: {str(e)}",
                 risk_assessment={'availability': 'degraded'}
-            )
+            ))
     
     async def infer_dependencies(self, tasks: List[Task]) -> List[SemanticDependency]:
         """
@@ -103,7 +109,7 @@ class AnthropicProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"Anthropic dependency inference failed: {e}")
-            return []
+            return self._degraded([])
     
     async def generate_enhanced_description(self, task: Task, context: Dict[str, Any]) -> str:
         """
@@ -124,7 +130,7 @@ class AnthropicProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"Anthropic description enhancement failed: {e}")
-            return task.description or task.name
+            return self._degraded(task.description or task.name)
     
     async def estimate_effort(self, task: Task, context: Dict[str, Any]) -> EffortEstimate:
         """
@@ -145,13 +151,13 @@ class AnthropicProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"Anthropic effort estimation failed: {e}")
-            return EffortEstimate(
+            return self._degraded(EffortEstimate(
                 estimated_hours=8.0,  # Safe default
                 confidence=0.1,
                 factors=["ai_estimation_failed"],
                 similar_tasks=[],
                 risk_multiplier=1.5
-            )
+            ))
     
     async def analyze_blocker(self, task: Task, blocker: str, context: Dict[str, Any]) -> List[str]:
         """
@@ -173,11 +179,11 @@ class AnthropicProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"Anthropic blocker analysis failed: {e}")
-            return [
+            return self._degraded([
                 "Review task requirements and dependencies",
                 "Check documentation for similar issues",
                 "Consult with team lead or senior developer"
-            ]
+            ])
     
     def _build_task_analysis_prompt(self, task: Task, context: Dict[str, Any]) -> str:
         """Build prompt for task semantic analysis"""
@@ -363,6 +369,12 @@ Respond only with valid JSON array."""
         self.max_tokens = max_tokens
         return await self._call_claude(prompt)
     
+    async def _post(self, url: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST to the Claude API, raising on error statuses so the endpoint sees them"""
+        response = await self.client.post(url, json=payload)
+        response.raise_for_status()
+        return response
+    
     async def _call_claude(self, prompt: str) -> str:
         """
         Make API call to Claude
@@ -385,12 +397,7 @@ Respond only with valid JSON array."""
         }
         
         try:
-            response = await self.client.post(
-                f"{self.base_url}/messages",
-                json=payload
-            )
-            response.raise_for_status()
-            
+            response = await self.resilience.call(self._post, f"{self.base_url}/messages", payload)
             data = response.json()
             return data['content'][0]['text']
             
@@ -416,7 +423,7 @@ Respond only with valid JSON array."""
             )
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to parse Claude task analysis: {e}")
-            return SemanticAnalysis(
+            return self._degraded(SemanticAnalysis(
                 task_intent="parse_error",
                 semantic_dependencies=[],
                 risk_factors=["response_parsing_failed"],
@@ -424,7 +431,7 @@ Respond only with valid JSON array."""
                 confidence=0.1,
                 reasoning="Failed to parse AI response",
                 risk_assessment={}
-            )
+            ))
     
     def _parse_dependency_response(self, response: str, tasks: List[Task]) -> List[SemanticDependency]:
         """Parse Claude's dependency inference response"""
@@ -450,7 +457,7 @@ Respond only with valid JSON array."""
             
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to parse Claude dependency response: {e}")
-            return []
+            return self._degraded([])
     
     def _parse_enhancement_response(self, response: str, task: Task) -> str:
         """Parse Claude's description enhancement response"""
@@ -459,7 +466,7 @@ Respond only with valid JSON array."""
         
         # Ensure we have some content
         if len(enhanced) < 10:
-            return task.description or task.name
+            return self._degraded(task.description or task.name)
         
         return enhanced
     
@@ -476,13 +483,13 @@ Respond only with valid JSON array."""
             )
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to parse Claude estimation response: {e}")
-            return EffortEstimate(
+            return self._degraded(EffortEstimate(
                 estimated_hours=8.0,
                 confidence=0.1,
                 factors=["parsing_failed"],
                 similar_tasks=[],
                 risk_multiplier=1.5
-            )
+            ))
     
     def _parse_blocker_response(self, response: str) -> List[str]:
         """Parse Claude's blocker analysis response"""
@@ -500,7 +507,9 @@ Respond only with valid JSON array."""
             for line in lines:
                 if line.strip() and not line.startswith('#'):
                     suggestions.append(line.strip('- ').strip())
-            return suggestions[:5] if suggestions else ["Review and retry the task"]
+            if not suggestions:
+                return self._degraded(["Review and retry the task"])
+            return suggestions[:5]
     
     def _classify_task_type(self, task: Task) -> str:
         """Classify task type for historical comparison"""
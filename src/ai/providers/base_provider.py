@@ -6,11 +6,34 @@ Separated to avoid circular imports.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Dict, List, Tuple, TypeVar
 from dataclasses import dataclass
 
 from src.core.models import Task
 
+T = TypeVar('T')
+
+# Set when the provider call running in this context answered with a
+# placeholder (API failure, open circuit, unparseable response) instead of
+# the model's answer; such results are returned but never cached
+_degraded_call: ContextVar[bool] = ContextVar('llm_degraded_call', default=False)
+
+
+async def call_provider(method: Callable[..., Awaitable[Any]], **kwargs) -> Tuple[Any, bool]:
+    """
+    Await a provider method and report whether its result is a placeholder
+    
+    Returns:
+        The method's result and True if the provider marked it degraded
+    """
+    token = _degraded_call.set(False)
+    try:
+        result = await method(**kwargs)
+        return result, _degraded_call.get()
+    finally:
+        _degraded_call.reset(token)
+
 
 @dataclass
 class SemanticAnalysis:
@@ -48,6 +71,12 @@ class EffortEstimate:
 class BaseLLMProvider(ABC):
     """Base class for LLM providers"""
     
+    @staticmethod
+    def _degraded(result: T) -> T:
+        """Mark the current call as answered by a placeholder and return it"""
+        _degraded_call.set(True)
+        return result
+    
     @abstractmethod
     async def analyze_task(self, task: Task, context: Dict[str, Any]) -> SemanticAnalysis:
         """Analyze task semantics"""
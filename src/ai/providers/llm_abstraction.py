@@ -13,7 +13,10 @@ from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
 from src.core.models import Task, Priority
-from .base_provider import BaseLLMProvider, SemanticAnalysis, SemanticDependency, EffortEstimate
+from src.utils.llm_cache import LLMResponseCache, make_cache_key
+from .base_provider import (
+    BaseLLMProvider, SemanticAnalysis, SemanticDependency, EffortEstimate, call_provider
+)
 
 logger = logging.getLogger(__name__)
 
@@ -37,10 +40,13 @@ class LLMAbstraction:
         
         # Performance tracking
         self.provider_stats = {
-            provider: {'requests': 0, 'failures': 0, 'avg_response_time': 0.0}
+            provider: {'requests': 0, 'failures': 0, 'circuit_open_skips': 0, 'avg_response_time': 0.0}
             for provider in self.fallback_providers
         }
         
+        # Responses to identical requests are served from the cache
+        self.response_cache = LLMResponseCache.from_config()
+        
         logger.info(f"LLM abstraction initialized with primary provider: {self.current_provider}")
     
     def _initialize_providers(self):
@@ -173,6 +179,10 @@ class LLMAbstraction:
         """
         Execute method with automatic provider fallback
         
+        Results are cached by the primary provider's model, the method and
+        its normalized arguments; a cached result skips the providers.
+        Placeholders a provider returns after a failure are not cached.
+        
         Args:
             method_name: Name of method to execute
             **kwargs: Arguments for the method
@@ -186,6 +196,14 @@ class LLMAbstraction:
         # Ensure providers are initialized
         self._initialize_providers()
         
+        primary = self.providers.get(self.current_provider)
+        model = getattr(primary, 'model', None) or self.current_provider
+        cache_key = make_cache_key(model, method_name, kwargs)
+        cached = await self.response_cache.aget(cache_key, method_name)
+        if cached is not None:
+            logger.debug(f"Served {method_name} from response cache")
+            return cached
+        
         providers_to_try = [self.current_provider] + [
             p for p in self.fallback_providers if p != self.current_provider
         ]
@@ -198,6 +216,15 @@ class LLMAbstraction:
             
             provider = self.providers[provider_name]
             
+            # A provider whose circuit is open would only fail fast; go
+            # straight to the next one
+            resilience = getattr(provider, 'resilience', None)
+            if resilience is not None and not resilience.is_available:
+                logger.debug(f"Skipping {provider_name} for {method_name}: circuit open")
+                self.provider_stats[provider_name]['circuit_open_skips'] += 1
+                last_exception = last_exception or Exception(f"{provider_name} circuit open")
+                continue
+            
             try:
                 logger.debug(f"Trying {method_name} with provider: {provider_name}")
                 
@@ -206,13 +233,20 @@ class LLMAbstraction:
                 
                 # Execute method
                 method = getattr(provider, method_name)
-                result = await method(**kwargs)
+                result, degraded = await call_provider(method, **kwargs)
                 
                 # Mark fallback usage if not primary
                 if hasattr(result, 'fallback_used'):
                     result.fallback_used = provider_name != self.current_provider
                 
+                if degraded:
+                    # The provider answered with its failure placeholder;
+                    # serve it, but let the next request reach the model
+                    logger.debug(f"{provider_name} returned a placeholder for {method_name}")
+                    return result
+                
                 logger.debug(f"Successfully executed {method_name} with {provider_name}")
+                await self.response_cache.aset(cache_key, method_name, result)
                 return result
                 
             except Exception as e:
@@ -270,7 +304,13 @@ class LLMAbstraction:
         return {
             'current_provider': self.current_provider,
             'available_providers': list(self.providers.keys()),
-            'stats': self.provider_stats.copy()
+            'stats': self.provider_stats.copy(),
+            'cache': self.response_cache.get_stats(),
+            'resilience': {
+                name: provider.resilience.get_stats()
+                for name, provider in self.providers.items()
+                if getattr(provider, 'resilience', None) is not None
+            }
         }
     
     def get_best_provider(self) -> str:
@@ -12,6 +12,7 @@ from typing import Dict, List, Any
 import httpx
 
 from src.core.models import Task
+from src.core.resilience import ResilientEndpoint
 from .base_provider import BaseLLMProvider, SemanticAnalysis, SemanticDependency, EffortEstimate
 
 logger = logging.getLogger(__name__)
@@ -44,6 +45,11 @@ class OpenAIProvider(BaseLLMProvider):
             timeout=self.timeout
         )
         
+        # Fails fast while the API keeps failing, so LLMAbstraction moves on
+        # to the next provider at once; transient errors are retried within
+        # a retry budget
+        self.resilience = ResilientEndpoint("openai-api")
+        
         logger.info(f"OpenAI provider initialized with model: {self.model}")
     
     async def analyze_task(self, task: Task, context: Dict[str, Any]) -> SemanticAnalysis:
@@ -65,7 +71,7 @@ class OpenAIProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"OpenAI task analysis failed: {e}")
-            return SemanticAnalysis(
+            return self._degraded(SemanticAnalysis(
                 task_intent="unknown",
                 semantic_dependencies=[],
                 risk_factors=["ai_analysis_failed"],
@@ -73,7 +79,7 @@ class OpenAIProvider(BaseLLMProvider):
                 confidence=0.1,
                 reasoning=f"OpenAI analysis failed: {str(e)}",
                 risk_assessment={'availability': 'degraded'}
-            )
+            ))
     
     async def infer_dependencies(self, tasks: List[Task]) -> List[SemanticDependency]:
         """Infer semantic dependencies using GPT"""
@@ -97,7 +103,7 @@ class OpenAIProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"OpenAI dependency inference failed: {e}")
-            return []
+            return self._degraded([])
     
     async def generate_enhanced_description(self, task: Task, context: Dict[str, Any]) -> str:
         """Generate enhanced description using GPT"""
@@ -118,7 +124,7 @@ class OpenAIProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"OpenAI description enhancement failed: {e}")
-            return task.description or task.name
+            return self._degraded(task.description or task.name)
     
     async def estimate_effort(self, task: Task, context: Dict[str, Any]) -> EffortEstimate:
         """Estimate effort using GPT"""
@@ -139,13 +145,13 @@ class OpenAIProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"OpenAI effort estimation failed: {e}")
-            return EffortEstimate(
+            return self._degraded(EffortEstimate(
                 estimated_hours=8.0,
                 confidence=0.1,
                 factors=["ai_estimation_failed"],
                 similar_tasks=[],
                 risk_multiplier=1.5
-            )
+            ))
     
     async def analyze_blocker(self, task: Task, blocker: str, context: Dict[str, Any]) -> List[str]:
         """Analyze blocker using GPT"""
@@ -166,11 +172,11 @@ class OpenAIProvider(BaseLLMProvider):
             
         except Exception as e:
             logger.error(f"OpenAI blocker analysis failed: {e}")
-            return [
+            return self._degraded([
                 "Check task requirements and prerequisites",
                 "Review relevant documentation",
                 "Seek assistance from team members"
-            ]
+            ])
     
     def _build_task_analysis_prompt(self, task: Task, context: Dict[str, Any]) -> str:
         """Build task analysis prompt for GPT"""
@@ -270,6 +276,12 @@ Severity: {context.get('severity', 'unknown')}
 Provide JSON array of 3-5 specific solutions:
 ["solution1", "solution2", "solution3"]"""
     
+    async def _post(self, url: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST to the OpenAI API, raising on error statuses so the endpoint sees them"""
+        response = await self.client.post(url, json=payload)
+        response.raise_for_status()
+        return response
+    
     async def _call_openai(self, messages: List[Dict[str, str]]) -> str:
         """Make API call to OpenAI"""
         payload = {
@@ -280,12 +292,7 @@ Provide JSON array of 3-5 specific solutions:
         }
         
         try:
-            response = await self.client.post(
-                f"{self.base_url}/chat/completions",
-                json=payload
-            )
-            response.raise_for_status()
-            
+            response = await self.resilience.call(self._post, f"{self.base_url}/chat/completions", payload)
             data = response.json()
             return data['choices'][0]['message']['content']
             
@@ -311,7 +318,7 @@ Provide JSON array of 3-5 specific solutions:
             )
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning(f"Failed to parse OpenAI response: {e}")
-            return SemanticAnalysis(
+            return self._degraded(SemanticAnalysis(
                 task_intent="parse_error",
                 semantic_dependencies=[],
                 risk_factors=["response_parsing_failed"],
@@ -319,7 +326,7 @@ Provide JSON array of 3-5 specific solutions:
                 confidence=0.1,
                 reasoning="Failed to parse AI response",
                 risk_assessment={}
-            )
+            ))
     
     def _parse_dependency_response(self, response: str, tasks: List[Task]) -> List[SemanticDependency]:
         """Parse dependency inference response"""
@@ -341,7 +348,7 @@ Provide JSON array of 3-5 specific solutions:
             
             return dependencies
         except (json.JSONDecodeError, KeyError, ValueError):
-            return []
+            return self._degraded([])
     
     def _parse_estimation_response(self, response: str) -> EffortEstimate:
         """Parse effort estimation response"""
@@ -355,13 +362,13 @@ Provide JSON array of 3-5 specific solutions:
                 risk_multiplier=float(data.get('risk_multiplier', 1.0))
             )
         except (json.JSONDecodeError, KeyError, ValueError):
-            return EffortEstimate(
+            return self._degraded(EffortEstimate(
                 estimated_hours=8.0,
                 confidence=0.1,
                 factors=["parsing_failed"],
                 similar_tasks=[],
                 risk_multiplier=1.5
-            )
+            ))
     
     def _parse_blocker_response(self, response: str) -> List[str]:
         """Parse blocker analysis response"""
@@ -378,7 +385,9 @@ Provide JSON array of 3-5 specific solutions:
             for line in lines:
                 if line.strip() and not line.startswith('#'):
                     suggestions.append(line.strip('- ').strip())
-            return suggestions[:5] if suggestions else ["Review task requirements"]
+            if not suggestions:
+                return self._degraded(["Review task requirements"])
+            return suggestions[:5]
     
     async def complete(self, prompt: str, max_tokens: int = 2000) -> str:
         """
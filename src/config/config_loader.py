@@ -95,6 +95,10 @@ class ConfigLoader:
             # Advanced
             'MARCUS_DEBUG': 'advanced.debug',
             'MARCUS_PORT': 'advanced.port',
+            
+            # MCP transport
+            'MARCUS_TRANSPORT': 'transport.type',
+            'MARCUS_HOST': 'transport.host',
         }
         
         for env_var, config_path in env_mappings.items():
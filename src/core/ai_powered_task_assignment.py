@@ -5,17 +5,65 @@ This module upgrades the basic task assignment logic to use
 Phase 1-4 AI capabilities for intelligent task selection.
 """
 
+import asyncio
+import dataclasses
+import inspect
+import json
 import logging
-from typing import Optional, List, Dict, Any, Set
+import math
+from typing import Optional, List, Dict, Any, Set, Callable, Awaitable
 from datetime import datetime
 
 from src.core.models import Task, TaskStatus, Priority
 from src.ai.core.ai_engine import MarcusAIEngine
 from src.ai.types import AnalysisContext, AssignmentContext
-from src.intelligence.dependency_inferer import DependencyInferer
+from src.intelligence.dependency_graph_cache import DependencyGraphCache
+from src.utils.json_parser import parse_ai_json_response
 
 logger = logging.getLogger(__name__)
 
+# Rough characters-per-token ratio used to budget batched scoring prompts
+CHARS_PER_TOKEN = 4
+
+BATCH_SCORING_PROMPT = """You are an AI Project Manager scoring candidate tasks for one agent.
+
+Agent: {agent}
+Project: {project}
+
+Candidate tasks:
+{tasks}
+
+For EVERY candidate task, estimate:
+- suitability_score: 0.0-1.0, how well the task fits this agent now
+- confidence: 0.0-1.0, confidence in the suitability score
+- timeline_reduction_days: days completing the task would save the project
+- risk_reduction: 0.0-1.0, how much project risk completing the task removes
+
+Return JSON only:
+{{
+    "scores": [
+        {{
+            "task_id": "id",
+            "suitability_score": 0.0,
+            "confidence": 0.0,
+            "timeline_reduction_days": 0,
+            "risk_reduction": 0.0
+        }}
+    ]
+}}"""
+
+# Numeric fields of a batched score entry and the range each is clamped to
+BATCH_SCORE_BOUNDS = {
+    "suitability_score": (0.0, 1.0),
+    "confidence": (0.0, 1.0),
+    "timeline_reduction_days": (0.0, float("inf")),
+    "risk_reduction": (0.0, 1.0),
+}
+
+# Dependency graph cache shared by every assignment request; engines are
+# created per request, but the board rarely changes between requests
+_shared_dependency_cache = DependencyGraphCache()
+
 
 class AITaskAssignmentEngine:
     """
@@ -28,10 +76,35 @@ class AITaskAssignmentEngine:
     - Phase 4: Predictive impact analysis
     """
     
-    def __init__(self, ai_engine: MarcusAIEngine, project_tasks: List[Task]):
+    def __init__(
+        self,
+        ai_engine: MarcusAIEngine,
+        project_tasks: List[Task],
+        batch_scoring: bool = True,
+        max_prompt_tokens: int = 6000,
+        max_concurrency: int = 5,
+        dependency_cache: Optional[DependencyGraphCache] = None
+    ):
+        """
+        Args:
+            ai_engine: Engine used for safety checks and task scoring
+            project_tasks: Every task in the project
+            batch_scoring: Score all candidates in a few structured prompts
+                instead of one LLM call per task and phase
+            max_prompt_tokens: Approximate token budget for the task list of
+                a single batched prompt; larger candidate sets are split
+            max_concurrency: Maximum LLM calls in flight at once, for both
+                batched chunks and per-task fallback calls
+            dependency_cache: Dependency graph cache; defaults to the cache
+                shared by all assignment engines
+        """
         self.ai_engine = ai_engine
         self.project_tasks = project_tasks
-        self.dependency_inferer = DependencyInferer()
+        self.dependency_cache = dependency_cache or _shared_dependency_cache
+        self.dependency_inferer = self.dependency_cache.inferer
+        self.batch_scoring = batch_scoring
+        self.max_prompt_tokens = max_prompt_tokens
+        self.max_concurrency = max(1, max_concurrency)
         
     async def find_optimal_task_for_agent(
         self,
@@ -45,8 +118,31 @@ class AITaskAssignmentEngine:
         
         This replaces the basic skill/priority matching with intelligent analysis.
         """
-        if not available_tasks:
+        ranked_tasks = await self.rank_tasks_for_agent(
+            agent_id, agent_info, available_tasks, assigned_task_ids
+        )
+        if not ranked_tasks:
             return None
+        
+        best_task = ranked_tasks[0]
+        logger.info(f"Selected task '{best_task.name}' for agent {agent_id}")
+        return best_task
+    
+    async def rank_tasks_for_agent(
+        self,
+        agent_id: str,
+        agent_info: Dict[str, Any],
+        available_tasks: List[Task],
+        assigned_task_ids: Set[str]
+    ) -> List[Task]:
+        """
+        Rank the safe candidate tasks for an agent, best first
+        
+        Callers that reserve tasks optimistically fall back to the next
+        candidate when another agent claimed the first one meanwhile.
+        """
+        if not available_tasks:
+            return []
             
         logger.info(f"Finding optimal task for agent {agent_id} from {len(available_tasks)} tasks")
         
@@ -55,28 +151,28 @@ class AITaskAssignmentEngine:
         logger.info(f"After safety filtering: {len(safe_tasks)} tasks remain")
         
         if not safe_tasks:
-            return None
+            return []
         
         # Step 2: Dependency analysis (Phase 2)
         dependency_scores = await self._analyze_dependencies(safe_tasks)
         
+        # Steps 3 and 4 share one batched scoring pass when the engine allows it
+        batch_analyses = await self._get_batched_analyses(safe_tasks, agent_info)
+        
         # Step 3: AI-powered analysis (Phase 3)
-        ai_scores = await self._get_ai_recommendations(safe_tasks, agent_info)
+        ai_scores = await self._get_ai_recommendations(safe_tasks, agent_info, batch_analyses)
         
         # Step 4: Predictive impact (Phase 4)
-        impact_scores = await self._predict_task_impact(safe_tasks)
+        impact_scores = await self._predict_task_impact(safe_tasks, batch_analyses)
         
         # Step 5: Combine scores intelligently
-        best_task = await self._select_best_task(
+        return await self._rank_tasks(
             safe_tasks,
             dependency_scores,
             ai_scores,
             impact_scores,
             agent_info
         )
-        
-        logger.info(f"Selected task '{best_task.name}' for agent {agent_id}")
-        return best_task
     
     async def _filter_safe_tasks(self, tasks: List[Task]) -> List[Task]:
         """
@@ -108,19 +204,15 @@ class AITaskAssignmentEngine:
         """
         dependency_scores = {}
         
-        # Build dependency graph
-        dependency_graph = await self.dependency_inferer.infer_dependencies(self.project_tasks)
+        # Reuse the cached graph unless the board changed since the last request
+        await self.dependency_cache.sync(self.project_tasks, self.dependency_inferer)
         
         for task in tasks:
             # Count how many tasks this would unblock
-            unblocked_count = 0
-            for other_task in self.project_tasks:
-                if task.id in other_task.dependencies and other_task.status == TaskStatus.TODO:
-                    unblocked_count += 1
+            unblocked_count = self.dependency_cache.unblocked_count(task.id)
             
             # Check if task is on critical path
-            critical_path = dependency_graph.get_critical_path()
-            is_critical = task.id in critical_path
+            is_critical = self.dependency_cache.is_critical(task.id)
             
             # Calculate dependency score
             score = unblocked_count * 0.5
@@ -135,12 +227,16 @@ class AITaskAssignmentEngine:
     async def _get_ai_recommendations(
         self, 
         tasks: List[Task], 
-        agent_info: Dict[str, Any]
+        agent_info: Dict[str, Any],
+        batch_analyses: Optional[Dict[str, Dict[str, Any]]] = None
     ) -> Dict[str, float]:
         """
         Phase 3: Get AI-powered recommendations for agent-task matching
+        
+        Tasks already scored by the batched pass are not sent again; the rest
+        are analyzed one call per task with bounded concurrency.
         """
-        ai_scores = {}
+        batch_analyses = batch_analyses or {}
         
         # Prepare context for AI analysis
         context = AssignmentContext(
@@ -148,58 +244,257 @@ class AITaskAssignmentEngine:
             agent_id=agent_info["worker_id"],
             agent_status=agent_info,
             available_tasks=tasks,
-            project_context={
-                "total_tasks": len(self.project_tasks),
-                "completed_tasks": len([t for t in self.project_tasks if t.status == TaskStatus.DONE]),
-                "project_phase": self._detect_project_phase()
-            },
+            project_context=self._build_project_context(),
             team_status={}  # Could include other agents' status
         )
         
-        # Get AI recommendations for each task
+        remaining = [task for task in tasks if task.id not in batch_analyses]
+        
+        # Use hybrid AI decision framework for tasks the batch did not cover
+        analyses = await self._gather_bounded(
+            remaining,
+            lambda task: self.ai_engine.analyze_task_assignment(
+                dataclasses.replace(context, task=task)
+            )
+        )
+        analyses.update({task.id: batch_analyses[task.id] for task in tasks if task.id in batch_analyses})
+        
+        ai_scores = {}
         for task in tasks:
-            context.task = task
-            
-            # Use hybrid AI decision framework
-            ai_analysis = await self.ai_engine.analyze_task_assignment(context)
-            
-            # Extract score from AI analysis
-            score = ai_analysis.get("suitability_score", 0.5)
-            score *= ai_analysis.get("confidence", 1.0)
-            
+            ai_analysis = analyses[task.id]
+            score = self._suitability_score(ai_analysis)
             ai_scores[task.id] = score
             logger.debug(f"AI score for {task.name}: {score} (confidence: {ai_analysis.get('confidence')})")
         
         return ai_scores
     
-    async def _predict_task_impact(self, tasks: List[Task]) -> Dict[str, float]:
+    async def _predict_task_impact(
+        self,
+        tasks: List[Task],
+        batch_analyses: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> Dict[str, float]:
         """
         Phase 4: Predict the impact of completing each task
         """
-        impact_scores = {}
+        batch_analyses = batch_analyses or {}
+        velocity_context = {
+            "current_velocity": self._calculate_velocity(),
+            "team_size": 3  # Could be dynamic
+        }
         
-        for task in tasks:
-            # Predict how completing this task affects project timeline
-            impact_analysis = await self.ai_engine.predict_task_impact(
+        remaining = [task for task in tasks if task.id not in batch_analyses]
+        
+        # Predict how completing each remaining task affects project timeline
+        analyses = await self._gather_bounded(
+            remaining,
+            lambda task: self.ai_engine.predict_task_impact(
                 task,
                 self.project_tasks,
-                {
-                    "current_velocity": self._calculate_velocity(),
-                    "team_size": 3  # Could be dynamic
-                }
+                velocity_context
             )
-            
-            # Score based on timeline reduction and risk mitigation
-            timeline_impact = impact_analysis.get("timeline_reduction_days", 0) / 10  # Normalize
-            risk_reduction = impact_analysis.get("risk_reduction", 0)
-            
-            score = (timeline_impact * 0.6) + (risk_reduction * 0.4)
-            impact_scores[task.id] = min(score, 1.0)  # Cap at 1.0
-            
-            logger.debug(f"Impact score for {task.name}: {score} (timeline: {timeline_impact}, risk: {risk_reduction})")
+        )
+        analyses.update({task.id: batch_analyses[task.id] for task in tasks if task.id in batch_analyses})
+        
+        impact_scores = {}
+        for task in tasks:
+            score = self._impact_score(analyses[task.id])
+            impact_scores[task.id] = score
+            logger.debug(f"Impact score for {task.name}: {score}")
         
         return impact_scores
     
+    async def _get_batched_analyses(
+        self,
+        tasks: List[Task],
+        agent_info: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Score every candidate task in a few token-budgeted structured prompts
+        
+        Each prompt returns suitability, confidence and impact estimates for
+        all of its tasks, replacing two LLM calls per task. Chunks run
+        concurrently. Returns an empty dict when batching is disabled, the
+        engine cannot take raw prompts or the batch fails; callers then fall
+        back to per-task analysis for anything missing.
+        """
+        if not self.batch_scoring or not tasks:
+            return {}
+        
+        send_prompt = self._get_prompt_sender()
+        if send_prompt is None:
+            return {}
+        
+        agent_data = {
+            "id": agent_info.get("worker_id"),
+            "name": agent_info.get("name"),
+            "role": agent_info.get("role"),
+            "skills": agent_info.get("skills", []),
+            "capacity": agent_info.get("capacity"),
+        }
+        project_data = self._build_project_context()
+        project_data["current_velocity"] = self._calculate_velocity()
+        
+        chunks = self._chunk_for_prompt(tasks)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def score_chunk(chunk: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+            prompt = BATCH_SCORING_PROMPT.format(
+                agent=json.dumps(agent_data, default=str),
+                project=json.dumps(project_data, default=str),
+                tasks=json.dumps(chunk, indent=1, default=str)
+            )
+            async with semaphore:
+                response = await send_prompt(prompt)
+            return self._parse_batch_scores(response, {item["id"] for item in chunk})
+        
+        try:
+            results = await asyncio.gather(*(score_chunk(chunk) for chunk in chunks))
+        except Exception as e:
+            logger.warning(f"Batched task scoring failed, falling back to per-task analysis: {e}")
+            return {}
+        
+        analyses: Dict[str, Dict[str, Any]] = {}
+        for result in results:
+            analyses.update(result)
+        
+        logger.info(
+            f"Batched scoring covered {len(analyses)}/{len(tasks)} tasks "
+            f"in {len(chunks)} prompt(s)"
+        )
+        return analyses
+    
+    def _get_prompt_sender(self) -> Optional[Callable[[str], Awaitable[str]]]:
+        """
+        Find a coroutine on the AI engine that sends a raw prompt
+        
+        Returns None when AI is disabled (``MARCUS_AI_ENABLED=false``) so
+        scoring goes through the engine's non-LLM analysis methods.
+        """
+        if not getattr(self.ai_engine, "ai_enabled", True):
+            return None
+        
+        call_claude = getattr(self.ai_engine, "_call_claude", None)
+        if inspect.iscoroutinefunction(call_claude):
+            return call_claude
+        
+        llm_client = getattr(self.ai_engine, "llm_client", None)
+        analyze = getattr(llm_client, "analyze", None)
+        if inspect.iscoroutinefunction(analyze):
+            return lambda prompt: analyze(prompt, None)
+        
+        return None
+    
+    def _chunk_for_prompt(self, tasks: List[Task]) -> List[List[Dict[str, Any]]]:
+        """Split task summaries into chunks that fit the prompt token budget"""
+        chunks: List[List[Dict[str, Any]]] = []
+        current: List[Dict[str, Any]] = []
+        current_tokens = 0
+        
+        for task in tasks:
+            summary = {
+                "id": task.id,
+                "name": task.name,
+                "description": (task.description or "")[:300],
+                "priority": task.priority.value if hasattr(task.priority, "value") else str(task.priority),
+                "estimated_hours": task.estimated_hours,
+                "labels": task.labels or [],
+                "dependencies": task.dependencies or [],
+            }
+            tokens = len(json.dumps(summary, default=str)) // CHARS_PER_TOKEN + 1
+            if current and current_tokens + tokens > self.max_prompt_tokens:
+                chunks.append(current)
+                current, current_tokens = [], 0
+            current.append(summary)
+            current_tokens += tokens
+        
+        if current:
+            chunks.append(current)
+        return chunks
+    
+    def _parse_batch_scores(self, response: str, task_ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+        """Extract per-task analyses for the requested task ids from a batched response"""
+        parsed = parse_ai_json_response(response)
+        entries = parsed.get("scores", []) if isinstance(parsed, dict) else parsed
+        if not isinstance(entries, list):
+            raise ValueError("Batched scoring response has no score list")
+        
+        analyses = {}
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            task_id = str(entry.get("task_id", ""))
+            if task_id not in task_ids:
+                continue
+            analysis = self._validate_batch_entry(entry)
+            if analysis is None:
+                logger.debug(f"Dropping malformed batched score for {task_id}: {entry}")
+                continue
+            analyses[task_id] = analysis
+        return analyses
+    
+    def _validate_batch_entry(self, entry: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Clamp the numeric fields of one batched score entry to their ranges
+        
+        Returns None when a field is present but not a finite number, so the
+        task is left to per-task analysis instead of failing the whole ranking.
+        """
+        analysis = dict(entry)
+        for field_name, (low, high) in BATCH_SCORE_BOUNDS.items():
+            if field_name not in entry:
+                continue
+            value = entry[field_name]
+            if isinstance(value, bool):
+                return None
+            try:
+                value = float(value)
+            except (TypeError, ValueError):
+                return None
+            if math.isnan(value) or math.isinf(value):
+                return None
+            analysis[field_name] = max(low, min(value, high))
+        return analysis
+    
+    async def _gather_bounded(
+        self,
+        tasks: List[Task],
+        call: Callable[[Task], Awaitable[Dict[str, Any]]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Run one AI call per task, at most ``max_concurrency`` at a time"""
+        if not tasks:
+            return {}
+        
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def run(task: Task) -> Dict[str, Any]:
+            async with semaphore:
+                return await call(task)
+        
+        results = await asyncio.gather(*(run(task) for task in tasks))
+        return {task.id: result for task, result in zip(tasks, results)}
+    
+    def _suitability_score(self, ai_analysis: Dict[str, Any]) -> float:
+        """Suitability weighted by the AI's confidence"""
+        score = float(ai_analysis.get("suitability_score", 0.5))
+        score *= float(ai_analysis.get("confidence", 1.0))
+        return score
+    
+    def _impact_score(self, impact_analysis: Dict[str, Any]) -> float:
+        """Score based on timeline reduction and risk mitigation, in [0, 1]"""
+        timeline_impact = float(impact_analysis.get("timeline_reduction_days", 0)) / 10  # Normalize
+        risk_reduction = float(impact_analysis.get("risk_reduction", 0))
+        
+        score = (timeline_impact * 0.6) + (risk_reduction * 0.4)
+        return max(0.0, min(score, 1.0))  # Cap at 1.0
+    
+    def _build_project_context(self) -> Dict[str, Any]:
+        """Project summary shared by per-task and batched analysis"""
+        return {
+            "total_tasks": len(self.project_tasks),
+            "completed_tasks": len([t for t in self.project_tasks if t.status == TaskStatus.DONE]),
+            "project_phase": self._detect_project_phase()
+        }
+    
     async def _select_best_task(
         self,
         tasks: List[Task],
@@ -211,8 +506,25 @@ class AITaskAssignmentEngine:
         """
         Combine all scores to select the best task
         """
-        best_task = None
-        best_combined_score = -1
+        ranked_tasks = await self._rank_tasks(
+            tasks, dependency_scores, ai_scores, impact_scores, agent_info
+        )
+        return ranked_tasks[0] if ranked_tasks else None
+    
+    async def _rank_tasks(
+        self,
+        tasks: List[Task],
+        dependency_scores: Dict[str, float],
+        ai_scores: Dict[str, float],
+        impact_scores: Dict[str, float],
+        agent_info: Dict[str, Any]
+    ) -> List[Task]:
+        """
+        Combine all scores and order the tasks best first
+        
+        Ties keep the input order, so the first task wins as before.
+        """
+        combined_scores: Dict[str, float] = {}
         
         # Weights for different factors
         weights = {
@@ -256,11 +568,9 @@ class AITaskAssignmentEngine:
                 f"combined: {combined_score:.2f}"
             )
             
-            if combined_score > best_combined_score:
-                best_combined_score = combined_score
-                best_task = task
+            combined_scores[task.id] = combined_score
         
-        return best_task
+        return sorted(tasks, key=lambda task: combined_scores[task.id], reverse=True)
     
     def _is_deployment_task(self, task: Task) -> bool:
         """Check if task is deployment-related"""
@@ -347,4 +657,28 @@ async def find_optimal_task_for_agent_ai_powered(
         assigned_task_ids=assigned_task_ids
     )
     
-    return optimal_task
\ No newline at end of file
+    return optimal_task
+
+
+async def rank_tasks_for_agent_ai_powered(
+    agent_id: str,
+    agent_status: Dict[str, Any],
+    project_tasks: List[Task],
+    available_tasks: List[Task],
+    assigned_task_ids: Set[str],
+    ai_engine: MarcusAIEngine
+) -> List[Task]:
+    """
+    AI-powered ranking of every safe candidate task, best first
+    
+    Used by request_next_task to score without holding the assignment lock
+    and then reserve the highest-ranked task nobody else claimed.
+    """
+    assignment_engine = AITaskAssignmentEngine(ai_engine, project_tasks)
+    
+    return await assignment_engine.rank_tasks_for_agent(
+        agent_id=agent_id,
+        agent_info=agent_status,
+        available_tasks=available_tasks,
+        assigned_task_ids=assigned_task_ids
+    )
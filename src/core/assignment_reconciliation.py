@@ -6,7 +6,7 @@ kanban board state on startup or after connectivity issues.
 """
 
 import logging
-from typing import Dict, List, Set, Any
+from typing import Dict, List, Set, Any, Optional
 from datetime import datetime
 
 from src.core.models import Task, TaskStatus
@@ -34,10 +34,14 @@ class AssignmentReconciler:
         self.persistence = persistence
         self.kanban_client = kanban_client
         
-    async def reconcile_assignments(self) -> Dict[str, Any]:
+    async def reconcile_assignments(self, tasks: Optional[List[Task]] = None) -> Dict[str, Any]:
         """
         Reconcile persisted assignments with kanban board state.
         
+        Args:
+            tasks: Every task on the board, e.g. from a shared monitoring
+                snapshot; fetched from kanban if not given
+        
         Returns:
             Dictionary with reconciliation results
         """
@@ -54,7 +58,7 @@ class AssignmentReconciler:
             persisted = await self.persistence.load_assignments()
             
             # Get all tasks from kanban
-            all_tasks = await self.kanban_client.get_all_tasks()
+            all_tasks = tasks if tasks is not None else await self.kanban_client.get_all_tasks()
             task_map = {task.id: task for task in all_tasks}
             
             # Check each persisted assignment
@@ -130,10 +134,13 @@ class AssignmentReconciler:
             
         return results
         
-    async def get_assignment_health(self) -> Dict[str, Any]:
+    async def get_assignment_health(self, tasks: Optional[List[Task]] = None) -> Dict[str, Any]:
         """
         Get health status of assignment tracking.
         
+        Args:
+            tasks: Every task on the board; fetched from kanban if not given
+        
         Returns:
             Dictionary with health metrics
         """
@@ -150,7 +157,7 @@ class AssignmentReconciler:
             health["persisted_count"] = len(persisted)
             
             # Get kanban assignments
-            all_tasks = await self.kanban_client.get_all_tasks()
+            all_tasks = tasks if tasks is not None else await self.kanban_client.get_all_tasks()
             kanban_assigned = [
                 t for t in all_tasks 
                 if t.status == TaskStatus.IN_PROGRESS and t.assigned_to
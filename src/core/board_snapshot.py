@@ -0,0 +1,223 @@
+"""
+In-process board snapshot for Marcus.
+
+This module keeps an indexed copy of the kanban board in memory so that
+tool calls such as request_next_task and get_project_status do not have to
+re-fetch every list and card from the kanban provider on each request.
+
+The snapshot is updated immediately by Marcus's own writes and reconciled
+with the board by a background poll that only re-indexes cards whose
+``updated_at`` timestamp changed.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from dataclasses import fields
+from typing import Any, Dict, Iterable, List, Optional
+
+from src.core.models import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+_TASK_FIELDS = {f.name for f in fields(Task)}
+
+
+class BoardSnapshot:
+    """Indexed in-memory view of the kanban board."""
+
+    def __init__(self, max_staleness: float = 30.0):
+        """
+        Initialize an empty board snapshot.
+
+        Args:
+            max_staleness: Seconds after the last successful sync before the
+                snapshot is considered stale and must be re-fetched.
+        """
+        self.max_staleness = max_staleness
+
+        self._tasks: Dict[str, Task] = {}
+        # Indexes are dicts used as ordered sets so queries return tasks in a
+        # stable order (the order they entered the status or assignee) and
+        # not in set order, which changes with PYTHONHASHSEED
+        self._by_status: Dict[Any, Dict[str, None]] = defaultdict(dict)
+        self._by_assignee: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # updated_at value seen for each task at the last sync
+        self._seen_versions: Dict[str, Any] = {}
+
+        self.version = 0
+        self.populated = False
+        self._last_synced: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Freshness
+    # ------------------------------------------------------------------
+
+    def is_fresh(self) -> bool:
+        """Return True if the snapshot was synced within ``max_staleness``."""
+        if not self.populated or self._last_synced is None:
+            return False
+        return (time.monotonic() - self._last_synced) <= self.max_staleness
+
+    def age(self) -> Optional[float]:
+        """Seconds since the last successful sync, or None if never synced."""
+        if self._last_synced is None:
+            return None
+        return time.monotonic() - self._last_synced
+
+    def invalidate(self) -> None:
+        """Force the next refresh to re-fetch the board."""
+        self._last_synced = None
+
+    # ------------------------------------------------------------------
+    # Syncing with the board
+    # ------------------------------------------------------------------
+
+    def reconcile(self, tasks: Iterable[Task]) -> Dict[str, List[str]]:
+        """
+        Merge a fresh board listing into the snapshot.
+
+        Only tasks that are new, or whose ``updated_at`` differs from the
+        value seen at the previous sync, are re-indexed. Tasks missing from
+        the listing are dropped.
+
+        Args:
+            tasks: Every task currently on the board
+
+        Returns:
+            Dict with "added", "updated" and "removed" task id lists
+        """
+        added: List[str] = []
+        updated: List[str] = []
+        incoming_ids = set()
+
+        for task in tasks:
+            task_id = task.id
+            incoming_ids.add(task_id)
+            version = getattr(task, 'updated_at', None)
+
+            if task_id not in self._tasks:
+                added.append(task_id)
+            elif version is None or self._seen_versions.get(task_id) != version:
+                updated.append(task_id)
+            else:
+                continue
+
+            self._index(task)
+            self._seen_versions[task_id] = version
+
+        removed = [task_id for task_id in self._tasks if task_id not in incoming_ids]
+        for task_id in removed:
+            self._drop(task_id)
+
+        if added or updated or removed:
+            self.version += 1
+        self.populated = True
+        self._last_synced = time.monotonic()
+
+        return {"added": added, "updated": updated, "removed": removed}
+
+    # ------------------------------------------------------------------
+    # Local writes
+    # ------------------------------------------------------------------
+
+    def upsert(self, task: Task) -> None:
+        """Insert or replace a single task (e.g. one Marcus just created)."""
+        self._index(task)
+        self.version += 1
+
+    def remove(self, task_id: str) -> None:
+        """Drop a task from the snapshot and every index."""
+        if self._drop(task_id):
+            self.version += 1
+
+    def apply_update(self, task_id: str, updates: Dict[str, Any]) -> Optional[Task]:
+        """
+        Apply a write Marcus already made on the board to the cached task.
+
+        Keys that are not Task fields (progress, blocker, ...) are ignored.
+
+        Args:
+            task_id: ID of the updated task
+            updates: Field updates as passed to ``kanban_client.update_task``
+
+        Returns:
+            The updated task, or None if it is not in the snapshot
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            return None
+
+        self._unindex(task_id, task)
+        for key, value in updates.items():
+            if key in _TASK_FIELDS:
+                setattr(task, key, value)
+        self._index(task)
+        self.version += 1
+        return task
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Look up a task by id."""
+        return self._tasks.get(task_id)
+
+    def all_tasks(self) -> List[Task]:
+        """Return every task in the snapshot."""
+        return list(self._tasks.values())
+
+    def tasks_with_status(self, status: TaskStatus) -> List[Task]:
+        """
+        Return the tasks currently in the given status.
+
+        Tasks come in the order they entered the status; after the first
+        sync that is board order.
+        """
+        return [self._tasks[task_id] for task_id in self._by_status.get(status, ())]
+
+    def tasks_assigned_to(self, agent_id: str) -> List[Task]:
+        """Return the tasks currently assigned to an agent."""
+        return [self._tasks[task_id] for task_id in self._by_assignee.get(agent_id, ())]
+
+    def count(self, status: Optional[TaskStatus] = None) -> int:
+        """Count all tasks, or only those with the given status."""
+        if status is None:
+            return len(self._tasks)
+        return len(self._by_status.get(status, ()))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    # ------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------
+
+    def _drop(self, task_id: str) -> bool:
+        task = self._tasks.pop(task_id, None)
+        self._seen_versions.pop(task_id, None)
+        if task is None:
+            return False
+        self._unindex(task_id, task)
+        return True
+
+    def _index(self, task: Task) -> None:
+        previous = self._tasks.get(task.id)
+        if previous is not None:
+            self._unindex(task.id, previous)
+        self._tasks[task.id] = task
+        self._by_status[task.status][task.id] = None
+        if task.assigned_to:
+            self._by_assignee[task.assigned_to][task.id] = None
+
+    def _unindex(self, task_id: str, task: Task) -> None:
+        status_ids = self._by_status.get(task.status)
+        if status_ids is not None:
+            status_ids.pop(task_id, None)
+        if task.assigned_to:
+            assignee_ids = self._by_assignee.get(task.assigned_to)
+            if assignee_ids is not None:
+                assignee_ids.pop(task_id, None)
+                if not assignee_ids:
+                    del self._by_assignee[task.assigned_to]
@@ -7,10 +7,13 @@ context-aware information to workers about implemented features.
 
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
+import asyncio
+import hashlib
 import re
 import json
 
 from src.core.models import Task, WorkerStatus
+from src.utils.code_intelligence_cache import CodeIntelligenceCache, make_blob_key
 
 
 class CodeAnalyzer:
@@ -27,6 +30,10 @@ class CodeAnalyzer:
         Function to call GitHub MCP tools for API interactions
     endpoint_patterns : List[str]
         Regular expression patterns for detecting API endpoints
+    code_cache : CodeIntelligenceCache
+        Endpoints and models extracted per repository file, keyed by blob SHA
+    max_concurrency : int
+        Maximum file fetches in flight at once
     
     Examples
     --------
@@ -36,7 +43,12 @@ class CodeAnalyzer:
     ... )
     """
     
-    def __init__(self, mcp_caller: Optional[callable] = None) -> None:
+    def __init__(
+        self,
+        mcp_caller: Optional[callable] = None,
+        code_cache: Optional[CodeIntelligenceCache] = None,
+        max_concurrency: int = 5
+    ) -> None:
         """
         Initialize the code analyzer.
         
@@ -45,8 +57,15 @@ class CodeAnalyzer:
         mcp_caller : Optional[callable], default=None
             Function to call GitHub MCP tools. Should accept tool name
             and parameters dict.
+        code_cache : Optional[CodeIntelligenceCache], default=None
+            Cache of per-file extractions; defaults to one configured from
+            the ``github.code_cache`` config section
+        max_concurrency : int, default=5
+            Maximum file fetches in flight at once
         """
         self.mcp_caller = mcp_caller
+        self.code_cache = code_cache or CodeIntelligenceCache.from_config()
+        self.max_concurrency = max(1, max_concurrency)
         self.endpoint_patterns = [
             # FastAPI/Flask style
             r'@app\.(get|post|put|delete|patch)\(["\']([^"\']+)["\']\)',
@@ -386,7 +405,8 @@ class CodeAnalyzer:
         Find API endpoints in the repository.
         
         Searches common API file patterns and extracts endpoint definitions
-        using regex patterns.
+        using regex patterns. Files unchanged since an earlier lookup are
+        served from the code cache instead of being fetched and parsed again.
         
         Parameters
         ----------
@@ -419,24 +439,87 @@ class CodeAnalyzer:
                 })
                 
                 if result.get('items'):
-                    for item in result['items']:
-                        # Get file content to extract endpoints
-                        file_result = await self.mcp_caller('github.get_file_contents', {
-                            "owner": owner,
-                            "repo": repo,
-                            "path": item.get('path')
-                        })
-                        
-                        if file_result.get('content'):
-                            content = self._decode_content(file_result['content'])
-                            found_endpoints = self._extract_endpoints(content)
-                            endpoints.extend(found_endpoints)
+                    # Extract every hit concurrently, keeping search order
+                    extractions = await self._extract_repository_files(owner, repo, result['items'])
+                    for extraction in extractions:
+                        endpoints.extend(extraction["endpoints"])
                             
             return endpoints
             
         except Exception as e:
             print(f"Error finding endpoints: {e}")
             return []
+    
+    async def _extract_repository_files(
+        self,
+        owner: str,
+        repo: str,
+        items: List[Dict[str, Any]]
+    ) -> List[Dict[str, List[Dict[str, Any]]]]:
+        """
+        Extract endpoints and models from code search hits.
+        
+        Hits whose blob SHA is in the code cache are answered without
+        touching GitHub. The rest are fetched with at most
+        ``max_concurrency`` requests in flight, parsed, and cached under
+        their blob SHA.
+        
+        Parameters
+        ----------
+        owner : str
+            Repository owner
+        repo : str
+            Repository name
+        items : List[Dict[str, Any]]
+            Items from ``github.search_code``
+            
+        Returns
+        -------
+        List[Dict[str, List[Dict[str, Any]]]]
+            One dict per item, in item order, with "endpoints" and "models"
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        extractor = self._extractor_fingerprint()
+        
+        async def extract(item: Dict[str, Any]) -> Dict[str, List[Dict[str, Any]]]:
+            path = item.get('path')
+            blob_sha = item.get('sha')
+            key = make_blob_key(f"{owner}/{repo}", path or "", blob_sha, extractor) if blob_sha else None
+            if key:
+                cached = await self.code_cache.aget(key)
+                if cached is not None:
+                    return cached
+            
+            async with semaphore:
+                file_result = await self.mcp_caller('github.get_file_contents', {
+                    "owner": owner,
+                    "repo": repo,
+                    "path": path
+                })
+            
+            raw_content = file_result.get('content')
+            if not raw_content:
+                # Nothing fetched; leave the blob uncached so the next run retries
+                return {"endpoints": [], "models": []}
+            
+            content = self._decode_base64(raw_content)
+            decoded = content is not None
+            if not decoded:
+                content = raw_content
+            extraction = {
+                "endpoints": self._extract_endpoints(content),
+                "models": self._extract_models(content)
+            }
+            # Only results from a decoded blob are known to match its SHA
+            if key and decoded:
+                await self.code_cache.aset(key, extraction)
+            return extraction
+        
+        return await asyncio.gather(*(extract(item) for item in items))
+    
+    def _extractor_fingerprint(self) -> str:
+        """Identify the extraction rules, so editing them invalidates cached results"""
+        return hashlib.sha1("\n".join(self.endpoint_patterns).encode("utf-8")).hexdigest()[:12]
             
     def _extract_endpoints(self, content: str) -> List[Dict[str, Any]]:
         """
@@ -694,11 +777,16 @@ class CodeAnalyzer:
         str
             Decoded UTF-8 string content
         """
+        decoded = self._decode_base64(content)
+        return content if decoded is None else decoded
+    
+    def _decode_base64(self, content: str) -> Optional[str]:
+        """Decode base64 UTF-8 content, or None if it is not valid base64 UTF-8."""
         import base64
         try:
             return base64.b64decode(content).decode('utf-8')
         except:
-            return content
+            return None
             
     def _summarize_config_changes(self, patch: str) -> str:
         """
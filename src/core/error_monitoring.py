@@ -3,13 +3,21 @@ Marcus Error Monitoring and Correlation System
 
 Provides comprehensive error tracking, pattern analysis, and correlation
 capabilities for autonomous agent environments.
+
+Recorded errors live in a bounded store: the history, the correlation ID
+index and the secondary indexes (error type, error code, agent, operation,
+integration, severity) are evicted together, so memory stays flat in long
+runs. Rates and pattern thresholds are read from rolling windowed counters
+instead of rescanning the history, and patterns and metrics snapshots are
+appended to a JSON Lines journal that is compacted only occasionally.
 """
 
 import asyncio
 import json
+import os
 import time
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List, Callable, Set, Union
+from typing import Dict, Any, Optional, List, Callable, Set, Tuple, Union
 from dataclasses import dataclass, field, asdict
 from collections import defaultdict, deque
 from enum import Enum
@@ -61,6 +69,65 @@ class ErrorPattern:
     sample_errors: List[str] = field(default_factory=list)
 
 
+class RollingWindowCounter:
+    """
+    Event counts over a sliding time window, per key.
+    
+    Events are counted in fixed-width buckets, so adding an event and
+    reading a count are amortized O(1). Counts are exact to within one
+    bucket at the trailing edge of the window.
+    """
+    
+    def __init__(self, window_seconds: float, buckets: int = 60):
+        self.window_seconds = window_seconds
+        self.bucket_count = buckets
+        self.bucket_width = window_seconds / buckets
+        self._buckets: Dict[Any, deque] = {}  # key -> deque of [bucket, count]
+        self._totals: Dict[Any, int] = {}
+    
+    def add(self, key: Any = None, now: Optional[float] = None) -> int:
+        """Count one event for a key and return the key's count in the window."""
+        bucket = self._bucket(now)
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            buckets = self._buckets[key] = deque()
+            self._totals[key] = 0
+        self._expire(key, buckets, bucket)
+        
+        if buckets and buckets[-1][0] >= bucket:
+            buckets[-1][1] += 1
+        else:
+            buckets.append([bucket, 1])
+        self._totals[key] += 1
+        return self._totals[key]
+    
+    def count(self, key: Any = None, now: Optional[float] = None) -> int:
+        """Events for a key within the window."""
+        buckets = self._buckets.get(key)
+        if buckets is None:
+            return 0
+        self._expire(key, buckets, self._bucket(now))
+        return self._totals[key]
+    
+    def prune(self, now: Optional[float] = None):
+        """Drop keys with no events left in the window."""
+        bucket = self._bucket(now)
+        for key in list(self._buckets):
+            buckets = self._buckets[key]
+            self._expire(key, buckets, bucket)
+            if not buckets:
+                del self._buckets[key]
+                del self._totals[key]
+    
+    def _bucket(self, now: Optional[float]) -> int:
+        return int((time.monotonic() if now is None else now) // self.bucket_width)
+    
+    def _expire(self, key: Any, buckets: deque, bucket: int):
+        oldest = bucket - self.bucket_count + 1
+        while buckets and buckets[0][0] < oldest:
+            self._totals[key] -= buckets.popleft()[1]
+
+
 @dataclass
 class CorrelationGroup:
     """Group of correlated errors."""
@@ -81,21 +148,53 @@ class ErrorMonitor:
     proactive issue detection for autonomous agents.
     """
     
+    # Record fields with a secondary index (field value -> records, oldest first)
+    INDEXED_FIELDS = (
+        'error_type', 'error_code', 'agent_id', 'operation', 'integration_name', 'severity'
+    )
+    
     def __init__(
         self,
         storage_path: str = "logs/error_monitoring.json",
         metrics_window_minutes: int = 60,
         pattern_detection_enabled: bool = True,
-        correlation_timeout_minutes: int = 30
+        correlation_timeout_minutes: int = 30,
+        max_errors: int = 10000,
+        max_journal_records: int = 5000
     ):
+        """
+        Initialize the error monitor.
+        
+        Args:
+            storage_path: JSON Lines journal for patterns and metrics snapshots
+            metrics_window_minutes: Window for the error rate
+            pattern_detection_enabled: Whether to detect error patterns
+            correlation_timeout_minutes: How long a correlation group stays open
+            max_errors: Number of recent errors kept in memory and indexed
+            max_journal_records: Journal size at which it is compacted
+        """
         self.storage_path = Path(storage_path)
         self.metrics_window_minutes = metrics_window_minutes
         self.pattern_detection_enabled = pattern_detection_enabled
         self.correlation_timeout_minutes = correlation_timeout_minutes
+        self.max_errors = max_errors
+        self.max_journal_records = max_journal_records
         
-        # Error storage
-        self.error_history: deque = deque(maxlen=10000)  # Keep last 10k errors
+        # Error storage, in arrival order; every index below is pruned with it
+        self.error_history: deque = deque(maxlen=max_errors)
         self.error_index: Dict[str, Dict[str, Any]] = {}  # correlation_id -> error data
+        self._indexes: Dict[str, Dict[Any, deque]] = {name: {} for name in self.INDEXED_FIELDS}
+        self._cascade_index: Dict[Tuple[str, Any], deque] = {}  # (type, operation) -> records
+        self._sequence = 0
+        # Arrival number of each stored record, keyed by id(record); kept out
+        # of the records themselves so it never shows up in search results
+        self._sequences: Dict[int, int] = {}
+        
+        # Rolling counters for the error rate and pattern windows
+        self._rate_counter = RollingWindowCounter(metrics_window_minutes * 60)
+        self._burst_counter = RollingWindowCounter(5 * 60)
+        self._type_counter = RollingWindowCounter(10 * 60)
+        self._agent_counter = RollingWindowCounter(30 * 60)
         
         # Metrics
         self.current_metrics = ErrorMetrics()
@@ -113,10 +212,17 @@ class ErrorMonitor:
         # Correlation tracking
         self.correlation_groups: Dict[str, CorrelationGroup] = {}
         self.active_correlations: Dict[str, str] = {}  # correlation_id -> group_id
+        self._groups_by_key: Dict[str, str] = {}  # correlation_key -> latest group_id
         
         # Alert callbacks
         self.alert_callbacks: List[Callable[[ErrorPattern], None]] = []
         
+        # Journal state: what has been persisted since the last compaction
+        self._saved_pattern_versions: Dict[str, Tuple[datetime, int]] = {}
+        self._last_saved_metrics: Optional[ErrorMetrics] = None
+        self._journal_records = 0
+        self._needs_compaction = False
+        
         # Background task management
         self._monitoring_task: Optional[asyncio.Task] = None
         self._lock = threading.Lock()
@@ -132,71 +238,181 @@ class ErrorMonitor:
         if self.storage_path.exists():
             try:
                 with open(self.storage_path, 'r') as f:
-                    data = json.load(f)
-                    self._load_from_storage(data)
+                    content = f.read()
+                self._load_storage_content(content)
             except Exception as e:
                 logger.warning(f"Failed to load error monitoring data: {e}")
     
+    def _load_storage_content(self, content: str):
+        """Load a JSON Lines journal, or a snapshot written by older versions."""
+        if not content.strip():
+            return
+        
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            data = None
+        if isinstance(data, dict) and ('patterns' in data or 'metrics_history' in data):
+            self._load_from_storage(data)
+            # Rewrite as a journal before appending to it
+            self._needs_compaction = True
+        else:
+            metrics_data = []
+            for line in content.splitlines():
+                if not line.strip():
+                    continue
+                self._journal_records += 1
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from an interrupted append
+                    logger.warning("Skipping unreadable error monitoring journal record")
+                    continue
+                if record.get('type') == 'pattern':
+                    pattern = self._pattern_from_dict(record['data'])
+                    self.detected_patterns[pattern.pattern_id] = pattern
+                elif record.get('type') == 'metrics':
+                    metrics_data.append(record['data'])
+            for data in metrics_data[-100:]:  # Keep last 100
+                self.metrics_history.append(self._metrics_from_dict(data))
+        
+        # Patterns the journal still holds but cleanup has since dropped
+        cutoff_time = datetime.now() - timedelta(days=7)
+        for pattern_id in [
+            pattern_id for pattern_id, pattern in self.detected_patterns.items()
+            if pattern.last_seen < cutoff_time
+        ]:
+            del self.detected_patterns[pattern_id]
+        
+        self._saved_pattern_versions = {
+            pattern_id: self._pattern_version(pattern)
+            for pattern_id, pattern in self.detected_patterns.items()
+        }
+        if self.metrics_history:
+            self._last_saved_metrics = self.metrics_history[-1]
+    
     def _load_from_storage(self, data: Dict[str, Any]):
-        """Load monitoring data from storage."""
+        """Load monitoring data from a JSON snapshot."""
         # Load metrics history
         if 'metrics_history' in data:
             for metrics_data in data['metrics_history'][-100:]:  # Keep last 100
-                # Convert ISO string to datetime if needed
-                if 'last_updated' in metrics_data and isinstance(metrics_data['last_updated'], str):
-                    metrics_data['last_updated'] = datetime.fromisoformat(metrics_data['last_updated'])
-                metrics = ErrorMetrics(**metrics_data)
-                self.metrics_history.append(metrics)
+                self.metrics_history.append(self._metrics_from_dict(metrics_data))
         
         # Load detected patterns
         if 'patterns' in data:
             for pattern_data in data['patterns'].values():
-                # Convert ISO strings to datetime objects
-                if 'first_seen' in pattern_data and isinstance(pattern_data['first_seen'], str):
-                    pattern_data['first_seen'] = datetime.fromisoformat(pattern_data['first_seen'])
-                if 'last_seen' in pattern_data and isinstance(pattern_data['last_seen'], str):
-                    pattern_data['last_seen'] = datetime.fromisoformat(pattern_data['last_seen'])
-                if 'severity' in pattern_data and isinstance(pattern_data['severity'], str):
-                    pattern_data['severity'] = ErrorSeverity(pattern_data['severity'])
-                    
-                pattern = ErrorPattern(**pattern_data)
-                pattern.affected_agents = set(pattern.affected_agents)
-                pattern.affected_operations = set(pattern.affected_operations)
+                pattern = self._pattern_from_dict(pattern_data)
                 self.detected_patterns[pattern.pattern_id] = pattern
     
+    @staticmethod
+    def _pattern_from_dict(pattern_data: Dict[str, Any]) -> ErrorPattern:
+        # Convert ISO strings to datetime objects
+        if 'first_seen' in pattern_data and isinstance(pattern_data['first_seen'], str):
+            pattern_data['first_seen'] = datetime.fromisoformat(pattern_data['first_seen'])
+        if 'last_seen' in pattern_data and isinstance(pattern_data['last_seen'], str):
+            pattern_data['last_seen'] = datetime.fromisoformat(pattern_data['last_seen'])
+        if 'severity' in pattern_data and isinstance(pattern_data['severity'], str):
+            pattern_data['severity'] = ErrorSeverity(pattern_data['severity'])
+        
+        pattern = ErrorPattern(**pattern_data)
+        pattern.affected_agents = set(pattern.affected_agents)
+        pattern.affected_operations = set(pattern.affected_operations)
+        return pattern
+    
+    @staticmethod
+    def _pattern_to_dict(pattern: ErrorPattern) -> Dict[str, Any]:
+        pattern_dict = asdict(pattern)
+        pattern_dict['affected_agents'] = list(pattern.affected_agents)
+        pattern_dict['affected_operations'] = list(pattern.affected_operations)
+        pattern_dict['first_seen'] = pattern.first_seen.isoformat()
+        pattern_dict['last_seen'] = pattern.last_seen.isoformat()
+        pattern_dict['severity'] = pattern.severity.value
+        return pattern_dict
+    
+    @staticmethod
+    def _metrics_from_dict(metrics_data: Dict[str, Any]) -> ErrorMetrics:
+        # Convert ISO string to datetime if needed
+        if 'last_updated' in metrics_data and isinstance(metrics_data['last_updated'], str):
+            metrics_data['last_updated'] = datetime.fromisoformat(metrics_data['last_updated'])
+        return ErrorMetrics(**metrics_data)
+    
+    @staticmethod
+    def _metrics_to_dict(metrics: ErrorMetrics) -> Dict[str, Any]:
+        metrics_dict = asdict(metrics)
+        metrics_dict['last_updated'] = metrics.last_updated.isoformat()
+        return metrics_dict
+    
+    @staticmethod
+    def _pattern_version(pattern: ErrorPattern) -> Tuple[datetime, int]:
+        return (pattern.last_seen, pattern.frequency)
+    
+    def _unsaved_metrics(self) -> List[ErrorMetrics]:
+        """Metrics snapshots appended since the last save."""
+        unsaved = []
+        for metrics in reversed(self.metrics_history):
+            if metrics is self._last_saved_metrics:
+                break
+            unsaved.append(metrics)
+        unsaved.reverse()
+        return unsaved
+    
     def _save_to_storage(self):
-        """Save monitoring data to storage."""
+        """
+        Save monitoring data to storage.
+        
+        Only patterns that changed and metrics snapshots taken since the last
+        save are appended to the journal. The journal is rewritten from the
+        current state once it grows past ``max_journal_records``.
+        """
         try:
-            # Convert patterns for JSON serialization
-            patterns_data = {}
-            for pattern_id, pattern in self.detected_patterns.items():
-                pattern_dict = asdict(pattern)
-                pattern_dict['affected_agents'] = list(pattern.affected_agents)
-                pattern_dict['affected_operations'] = list(pattern.affected_operations)
-                pattern_dict['first_seen'] = pattern.first_seen.isoformat()
-                pattern_dict['last_seen'] = pattern.last_seen.isoformat()
-                pattern_dict['severity'] = pattern.severity.value
-                patterns_data[pattern_id] = pattern_dict
-            
-            # Convert metrics for JSON serialization
-            metrics_data = []
-            for metrics in self.metrics_history[-100:]:  # Keep last 100
-                metrics_dict = asdict(metrics)
-                metrics_dict['last_updated'] = metrics.last_updated.isoformat()
-                metrics_data.append(metrics_dict)
+            records = [
+                {'type': 'pattern', 'data': self._pattern_to_dict(pattern)}
+                for pattern_id, pattern in list(self.detected_patterns.items())
+                if self._saved_pattern_versions.get(pattern_id) != self._pattern_version(pattern)
+            ]
+            records.extend(
+                {'type': 'metrics', 'data': self._metrics_to_dict(metrics)}
+                for metrics in self._unsaved_metrics()
+            )
             
-            data = {
-                'patterns': patterns_data,
-                'metrics_history': metrics_data,
-                'last_updated': datetime.now().isoformat()
-            }
+            if self._needs_compaction or self._journal_records + len(records) > self.max_journal_records:
+                self._compact_storage()
+            elif records:
+                with open(self.storage_path, 'a') as f:
+                    f.write(''.join(json.dumps(record) + '\n' for record in records))
+                self._journal_records += len(records)
             
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            self._mark_saved()
                 
         except Exception as e:
             logger.error(f"Failed to save error monitoring data: {e}")
     
+    def _compact_storage(self):
+        """Rewrite the journal with only the current patterns and recent metrics."""
+        records = [
+            {'type': 'pattern', 'data': self._pattern_to_dict(pattern)}
+            for pattern in list(self.detected_patterns.values())
+        ]
+        records.extend(
+            {'type': 'metrics', 'data': self._metrics_to_dict(metrics)}
+            for metrics in self.metrics_history[-100:]  # Keep last 100
+        )
+        
+        temp_path = self.storage_path.with_name(self.storage_path.name + '.tmp')
+        with open(temp_path, 'w') as f:
+            f.write(''.join(json.dumps(record) + '\n' for record in records))
+        os.replace(temp_path, self.storage_path)
+        
+        self._journal_records = len(records)
+        self._needs_compaction = False
+    
+    def _mark_saved(self):
+        self._saved_pattern_versions = {
+            pattern_id: self._pattern_version(pattern)
+            for pattern_id, pattern in self.detected_patterns.items()
+        }
+        self._last_saved_metrics = self.metrics_history[-1] if self.metrics_history else None
+    
     def record_error(self, error: MarcusBaseError):
         """Record an error for monitoring and analysis."""
         with self._lock:
@@ -218,8 +434,7 @@ class ErrorMonitor:
             }
             
             # Store error
-            self.error_history.append(error_record)
-            self.error_index[error.context.correlation_id] = error_record
+            self._store_record(error_record)
             
             # Update metrics
             self._update_metrics(error_record)
@@ -234,6 +449,51 @@ class ErrorMonitor:
             # Log for debugging
             logger.debug(f"Recorded error: {error.error_code} ({error.context.correlation_id})")
     
+    def _store_record(self, error_record: Dict[str, Any]):
+        """Append a record to the history and its indexes, evicting the oldest."""
+        if len(self.error_history) == self.error_history.maxlen:
+            self._evict_record(self.error_history.popleft())
+        
+        self._sequence += 1
+        self._sequences[id(error_record)] = self._sequence
+        self.error_history.append(error_record)
+        self.error_index[error_record['correlation_id']] = error_record
+        
+        for name, index in self._indexes.items():
+            index.setdefault(error_record.get(name), deque()).append(error_record)
+        cascade_key = (error_record['error_type'], error_record.get('operation'))
+        self._cascade_index.setdefault(cascade_key, deque()).append(error_record)
+        
+        now = time.monotonic()
+        self._rate_counter.add(now=now)
+        self._burst_counter.add(now=now)
+        self._type_counter.add(error_record['error_type'], now=now)
+        if error_record.get('agent_id'):
+            self._agent_counter.add(error_record['agent_id'], now=now)
+    
+    def _evict_record(self, error_record: Dict[str, Any]):
+        """Drop the oldest record from every index."""
+        del self._sequences[id(error_record)]
+        correlation_id = error_record['correlation_id']
+        # The same correlation ID may have been recorded again since
+        if self.error_index.get(correlation_id) is error_record:
+            del self.error_index[correlation_id]
+            self.active_correlations.pop(correlation_id, None)
+        
+        # Records are indexed in arrival order, so the oldest is at the left
+        for name, index in self._indexes.items():
+            self._pop_oldest(index, error_record.get(name), error_record)
+        cascade_key = (error_record['error_type'], error_record.get('operation'))
+        self._pop_oldest(self._cascade_index, cascade_key, error_record)
+    
+    @staticmethod
+    def _pop_oldest(index: Dict[Any, deque], key: Any, error_record: Dict[str, Any]):
+        records = index.get(key)
+        if records and records[0] is error_record:
+            records.popleft()
+            if not records:
+                del index[key]
+    
     def _update_metrics(self, error_record: Dict[str, Any]):
         """Update error metrics."""
         metrics = self.current_metrics
@@ -278,15 +538,7 @@ class ErrorMonitor:
     
     def _calculate_error_rate(self):
         """Calculate current error rate per minute."""
-        now = datetime.now()
-        cutoff_time = now - timedelta(minutes=self.metrics_window_minutes)
-        
-        # Count errors in time window
-        recent_errors = sum(
-            1 for error in self.error_history
-            if error['timestamp'] > cutoff_time
-        )
-        
+        recent_errors = self._rate_counter.count()
         self.current_metrics.error_rate_per_minute = recent_errors / self.metrics_window_minutes
     
     def _detect_patterns(self, error_record: Dict[str, Any]):
@@ -310,11 +562,7 @@ class ErrorMonitor:
         error_type = error_record['error_type']
         
         # Count recent occurrences of this error type
-        recent_count = sum(
-            1 for error in self.error_history
-            if (error['error_type'] == error_type and
-                now - error['timestamp'] < timedelta(minutes=10))
-        )
+        recent_count = self._type_counter.count(error_type)
         
         if recent_count >= self.pattern_thresholds['frequency_threshold']:
             pattern_id = f"frequency_{error_type}_{now.strftime('%Y%m%d_%H%M')}"
@@ -341,10 +589,7 @@ class ErrorMonitor:
     def _detect_burst_pattern(self, error_record: Dict[str, Any], now: datetime):
         """Detect burst error patterns."""
         # Count all errors in last 5 minutes
-        burst_count = sum(
-            1 for error in self.error_history
-            if now - error['timestamp'] < timedelta(minutes=5)
-        )
+        burst_count = self._burst_counter.count()
         
         if burst_count >= self.pattern_thresholds['burst_threshold']:
             pattern_id = f"burst_{now.strftime('%Y%m%d_%H%M')}"
@@ -370,11 +615,7 @@ class ErrorMonitor:
             return
         
         # Count errors from this agent in last 30 minutes
-        agent_errors = sum(
-            1 for error in self.error_history
-            if (error.get('agent_id') == agent_id and
-                now - error['timestamp'] < timedelta(minutes=30))
-        )
+        agent_errors = self._agent_counter.count(agent_id)
         
         if agent_errors >= self.pattern_thresholds['agent_error_threshold']:
             pattern_id = f"agent_{agent_id}_{now.strftime('%Y%m%d_%H%M')}"
@@ -396,9 +637,17 @@ class ErrorMonitor:
     
     def _detect_cascade_pattern(self, error_record: Dict[str, Any], now: datetime):
         """Detect cascade error patterns (related errors in sequence)."""
-        # Look for errors with similar context that occurred recently
+        # Look for errors with similar context among the last 50 errors.
+        # Passing the 70% threshold takes the same error type and operation,
+        # so only those candidates are compared.
+        oldest_seq = self._sequences[id(error_record)] - 49
+        candidates = self._cascade_index.get(
+            (error_record['error_type'], error_record.get('operation')), ()
+        )
         similar_errors = []
-        for error in list(self.error_history)[-50:]:  # Check last 50 errors
+        for error in reversed(candidates):
+            if self._sequences[id(error)] < oldest_seq:
+                break
             if (now - error['timestamp'] < timedelta(minutes=5) and
                 error['correlation_id'] != error_record['correlation_id']):
                 
@@ -454,19 +703,16 @@ class ErrorMonitor:
         correlation_key = f"{error_record.get('operation', 'unknown')}_{error_record.get('agent_id', 'unknown')}_{error_record.get('integration_name', 'unknown')}"
         
         # Find or create correlation group
-        group_id = None
-        for gid, group in self.correlation_groups.items():
-            if (group.correlation_key == correlation_key and 
-                datetime.now() - group.start_time < timedelta(minutes=self.correlation_timeout_minutes)):
-                group_id = gid
-                break
-        
-        if not group_id:
+        group_id = self._groups_by_key.get(correlation_key)
+        group = self.correlation_groups.get(group_id) if group_id else None
+        if (group is None or
+                datetime.now() - group.start_time >= timedelta(minutes=self.correlation_timeout_minutes)):
             group_id = f"corr_{int(time.time())}_{correlation_key[:20]}"
             self.correlation_groups[group_id] = CorrelationGroup(
                 group_id=group_id,
                 correlation_key=correlation_key
             )
+            self._groups_by_key[correlation_key] = group_id
         
         # Add error to group
         group = self.correlation_groups[group_id]
@@ -536,28 +782,49 @@ class ErrorMonitor:
         agent_id: str = None,
         operation: str = None,
         severity: str = None,
-        hours: int = 24
+        hours: int = 24,
+        error_code: str = None,
+        integration_name: str = None
     ) -> List[Dict[str, Any]]:
-        """Search errors with specified criteria."""
+        """
+        Search errors with specified criteria.
+        
+        Starts from the smallest index matching a filter and walks it from
+        the newest error back to the time cutoff, so the cost follows the
+        number of candidates rather than the size of the history.
+        """
         cutoff_time = datetime.now() - timedelta(hours=hours)
+        filters = {
+            name: value for name, value in (
+                ('error_type', error_type),
+                ('agent_id', agent_id),
+                ('operation', operation),
+                ('severity', severity),
+                ('error_code', error_code),
+                ('integration_name', integration_name),
+            ) if value
+        }
         
-        results = []
-        for error in self.error_history:
-            if error['timestamp'] < cutoff_time:
-                continue
-            
-            # Apply filters
-            if error_type and error['error_type'] != error_type:
-                continue
-            if agent_id and error.get('agent_id') != agent_id:
-                continue
-            if operation and error.get('operation') != operation:
-                continue
-            if severity and error['severity'] != severity:
-                continue
+        with self._lock:
+            candidates = self.error_history
+            for name, value in filters.items():
+                records = self._indexes[name].get(value)
+                if records is None:
+                    return []
+                if len(records) < len(candidates):
+                    candidates = records
             
-            results.append(error)
+            results = []
+            for error in reversed(candidates):
+                # Errors are indexed in arrival order
+                if error['timestamp'] < cutoff_time:
+                    break
+                
+                # Apply filters
+                if all(error.get(name) == value for name, value in filters.items()):
+                    results.append(error)
         
+        results.reverse()
         return results
     
     def generate_health_report(self) -> Dict[str, Any]:
@@ -637,13 +904,17 @@ class ErrorMonitor:
             if error_count > 10:
                 recommendations.append(f"Agent {agent_id} has high error count ({error_count}) - review agent configuration")
         
-        # Integration-specific recommendations
+        # Integration-specific recommendations, over the last 1000 errors
         integration_errors = defaultdict(int)
-        # Get last 1000 errors from deque
-        recent_errors = list(self.error_history)[-1000:] if len(self.error_history) > 1000 else list(self.error_history)
-        for error in recent_errors:
-            if error.get('integration_name'):
-                integration_errors[error['integration_name']] += 1
+        oldest_seq = self._sequence - 999
+        with self._lock:
+            for integration, records in self._indexes['integration_name'].items():
+                if not integration:
+                    continue
+                for error in reversed(records):
+                    if self._sequences[id(error)] < oldest_seq:
+                        break
+                    integration_errors[integration] += 1
         
         for integration, count in integration_errors.items():
             if count > 20:
@@ -712,7 +983,13 @@ class ErrorMonitor:
             if group.end_time and group.end_time < cutoff_time
         ]
         for group_id in old_groups:
-            del self.correlation_groups[group_id]
+            group = self.correlation_groups.pop(group_id)
+            if self._groups_by_key.get(group.correlation_key) == group_id:
+                del self._groups_by_key[group.correlation_key]
+        
+        # Forget agents and error types with no errors left in their windows
+        self._type_counter.prune()
+        self._agent_counter.prune()
         
         # Keep only last 1000 metrics
         if len(self.metrics_history) > 1000:
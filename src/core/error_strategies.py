@@ -93,6 +93,27 @@ class CircuitBreaker:
     
     async def call(self, func: Callable, *args, **kwargs):
         """Execute function with circuit breaker protection."""
+        await self.before_call()
+        
+        # Execute function
+        try:
+            if asyncio.iscoroutinefunction(func):
+                result = await func(*args, **kwargs)
+            else:
+                result = func(*args, **kwargs)
+            
+            # Record success
+            await self.record_success()
+            
+            return result
+            
+        except Exception as e:
+            # Record failure
+            await self.record_failure(e)
+            raise
+    
+    async def before_call(self):
+        """Raise IntegrationError if the circuit is open, otherwise let the call through."""
         async with self._lock:
             # Check if circuit should transition states
             await self._update_state()
@@ -110,25 +131,23 @@ class CircuitBreaker:
                     },
                     severity=ErrorSeverity.MEDIUM
                 )
-        
-        # Execute function
-        try:
-            if asyncio.iscoroutinefunction(func):
-                result = await func(*args, **kwargs)
-            else:
-                result = func(*args, **kwargs)
-            
-            # Record success
-            async with self._lock:
-                await self._record_success()
-            
-            return result
-            
-        except Exception as e:
-            # Record failure
-            async with self._lock:
-                await self._record_failure(e)
-            raise
+    
+    async def record_success(self):
+        """Record the outcome of a call made after before_call()."""
+        async with self._lock:
+            await self._record_success()
+    
+    async def record_failure(self, exception: Exception):
+        """Record a failed call made after before_call()."""
+        async with self._lock:
+            await self._record_failure(exception)
+    
+    def is_open(self) -> bool:
+        """Whether calls are currently blocked (open and not yet due for a half-open trial)."""
+        return (
+            self.state.state == CircuitBreakerState.OPEN and
+            not (self.state.next_attempt_time and datetime.now() >= self.state.next_attempt_time)
+        )
     
     async def _update_state(self):
         """Update circuit breaker state based on current conditions."""
@@ -178,13 +197,18 @@ class CircuitBreaker:
         self.state.last_failure_time = now
         self.state.failure_history.append(now)
         
-        # Check if should open circuit
+        # Check if should open circuit; only failures within the monitor
+        # window count, so occasional errors in a long-lived process never
+        # add up to an open circuit
         if (self.state.state == CircuitBreakerState.CLOSED and
-            self.state.failure_count >= self.config.failure_threshold):
+            len(self.state.failure_history) >= self.config.failure_threshold):
             
             self.state.state = CircuitBreakerState.OPEN
             self.state.next_attempt_time = now + timedelta(seconds=self.config.timeout)
-            logger.warning(f"Circuit breaker {self.name} OPENED due to {self.state.failure_count} failures")
+            logger.warning(
+                f"Circuit breaker {self.name} OPENED due to "
+                f"{len(self.state.failure_history)} failures in {self.config.monitor_window:.0f}s"
+            )
         
         elif (self.state.state == CircuitBreakerState.HALF_OPEN):
             # Failed while half-open, go back to open
@@ -5,8 +5,9 @@ This module defines the fundamental data structures used throughout the Marcus s
 including tasks, workers, assignments, and project state tracking.
 """
 
-from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, List, Dict, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -74,6 +75,25 @@ class Priority(Enum):
     URGENT = "urgent"
 
 
+def _slotted(cls: type) -> type:
+    """
+    Rebuild a dataclass with ``__slots__`` holding its fields.
+
+    Equivalent to ``dataclass(slots=True)``, which needs Python 3.10. Field
+    defaults are dropped from the class body (``__init__`` already holds
+    them), as slot descriptors cannot share a name with a class attribute.
+    """
+    field_names = tuple(f.name for f in fields(cls))
+    namespace = dict(cls.__dict__)
+    namespace["__slots__"] = field_names
+    for name in field_names + ("__dict__", "__weakref__"):
+        namespace.pop(name, None)
+    slotted = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted.__qualname__ = cls.__qualname__
+    return slotted
+
+
+@_slotted
 @dataclass
 class Task:
     """
@@ -107,10 +127,23 @@ class Task:
         List of task IDs that must be completed first
     labels : List[str], optional
         Tags for categorizing the task
+    acceptance_criteria : Optional[List[str]], default=None
+        Conditions for the task to count as done, set by the PRD parser
+    subtasks : Optional[List[Dict[str, Any]]], default=None
+        Breakdown of the task into smaller steps, set by the PRD parser
+    metadata : Optional[Dict[str, Any]], default=None
+        Free-form tracking data attached by task generators
+    completed_at : Optional[datetime], default=None
+        When the task was completed, if known
     
     Notes
     -----
     Dependencies and labels are initialized as empty lists if not provided.
+    Tasks use ``__slots__``: large boards are held in several places at
+    once (project state, board snapshot, knowledge graph), and slotted
+    instances carry no per-instance ``__dict__``. Attributes beyond the
+    fields above cannot be added. Label strings are interned so that the
+    few distinct labels on a board are stored once.
     """
     id: str
     name: str
@@ -125,6 +158,41 @@ class Task:
     actual_hours: float = 0.0
     dependencies: List[str] = field(default_factory=list)
     labels: List[str] = field(default_factory=list)
+    acceptance_criteria: Optional[List[str]] = None
+    subtasks: Optional[List[Dict[str, Any]]] = None
+    metadata: Optional[Dict[str, Any]] = None
+    completed_at: Optional[datetime] = None
+    
+    def __post_init__(self) -> None:
+        labels = self.labels
+        for i, label in enumerate(labels):
+            if type(label) is str:
+                labels[i] = sys.intern(label)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Same state as the former __dict__-based Task, so pickles stay
+        # readable in both directions
+        return {name: getattr(self, name) for name in _TASK_FIELD_NAMES}
+    
+    def __setstate__(self, state: Any) -> None:
+        if isinstance(state, tuple):
+            # (dict state, slot state) as produced by the default protocol
+            merged: Dict[str, Any] = {}
+            for part in state:
+                merged.update(part or {})
+            state = merged
+        for f in _TASK_FIELDS:
+            if f.name in state:
+                value = state[f.name]
+            elif f.default is not MISSING:
+                value = f.default
+            else:
+                value = f.default_factory() if f.default_factory is not MISSING else None
+            object.__setattr__(self, f.name, value)
+
+
+_TASK_FIELDS = fields(Task)
+_TASK_FIELD_NAMES = tuple(f.name for f in _TASK_FIELDS)
 
 
 @dataclass
@@ -0,0 +1,485 @@
+"""
+Marcus Resilience Layer
+
+Protects calls to external backends (kanban boards, LLM APIs) with:
+- A per-endpoint circuit breaker, so a degraded backend fails fast
+- Retries with full-jitter backoff, limited by a retry budget
+- An AIMD adaptive concurrency limit driven by observed latency
+
+Every endpoint registers itself so breaker state and limiter metrics can be
+exported with ``get_resilience_stats``.
+"""
+
+import asyncio
+import logging
+import random
+import time
+import weakref
+from collections import deque
+from functools import wraps
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar
+
+from .error_framework import ErrorContext, ErrorSeverity, IntegrationError, TransientError
+from .error_strategies import CircuitBreaker, CircuitBreakerConfig
+
+try:
+    import httpx
+    _TRANSPORT_ERRORS: tuple = (httpx.TransportError,)
+except ImportError:  # pragma: no cover - httpx ships with the anthropic SDK
+    _TRANSPORT_ERRORS = ()
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# Responses that mean "try again later" rather than "this request is wrong"
+TRANSIENT_STATUS_CODES = frozenset({408, 425, 429, 500, 502, 503, 504, 529})
+
+# Limiter outcomes
+SUCCESS = "success"
+DROPPED = "dropped"
+IGNORED = "ignored"
+
+
+def _status_code(error: Exception) -> Optional[int]:
+    """HTTP status of an API error (anthropic APIStatusError, httpx HTTPStatusError), if any."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status if isinstance(status, int) else None
+
+
+def is_transient_error(error: Exception) -> bool:
+    """
+    Whether an error is worth retrying.
+
+    Timeouts, dropped connections (including httpx transport errors), Marcus
+    transient errors and throttling or server-side HTTP responses are;
+    everything else is raised straight away.
+    """
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError, TransientError) + _TRANSPORT_ERRORS):
+        return True
+    return _status_code(error) in TRANSIENT_STATUS_CODES
+
+
+def is_backend_failure(error: Exception) -> bool:
+    """
+    Whether an error counts against the backend's health.
+
+    Client errors (HTTP 4xx other than throttling) say nothing about the
+    backend, so they neither trip the breaker nor shrink the concurrency limit.
+    """
+    status = _status_code(error)
+    return status is None or status in TRANSIENT_STATUS_CODES
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    AIMD concurrency limit for one backend.
+
+    While calls succeed within ``latency_tolerance`` times the baseline
+    latency (never less than ``min_latency``), the limit grows by one per limit's worth of calls (additive
+    increase). A slow call, timeout or failure multiplies it by
+    ``backoff_ratio`` (multiplicative decrease), at most once per round of
+    in-flight calls. Callers over the limit queue in order; with
+    ``max_queue_wait`` set, those that wait longer are rejected.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_tolerance: float = 2.0,
+        backoff_ratio: float = 0.5,
+        smoothing: float = 0.1,
+        min_samples: int = 5,
+        min_latency: float = 0.05,
+        max_queue_wait: Optional[float] = None
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            name: Backend name, used in logs and errors
+            initial_limit: Concurrent calls allowed before any feedback
+            min_limit: Floor for the limit
+            max_limit: Ceiling for the limit
+            latency_tolerance: A call slower than this multiple of the
+                baseline latency counts as congestion
+            backoff_ratio: Factor applied to the limit on congestion
+            smoothing: Weight of each sample in the baseline latency average
+            min_samples: Samples needed before calls can count as slow
+            min_latency: Floor for the baseline in the slow-call check, so
+                scheduling jitter on very fast calls is not read as congestion
+            max_queue_wait: Seconds a caller may wait for a slot, None to wait
+        """
+        self.name = name
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self._limit = float(min(max(initial_limit, self.min_limit), self.max_limit))
+        self.latency_tolerance = latency_tolerance
+        self.backoff_ratio = backoff_ratio
+        self.smoothing = smoothing
+        self.min_samples = min_samples
+        self.min_latency = min_latency
+        self.max_queue_wait = max_queue_wait
+
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._last_decrease = 0.0
+
+        self.baseline_latency: Optional[float] = None
+        self.last_latency: Optional[float] = None
+        self.samples = 0
+        self.slow_calls = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.increases = 0
+        self.decreases = 0
+
+    @property
+    def limit(self) -> int:
+        """Current number of calls allowed in flight."""
+        return int(self._limit)
+
+    async def acquire(self) -> float:
+        """
+        Wait for a slot.
+
+        Returns:
+            Monotonic start time, to be passed back to release()
+
+        Raises:
+            IntegrationError: If no slot freed up within max_queue_wait
+        """
+        if self.in_flight < self.limit and not self._waiters:
+            self.in_flight += 1
+            return time.monotonic()
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(waiter, self.max_queue_wait)
+        except asyncio.TimeoutError:
+            self.rejected += 1
+            raise IntegrationError(
+                service_name=self.name,
+                operation="concurrency_limit_exceeded",
+                context=ErrorContext(operation=f"concurrency_limit_{self.name}"),
+                remediation={
+                    "immediate_action": f"Backend saturated (limit {self.limit}); retry later",
+                    "fallback_strategy": "Use cached data or alternative service"
+                },
+                severity=ErrorSeverity.LOW
+            )
+        except asyncio.CancelledError:
+            # A slot handed over just before cancellation must go back
+            if waiter.done() and not waiter.cancelled():
+                self.release(time.monotonic(), IGNORED)
+            raise
+        finally:
+            if not waiter.done() or waiter.cancelled():
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+        return time.monotonic()
+
+    def release(self, started: float, outcome: str = SUCCESS) -> None:
+        """
+        Free a slot and adjust the limit.
+
+        Args:
+            started: Value returned by acquire()
+            outcome: SUCCESS to record the latency, DROPPED for a timeout or
+                backend failure, IGNORED to leave the limit alone
+        """
+        concurrency = self.in_flight
+        self.in_flight -= 1
+
+        if outcome == SUCCESS:
+            self._record_latency(time.monotonic() - started, started, concurrency)
+        elif outcome == DROPPED:
+            self.dropped += 1
+            self._decrease(started)
+
+        self._wake()
+
+    def _record_latency(self, latency: float, started: float, concurrency: int) -> None:
+        self.samples += 1
+        self.last_latency = latency
+        if self.baseline_latency is None:
+            self.baseline_latency = latency
+
+        slow_threshold = max(self.baseline_latency, self.min_latency) * self.latency_tolerance
+        if self.samples > self.min_samples and latency > slow_threshold:
+            self.slow_calls += 1
+            self._decrease(started)
+        elif concurrency >= self._limit / 2 and self._limit < self.max_limit:
+            # Only grow a limit that is actually being used
+            self._limit = min(self.max_limit, self._limit + 1 / self._limit)
+            self.increases += 1
+
+        # Slow samples still move the baseline, so a backend that became
+        # permanently slower is re-learnt rather than throttled forever
+        self.baseline_latency += self.smoothing * (latency - self.baseline_latency)
+
+    def _decrease(self, started: float) -> None:
+        # Calls already in flight at the last decrease report the same congestion
+        if started < self._last_decrease:
+            return
+        self._limit = max(self.min_limit, self._limit * self.backoff_ratio)
+        self._last_decrease = time.monotonic()
+        self.decreases += 1
+        logger.info(f"Concurrency limit for {self.name} reduced to {self.limit}")
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.limit:
+            waiter = self._waiters.popleft()
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(True)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Limit, queue and latency metrics."""
+        return {
+            'limit': self.limit,
+            'in_flight': self.in_flight,
+            'queued': len(self._waiters),
+            'rejected': self.rejected,
+            'dropped': self.dropped,
+            'slow_calls': self.slow_calls,
+            'increases': self.increases,
+            'decreases': self.decreases,
+            'baseline_latency_ms': round(self.baseline_latency * 1000, 1) if self.baseline_latency is not None else None,
+            'last_latency_ms': round(self.last_latency * 1000, 1) if self.last_latency is not None else None
+        }
+
+
+class RetryBudget:
+    """
+    Caps retries at a fraction of recent requests.
+
+    Retrying every failure multiplies the load on a backend that is already
+    struggling. The budget allows ``ratio`` retries per request over the last
+    ``window`` seconds, plus ``min_retries`` so a quiet endpoint can still retry.
+    """
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 3, window: float = 10.0):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.window = window
+        self._requests: Deque[float] = deque()
+        self._retries: Deque[float] = deque()
+
+    def record_request(self) -> None:
+        """Count a first attempt."""
+        now = time.monotonic()
+        self._prune(now)
+        self._requests.append(now)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if it is exhausted."""
+        now = time.monotonic()
+        self._prune(now)
+        if len(self._retries) >= self.min_retries + self.ratio * len(self._requests):
+            return False
+        self._retries.append(now)
+        return True
+
+    def _prune(self, now: float) -> None:
+        cutoff = now - self.window
+        for timestamps in (self._requests, self._retries):
+            while timestamps and timestamps[0] < cutoff:
+                timestamps.popleft()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Requests and retries in the current window."""
+        self._prune(time.monotonic())
+        return {
+            'window_requests': len(self._requests),
+            'window_retries': len(self._retries)
+        }
+
+
+_endpoints: "weakref.WeakSet[ResilientEndpoint]" = weakref.WeakSet()
+
+
+class ResilientEndpoint:
+    """
+    Circuit breaker, retry budget and adaptive concurrency for one backend.
+
+    A call first checks the breaker; an open circuit raises IntegrationError
+    at once so callers fall back without waiting on a degraded backend. It
+    then takes a slot from the concurrency limiter and runs with an optional
+    timeout. Transient errors are retried with full-jitter backoff while the
+    retry budget allows; otherwise the original exception is raised.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        breaker_config: Optional[CircuitBreakerConfig] = None,
+        limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        retry_budget: Optional[RetryBudget] = None,
+        max_attempts: int = 3,
+        base_delay: float = 0.1,
+        max_delay: float = 5.0,
+        timeout: Optional[float] = None,
+        is_retryable: Callable[[Exception], bool] = is_transient_error,
+        is_failure: Callable[[Exception], bool] = is_backend_failure
+    ):
+        """
+        Initialize the endpoint.
+
+        Args:
+            name: Backend name, used in logs, errors and exported stats
+            breaker_config: Circuit breaker settings; defaults open after 5
+                failures within a minute and probe again after 30 seconds
+            limiter: Concurrency limiter; defaults to an AIMD limit starting at 4
+            retry_budget: Retry budget; defaults to 20% of recent requests
+            max_attempts: Attempts per call, including the first
+            base_delay: Backoff ceiling for the first retry in seconds
+            max_delay: Backoff ceiling in seconds
+            timeout: Seconds allowed per attempt, None for no limit
+            is_retryable: Decides whether an error is retried
+            is_failure: Decides whether an error counts against the backend
+        """
+        self.name = name
+        self.breaker = CircuitBreaker(name, breaker_config or CircuitBreakerConfig(
+            failure_threshold=5,
+            success_threshold=1,
+            timeout=30.0,
+            monitor_window=60.0
+        ))
+        self.limiter = limiter or AdaptiveConcurrencyLimiter(name)
+        self.retry_budget = retry_budget or RetryBudget()
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.timeout = timeout
+        self.is_retryable = is_retryable
+        self.is_failure = is_failure
+
+        self.calls = 0
+        self.successes = 0
+        self.failures = 0
+        self.retries = 0
+        self.retries_denied = 0
+        self.short_circuited = 0
+
+        _endpoints.add(self)
+
+    @property
+    def is_available(self) -> bool:
+        """False while the circuit is open and calls would fail fast."""
+        return not self.breaker.is_open()
+
+    async def call(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Call a coroutine function against the backend.
+
+        Args:
+            func: Coroutine function performing the backend request
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            The function's result
+
+        Raises:
+            IntegrationError: If the circuit is open or no concurrency slot freed up
+            Exception: The last error from func once it is not retried
+        """
+        return await self._call(func, args, kwargs, self.max_attempts)
+
+    async def call_once(self, func: Callable[..., Awaitable[T]], *args, **kwargs) -> T:
+        """
+        Like call(), but never retried.
+
+        For writes that are not idempotent: a timed-out request may still
+        have been applied, so sending it again could duplicate it.
+        """
+        return await self._call(func, args, kwargs, 1)
+
+    async def _call(self, func: Callable[..., Awaitable[T]], args: tuple, kwargs: Dict[str, Any], max_attempts: int) -> T:
+        self.calls += 1
+        self.retry_budget.record_request()
+        attempt = 0
+
+        while True:
+            try:
+                await self.breaker.before_call()
+            except IntegrationError:
+                self.short_circuited += 1
+                raise
+
+            started = await self.limiter.acquire()
+            try:
+                if self.timeout:
+                    result = await asyncio.wait_for(func(*args, **kwargs), self.timeout)
+                else:
+                    result = await func(*args, **kwargs)
+            except Exception as e:
+                failure = self.is_failure(e)
+                self.limiter.release(started, DROPPED if failure else IGNORED)
+                if failure:
+                    self.failures += 1
+                    await self.breaker.record_failure(e)
+
+                if attempt + 1 >= max_attempts or not self.is_retryable(e):
+                    raise
+                if not self.retry_budget.try_spend():
+                    self.retries_denied += 1
+                    raise
+
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+                attempt += 1
+                self.retries += 1
+                logger.debug(f"Retrying {self.name} (attempt {attempt + 1}) in {delay:.2f}s after: {e}")
+                await asyncio.sleep(delay)
+                continue
+            except BaseException:
+                self.limiter.release(started, IGNORED)
+                raise
+
+            self.limiter.release(started, SUCCESS)
+            await self.breaker.record_success()
+            self.successes += 1
+            return result
+
+    def wrap(self, func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        """Return a coroutine function that calls func through this endpoint."""
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await self.call(func, *args, **kwargs)
+        return wrapper
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Breaker state, call counters and limiter metrics."""
+        breaker = self.breaker.state
+        return {
+            'name': self.name,
+            'state': breaker.state.value,
+            'recent_failures': len(breaker.failure_history),
+            'next_attempt': (
+                breaker.next_attempt_time.isoformat()
+                if self.breaker.is_open() and breaker.next_attempt_time else None
+            ),
+            'calls': self.calls,
+            'successes': self.successes,
+            'failures': self.failures,
+            'retries': self.retries,
+            'retries_denied': self.retries_denied,
+            'short_circuited': self.short_circuited,
+            'retry_budget': self.retry_budget.get_stats(),
+            'limiter': self.limiter.get_stats()
+        }
+
+
+def get_resilience_stats() -> List[Dict[str, Any]]:
+    """Stats of every live endpoint, sorted by name."""
+    return sorted((endpoint.get_stats() for endpoint in list(_endpoints)), key=lambda stats: stats['name'])
@@ -19,18 +19,83 @@ Examples
 >>> instructions = await engine.generate_task_instructions(task, agent)
 """
 
+import asyncio
 import json
 import os
 import sys
-from typing import List, Dict, Optional, Any, Union
+import weakref
+from typing import List, Dict, Optional, Any, Callable, Tuple, Union
 from datetime import datetime, timedelta
 
 import anthropic
+import httpx
 
 from src.core.models import (
     Task, WorkerStatus, ProjectState, 
     RiskLevel, Priority, BlockerReport, ProjectRisk
 )
+from src.core.resilience import AdaptiveConcurrencyLimiter, ResilientEndpoint
+from src.utils.llm_cache import LLMResponseCache, make_cache_key
+
+# Async clients shared by every engine running on the same event loop, so
+# all AI calls reuse one HTTP connection pool per API key (and client
+# implementation). An httpx pool is bound to the loop that opened its
+# connections, so each loop gets its own clients; clients created outside a
+# running loop are kept separately. Entries go away with their loop.
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[str, Any], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+_unbound_clients: Dict[Tuple[str, Any], Any] = {}
+
+
+def _get_shared_client(api_key: str, max_connections: int, **kwargs: Any) -> "anthropic.AsyncAnthropic":
+    """
+    Return the async Anthropic client shared on the running event loop.
+
+    Parameters
+    ----------
+    api_key : str
+        Anthropic API key
+    max_connections : int
+        Size of the HTTP connection pool
+    **kwargs
+        Extra client constructor arguments
+
+    Returns
+    -------
+    anthropic.AsyncAnthropic
+        Shared async client
+
+    Notes
+    -----
+    Only the first call for an API key on a loop configures the client;
+    ``max_connections`` and ``kwargs`` passed by later callers are ignored.
+    """
+    try:
+        clients = _shared_clients.setdefault(asyncio.get_running_loop(), {})
+    except RuntimeError:
+        clients = _unbound_clients
+    
+    key = (api_key, anthropic.AsyncAnthropic)
+    client = clients.get(key)
+    if client is None:
+        http_client = anthropic.DefaultAsyncHttpxClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections
+            )
+        )
+        client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client, **kwargs)
+        clients[key] = client
+    return client
+
+
+def _config_number(config: Any, key: str, default: float) -> float:
+    """Read a numeric config value, falling back to the default if it is not a number."""
+    try:
+        return float(config.get(key, default))
+    except (TypeError, ValueError):
+        return default
 
 
 class AIAnalysisEngine:
@@ -43,10 +108,18 @@ class AIAnalysisEngine:
     
     Attributes
     ----------
-    client : Optional[anthropic.Anthropic]
-        Anthropic API client, None if unavailable
+    client : Optional[anthropic.AsyncAnthropic]
+        Async Anthropic API client shared across engines, None if unavailable
     model : str
         Claude model to use for analysis
+    request_timeout : float
+        Seconds allowed for a single Claude call
+    max_concurrent_requests : int
+        Maximum Claude calls in flight from this engine
+    resilience : ResilientEndpoint
+        Circuit breaker and adaptive concurrency limit for Claude calls
+    response_cache : LLMResponseCache
+        Cache of Claude responses keyed by model, method and prompt
     prompts : Dict[str, str]
         Template prompts for different analysis types
     
@@ -60,6 +133,9 @@ class AIAnalysisEngine:
     -----
     Requires ANTHROPIC_API_KEY environment variable for AI features.
     Works in fallback mode without the API key.
+    
+    Claude is called through the async client, so a slow model response
+    never blocks the server's event loop.
     """
     
     def __init__(self) -> None:
@@ -70,11 +146,15 @@ class AIAnalysisEngine:
         approaches for different library versions.
         """
         # Initialize Anthropic client with better error handling
-        self.client: Optional[anthropic.Anthropic] = None
+        self.client: Optional[anthropic.AsyncAnthropic] = None
+        self.request_timeout: float = 60.0
+        self.max_concurrent_requests: int = 4
         try:
             # Get API key from config first, fall back to environment
             from src.config.config_loader import get_config
             config = get_config()
+            self.request_timeout = _config_number(config, 'ai.request_timeout', 60.0)
+            self.max_concurrent_requests = int(_config_number(config, 'ai.max_concurrent_requests', 4))
             api_key = config.get('ai.anthropic_api_key') or os.environ.get("ANTHROPIC_API_KEY")
             if not api_key:
                 print("⚠️  Anthropic API key not found - AI features will use fallback mode", file=sys.stderr)
@@ -83,13 +163,13 @@ class AIAnalysisEngine:
                 # Try different initialization approaches based on version
                 try:
                     # First try simple initialization
-                    self.client = anthropic.Anthropic(api_key=api_key)
+                    self.client = _get_shared_client(api_key, self.max_concurrent_requests)
                     print("✅ Anthropic client initialized successfully", file=sys.stderr)
                 except TypeError as te:
                     # If we get a TypeError about proxies, try with explicit None
                     if 'proxies' in str(te):
                         print("⚠️  Retrying Anthropic init with proxies=None", file=sys.stderr)
-                        self.client = anthropic.Anthropic(api_key=api_key, proxies=None)
+                        self.client = _get_shared_client(api_key, self.max_concurrent_requests, proxies=None)
                         print("✅ Anthropic client initialized with proxies=None", file=sys.stderr)
                     else:
                         raise te
@@ -101,6 +181,28 @@ class AIAnalysisEngine:
         
         self.model: str = config.get('ai.model', 'claude-3-5-sonnet-20241022') if 'config' in locals() else "claude-3-5-sonnet-20241022"  # Using Sonnet 3.5 for speed/cost balance
         
+        # Bounds concurrent Claude calls so bursts of agent requests queue
+        # here instead of opening unbounded connections
+        self._request_semaphore = asyncio.Semaphore(max(1, self.max_concurrent_requests))
+        
+        # Fails fast while Claude keeps failing, so callers use their
+        # rule-based fallbacks at once, and lowers the concurrency limit
+        # when responses slow down. The SDK already retries throttled and
+        # failed requests, so the endpoint does not retry on top of it.
+        self.resilience = ResilientEndpoint(
+            "anthropic",
+            limiter=AdaptiveConcurrencyLimiter(
+                "anthropic",
+                initial_limit=self.max_concurrent_requests,
+                max_limit=max(1, self.max_concurrent_requests),
+                latency_tolerance=3.0
+            ),
+            max_attempts=1
+        )
+        
+        # Identical prompts are answered from the response cache
+        self.response_cache = LLMResponseCache.from_config(config) if 'config' in locals() else LLMResponseCache()
+        
         # Analysis prompts
         self.prompts: Dict[str, str] = {
             "task_assignment": """You are an AI Project Manager analyzing task assignments.
@@ -202,10 +304,11 @@ Identify risks and provide JSON:
         
         # Test connection
         try:
-            response = self.client.messages.create(
+            response = await self.client.messages.create(
                 model=self.model,
                 max_tokens=10,
-                messages=[{"role": "user", "content": "test"}]
+                messages=[{"role": "user", "content": "test"}],
+                timeout=self.request_timeout
             )
             print("✅ AI Engine connection verified", file=sys.stderr)
         except Exception as e:
@@ -299,7 +402,7 @@ Identify risks and provide JSON:
         )
         
         try:
-            response = await self._call_claude(prompt)
+            response = await self._call_claude(prompt, method="match_task_to_agent", validate=json.loads)
             result = json.loads(response)
             
             # Find the recommended task
@@ -418,7 +521,7 @@ Identify risks and provide JSON:
         )
         
         try:
-            instructions = await self._call_claude(prompt)
+            instructions = await self._call_claude(prompt, method="generate_task_instructions")
             return instructions
         except Exception as e:
             print(f"AI instruction generation failed: {e}", file=sys.stderr)
@@ -568,7 +671,7 @@ Task Details:
         )
         
         try:
-            response = await self._call_claude(prompt)
+            response = await self._call_claude(prompt, method="analyze_blocker", validate=json.loads)
             return json.loads(response)
         except Exception as e:
             print(f"AI blocker analysis failed: {e}", file=sys.stderr)
@@ -687,7 +790,7 @@ Context: {context}
 Provide a helpful clarification that guides the developer."""
         
         try:
-            return await self._call_claude(prompt)
+            return await self._call_claude(prompt, method="generate_clarification")
         except Exception as e:
             print(f"AI clarification failed: {e}", file=sys.stderr)
             return f"Please clarify: {question}\n\nTask: {task.name}\nContext: {context}"
@@ -775,7 +878,7 @@ Provide a helpful clarification that guides the developer."""
         )
         
         try:
-            response = await self._call_claude(prompt)
+            response = await self._call_claude(prompt, method="analyze_project_risks", validate=json.loads)
             result = json.loads(response)
             
             # Convert to ProjectRisk objects
@@ -951,7 +1054,7 @@ Return JSON in this format:
 }}"""
         
         try:
-            response = await self._call_claude(prompt)
+            response = await self._call_claude(prompt, method="analyze_project_health", validate=json.loads)
             result = json.loads(response)
             return result
             
@@ -1101,10 +1204,9 @@ Return JSON with this exact format:
 
 Be specific and actionable. Each task should be self-contained and assignable to a developer."""
 
-            response = await self._call_claude(prompt)
-            
-            # Parse JSON response
+            # Parse JSON response; a reply that is not JSON is not cached
             try:
+                response = await self._call_claude(prompt, method="analyze_feature_request", validate=json.loads)
                 result = json.loads(response)
                 return result
             except json.JSONDecodeError:
@@ -1256,10 +1358,9 @@ Return JSON with this format:
     "rationale": "explanation of integration approach"
 }}"""
 
-            response = await self._call_claude(prompt)
-            
-            # Parse JSON response
+            # Parse JSON response; a reply that is not JSON is not cached
             try:
+                response = await self._call_claude(prompt, method="analyze_integration_points", validate=json.loads)
                 result = json.loads(response)
                 return result
             except json.JSONDecodeError:
@@ -1306,14 +1407,33 @@ Return JSON with this format:
             "rationale": "Based on task label matching and project progress"
         }
     
-    async def _call_claude(self, prompt: str) -> str:
+    async def _call_claude(
+        self,
+        prompt: str,
+        method: str = "call_claude",
+        validate: Optional[Callable[[str], Any]] = None
+    ) -> str:
         """
         Call Claude API with error handling.
         
+        Uses the async client so the event loop keeps serving other agents
+        while the model responds. At most ``max_concurrent_requests`` calls
+        run at once, fewer while Claude is slow, and each is bounded by
+        ``request_timeout``. While Claude keeps failing the call fails fast
+        with IntegrationError so callers fall back at once. Responses
+        are cached by model, method and normalized prompt, so a repeated
+        prompt is answered without calling the API.
+        
         Parameters
         ----------
         prompt : str
             The prompt to send to Claude
+        method : str, optional
+            Analysis the prompt belongs to; selects the cache TTL
+        validate : Callable[[str], Any], optional
+            Check run on a fresh response before it is cached, usually the
+            caller's parser. If it raises, the response is not cached and
+            the error propagates, so a malformed answer is not replayed.
         
         Returns
         -------
@@ -1323,24 +1443,39 @@ Return JSON with this format:
         Raises
         ------
         Exception
-            If the API call fails or client is unavailable
+            If the API call fails, the client is unavailable or ``validate``
+            rejects the response
         """
+        cache_key = make_cache_key(self.model, method, prompt)
+        cached = await self.response_cache.aget(cache_key, method)
+        if cached is not None:
+            return cached
+        
         if not self.client:
             raise Exception("Anthropic client not available")
         
         try:
-            response = self.client.messages.create(
+            response = await self.resilience.call(self._create_message, prompt)
+            text = response.content[0].text
+        except Exception as e:
+            print(f"Error calling Claude: {e}", file=sys.stderr)
+            raise
+        
+        if validate is not None:
+            validate(text)
+        await self.response_cache.aset(cache_key, method, text)
+        return text
+    
+    async def _create_message(self, prompt: str) -> Any:
+        """Send one Messages API request, holding a connection slot."""
+        async with self._request_semaphore:
+            return await self.client.messages.create(
                 model=self.model,
                 max_tokens=2000,
                 temperature=0.7,
                 messages=[{
                     "role": "user",
                     "content": prompt
-                }]
+                }],
+                timeout=self.request_timeout
             )
-            
-            return response.content[0].text
-            
-        except Exception as e:
-            print(f"Error calling Claude: {e}", file=sys.stderr)
-            raise
\ No newline at end of file
@@ -5,16 +5,113 @@ This module extends the SimpleMCPKanbanClient to add create_task functionality
 for creating new tasks on the kanban board.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
+from dataclasses import dataclass, field
 from datetime import datetime
+import asyncio
 import json
+import sys
+import time
 
 from src.integrations.mcp_kanban_client_simple import SimpleMCPKanbanClient
 from src.core.models import Task, TaskStatus, Priority
-from mcp import ClientSession, StdioServerParameters
-from mcp.client.stdio import stdio_client
+from src.core.error_strategies import ErrorAggregator
 import os
-from src.integrations.label_manager_helper import LabelManagerHelper
+from src.integrations.label_manager_helper import LabelManagerHelper, get_label_registry
+
+
+@dataclass
+class BulkTaskResult:
+    """
+    Outcome of creating one task in a bulk request.
+    
+    Attributes
+    ----------
+    index : int
+        Position of the task in the request
+    name : str
+        Task name
+    task : Optional[Task]
+        The created task, None if creation failed
+    error : Optional[Exception]
+        Why the card could not be created
+    label_failures : List[str]
+        Labels that could not be attached to the card
+    checklist_failures : List[str]
+        Checklist items that could not be added to the card
+    duration : float
+        Seconds spent creating the card and its details
+    """
+    index: int
+    name: str
+    task: Optional[Task] = None
+    error: Optional[Exception] = None
+    label_failures: List[str] = field(default_factory=list)
+    checklist_failures: List[str] = field(default_factory=list)
+    duration: float = 0.0
+    
+    @property
+    def succeeded(self) -> bool:
+        """Whether the card was created"""
+        return self.task is not None
+
+
+@dataclass
+class BulkCreationReport:
+    """
+    Per-task report of a bulk task creation.
+    
+    Attributes
+    ----------
+    results : List[BulkTaskResult]
+        One result per requested task, in request order
+    aggregator : ErrorAggregator
+        Successes and failures in the shape used for other batch operations
+    duration : float
+        Seconds spent on the whole request
+    """
+    results: List[BulkTaskResult]
+    aggregator: ErrorAggregator
+    duration: float = 0.0
+    
+    @property
+    def created_tasks(self) -> List[Task]:
+        """Tasks that were created, in request order"""
+        return [result.task for result in self.results if result.task is not None]
+    
+    @property
+    def failed(self) -> List[BulkTaskResult]:
+        """Results of tasks whose card could not be created"""
+        return [result for result in self.results if result.task is None]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Summarize the report.
+        
+        Returns
+        -------
+        Dict[str, Any]
+            ``ErrorAggregator.get_summary()`` plus per-task outcomes and
+            throughput
+        """
+        summary = self.aggregator.get_summary()
+        summary.update({
+            "duration_seconds": round(self.duration, 3),
+            "tasks_per_second": round(len(self.results) / self.duration, 2) if self.duration else 0.0,
+            "tasks": [
+                {
+                    "index": result.index,
+                    "name": result.name,
+                    "task_id": result.task.id if result.task else None,
+                    "success": result.succeeded,
+                    "error": str(result.error) if result.error else None,
+                    "label_failures": result.label_failures,
+                    "checklist_failures": result.checklist_failures,
+                }
+                for result in self.results
+            ],
+        })
+        return summary
 
 
 class KanbanClientWithCreate(SimpleMCPKanbanClient):
@@ -79,171 +176,267 @@ class KanbanClientWithCreate(SimpleMCPKanbanClient):
         >>> task = await client.create_task(task_data)
         >>> print(f"Created task: {task.name} with ID: {task.id}")
         """
-        if not self.board_id:
-            from src.core.error_framework import ConfigurationError, ErrorContext
+        self._require_board_id("create_task", task_data.get('name', 'unknown'))
+        
+        async with self._session_pool.get_session() as session:
+            # First, find the appropriate list to add the task to
+            target_list = await self._find_target_list(session, task_data.get('name', 'unknown'))
+            
+            created_card = await self._create_card(session, target_list, task_data)
+            
+            # Add labels if provided
+            if task_data.get("labels"):
+                await self._add_labels_to_card(session, created_card["id"], task_data["labels"])
+            
+            # Add subtasks/acceptance criteria if provided
+            checklist_items = self._build_checklist_items(task_data)
+            if checklist_items:
+                print(f"DEBUG: Adding {len(checklist_items)} checklist items to card")
+                await self._add_checklist_items(session, created_card["id"], checklist_items)
+            
+            # Add initial comment with task metadata
+            metadata_comment = self._build_metadata_comment(task_data)
+            if metadata_comment:
+                await self._call_tool(
+                    session,
+                    "mcp_kanban_comment_manager",
+                    {
+                        "action": "create",
+                        "cardId": created_card["id"],
+                        "text": metadata_comment
+                    }
+                )
+            
+            return self._build_task(created_card, target_list, task_data)
+    
+    def _require_board_id(self, operation: str, task_name: str) -> None:
+        """
+        Raise a ConfigurationError if no board is configured.
+        
+        Parameters
+        ----------
+        operation : str
+            Operation that needs the board
+        task_name : str
+            Task being created, for the error context
+        """
+        if self.board_id:
+            return
+        
+        from src.core.error_framework import ConfigurationError, ErrorContext
+        
+        raise ConfigurationError(
+            "Board ID must be set before creating tasks. "
+            "Check your marcus.config.json kanban configuration or ensure "
+            "the kanban client is properly initialized with a valid board.",
+            context=ErrorContext(
+                operation=operation,
+                integration_name="kanban_client_with_create",
+                custom_context={
+                    "task_name": task_name,
+                    "service_name": "Kanban Client",
+                    "config_type": "board configuration",
+                    "missing_field": "board_id"
+                }
+            )
+        )
+    
+    async def _find_target_list(self, session: Any, task_name: str) -> Dict[str, Any]:
+        """
+        Find the list new cards are added to.
+        
+        Parameters
+        ----------
+        session : Any
+            MCP client session
+        task_name : str
+            Task being created, for the error context
+            
+        Returns
+        -------
+        Dict[str, Any]
+            The Backlog or TODO list, or the first list of the board
+            
+        Raises
+        ------
+        KanbanIntegrationError
+            If the board has no lists
+        """
+        # Default to "Backlog" or "TODO" list
+        lists_result = await self._call_tool(
+            session,
+            "mcp_kanban_list_manager",
+            {
+                "action": "get_all",
+                "boardId": self.board_id
+            }
+        )
+        
+        target_list = None
+        if lists_result and hasattr(lists_result, 'content') and lists_result.content:
+            lists_data = json.loads(lists_result.content[0].text)
+            lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
+            
+            # Look for Backlog or TODO list
+            for lst in lists:
+                list_name_lower = lst.get("name", "").lower()
+                if "backlog" in list_name_lower or "todo" in list_name_lower:
+                    target_list = lst
+                    break
             
-            raise ConfigurationError(
-                "Board ID must be set before creating tasks. "
-                "Check your marcus.config.json kanban configuration or ensure "
-                "the kanban client is properly initialized with a valid board.",
+            # If no backlog/todo list found, use the first list
+            if not target_list and lists:
+                target_list = lists[0]
+        
+        if not target_list:
+            from src.core.error_framework import KanbanIntegrationError, ErrorContext
+            
+            raise KanbanIntegrationError(
+                board_name=str(self.board_id),
+                operation="find_target_list",
                 context=ErrorContext(
                     operation="create_task",
                     integration_name="kanban_client_with_create",
                     custom_context={
-                        "task_name": task_data.get('name', 'unknown'),
-                        "service_name": "Kanban Client",
-                        "config_type": "board configuration",
-                        "missing_field": "board_id"
+                        "board_id": str(self.board_id),
+                        "task_name": task_name,
+                        "details": f"No suitable list found for new tasks on board {self.board_id}. "
+                                  f"Expected a list named 'Backlog' or 'TODO', or at least one list to exist. "
+                                  f"Please check that your kanban board is properly configured with lists."
                     }
                 )
             )
         
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
+        return target_list
+    
+    async def _create_card(
+        self, session: Any, target_list: Dict[str, Any], task_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Create the card for a task.
+        
+        Parameters
+        ----------
+        session : Any
+            MCP client session
+        target_list : Dict[str, Any]
+            List to add the card to
+        task_data : Dict[str, Any]
+            Task information
+            
+        Returns
+        -------
+        Dict[str, Any]
+            The created card
+            
+        Raises
+        ------
+        KanbanIntegrationError
+            If the card could not be created
+        """
+        card_name = task_data.get("name", "Untitled Task")
+        card_description = task_data.get("description", "")
+        
+        create_result = await self._call_tool(
+            session,
+            "mcp_kanban_card_manager",
+            {
+                "action": "create",
+                "listId": target_list["id"],
+                "name": card_name,
+                "description": card_description,
+                "position": 65535  # Add at end of list
+            }
         )
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                # First, find the appropriate list to add the task to
-                # Default to "Backlog" or "TODO" list
-                lists_result = await session.call_tool(
-                    "mcp_kanban_list_manager",
-                    {
-                        "action": "get_all",
-                        "boardId": self.board_id
-                    }
-                )
-                
-                target_list = None
-                if lists_result and hasattr(lists_result, 'content') and lists_result.content:
-                    lists_data = json.loads(lists_result.content[0].text)
-                    lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
-                    
-                    # Look for Backlog or TODO list
-                    for lst in lists:
-                        list_name_lower = lst.get("name", "").lower()
-                        if "backlog" in list_name_lower or "todo" in list_name_lower:
-                            target_list = lst
-                            break
-                    
-                    # If no backlog/todo list found, use the first list
-                    if not target_list and lists:
-                        target_list = lists[0]
-                
-                if not target_list:
-                    from src.core.error_framework import KanbanIntegrationError, ErrorContext
-                    
-                    raise KanbanIntegrationError(
-                        board_name=str(self.board_id),
-                        operation="find_target_list",
-                        context=ErrorContext(
-                            operation="create_task",
-                            integration_name="kanban_client_with_create",
-                            custom_context={
-                                "board_id": str(self.board_id),
-                                "task_name": task_data.get('name', 'unknown'),
-                                "details": f"No suitable list found for new tasks on board {self.board_id}. "
-                                          f"Expected a list named 'Backlog' or 'TODO', or at least one list to exist. "
-                                          f"Please check that your kanban board is properly configured with lists."
-                            }
-                        )
-                    )
-                
-                # Prepare card data
-                card_name = task_data.get("name", "Untitled Task")
-                card_description = task_data.get("description", "")
-                
-                # Create the card
-                create_result = await session.call_tool(
-                    "mcp_kanban_card_manager",
-                    {
-                        "action": "create",
-                        "listId": target_list["id"],
-                        "name": card_name,
-                        "description": card_description,
-                        "position": 65535  # Add at end of list
+        if not create_result or not hasattr(create_result, 'content'):
+            from src.core.error_framework import KanbanIntegrationError, ErrorContext
+            
+            raise KanbanIntegrationError(
+                board_name=str(self.board_id),
+                operation="create_card",
+                context=ErrorContext(
+                    operation="create_task",
+                    integration_name="kanban_client_with_create",
+                    custom_context={
+                        "board_id": str(self.board_id),
+                        "task_name": card_name,
+                        "list_id": target_list["id"] if target_list else None,
+                        "details": f"Failed to create card '{card_name}' on board {self.board_id}. "
+                                  f"The kanban-mcp server may be down, the board may not exist, "
+                                  f"or there may be permission issues. Check kanban-mcp server logs."
                     }
                 )
-                
-                if not create_result or not hasattr(create_result, 'content'):
-                    from src.core.error_framework import KanbanIntegrationError, ErrorContext
-                    
-                    raise KanbanIntegrationError(
-                        board_name=str(self.board_id),
-                        operation="create_card",
-                        context=ErrorContext(
-                            operation="create_task",
-                            integration_name="kanban_client_with_create",
-                            custom_context={
-                                "board_id": str(self.board_id),
-                                "task_name": card_name,
-                                "list_id": target_list["id"] if target_list else None,
-                                "details": f"Failed to create card '{card_name}' on board {self.board_id}. "
-                                          f"The kanban-mcp server may be down, the board may not exist, "
-                                          f"or there may be permission issues. Check kanban-mcp server logs."
-                            }
-                        )
-                    )
-                
-                # Parse the created card
-                created_card_data = json.loads(create_result.content[0].text)
-                created_card = created_card_data if isinstance(created_card_data, dict) else created_card_data.get("item", {})
-                
-                # Add labels if provided
-                if task_data.get("labels"):
-                    await self._add_labels_to_card(session, created_card["id"], task_data["labels"])
-                
-                # Add subtasks/acceptance criteria if provided
-                if task_data.get("acceptance_criteria") or task_data.get("subtasks"):
-                    checklist_items = []
-                    
-                    # Add acceptance criteria as checklist items
-                    if task_data.get("acceptance_criteria"):
-                        print(f"DEBUG: Found {len(task_data['acceptance_criteria'])} acceptance criteria for task '{card_name}'")
-                        for criteria in task_data["acceptance_criteria"]:
-                            checklist_items.append(f"✓ {criteria}")
-                    
-                    # Add subtasks as checklist items
-                    if task_data.get("subtasks"):
-                        print(f"DEBUG: Found {len(task_data['subtasks'])} subtasks for task '{card_name}'")
-                        for subtask in task_data["subtasks"]:
-                            checklist_items.append(f"• {subtask}")
-                    
-                    if checklist_items:
-                        print(f"DEBUG: Adding {len(checklist_items)} checklist items to card")
-                        await self._add_checklist_items(session, created_card["id"], checklist_items)
-                
-                # Add initial comment with task metadata
-                metadata_comment = self._build_metadata_comment(task_data)
-                if metadata_comment:
-                    await session.call_tool(
-                        "mcp_kanban_comment_manager",
-                        {
-                            "action": "create",
-                            "cardId": created_card["id"],
-                            "text": metadata_comment
-                        }
-                    )
-                
-                # Convert the created card to a Task object
-                created_card["listName"] = target_list.get("name", "")
-                task = self._card_to_task(created_card)
-                
-                # Override with provided data
-                if "priority" in task_data:
-                    task.priority = self._parse_priority(task_data["priority"])
-                if "estimated_hours" in task_data:
-                    task.estimated_hours = float(task_data["estimated_hours"])
-                if "labels" in task_data:
-                    task.labels = task_data["labels"]
-                if "dependencies" in task_data:
-                    task.dependencies = task_data["dependencies"]
-                
-                return task
+            )
+        
+        created_card_data = json.loads(create_result.content[0].text)
+        return created_card_data if isinstance(created_card_data, dict) else created_card_data.get("item", {})
+    
+    def _build_task(
+        self, created_card: Dict[str, Any], target_list: Dict[str, Any], task_data: Dict[str, Any]
+    ) -> Task:
+        """
+        Convert a created card to a Task, overriding fields from the request.
+        
+        Parameters
+        ----------
+        created_card : Dict[str, Any]
+            The card returned by the board
+        target_list : Dict[str, Any]
+            List the card was added to
+        task_data : Dict[str, Any]
+            Task information the card was created from
+            
+        Returns
+        -------
+        Task
+            The created task
+        """
+        created_card["listName"] = target_list.get("name", "")
+        task = self._card_to_task(created_card)
+        
+        # Override with provided data
+        if "priority" in task_data:
+            task.priority = self._parse_priority(task_data["priority"])
+        if "estimated_hours" in task_data:
+            task.estimated_hours = float(task_data["estimated_hours"])
+        if "labels" in task_data:
+            task.labels = task_data["labels"]
+        if "dependencies" in task_data:
+            task.dependencies = task_data["dependencies"]
+        
+        return task
+    
+    def _build_checklist_items(self, task_data: Dict[str, Any]) -> List[str]:
+        """
+        Build checklist item names from acceptance criteria and subtasks.
+        
+        Parameters
+        ----------
+        task_data : Dict[str, Any]
+            Task information
+            
+        Returns
+        -------
+        List[str]
+            Acceptance criteria followed by subtasks
+        """
+        checklist_items = []
+        card_name = task_data.get("name", "Untitled Task")
+        
+        # Add acceptance criteria as checklist items
+        if task_data.get("acceptance_criteria"):
+            print(f"DEBUG: Found {len(task_data['acceptance_criteria'])} acceptance criteria for task '{card_name}'")
+            for criteria in task_data["acceptance_criteria"]:
+                checklist_items.append(f"✓ {criteria}")
+        
+        # Add subtasks as checklist items
+        if task_data.get("subtasks"):
+            print(f"DEBUG: Found {len(task_data['subtasks'])} subtasks for task '{card_name}'")
+            for subtask in task_data["subtasks"]:
+                checklist_items.append(f"• {subtask}")
+        
+        return checklist_items
     
     def _parse_priority(self, priority_str: str) -> Priority:
         """
@@ -352,7 +545,8 @@ class KanbanClientWithCreate(SimpleMCPKanbanClient):
             position = 65536
             for item in items:
                 try:
-                    result = await session.call_tool(
+                    result = await self._call_tool(
+                        session,
                         "mcp_kanban_task_manager",
                         {
                             "action": "create",
@@ -385,22 +579,204 @@ class KanbanClientWithCreate(SimpleMCPKanbanClient):
         Returns
         -------
         list[Task]
-            List of created Task objects
+            List of created Task objects, in request order
             
         Notes
         -----
-        This method creates tasks sequentially to maintain order and
-        handle dependencies properly.
+        Tasks are created concurrently through ``create_tasks_bulk``; tasks
+        that fail are left out of the result. Use ``create_tasks_bulk``
+        directly for the per-task report.
+        """
+        try:
+            report = await self.create_tasks_bulk(tasks_data)
+        except Exception as e:
+            print(f"Failed to create tasks: {str(e)}", file=sys.stderr)
+            return []
+        
+        for result in report.failed:
+            print(f"Failed to create task '{result.name}': {str(result.error)}", file=sys.stderr)
+        
+        return report.created_tasks
+    
+    async def create_tasks_bulk(
+        self,
+        tasks_data: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> BulkCreationReport:
+        """
+        Create many tasks concurrently over the session pool.
+        
+        The target list is looked up and every distinct label is created
+        once for the whole request. Cards are then created with at most
+        ``max_concurrency`` in flight, each on a pooled session, and the
+        labels, checklist items and metadata comment of a card are written
+        concurrently instead of one call at a time.
+        
+        Parameters
+        ----------
+        tasks_data : List[Dict[str, Any]]
+            Task data dictionaries, as accepted by ``create_task``
+        max_concurrency : Optional[int]
+            Cards created at once; defaults to the session pool size
+            
+        Returns
+        -------
+        BulkCreationReport
+            Per-task outcome, in request order
+            
+        Raises
+        ------
+        ConfigurationError
+            If board_id is not set
+        KanbanIntegrationError
+            If the board has no list to add cards to
+        """
+        started = time.perf_counter()
+        aggregator = ErrorAggregator("create_tasks_bulk")
+        if not tasks_data:
+            return BulkCreationReport(results=[], aggregator=aggregator)
+        
+        self._require_board_id("create_tasks_bulk", tasks_data[0].get('name', 'unknown'))
+        
+        async with self._session_pool.get_session() as session:
+            target_list = await self._find_target_list(session, tasks_data[0].get('name', 'unknown'))
+            label_ids = await self._ensure_labels(
+                session,
+                [label for task_data in tasks_data for label in task_data.get("labels") or []]
+            )
+        
+        limit = max_concurrency or self._session_pool.max_sessions
+        semaphore = asyncio.Semaphore(max(1, limit))
+        
+        async def create_one(index: int, task_data: Dict[str, Any]) -> BulkTaskResult:
+            result = BulkTaskResult(index=index, name=task_data.get("name", "Untitled Task"))
+            task_started = time.perf_counter()
+            async with semaphore:
+                try:
+                    async with self._session_pool.get_session() as session:
+                        result.task, result.label_failures, result.checklist_failures = (
+                            await self._create_task_pipelined(session, target_list, task_data, label_ids)
+                        )
+                except Exception as e:
+                    result.error = e
+            result.duration = time.perf_counter() - task_started
+            return result
+        
+        results = await asyncio.gather(
+            *(create_one(index, task_data) for index, task_data in enumerate(tasks_data))
+        )
+        
+        for result in results:
+            if result.succeeded:
+                aggregator.add_success()
+            else:
+                aggregator.add_error(result.error, {"index": result.index, "task_name": result.name})
+        
+        report = BulkCreationReport(
+            results=list(results),
+            aggregator=aggregator,
+            duration=time.perf_counter() - started
+        )
+        print(
+            f"Bulk task creation: {aggregator.successes}/{len(tasks_data)} created "
+            f"in {report.duration:.1f}s",
+            file=sys.stderr
+        )
+        return report
+    
+    async def _ensure_labels(self, session: Any, labels: List[str]) -> Dict[str, str]:
         """
-        created_tasks = []
-        
-        for task_data in tasks_data:
-            try:
-                task = await self.create_task(task_data)
-                created_tasks.append(task)
-            except Exception as e:
-                print(f"Failed to create task '{task_data.get('name', 'Unknown')}': {str(e)}")
-                # Continue with other tasks even if one fails
+        Make sure every label exists on the board, creating missing ones.
+        
+        Parameters
+        ----------
+        session : Any
+            MCP client session
+        labels : List[str]
+            Label names, possibly repeated
+            
+        Returns
+        -------
+        Dict[str, str]
+            Lower-cased label name to label ID for every label that exists
+        """
+        # The board's shared label registry is listed at most once, and
+        # missing labels are created concurrently
+        return await LabelManagerHelper(session, self.board_id).resolve_labels(labels)
+    
+    async def _create_task_pipelined(
+        self,
+        session: Any,
+        target_list: Dict[str, Any],
+        task_data: Dict[str, Any],
+        label_ids: Dict[str, str]
+    ) -> Tuple[Task, List[str], List[str]]:
+        """
+        Create one card and write its labels, checklist and comment concurrently.
+        
+        Parameters
+        ----------
+        session : Any
+            MCP client session
+        target_list : Dict[str, Any]
+            List to add the card to
+        task_data : Dict[str, Any]
+            Task information
+        label_ids : Dict[str, str]
+            Lower-cased label name to label ID, from ``_ensure_labels``
+            
+        Returns
+        -------
+        Tuple[Task, List[str], List[str]]
+            The created task, labels that could not be attached and
+            checklist items that could not be added
+        """
+        created_card = await self._create_card(session, target_list, task_data)
+        card_id = created_card["id"]
+        
+        writes: List[Tuple[str, str, Any]] = []
+        label_failures: List[str] = []
+        
+        for label in task_data.get("labels") or []:
+            label_id = label_ids.get(label.lower())
+            if label_id is None:
+                label_failures.append(label)
+                continue
+            writes.append(("label", label, self._call_tool(
+                session,
+                "mcp_kanban_label_manager",
+                {"action": "add_to_card", "cardId": card_id, "labelId": label_id}
+            )))
+        
+        # Positions are fixed up front so items keep their order on the card
+        for position, item in enumerate(self._build_checklist_items(task_data), start=1):
+            writes.append(("checklist", item, self._call_tool(
+                session,
+                "mcp_kanban_task_manager",
+                {"action": "create", "cardId": card_id, "name": item, "position": position * 65536}
+            )))
+        
+        metadata_comment = self._build_metadata_comment(task_data)
+        if metadata_comment:
+            writes.append(("comment", metadata_comment, self._call_tool(
+                session,
+                "mcp_kanban_comment_manager",
+                {"action": "create", "cardId": card_id, "text": metadata_comment}
+            )))
+        
+        outcomes = await asyncio.gather(*(call for _, _, call in writes), return_exceptions=True)
+        
+        checklist_failures: List[str] = []
+        for (kind, name, _), outcome in zip(writes, outcomes):
+            if not isinstance(outcome, Exception):
                 continue
+            # Detail writes never fail the task, as in create_task
+            print(f"Failed to add {kind} '{name[:30]}' to card {card_id}: {outcome}", file=sys.stderr)
+            if kind == "label":
+                label_failures.append(name)
+                # The label may have been deleted since the registry listed it
+                get_label_registry(self.board_id).invalidate()
+            elif kind == "checklist":
+                checklist_failures.append(name)
         
-        return created_tasks
\ No newline at end of file
+        return self._build_task(created_card, target_list, task_data), label_failures, checklist_failures
@@ -7,10 +7,118 @@ specific requirements of the kanban-mcp label manager including:
 - Using proper color names from the allowed enum
 - Creating labels before adding them to cards
 - Managing label IDs for card operations
+
+Labels are cached per board in a ``BoardLabelRegistry`` shared by every
+helper for that board, so the board's labels are listed once rather than
+once per session or task. The listing expires after a TTL, and a label
+missing from an older listing is looked up again before it is created, so
+labels added by other processes are reused rather than duplicated.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
 import json
+import sys
+import time
+
+# Seconds a board's label listing is trusted before it is listed again
+LABEL_REGISTRY_TTL = 300.0
+
+
+class BoardLabelRegistry:
+    """
+    Labels of one board, shared by every LabelManagerHelper for the board.
+    
+    The registry is warmed with a single label listing, which is trusted
+    for ``ttl`` seconds. Labels created afterwards are added to it, and
+    concurrent requests for the same missing label share one creation call.
+    
+    Parameters
+    ----------
+    board_id : str
+        ID of the board the labels belong to
+    ttl : float
+        Seconds a listing stays fresh
+    """
+    
+    def __init__(self, board_id: str, ttl: float = LABEL_REGISTRY_TTL):
+        self.board_id = board_id
+        self.ttl = ttl
+        self.labels: Dict[str, Dict[str, Any]] = {}  # lower-cased name -> label data
+        self.warmed = False
+        self.warmed_at = 0.0
+        self.generation = 0  # Bumped by every listing
+        self.color_checked: set = set()
+        self._warming: Optional[asyncio.Future] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.stats = {"refreshes": 0, "hits": 0, "created": 0, "color_updates": 0}
+    
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Whether the cached listing can be used without listing the board again."""
+        now = time.monotonic() if now is None else now
+        return self.warmed and now - self.warmed_at < self.ttl
+    
+    def mark_listed(self) -> None:
+        """Record that the labels were just listed from the board."""
+        self.warmed = True
+        self.warmed_at = time.monotonic()
+        self.generation += 1
+        self.color_checked.clear()
+        self.stats["refreshes"] += 1
+    
+    def invalidate(self) -> None:
+        """Re-list the board's labels on next use."""
+        self.warmed = False
+        self.color_checked.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Registry size and round trips saved.
+        
+        Returns
+        -------
+        Dict[str, Any]
+            Cached label count, warm state and operation counters
+        """
+        return {"board_id": self.board_id, "labels": len(self.labels), "warmed": self.warmed, **self.stats}
+
+
+_registries: Dict[str, BoardLabelRegistry] = {}
+
+
+def get_label_registry(board_id: str) -> BoardLabelRegistry:
+    """
+    Get the shared label registry of a board.
+    
+    Registries of other boards whose listing has expired, and that are not
+    in use, are dropped so boards that are no longer used do not pile up.
+    
+    Parameters
+    ----------
+    board_id : str
+        ID of the board
+        
+    Returns
+    -------
+    BoardLabelRegistry
+        The board's registry, created on first use
+    """
+    key = str(board_id)
+    now = time.monotonic()
+    for other_key, other in list(_registries.items()):
+        if (other_key != key and not other.is_fresh(now)
+                and other._warming is None and not other._pending):
+            del _registries[other_key]
+    
+    registry = _registries.get(key)
+    if registry is None:
+        registry = _registries[key] = BoardLabelRegistry(key)
+    return registry
+
+
+def clear_label_registries() -> None:
+    """Forget every board's cached labels."""
+    _registries.clear()
 
 
 class LabelManagerHelper:
@@ -73,7 +181,10 @@ class LabelManagerHelper:
         "infrastructure": "tank-green"
     }
     
-    def __init__(self, session, board_id: str):
+    # Labels attached to a card concurrently
+    ATTACH_BATCH_SIZE = 8
+    
+    def __init__(self, session, board_id: str, registry: Optional[BoardLabelRegistry] = None):
         """
         Initialize the label manager helper.
         
@@ -83,10 +194,13 @@ class LabelManagerHelper:
             Active MCP client session
         board_id : str
             ID of the board to manage labels for
+        registry : Optional[BoardLabelRegistry]
+            Label cache to use; defaults to the board's shared registry
         """
         self.session = session
         self.board_id = board_id
-        self._label_cache = {}  # Cache of label name -> label data
+        self.registry = registry or get_label_registry(board_id)
+        self._label_cache = self.registry.labels  # Cache of label name -> label data
     
     async def refresh_labels(self) -> List[Dict[str, Any]]:
         """
@@ -116,9 +230,29 @@ class LabelManagerHelper:
                 name = label.get('name', '').lower()
                 if name:
                     self._label_cache[name] = label
+            self.registry.mark_listed()
         
         return labels
     
+    async def warm(self, force: bool = False) -> None:
+        """
+        List the board's labels unless the shared registry has a fresh listing.
+        
+        Concurrent callers wait for the same listing.
+        
+        Parameters
+        ----------
+        force : bool
+            List the labels even if the registry's listing is still fresh
+        """
+        if not force and self.registry.is_fresh():
+            return
+        if self.registry._warming is None:
+            warming = asyncio.ensure_future(self.refresh_labels())
+            self.registry._warming = warming
+            warming.add_done_callback(lambda _: setattr(self.registry, '_warming', None))
+        await asyncio.shield(self.registry._warming)
+    
     async def ensure_label_exists(self, name: str, color: Optional[str] = None) -> str:
         """
         Ensure a label exists, creating it if necessary.
@@ -140,65 +274,112 @@ class LabelManagerHelper:
         ValueError
             If the color is not in the valid colors list
         """
-        # Normalize name
+        generation = self.registry.generation
+        await self.warm()
+        return await self._ensure_warmed_label(name, color, generation)
+    
+    async def _ensure_warmed_label(self, name: str, color: Optional[str], generation: int) -> str:
+        """
+        Look a label up in the warmed registry, creating it if the board lacks it.
+        
+        Parameters
+        ----------
+        name : str
+            Name of the label
+        color : Optional[str]
+            Color for a created label
+        generation : int
+            Registry generation when the caller started; a listing made
+            since then is fresh enough to trust a miss
+            
+        Returns
+        -------
+        str
+            ID of the label
+        """
         normalized_name = name.lower()
         
-        # Check cache first
-        if normalized_name in self._label_cache:
-            cached_label = self._label_cache[normalized_name]
-            # Verify the color is correct
-            expected_color = self.get_color_for_label(name)
-            if cached_label['color'] != expected_color:
-                # Update the label color
-                print(f"Updating label '{name}' color from {cached_label['color']} to {expected_color}")
-                try:
-                    update_result = await self.session.call_tool(
-                        "mcp_kanban_label_manager",
-                        {
-                            "action": "update",
-                            "id": cached_label['id'],
-                            "boardId": self.board_id,
-                            "name": name,
-                            "color": expected_color,
-                            "position": cached_label.get('position', 65536)
-                        }
-                    )
-                    if update_result and hasattr(update_result, 'content') and update_result.content:
-                        updated_label = json.loads(update_result.content[0].text)
-                        self._label_cache[normalized_name] = updated_label
-                except Exception as e:
-                    print(f"Failed to update label color: {e}")
-            return cached_label['id']
+        if normalized_name not in self._label_cache and self.registry.generation == generation:
+            # The listing predates this request and another process may have
+            # created the label since; concurrent misses share one re-list
+            await self.warm(force=True)
         
-        # Refresh cache and check again
-        await self.refresh_labels()
         if normalized_name in self._label_cache:
-            cached_label = self._label_cache[normalized_name]
-            # Verify the color is correct
-            expected_color = self.get_color_for_label(name)
-            if cached_label['color'] != expected_color:
-                # Update the label color
-                print(f"Updating label '{name}' color from {cached_label['color']} to {expected_color}")
-                try:
-                    update_result = await self.session.call_tool(
-                        "mcp_kanban_label_manager",
-                        {
-                            "action": "update",
-                            "id": cached_label['id'],
-                            "boardId": self.board_id,
-                            "name": name,
-                            "color": expected_color,
-                            "position": cached_label.get('position', 65536)
-                        }
-                    )
-                    if update_result and hasattr(update_result, 'content') and update_result.content:
-                        updated_label = json.loads(update_result.content[0].text)
-                        self._label_cache[normalized_name] = updated_label
-                except Exception as e:
-                    print(f"Failed to update label color: {e}")
+            self.registry.stats["hits"] += 1
+            return await self._sync_label_color(name, self._label_cache[normalized_name])
+        
+        # Need to create the label, once however many callers ask for it
+        pending = self.registry._pending.get(normalized_name)
+        if pending is None:
+            pending = asyncio.ensure_future(self._create_label(name, color))
+            self.registry._pending[normalized_name] = pending
+            pending.add_done_callback(lambda _: self.registry._pending.pop(normalized_name, None))
+        return await asyncio.shield(pending)
+    
+    async def _sync_label_color(self, name: str, cached_label: Dict[str, Any]) -> str:
+        """
+        Update a cached label's color if it differs from the default mapping.
+        
+        Each label is checked once per registry warm-up.
+        
+        Parameters
+        ----------
+        name : str
+            Name of the label
+        cached_label : Dict[str, Any]
+            The label as cached in the registry
+            
+        Returns
+        -------
+        str
+            ID of the label
+        """
+        normalized_name = name.lower()
+        if normalized_name in self.registry.color_checked:
             return cached_label['id']
+        self.registry.color_checked.add(normalized_name)
+        
+        # Verify the color is correct
+        expected_color = self.get_color_for_label(name)
+        if cached_label['color'] != expected_color:
+            # Update the label color
+            print(f"Updating label '{name}' color from {cached_label['color']} to {expected_color}", file=sys.stderr)
+            try:
+                update_result = await self.session.call_tool(
+                    "mcp_kanban_label_manager",
+                    {
+                        "action": "update",
+                        "id": cached_label['id'],
+                        "boardId": self.board_id,
+                        "name": name,
+                        "color": expected_color,
+                        "position": cached_label.get('position', 65536)
+                    }
+                )
+                if update_result and hasattr(update_result, 'content') and update_result.content:
+                    updated_label = json.loads(update_result.content[0].text)
+                    self._label_cache[normalized_name] = updated_label
+                    self.registry.stats["color_updates"] += 1
+            except Exception as e:
+                print(f"Failed to update label color: {e}", file=sys.stderr)
+        return cached_label['id']
+    
+    async def _create_label(self, name: str, color: Optional[str] = None) -> str:
+        """
+        Create a label on the board and add it to the registry.
         
-        # Need to create the label
+        Parameters
+        ----------
+        name : str
+            Name of the label
+        color : Optional[str]
+            Color for the label; defaults to the mapping for its name
+            
+        Returns
+        -------
+        str
+            ID of the created label
+        """
         if color is None:
             # Use the class method for consistency
             color = self.get_color_for_label(name)
@@ -222,11 +403,50 @@ class LabelManagerHelper:
         if result and hasattr(result, 'content') and result.content:
             created_label = json.loads(result.content[0].text)
             # Update cache
-            self._label_cache[normalized_name] = created_label
+            self._label_cache[name.lower()] = created_label
+            self.registry.color_checked.add(name.lower())
+            self.registry.stats["created"] += 1
             return created_label['id']
         else:
             raise Exception(f"Failed to create label '{name}'")
     
+    async def resolve_labels(self, label_names: List[str]) -> Dict[str, str]:
+        """
+        Resolve many labels to IDs, creating missing ones concurrently.
+        
+        Parameters
+        ----------
+        label_names : List[str]
+            Label names, possibly repeated
+            
+        Returns
+        -------
+        Dict[str, str]
+            Lower-cased label name to label ID for every label that exists
+        """
+        generation = self.registry.generation
+        await self.warm()
+        
+        names: Dict[str, str] = {}
+        for label_name in label_names:
+            names.setdefault(label_name.lower(), label_name)
+        
+        outcomes = await asyncio.gather(
+            *(
+                self._ensure_warmed_label(label_name, None, generation)
+                for label_name in names.values()
+            ),
+            return_exceptions=True
+        )
+        
+        label_ids: Dict[str, str] = {}
+        for (key, label_name), outcome in zip(names.items(), outcomes):
+            if isinstance(outcome, Exception):
+                print(f"Warning: Failed to create label '{label_name}': {outcome}", file=sys.stderr)
+            else:
+                label_ids[key] = outcome
+        return label_ids
+    
     async def add_labels_to_card(self, card_id: str, label_names: List[str]) -> List[str]:
         """
         Add multiple labels to a card, creating them if necessary.
@@ -243,27 +463,69 @@ class LabelManagerHelper:
         List[str]
             List of label IDs that were successfully added
         """
-        added_label_ids = []
+        label_ids = await self.resolve_labels(label_names)
         
+        to_attach: List[Tuple[str, str]] = []
+        seen = set()
         for label_name in label_names:
-            try:
-                # Ensure label exists and get its ID
-                label_id = await self.ensure_label_exists(label_name)
-                
-                # Add label to card
-                await self.session.call_tool(
-                    "mcp_kanban_label_manager",
-                    {
-                        "action": "add_to_card",
-                        "cardId": card_id,
-                        "labelId": label_id
-                    }
-                )
-                
-                added_label_ids.append(label_id)
-                
-            except Exception as e:
-                print(f"Warning: Failed to add label '{label_name}' to card: {e}")
+            label_id = label_ids.get(label_name.lower())
+            if label_id is not None and label_id not in seen:
+                seen.add(label_id)
+                to_attach.append((label_name, label_id))
+        
+        return await self.attach_labels(card_id, to_attach)
+    
+    async def attach_labels(
+        self,
+        card_id: str,
+        labels: List[Tuple[str, str]],
+        batch_size: Optional[int] = None
+    ) -> List[str]:
+        """
+        Attach existing labels to a card in parallel batches.
+        
+        A failed attachment marks the registry stale, in case the label was
+        deleted from the board since it was listed.
+        
+        Parameters
+        ----------
+        card_id : str
+            ID of the card to add labels to
+        labels : List[Tuple[str, str]]
+            (label name, label ID) pairs
+        batch_size : Optional[int]
+            Labels attached at once; defaults to ATTACH_BATCH_SIZE
+            
+        Returns
+        -------
+        List[str]
+            IDs of the labels that were attached, in request order
+        """
+        batch_size = batch_size or self.ATTACH_BATCH_SIZE
+        added_label_ids = []
+        
+        for start in range(0, len(labels), batch_size):
+            batch = labels[start:start + batch_size]
+            outcomes = await asyncio.gather(
+                *(
+                    self.session.call_tool(
+                        "mcp_kanban_label_manager",
+                        {
+                            "action": "add_to_card",
+                            "cardId": card_id,
+                            "labelId": label_id
+                        }
+                    )
+                    for _, label_id in batch
+                ),
+                return_exceptions=True
+            )
+            for (label_name, label_id), outcome in zip(batch, outcomes):
+                if isinstance(outcome, Exception):
+                    print(f"Warning: Failed to add label '{label_name}' to card: {outcome}", file=sys.stderr)
+                    self.registry.invalidate()
+                else:
+                    added_label_ids.append(label_id)
         
         return added_label_ids
     
@@ -12,14 +12,19 @@ The client handles:
 
 Notes
 -----
-This implementation avoids persistent connections and creates a new MCP session
-for each operation to ensure reliability.
+Operations share a small pool of long-lived, initialized MCP sessions
+(see ``MCPSessionPool``) instead of spawning a kanban-mcp process per call.
+Crashed sessions are dropped and respawned automatically.
+
+Every tool call goes through a ``ResilientEndpoint``: a circuit breaker that
+fails fast while kanban-mcp is unhealthy, an adaptive concurrency limit, and
+budgeted retries of timed-out reads. Writes are never retried.
 """
 
 import asyncio
 import json
 import os
-from typing import List, Dict, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 from datetime import datetime
 from contextlib import asynccontextmanager
 
@@ -27,15 +32,33 @@ from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
 
 from src.core.models import Task, TaskStatus, Priority
+from src.core.resilience import AdaptiveConcurrencyLimiter, ResilientEndpoint, is_transient_error
+from src.integrations.mcp_session_pool import CONNECTION_ERRORS, MCPSessionPool
 import sys
 
 
+def is_read_action(arguments: Dict[str, Any]) -> bool:
+    """
+    Whether a kanban-mcp tool call only reads.
+
+    Reads ("get_all", "get_details", ...) are safe to retry; a timed-out write
+    may already have been applied, so writes are sent once.
+    """
+    return str(arguments.get("action", "")).startswith("get")
+
+
+def _is_retryable_kanban_error(error: Exception) -> bool:
+    """Transient errors other than a lost transport; retrying on a dead session cannot succeed."""
+    return is_transient_error(error) and not isinstance(error, CONNECTION_ERRORS)
+
+
 class SimpleMCPKanbanClient:
     """
     Simple MCP Kanban client that follows proven patterns for reliability.
     
-    This client creates a new MCP session for each operation rather than
-    maintaining persistent connections, which has proven more reliable in practice.
+    All operations borrow an initialized session from a per-client
+    ``MCPSessionPool``, so the kanban-mcp server process and MCP handshake
+    are paid once rather than on every call.
     
     Attributes
     ----------
@@ -43,6 +66,13 @@ class SimpleMCPKanbanClient:
         ID of the kanban board to work with
     project_id : Optional[str]
         ID of the project associated with the board
+    session_pool_config : Dict[str, Any]
+        Pool sizing overrides from the ``session_pool`` config section
+    list_fetch_concurrency : int
+        Maximum card requests in flight while fetching the board's lists
+    resilience : ResilientEndpoint
+        Circuit breaker, retry budget and adaptive concurrency limit shared
+        by every kanban-mcp tool call
     
     Examples
     --------
@@ -55,6 +85,7 @@ class SimpleMCPKanbanClient:
     -----
     Planka credentials are loaded from environment variables or set to defaults.
     Board and project IDs are loaded from config_marcus.json if available.
+    Call ``close()`` to shut down pooled sessions when the client is discarded.
     """
     
     def __init__(self) -> None:
@@ -67,6 +98,18 @@ class SimpleMCPKanbanClient:
         # Initialize attributes
         self.board_id: Optional[str] = None
         self.project_id: Optional[str] = None
+        self.session_pool_config: Dict[str, Any] = {}
+        self.list_fetch_concurrency: int = 8
+        self.resilience = ResilientEndpoint(
+            "kanban-mcp",
+            limiter=AdaptiveConcurrencyLimiter(
+                "kanban-mcp",
+                initial_limit=self.list_fetch_concurrency,
+                max_limit=32
+            ),
+            timeout=60.0,
+            is_retryable=_is_retryable_kanban_error
+        )
         
         # Load config first - this may set environment variables
         self._load_config()
@@ -78,12 +121,107 @@ class SimpleMCPKanbanClient:
             os.environ['PLANKA_AGENT_EMAIL'] = 'demo@demo.demo'
         if 'PLANKA_AGENT_PASSWORD' not in os.environ:
             os.environ['PLANKA_AGENT_PASSWORD'] = 'demo'
+        
+        # Sessions are opened lazily on first use
+        self._session_pool = MCPSessionPool(
+            "kanban-mcp",
+            self._open_session,
+            **self.session_pool_config
+        )
+    
+    @asynccontextmanager
+    async def _open_session(self):
+        """
+        Spawn the kanban-mcp server and yield an initialized session.
+        
+        Used as the session factory for the pool; each pooled session owns
+        one server process for its whole lifetime.
+        
+        Yields
+        ------
+        ClientSession
+            Initialized MCP client session
+        """
+        server_params = StdioServerParameters(
+            command="node",
+            args=["../kanban-mcp/dist/index.js"],
+            env=os.environ.copy()
+        )
+        
+        async with stdio_client(server_params) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                yield session
+    
+    async def close(self) -> None:
+        """
+        Close all pooled MCP sessions and their server processes.
+        
+        The client can still be used afterwards; a fresh pool is created
+        on the next operation.
+        """
+        await self._session_pool.close()
+        self._session_pool = MCPSessionPool(
+            "kanban-mcp",
+            self._open_session,
+            **self.session_pool_config
+        )
+    
+    def get_session_pool_stats(self) -> Dict[str, Any]:
+        """
+        Get statistics for the client's MCP session pool.
+        
+        Returns
+        -------
+        Dict[str, Any]
+            Open, idle and in-use session counts plus lifetime counters
+        """
+        return self._session_pool.get_stats()
+    
+    def get_resilience_stats(self) -> Dict[str, Any]:
+        """
+        Get circuit breaker, retry and concurrency limit statistics.
+        
+        Returns
+        -------
+        Dict[str, Any]
+            Breaker state, call counters and limiter metrics
+        """
+        return self.resilience.get_stats()
+    
+    async def _call_tool(self, session: ClientSession, tool: str, arguments: Dict[str, Any]) -> Any:
+        """
+        Call a kanban-mcp tool through the client's resilience endpoint.
+        
+        Parameters
+        ----------
+        session : ClientSession
+            Borrowed pooled session
+        tool : str
+            Tool name
+        arguments : Dict[str, Any]
+            Tool arguments; reads are retried on timeouts, writes are not
+        
+        Returns
+        -------
+        Any
+            The tool result
+        
+        Raises
+        ------
+        IntegrationError
+            If the circuit is open because kanban-mcp keeps failing
+        """
+        if is_read_action(arguments):
+            return await self.resilience.call(session.call_tool, tool, arguments)
+        return await self.resilience.call_once(session.call_tool, tool, arguments)
     
     def _load_config(self) -> None:
         """
         Load configuration from config_marcus.json file.
         
-        Reads project_id, board_id, and Planka credentials from the configuration file if it exists.
+        Reads project_id, board_id, Planka credentials and optional session pool
+        settings from the configuration file if it exists.
         Prints confirmation message to stderr for debugging.
         
         Notes
@@ -120,6 +258,14 @@ class SimpleMCPKanbanClient:
                 if planka_config.get("password"):
                     os.environ['PLANKA_AGENT_PASSWORD'] = planka_config["password"]
                 
+                # Optional session pool sizing (min_sessions, max_sessions,
+                # max_idle_time, health_check_interval)
+                pool_config = config.get("session_pool") or {}
+                self.session_pool_config = {
+                    key: value for key, value in pool_config.items()
+                    if key in ("min_sessions", "max_sessions", "max_idle_time", "health_check_interval")
+                }
+                
                 print(f"✅ Loaded config from {config_path}: project_id={self.project_id}, board_id={self.board_id}", file=sys.stderr)
         else:
             print(f"❌ config_marcus.json not found in any of the following locations:", file=sys.stderr)
@@ -151,72 +297,16 @@ class SimpleMCPKanbanClient:
         
         Notes
         -----
-        This method creates a new MCP session for the operation.
+        This method borrows a pooled MCP session for the operation.
         Tasks are filtered based on their list name (TODO, BACKLOG, etc.)
         and whether they have an assigned_to field.
         """
         if not self.board_id:
             raise RuntimeError("Board ID not set")
         
-        # Use the exact same pattern as working scripts
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
-        )
-        
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                # First get all lists for the board
-                lists_result = await session.call_tool(
-                    "mcp_kanban_list_manager",
-                    {
-                        "action": "get_all",
-                        "boardId": self.board_id
-                    }
-                )
-                
-                all_cards = []
-                if lists_result and hasattr(lists_result, 'content') and lists_result.content:
-                    lists_data = json.loads(lists_result.content[0].text)
-                    lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
-                    
-                    # Get cards from each list
-                    for lst in lists:
-                        list_id = lst.get("id")
-                        if list_id:
-                            # Get cards for this list
-                            cards_result = await session.call_tool(
-                                "mcp_kanban_card_manager",
-                                {
-                                    "action": "get_all",
-                                    "listId": list_id
-                                }
-                            )
-                            
-                            if cards_result and hasattr(cards_result, 'content') and cards_result.content:
-                                cards_text = cards_result.content[0].text
-                                if cards_text and cards_text.strip():
-                                    cards_data = json.loads(cards_text)
-                                    cards_list = cards_data if isinstance(cards_data, list) else cards_data.get("items", [])
-                                    # Add list name to each card
-                                    for card in cards_list:
-                                        card["listName"] = lst.get("name", "")
-                                        all_cards.append(card)
-                
-                result = None  # We'll use all_cards instead
-                
-                tasks = []
-                
-                # Use the all_cards we collected
-                for card in all_cards:
-                    task = self._card_to_task(card)
-                    if not task.assigned_to and self._is_available_task(card):
-                        tasks.append(task)
-                
-                return tasks
+        async with self._session_pool.get_session() as session:
+            all_cards = await self._fetch_board_cards(session)
+            return self._cards_to_tasks(all_cards, available_only=True)
     
     async def get_all_tasks(self) -> List[Task]:
         """
@@ -243,69 +333,207 @@ class SimpleMCPKanbanClient:
         
         Notes
         -----
-        This method creates a new MCP session for the operation.
+        This method borrows a pooled MCP session for the operation.
         Unlike get_available_tasks(), this includes tasks in all states
         and with any assignment status.
         """
         if not self.board_id:
             raise RuntimeError("Board ID not set")
         
-        # Use the exact same pattern as working scripts
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
+        async with self._session_pool.get_session() as session:
+            all_cards = await self._fetch_board_cards(session)
+            return self._cards_to_tasks(all_cards)
+    
+    async def iter_tasks(self, available_only: bool = False) -> AsyncIterator[List[Task]]:
+        """
+        Stream the board's tasks one list at a time.
+        
+        Card fetches for all lists run concurrently; each list's tasks are
+        yielded as soon as its fetch completes, so the first batch arrives
+        after the fastest list rather than the whole board.
+        
+        Parameters
+        ----------
+        available_only : bool
+            Only yield unassigned tasks in available lists, as
+            get_available_tasks() does
+        
+        Yields
+        ------
+        List[Task]
+            Tasks of one board list, in completion order
+        
+        Raises
+        ------
+        RuntimeError
+            If board_id is not set in configuration
+        
+        Examples
+        --------
+        >>> async for tasks in client.iter_tasks():
+        ...     print(f"{len(tasks)} more tasks")
+        
+        Notes
+        -----
+        The pooled session is held until the iteration finishes or the
+        generator is closed; fetches still running at that point are cancelled.
+        """
+        if not self.board_id:
+            raise RuntimeError("Board ID not set")
+        
+        async with self._session_pool.get_session() as session:
+            lists = await self._fetch_lists(session)
+            semaphore = asyncio.Semaphore(self.list_fetch_concurrency)
+            fetches = [
+                asyncio.ensure_future(self._fetch_list_cards(session, lst, semaphore))
+                for lst in lists if lst.get("id")
+            ]
+            try:
+                for fetch in asyncio.as_completed(fetches):
+                    cards = await fetch
+                    yield self._cards_to_tasks(cards, available_only)
+            finally:
+                await self._cancel_fetches(fetches)
+    
+    async def _fetch_board_cards(self, session: ClientSession) -> List[Dict[str, Any]]:
+        """
+        Fetch every card on the board, fanning out one request per list.
+        
+        Parameters
+        ----------
+        session : ClientSession
+            Borrowed pooled session; list requests share it concurrently
+        
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Cards in board list order, each tagged with its ``listName``
+        
+        Notes
+        -----
+        At most ``list_fetch_concurrency`` card requests are in flight, and
+        they are issued in list order. If one fails, the others are cancelled
+        and the error is raised.
+        """
+        lists = await self._fetch_lists(session)
+        semaphore = asyncio.Semaphore(self.list_fetch_concurrency)
+        fetches = [
+            asyncio.ensure_future(self._fetch_list_cards(session, lst, semaphore))
+            for lst in lists if lst.get("id")
+        ]
+        try:
+            cards_by_list = await asyncio.gather(*fetches)
+        except BaseException:
+            await self._cancel_fetches(fetches)
+            raise
+        
+        return [card for cards in cards_by_list for card in cards]
+    
+    async def _fetch_lists(self, session: ClientSession) -> List[Dict[str, Any]]:
+        """
+        Fetch the board's lists.
+        
+        Parameters
+        ----------
+        session : ClientSession
+            Borrowed pooled session
+        
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Lists on the board, or an empty list for an empty response
+        """
+        lists_result = await self._call_tool(
+            session,
+            "mcp_kanban_list_manager",
+            {
+                "action": "get_all",
+                "boardId": self.board_id
+            }
         )
         
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                # First get all lists for the board
-                lists_result = await session.call_tool(
-                    "mcp_kanban_list_manager",
-                    {
-                        "action": "get_all",
-                        "boardId": self.board_id
-                    }
-                )
-                
-                all_cards = []
-                if lists_result and hasattr(lists_result, 'content') and lists_result.content:
-                    lists_data = json.loads(lists_result.content[0].text)
-                    lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
-                    
-                    # Get cards from each list
-                    for lst in lists:
-                        list_id = lst.get("id")
-                        if list_id:
-                            # Get cards for this list
-                            cards_result = await session.call_tool(
-                                "mcp_kanban_card_manager",
-                                {
-                                    "action": "get_all",
-                                    "listId": list_id
-                                }
-                            )
-                            
-                            if cards_result and hasattr(cards_result, 'content') and cards_result.content:
-                                cards_text = cards_result.content[0].text
-                                if cards_text and cards_text.strip():
-                                    cards_data = json.loads(cards_text)
-                                    cards_list = cards_data if isinstance(cards_data, list) else cards_data.get("items", [])
-                                    # Add list name to each card
-                                    for card in cards_list:
-                                        card["listName"] = lst.get("name", "")
-                                        all_cards.append(card)
-                
-                tasks = []
-                
-                # Convert all cards to tasks (no filtering)
-                for card in all_cards:
-                    task = self._card_to_task(card)
-                    tasks.append(task)
-                
-                return tasks
+        if not (lists_result and hasattr(lists_result, 'content') and lists_result.content):
+            return []
+        lists_data = json.loads(lists_result.content[0].text)
+        return lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
+    
+    async def _fetch_list_cards(
+        self,
+        session: ClientSession,
+        lst: Dict[str, Any],
+        semaphore: asyncio.Semaphore
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch the cards of one list, tagging each with the list's name.
+        
+        Parameters
+        ----------
+        session : ClientSession
+            Borrowed pooled session
+        lst : Dict[str, Any]
+            List data containing at least ``id`` and usually ``name``
+        semaphore : asyncio.Semaphore
+            Bounds the number of list requests in flight
+        
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Cards in the list, or an empty list for an empty response
+        """
+        async with semaphore:
+            cards_result = await self._call_tool(
+                session,
+                "mcp_kanban_card_manager",
+                {
+                    "action": "get_all",
+                    "listId": lst["id"]
+                }
+            )
+        
+        if not (cards_result and hasattr(cards_result, 'content') and cards_result.content):
+            return []
+        cards_text = cards_result.content[0].text
+        if not cards_text or not cards_text.strip():
+            return []
+        cards_data = json.loads(cards_text)
+        cards_list = cards_data if isinstance(cards_data, list) else cards_data.get("items", [])
+        
+        # Add list name to each card
+        list_name = lst.get("name", "")
+        for card in cards_list:
+            card["listName"] = list_name
+        return cards_list
+    
+    @staticmethod
+    async def _cancel_fetches(fetches: List["asyncio.Future[Any]"]) -> None:
+        """Cancel unfinished list fetches and wait for them to unwind."""
+        for fetch in fetches:
+            fetch.cancel()
+        await asyncio.gather(*fetches, return_exceptions=True)
+    
+    def _cards_to_tasks(self, cards: List[Dict[str, Any]], available_only: bool = False) -> List[Task]:
+        """
+        Convert cards to tasks, optionally keeping only available ones.
+        
+        Parameters
+        ----------
+        cards : List[Dict[str, Any]]
+            Cards tagged with their ``listName``
+        available_only : bool
+            Keep only unassigned tasks in available lists
+        
+        Returns
+        -------
+        List[Task]
+            Converted tasks in card order
+        """
+        tasks = []
+        for card in cards:
+            task = self._card_to_task(card)
+            if available_only and (task.assigned_to or not self._is_available_task(card)):
+                continue
+            tasks.append(task)
+        return tasks
     
     async def assign_task(self, task_id: str, agent_id: str) -> None:
         """
@@ -331,57 +559,51 @@ class SimpleMCPKanbanClient:
         The task is automatically moved to the first list containing
         "progress" in its name (case-insensitive).
         """
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
-        )
-        
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
+        async with self._session_pool.get_session() as session:
+            # Add comment
+            await self._call_tool(
+                session,
+                "mcp_kanban_comment_manager",
+                {
+                    "action": "create",
+                    "cardId": task_id,
+                    "text": f"📋 Task assigned to {agent_id} at {datetime.now().isoformat()}"
+                }
+            )
+            
+            # Move to In Progress
+            # First get lists
+            lists_result = await self._call_tool(
+                session,
+                "mcp_kanban_list_manager",
+                {
+                    "action": "get_all",
+                    "boardId": self.board_id
+                }
+            )
+            
+            if lists_result and hasattr(lists_result, 'content'):
+                lists_data = json.loads(lists_result.content[0].text)
+                lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
                 
-                # Add comment
-                await session.call_tool(
-                    "mcp_kanban_comment_manager",
-                    {
-                        "action": "create",
-                        "cardId": task_id,
-                        "text": f"📋 Task assigned to {agent_id} at {datetime.now().isoformat()}"
-                    }
-                )
+                # Find In Progress list
+                in_progress_list = None
+                for lst in lists:
+                    if "progress" in lst.get("name", "").lower():
+                        in_progress_list = lst
+                        break
                 
-                # Move to In Progress
-                # First get lists
-                lists_result = await session.call_tool(
-                    "mcp_kanban_list_manager",
-                    {
-                        "action": "get_all",
-                        "boardId": self.board_id
-                    }
-                )
-                
-                if lists_result and hasattr(lists_result, 'content'):
-                    lists_data = json.loads(lists_result.content[0].text)
-                    lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
-                    
-                    # Find In Progress list
-                    in_progress_list = None
-                    for lst in lists:
-                        if "progress" in lst.get("name", "").lower():
-                            in_progress_list = lst
-                            break
-                    
-                    if in_progress_list:
-                        # Move card
-                        await session.call_tool(
-                            "mcp_kanban_card_manager",
-                            {
-                                "action": "move",
-                                "id": task_id,
-                                "listId": in_progress_list["id"]
-                            }
-                        )
+                if in_progress_list:
+                    # Move card
+                    await self._call_tool(
+                        session,
+                        "mcp_kanban_card_manager",
+                        {
+                            "action": "move",
+                            "id": task_id,
+                            "listId": in_progress_list["id"]
+                        }
+                    )
     
     async def get_board_summary(self) -> Dict[str, Any]:
         """
@@ -412,29 +634,21 @@ class SimpleMCPKanbanClient:
         if not self.board_id:
             raise RuntimeError("Board ID not set")
         
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
-        )
-        
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                result = await session.call_tool(
-                    "mcp_kanban_project_board_manager",
-                    {
-                        "action": "get_board_summary",
-                        "boardId": self.board_id,
-                        "includeTaskDetails": False
-                    }
-                )
-                
-                if result and hasattr(result, 'content'):
-                    return json.loads(result.content[0].text)
-                
-                return {}
+        async with self._session_pool.get_session() as session:
+            result = await self._call_tool(
+                session,
+                "mcp_kanban_project_board_manager",
+                {
+                    "action": "get_board_summary",
+                    "boardId": self.board_id,
+                    "includeTaskDetails": False
+                }
+            )
+            
+            if result and hasattr(result, 'content'):
+                return json.loads(result.content[0].text)
+            
+            return {}
     
     def _is_available_task(self, card: Dict[str, Any]) -> bool:
         """
@@ -484,14 +698,15 @@ class SimpleMCPKanbanClient:
         -----
         - Status is determined by the list name (DONE, PROGRESS, BLOCKED, TODO)
         - Priority defaults to MEDIUM if not specified
-        - Dates default to current time if not provided
+        - createdAt/updatedAt are parsed when present, otherwise default to now
         - assigned_to is extracted from card users/assignment fields
         """
         task_name = card.get("name") or card.get("title", "")
         
-        # Parse dates
-        created_at = datetime.now()
-        updated_at = datetime.now()
+        # Parse dates (the board's updatedAt drives snapshot reconciliation)
+        now = datetime.now()
+        created_at = self._parse_timestamp(card.get("createdAt")) or now
+        updated_at = self._parse_timestamp(card.get("updatedAt")) or created_at
         
         # Determine status
         list_name = card.get("listName", "").upper()
@@ -535,6 +750,31 @@ class SimpleMCPKanbanClient:
             labels=[]
         )
     
+    @staticmethod
+    def _parse_timestamp(value: Any) -> Optional[datetime]:
+        """
+        Parse an ISO 8601 timestamp from a kanban card.
+        
+        Parameters
+        ----------
+        value : Any
+            Timestamp string such as "2024-01-01T12:00:00.000Z"
+        
+        Returns
+        -------
+        Optional[datetime]
+            Naive local datetime, or None if the value is missing or invalid
+        """
+        if not value or not isinstance(value, str):
+            return None
+        try:
+            parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone().replace(tzinfo=None)
+        return parsed
+    
     async def add_comment(self, task_id: str, comment_text: str) -> None:
         """
         Add a comment to a task.
@@ -554,24 +794,16 @@ class SimpleMCPKanbanClient:
         -----
         Comments are visible in the Planka UI and are timestamped automatically.
         """
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
-        )
-        
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                await session.call_tool(
-                    "mcp_kanban_comment_manager",
-                    {
-                        "action": "create",
-                        "cardId": task_id,
-                        "text": comment_text
-                    }
-                )
+        async with self._session_pool.get_session() as session:
+            await self._call_tool(
+                session,
+                "mcp_kanban_comment_manager",
+                {
+                    "action": "create",
+                    "cardId": task_id,
+                    "text": comment_text
+                }
+            )
     
     async def complete_task(self, task_id: str) -> None:
         """
@@ -643,50 +875,43 @@ class SimpleMCPKanbanClient:
         -----
         This is a helper method used by other status update methods.
         """
-        server_params = StdioServerParameters(
-            command="node",
-            args=["../kanban-mcp/dist/index.js"],
-            env=os.environ.copy()
-        )
-        
-        async with stdio_client(server_params) as (read, write):
-            async with ClientSession(read, write) as session:
-                await session.initialize()
-                
-                # Get all lists
-                lists_result = await session.call_tool(
-                    "mcp_kanban_list_manager",
-                    {
-                        "action": "get_all",
-                        "boardId": self.board_id
-                    }
-                )
+        async with self._session_pool.get_session() as session:
+            # Get all lists
+            lists_result = await self._call_tool(
+                session,
+                "mcp_kanban_list_manager",
+                {
+                    "action": "get_all",
+                    "boardId": self.board_id
+                }
+            )
+            
+            if lists_result and hasattr(lists_result, 'content'):
+                lists_data = json.loads(lists_result.content[0].text)
+                lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
                 
-                if lists_result and hasattr(lists_result, 'content'):
-                    lists_data = json.loads(lists_result.content[0].text)
-                    lists = lists_data if isinstance(lists_data, list) else lists_data.get("items", [])
-                    
-                    # Find matching list
-                    target_list = None
-                    for lst in lists:
-                        list_name_lower = lst.get("name", "").lower()
-                        for keyword in list_keywords:
-                            if keyword in list_name_lower:
-                                target_list = lst
-                                break
-                        if target_list:
+                # Find matching list
+                target_list = None
+                for lst in lists:
+                    list_name_lower = lst.get("name", "").lower()
+                    for keyword in list_keywords:
+                        if keyword in list_name_lower:
+                            target_list = lst
                             break
-                    
                     if target_list:
-                        # Move card
-                        await session.call_tool(
-                            "mcp_kanban_card_manager",
-                            {
-                                "action": "move",
-                                "id": task_id,
-                                "listId": target_list["id"],
-                                "position": 65535  # Default position at end of list
-                            }
-                        )
-                    else:
-                        raise RuntimeError(f"No list found matching keywords: {list_keywords}")
\ No newline at end of file
+                        break
+                
+                if target_list:
+                    # Move card
+                    await self._call_tool(
+                        session,
+                        "mcp_kanban_card_manager",
+                        {
+                            "action": "move",
+                            "id": task_id,
+                            "listId": target_list["id"],
+                            "position": 65535  # Default position at end of list
+                        }
+                    )
+                else:
+                    raise RuntimeError(f"No list found matching keywords: {list_keywords}")
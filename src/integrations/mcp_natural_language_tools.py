@@ -651,7 +651,8 @@ async def create_project_from_natural_language(
         # Update Marcus state if successful
         if result.get("success"):
             try:
-                await state.refresh_project_state()
+                # New cards are not in the board snapshot yet
+                await state.refresh_project_state(force=True)
             except Exception as e:
                 # Log but don't fail the operation
                 logger.warning(f"Failed to refresh project state: {str(e)}")
@@ -728,7 +729,8 @@ async def add_feature_natural_language(
         # Update Marcus state if successful
         if result.get("success"):
             try:
-                await state.refresh_project_state()
+                # New cards are not in the board snapshot yet
+                await state.refresh_project_state(force=True)
             except Exception as e:
                 # Log but don't fail the operation
                 logger.warning(f"Failed to refresh project state: {str(e)}")
@@ -210,7 +210,8 @@ async def create_project_from_natural_language_fast(
         # Refresh project state
         if created_tasks:
             try:
-                await state.refresh_project_state()
+                # New cards are not in the board snapshot yet
+                await state.refresh_project_state(force=True)
             except Exception as e:
                 logger.warning(f"Failed to refresh state: {e}")
         
@@ -0,0 +1,407 @@
+"""
+Session pooling for MCP stdio servers.
+
+This module keeps a small set of long-lived, initialized MCP ``ClientSession``
+objects so that kanban operations do not have to spawn a new server process
+and repeat the MCP handshake for every call.
+
+It follows the same shape as ``src.pm_agent.server.connection_pool``
+(min/max sizing, idle reaping, periodic health checks and pool statistics),
+but pools fully initialized MCP sessions instead of raw subprocesses.
+
+Notes
+-----
+The stdio transport and ``ClientSession`` are anyio context managers that
+must be entered and exited from the same task. Each pooled session is
+therefore owned by a dedicated background task which opens the session,
+hands it to the pool and keeps it open until the pool asks it to close.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import Any, AsyncContextManager, AsyncIterator, Callable, Deque, Dict, Optional
+
+import anyio
+
+logger = logging.getLogger(__name__)
+
+# Errors that mean the transport under a session is gone. Anything else raised
+# while a session is borrowed (bad JSON, tool errors, ...) leaves it reusable.
+CONNECTION_ERRORS = (
+    ConnectionError,
+    EOFError,
+    BrokenPipeError,
+    anyio.ClosedResourceError,
+    anyio.BrokenResourceError,
+    anyio.EndOfStream,
+)
+
+SessionFactory = Callable[[], AsyncContextManager[Any]]
+
+
+class PooledSession:
+    """
+    A single pooled MCP session and the task that owns its transport.
+
+    Attributes
+    ----------
+    id : str
+        Identifier of the session inside its pool
+    session : Any
+        The initialized MCP client session (None until ready)
+    created_at : datetime
+        When the session was opened
+    last_used : datetime
+        When the session was last returned to the pool
+    in_use : bool
+        Whether the session is currently borrowed
+    healthy : bool
+        False once the session failed or has been asked to close
+    """
+
+    def __init__(self, session_id: str) -> None:
+        self.id = session_id
+        self.session: Any = None
+        self.created_at = datetime.now()
+        self.last_used = datetime.now()
+        self.in_use = False
+        self.healthy = True
+        self.task: Optional[asyncio.Task] = None
+        self._closing = asyncio.Event()
+
+    def is_alive(self) -> bool:
+        """Check whether the owning task is still holding the session open."""
+        return self.healthy and self.task is not None and not self.task.done()
+
+    def mark_used(self) -> None:
+        """Mark the session as recently used."""
+        self.last_used = datetime.now()
+
+    async def close(self, timeout: float = 5.0) -> None:
+        """
+        Ask the owning task to close the session and wait for it.
+
+        Parameters
+        ----------
+        timeout : float
+            Seconds to wait for a graceful shutdown before cancelling
+        """
+        self.healthy = False
+        self._closing.set()
+        if self.task is None or self.task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self.task), timeout=timeout)
+        except (asyncio.TimeoutError, Exception):
+            self.task.cancel()
+
+
+class MCPSessionPool:
+    """
+    Pool of long-lived, initialized MCP client sessions.
+
+    Sessions are created lazily up to ``max_sessions``, reused by every caller
+    of :meth:`get_session`, pinged and reaped by a background health check,
+    and respawned automatically when the underlying server process dies.
+
+    Parameters
+    ----------
+    service_name : str
+        Name used in logs and statistics
+    session_factory : Callable[[], AsyncContextManager[Any]]
+        Returns an async context manager yielding an initialized session
+    min_sessions : int
+        Sessions kept warm by the health check once the pool is in use
+    max_sessions : int
+        Upper bound on concurrently open sessions
+    max_idle_time : int
+        Seconds after which idle sessions above ``min_sessions`` are closed
+    health_check_interval : int
+        Seconds between health checks
+    startup_timeout : float
+        Seconds allowed for spawning and initializing a session
+
+    Examples
+    --------
+    >>> pool = MCPSessionPool("kanban-mcp", open_session, max_sessions=4)
+    >>> async with pool.get_session() as session:
+    ...     await session.call_tool("mcp_kanban_list_manager", {...})
+    """
+
+    def __init__(
+        self,
+        service_name: str,
+        session_factory: SessionFactory,
+        min_sessions: int = 1,
+        max_sessions: int = 4,
+        max_idle_time: int = 300,
+        health_check_interval: int = 60,
+        startup_timeout: float = 30.0,
+    ) -> None:
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+        self.service_name = service_name
+        self.session_factory = session_factory
+        self.min_sessions = max(0, min(min_sessions, max_sessions))
+        self.max_sessions = max_sessions
+        self.max_idle_time = timedelta(seconds=max_idle_time)
+        self.health_check_interval = health_check_interval
+        self.startup_timeout = startup_timeout
+
+        self.sessions: Dict[str, PooledSession] = {}
+        self._idle: Deque[PooledSession] = deque()
+        self._pending = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._health_check_task: Optional[asyncio.Task] = None
+        self._closed = False
+
+        # Metrics
+        self.total_sessions_created = 0
+        self.total_sessions_closed = 0
+        self.session_errors = 0
+        self.total_acquisitions = 0
+
+    def _bind_loop(self) -> None:
+        """
+        Bind pool state to the running event loop.
+
+        Sessions belong to the loop that created them; if the client is later
+        used from a different loop (e.g. repeated ``asyncio.run`` calls) the
+        old sessions are unusable and the pool starts afresh.
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            logger.info(f"Event loop changed, discarding {len(self.sessions)} {self.service_name} sessions")
+            self.total_sessions_closed += len(self.sessions)
+        self._loop = loop
+        self.sessions.clear()
+        self._idle.clear()
+        self._pending = 0
+        self._condition = asyncio.Condition()
+        self._health_check_task = asyncio.create_task(self._health_check_loop())
+
+    async def initialize(self) -> None:
+        """Open ``min_sessions`` sessions up front and start the health check."""
+        self._closed = False
+        self._bind_loop()
+        while len(self.sessions) < self.min_sessions:
+            pooled = await self._create_session()
+            await self._release(pooled)
+        logger.info(f"Session pool for {self.service_name} initialized with {len(self.sessions)} sessions")
+
+    async def close(self) -> None:
+        """Close every session and stop the health check."""
+        self._closed = True
+
+        if self._health_check_task:
+            self._health_check_task.cancel()
+            try:
+                await self._health_check_task
+            except (asyncio.CancelledError, RuntimeError):
+                pass
+            self._health_check_task = None
+
+        sessions = list(self.sessions.values())
+        self.sessions.clear()
+        self._idle.clear()
+        for pooled in sessions:
+            await pooled.close()
+            self.total_sessions_closed += 1
+        self._loop = None
+
+        logger.info(f"Session pool for {self.service_name} closed")
+
+    @asynccontextmanager
+    async def get_session(self) -> AsyncIterator[Any]:
+        """
+        Borrow an initialized session from the pool.
+
+        Yields
+        ------
+        Any
+            An initialized MCP client session
+
+        Raises
+        ------
+        RuntimeError
+            If the pool has been closed
+        """
+        if self._closed:
+            raise RuntimeError("Session pool is closed")
+        self._bind_loop()
+
+        pooled = await self._acquire()
+        try:
+            yield pooled.session
+        except CONNECTION_ERRORS:
+            pooled.healthy = False
+            self.session_errors += 1
+            raise
+        finally:
+            await self._release(pooled)
+
+    async def _acquire(self) -> PooledSession:
+        """Take an idle session, open a new one, or wait for one to be released."""
+        assert self._condition is not None
+        while True:
+            async with self._condition:
+                while True:
+                    while self._idle:
+                        pooled = self._idle.popleft()
+                        if pooled.is_alive():
+                            pooled.in_use = True
+                            self.total_acquisitions += 1
+                            return pooled
+                        self._forget(pooled)
+                    if len(self.sessions) + self._pending < self.max_sessions:
+                        self._pending += 1
+                        break
+                    await self._condition.wait()
+
+            # Spawn outside the condition so other callers are not blocked
+            try:
+                pooled = await self._create_session()
+            finally:
+                async with self._condition:
+                    self._pending -= 1
+                    self._condition.notify()
+            pooled.in_use = True
+            self.total_acquisitions += 1
+            return pooled
+
+    async def _release(self, pooled: PooledSession) -> None:
+        """Return a borrowed session to the pool, dropping it if it failed."""
+        pooled.in_use = False
+        pooled.mark_used()
+        if self._condition is None:
+            return
+        if pooled.is_alive() and not self._closed and pooled.id in self.sessions:
+            async with self._condition:
+                self._idle.append(pooled)
+                self._condition.notify()
+            return
+
+        self._forget(pooled)
+        await pooled.close()
+        async with self._condition:
+            self._condition.notify()
+
+    def _forget(self, pooled: PooledSession) -> None:
+        """Remove a session from the pool bookkeeping."""
+        if self.sessions.pop(pooled.id, None) is not None:
+            self.total_sessions_closed += 1
+
+    async def _create_session(self) -> PooledSession:
+        """Spawn a session-owning task and wait until its session is initialized."""
+        session_id = f"{self.service_name}_{self.total_sessions_created}"
+        self.total_sessions_created += 1
+        pooled = PooledSession(session_id)
+        ready: asyncio.Future = asyncio.get_running_loop().create_future()
+        pooled.task = asyncio.create_task(self._run_session(pooled, ready))
+
+        try:
+            await asyncio.wait_for(asyncio.shield(ready), timeout=self.startup_timeout)
+        except BaseException:
+            self.session_errors += 1
+            await pooled.close(timeout=1.0)
+            raise
+
+        self.sessions[session_id] = pooled
+        logger.debug(f"Created session {session_id} for {self.service_name}")
+        return pooled
+
+    async def _run_session(self, pooled: PooledSession, ready: asyncio.Future) -> None:
+        """Own the transport of one session for its whole lifetime."""
+        try:
+            async with self.session_factory() as session:
+                pooled.session = session
+                if not ready.done():
+                    ready.set_result(pooled)
+                await pooled._closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning(f"Session {pooled.id} for {self.service_name} crashed: {e}")
+                self.session_errors += 1
+        finally:
+            pooled.healthy = False
+
+    async def _health_check_loop(self) -> None:
+        """Periodically ping sessions, reap idle ones and respawn crashed ones."""
+        while not self._closed:
+            try:
+                await asyncio.sleep(self.health_check_interval)
+                await self._perform_health_check()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error in session pool health check: {e}")
+
+    async def _perform_health_check(self) -> None:
+        """Check every idle session once and restore the minimum pool size."""
+        assert self._condition is not None
+        now = datetime.now()
+
+        async with self._condition:
+            idle = list(self._idle)
+            self._idle.clear()
+
+        keep = []
+        for pooled in idle:
+            if not pooled.is_alive():
+                logger.warning(f"Session {pooled.id} is dead")
+                self._forget(pooled)
+                continue
+            over_minimum = len(self.sessions) > self.min_sessions
+            if over_minimum and (now - pooled.last_used) > self.max_idle_time:
+                logger.info(f"Closing idle session {pooled.id}")
+                self._forget(pooled)
+                await pooled.close()
+                continue
+            try:
+                await asyncio.wait_for(pooled.session.send_ping(), timeout=10)
+            except Exception as e:
+                logger.warning(f"Session {pooled.id} failed health check: {e}")
+                self._forget(pooled)
+                await pooled.close()
+                continue
+            keep.append(pooled)
+
+        async with self._condition:
+            self._idle.extend(keep)
+            self._condition.notify_all()
+
+        # Respawn crashed sessions up to the configured minimum
+        while not self._closed and len(self.sessions) + self._pending < self.min_sessions:
+            try:
+                pooled = await self._create_session()
+            except Exception as e:
+                logger.error(f"Failed to respawn session for {self.service_name}: {e}")
+                break
+            await self._release(pooled)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        return {
+            "service": self.service_name,
+            "open_sessions": len(self.sessions),
+            "idle_sessions": len(self._idle),
+            "in_use_sessions": sum(1 for s in self.sessions.values() if s.in_use),
+            "total_created": self.total_sessions_created,
+            "total_closed": self.total_sessions_closed,
+            "total_acquisitions": self.total_acquisitions,
+            "session_errors": self.session_errors,
+            "min_sessions": self.min_sessions,
+            "max_sessions": self.max_sessions,
+        }
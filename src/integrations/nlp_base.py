@@ -40,6 +40,8 @@ class NaturalLanguageTaskCreator(ABC):
         self.task_classifier = TaskClassifier()
         self.task_builder = TaskBuilder()
         self.safety_checker = SafetyChecker()
+        # ErrorAggregator summary of the last create_tasks_on_board call
+        self.last_creation_report: Optional[Dict[str, Any]] = None
     
     async def create_tasks_on_board(
         self, 
@@ -86,43 +88,44 @@ class NaturalLanguageTaskCreator(ABC):
                 )
             )
         
+        from src.core.error_strategies import ErrorAggregator
+        
+        aggregator = ErrorAggregator("create_tasks_on_board")
         created_tasks = []
         failed_tasks = []
         
-        for task in tasks:
-            try:
-                # Build task data using utility
-                task_data = self.task_builder.build_task_data(task)
-                
-                # Create task on board
-                logger.info(f"Creating task: {task.name}")
-                kanban_task = await self.kanban_client.create_task(task_data)
-                created_tasks.append(kanban_task)
-                
-            except Exception as e:
-                from src.core.error_framework import KanbanIntegrationError, ErrorContext
-                from src.core.error_monitoring import record_error_for_monitoring
-                
-                # Create proper error with context
-                kanban_error = KanbanIntegrationError(
-                    board_name=getattr(self.kanban_client, 'board_id', 'unknown'),
-                    operation="individual_task_creation",
-                    context=ErrorContext(
-                        operation="create_tasks_on_board",
-                        integration_name="natural_language_tools",
-                        custom_context={
-                            "task_name": task.name,
-                            "task_type": getattr(task, 'task_type', 'unknown'),
-                            "details": f"Failed to create task '{task.name}': {str(e)}"
-                        }
+        # Clients with a bulk pipeline create all cards concurrently;
+        # anything else gets one create_task call per task
+        bulk_create = getattr(type(self.kanban_client), 'create_tasks_bulk', None)
+        if callable(bulk_create):
+            tasks_data = [self.task_builder.build_task_data(task) for task in tasks]
+            logger.info(f"Creating {len(tasks)} tasks in bulk")
+            report = await self.kanban_client.create_tasks_bulk(tasks_data)
+            for result in report.results:
+                if result.succeeded:
+                    created_tasks.append(result.task)
+                    aggregator.add_success()
+                else:
+                    failed_tasks.append(
+                        self._record_creation_failure(tasks[result.index], result.error, aggregator)
                     )
-                )
-                
-                # Record for monitoring but continue processing
-                record_error_for_monitoring(kanban_error)
-                logger.error(f"Failed to create task '{task.name}': {kanban_error}")
-                failed_tasks.append((task, str(kanban_error)))
-                # Continue with other tasks even if one fails
+        else:
+            for task in tasks:
+                try:
+                    # Build task data using utility
+                    task_data = self.task_builder.build_task_data(task)
+                    
+                    # Create task on board
+                    logger.info(f"Creating task: {task.name}")
+                    kanban_task = await self.kanban_client.create_task(task_data)
+                    created_tasks.append(kanban_task)
+                    aggregator.add_success()
+                    
+                except Exception as e:
+                    failed_tasks.append(self._record_creation_failure(task, e, aggregator))
+                    # Continue with other tasks even if one fails
+        
+        self.last_creation_report = aggregator.get_summary()
         
         # Log summary
         logger.info(
@@ -154,6 +157,42 @@ class NaturalLanguageTaskCreator(ABC):
         
         return created_tasks
     
+    def _record_creation_failure(self, task: Task, error: Exception, aggregator) -> tuple:
+        """
+        Record a task that could not be created.
+        
+        Args:
+            task: Task that failed
+            error: Why it failed
+            aggregator: ErrorAggregator collecting the batch results
+            
+        Returns:
+            The (task, error message) pair for the failure summary
+        """
+        from src.core.error_framework import KanbanIntegrationError, ErrorContext
+        from src.core.error_monitoring import record_error_for_monitoring
+        
+        # Create proper error with context
+        kanban_error = KanbanIntegrationError(
+            board_name=getattr(self.kanban_client, 'board_id', 'unknown'),
+            operation="individual_task_creation",
+            context=ErrorContext(
+                operation="create_tasks_on_board",
+                integration_name="natural_language_tools",
+                custom_context={
+                    "task_name": task.name,
+                    "task_type": getattr(task, 'task_type', 'unknown'),
+                    "details": f"Failed to create task '{task.name}': {str(error)}"
+                }
+            )
+        )
+        
+        # Record for monitoring but continue processing
+        record_error_for_monitoring(kanban_error)
+        aggregator.add_error(kanban_error, {"task_name": task.name})
+        logger.error(f"Failed to create task '{task.name}': {kanban_error}")
+        return (task, str(kanban_error))
+    
     async def apply_safety_checks(self, tasks: List[Task]) -> List[Task]:
         """
         Apply safety checks to ensure logical task ordering.
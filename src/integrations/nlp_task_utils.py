@@ -104,9 +104,9 @@ class TaskBuilder:
             "estimated_hours": task.estimated_hours,
             "dependencies": task.dependencies,
             # Include acceptance criteria if available
-            "acceptance_criteria": getattr(task, 'acceptance_criteria', []),
+            "acceptance_criteria": task.acceptance_criteria or [],
             # Include subtasks if available
-            "subtasks": getattr(task, 'subtasks', []),
+            "subtasks": task.subtasks or [],
             # Additional fields that might be needed
             "status": task.status.value if hasattr(task.status, 'value') else task.status,
             "created_at": task.created_at.isoformat() if task.created_at else None,
@@ -1,15 +1,17 @@
 """
 GitHub Projects implementation of KanbanInterface
 
-Uses GitHub MCP Server to manage tasks
+Uses GitHub MCP Server to manage tasks. Issues are fetched page by page and
+kept in a local cache keyed by issue number; after the first full sync only
+issues updated since the last sync are requested.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
-import json
 
 from src.integrations.kanban_interface import KanbanInterface, KanbanProvider
 from src.core.models import Task, TaskStatus, Priority
+from src.core.resilience import ResilientEndpoint
 
 
 class GitHubKanban(KanbanInterface):
@@ -25,13 +27,22 @@ class GitHubKanban(KanbanInterface):
                 - owner: Repository owner (user or org)
                 - repo: Repository name
                 - project_number: Project number (for v2 projects)
+                - page_size: Issues requested per page (default 100, the GitHub maximum)
         """
         super().__init__(config)
         self.provider = KanbanProvider.GITHUB
         self.mcp_caller = config.get('mcp_function_caller')
+        # Reads are retried on transient errors; writes are sent once
+        self.resilience = ResilientEndpoint("github-mcp")
         self.owner = config.get('owner')
         self.repo = config.get('repo')
         self.project_number = config.get('project_number')
+        self.page_size = max(1, min(100, int(config.get('page_size', 100))))
+        
+        # Local issue cache, keyed by issue number
+        self._issues: Dict[str, Dict[str, Any]] = {}
+        # updated_at of the newest issue seen; None until the first full sync
+        self._synced_until: Optional[str] = None
         
         if not self.mcp_caller:
             raise ValueError("mcp_function_caller is required for GitHub MCP integration")
@@ -40,7 +51,7 @@ class GitHubKanban(KanbanInterface):
         """Connect to GitHub MCP Server"""
         try:
             # Test connection by getting authenticated user
-            result = await self.mcp_caller('github.get_me', {})
+            result = await self.resilience.call(self.mcp_caller, 'github.get_me', {})
             return 'user' in result
         except Exception as e:
             print(f"Failed to connect to GitHub MCP: {e}")
@@ -53,22 +64,86 @@ class GitHubKanban(KanbanInterface):
         
     async def get_available_tasks(self) -> List[Task]:
         """Get unassigned tasks from backlog"""
-        # Search for unassigned issues in the repository
-        query = f"repo:{self.owner}/{self.repo} is:issue is:open no:assignee"
-        
-        result = await self.mcp_caller('github.search_issues', {
-            "query": query,
-            "sort": "created",
-            "order": "desc",
-            "perPage": 100
-        })
+        await self.sync_issues()
+        
+        available = [
+            issue for issue in self._issues.values()
+            if issue.get('state', 'open') == 'open'
+            and not issue.get('assignee') and not issue.get('assignees')
+        ]
+        available.sort(key=lambda issue: issue.get('created_at') or '', reverse=True)
+        return [self._github_issue_to_task(issue) for issue in available]
+        
+    async def get_all_tasks(self) -> List[Task]:
+        """Get all issues in the repository, open and closed"""
+        await self.sync_issues()
+        return [self._github_issue_to_task(issue) for issue in self._issues.values()]
+        
+    async def sync_issues(self, full: bool = False) -> int:
+        """
+        Bring the local issue cache up to date
         
-        tasks = []
-        if result.get('items'):
-            for issue in result['items']:
-                tasks.append(self._github_issue_to_task(issue))
-                
-        return tasks
+        The first sync (or a full one) lists every issue; later syncs only
+        list issues updated since the newest one already cached.
+        
+        Args:
+            full: Drop the cache and list every issue again
+            
+        Returns:
+            Number of issues received from GitHub
+        """
+        if full:
+            self._issues.clear()
+            self._synced_until = None
+            
+        args = {
+            "owner": self.owner,
+            "repo": self.repo,
+            "state": "all",
+            "sort": "updated",
+            "direction": "asc"
+        }
+        if self._synced_until:
+            # since is inclusive, so the newest cached issue comes back too
+            args["since"] = self._synced_until
+            
+        received = 0
+        async for issue in self.iter_issues('github.list_issues', args, 'issues'):
+            if 'pull_request' in issue:
+                continue
+            self._remember_issue(issue)
+            received += 1
+        return received
+        
+    async def iter_issues(self, tool: str, args: Dict[str, Any],
+                          items_key: str) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every item of a paginated GitHub MCP listing
+        
+        Args:
+            tool: MCP tool to call, e.g. 'github.list_issues'
+            args: Tool arguments, without page or perPage
+            items_key: Key of the item list in the tool result
+        """
+        page = 1
+        while True:
+            result = await self.resilience.call(
+                self.mcp_caller, tool, {**args, "page": page, "perPage": self.page_size}
+            ) or {}
+            items = result.get(items_key) or []
+            for item in items:
+                yield item
+            if len(items) < self.page_size:
+                return
+            page += 1
+            
+    def _remember_issue(self, issue: Dict[str, Any]) -> None:
+        """Store an issue in the local cache and advance the sync cursor"""
+        number = str(issue.get('number', issue.get('id', '')))
+        self._issues[number] = issue
+        updated_at = issue.get('updated_at')
+        if updated_at and (self._synced_until is None or updated_at > self._synced_until):
+            self._synced_until = updated_at
         
     def _github_issue_to_task(self, issue: Dict[str, Any]) -> Task:
         """Convert GitHub issue to Task model"""
@@ -94,7 +169,7 @@ class GitHubKanban(KanbanInterface):
                 break
                 
         # Determine status
-        status = TaskStatus.BACKLOG
+        status = TaskStatus.TODO
         state = issue.get('state', 'open')
         if state == 'closed':
             status = TaskStatus.DONE
@@ -109,7 +184,7 @@ class GitHubKanban(KanbanInterface):
                     status = TaskStatus.BLOCKED
                     break
                 elif "ready" in label_lower:
-                    status = TaskStatus.READY
+                    status = TaskStatus.TODO
                     break
                     
         # Parse dates
@@ -144,14 +219,15 @@ class GitHubKanban(KanbanInterface):
             assigned_to=assignee,
             dependencies=[],
             created_at=created_at,
-            updated_at=updated_at
+            updated_at=updated_at,
+            due_date=None
         )
         
     async def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get specific task by ID"""
         try:
             # task_id should be the issue number
-            result = await self.mcp_caller('github.get_issue', {
+            result = await self.resilience.call(self.mcp_caller, 'github.get_issue', {
                 "owner": self.owner,
                 "repo": self.repo,
                 "issue_number": int(task_id)
@@ -178,7 +254,7 @@ class GitHubKanban(KanbanInterface):
         if priority in priority_labels:
             labels.append(priority_labels[priority])
             
-        result = await self.mcp_caller('github.create_issue', {
+        result = await self.resilience.call_once(self.mcp_caller, 'github.create_issue', {
             "owner": self.owner,
             "repo": self.repo,
             "title": task_data.get("name", "Untitled Task"),
@@ -189,6 +265,7 @@ class GitHubKanban(KanbanInterface):
         if not result.get('issue'):
             raise Exception(f"Failed to create issue: {result.get('error', 'Unknown error')}")
             
+        self._cache_if_synced(result['issue'])
         return self._github_issue_to_task(result['issue'])
         
         
@@ -207,16 +284,28 @@ class GitHubKanban(KanbanInterface):
         if "status" in updates:
             update_data["state"] = "closed" if updates["status"] == TaskStatus.DONE else "open"
             
-        result = await self.mcp_caller('github.update_issue', update_data)
+        result = await self.resilience.call_once(self.mcp_caller, 'github.update_issue', update_data)
         
         if not result.get('issue'):
             raise Exception(f"Failed to update issue: {result.get('error', 'Unknown error')}")
             
+        self._cache_if_synced(result['issue'])
         return self._github_issue_to_task(result['issue'])
         
+    def _cache_if_synced(self, issue: Dict[str, Any]) -> None:
+        """
+        Write an issue returned by a mutation through to the cache
+        
+        Skipped before the first sync, so that sync still lists every issue.
+        The sync cursor is left alone so other updates are not skipped.
+        """
+        if self._synced_until is not None:
+            number = str(issue.get('number', issue.get('id', '')))
+            self._issues[number] = issue
+        
     async def assign_task(self, task_id: str, assignee_id: str) -> bool:
         """Assign issue to user"""
-        result = await self.mcp_caller('github.update_issue', {
+        result = await self.resilience.call_once(self.mcp_caller, 'github.update_issue', {
             "owner": self.owner,
             "repo": self.repo,
             "issue_number": int(task_id),
@@ -232,7 +321,7 @@ class GitHubKanban(KanbanInterface):
         
         # Update issue state if moving to done
         if column_lower in ["done", "completed", "closed"]:
-            await self.mcp_caller('github.update_issue', {
+            await self.resilience.call_once(self.mcp_caller, 'github.update_issue', {
                 "owner": self.owner,
                 "repo": self.repo,
                 "issue_number": int(task_id),
@@ -240,7 +329,7 @@ class GitHubKanban(KanbanInterface):
             })
         elif column_lower in ["in progress", "in-progress"]:
             # Add in-progress label
-            await self.mcp_caller('github.update_issue', {
+            await self.resilience.call_once(self.mcp_caller, 'github.update_issue', {
                 "owner": self.owner,
                 "repo": self.repo,
                 "issue_number": int(task_id),
@@ -248,7 +337,7 @@ class GitHubKanban(KanbanInterface):
             })
         elif column_lower == "blocked":
             # Add blocked label
-            await self.mcp_caller('github.update_issue', {
+            await self.resilience.call_once(self.mcp_caller, 'github.update_issue', {
                 "owner": self.owner,
                 "repo": self.repo,
                 "issue_number": int(task_id),
@@ -259,7 +348,7 @@ class GitHubKanban(KanbanInterface):
         
     async def add_comment(self, task_id: str, comment: str) -> bool:
         """Add comment to issue"""
-        result = await self.mcp_caller('github.add_issue_comment', {
+        result = await self.resilience.call_once(self.mcp_caller, 'github.add_issue_comment', {
             "owner": self.owner,
             "repo": self.repo,
             "issue_number": int(task_id),
@@ -278,37 +367,24 @@ class GitHubKanban(KanbanInterface):
             "blocked_tasks": 0
         }
         
-        # Get open issues
-        open_result = await self.mcp_caller('github.list_issues', {
-            "owner": self.owner,
-            "repo": self.repo,
-            "state": "open",
-            "perPage": 100
-        })
+        await self.sync_issues()
         
-        # Get closed issues
-        closed_result = await self.mcp_caller('github.list_issues', {
-            "owner": self.owner,
-            "repo": self.repo,
-            "state": "closed",
-            "perPage": 100
-        })
-        
-        # Count open issues by labels
-        if open_result.get('issues'):
-            for issue in open_result['issues']:
-                labels = [label.get('name', '').lower() for label in issue.get('labels', [])]
+        for issue in self._issues.values():
+            # Count closed issues
+            if issue.get('state') == 'closed':
+                metrics["completed_tasks"] += 1
+                continue
                 
-                if 'blocked' in labels:
-                    metrics["blocked_tasks"] += 1
-                elif 'in-progress' in labels or 'in progress' in labels:
-                    metrics["in_progress_tasks"] += 1
-                else:
-                    metrics["backlog_tasks"] += 1
-                    
-        # Count closed issues
-        if closed_result.get('issues'):
-            metrics["completed_tasks"] = len(closed_result['issues'])
+            # Count open issues by labels
+            labels = [label.get('name', '').lower() if isinstance(label, dict) else str(label).lower()
+                      for label in issue.get('labels', [])]
+            
+            if 'blocked' in labels:
+                metrics["blocked_tasks"] += 1
+            elif 'in-progress' in labels or 'in progress' in labels:
+                metrics["in_progress_tasks"] += 1
+            else:
+                metrics["backlog_tasks"] += 1
             
         metrics["total_tasks"] = metrics["backlog_tasks"] + metrics["in_progress_tasks"] + \
                                 metrics["completed_tasks"] + metrics["blocked_tasks"]
@@ -1,15 +1,18 @@
 """
 Linear implementation of KanbanInterface
 
-Uses Linear MCP Server to manage tasks and projects
+Uses Linear MCP Server to manage tasks and projects. Issues are fetched page
+by page and kept in a local cache keyed by issue ID; after the first full sync
+only issues whose updatedAt is newer than the last sync are requested.
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, AsyncIterator
 from datetime import datetime
 import json
 
 from src.integrations.kanban_interface import KanbanInterface, KanbanProvider
 from src.core.models import Task, TaskStatus, Priority
+from src.core.resilience import ResilientEndpoint
 
 
 class LinearKanban(KanbanInterface):
@@ -24,12 +27,21 @@ class LinearKanban(KanbanInterface):
                 - mcp_function_caller: Function to call MCP tools
                 - team_id: Linear team ID
                 - project_id: Optional Linear project ID
+                - page_size: Issues requested per page (default 100)
         """
         super().__init__(config)
         self.provider = KanbanProvider.LINEAR
         self.mcp_caller = config.get('mcp_function_caller')
+        # Reads are retried on transient errors; writes are sent once
+        self.resilience = ResilientEndpoint("linear-mcp")
         self.team_id = config.get('team_id')
         self.project_id = config.get('project_id')
+        self.page_size = max(1, int(config.get('page_size', 100)))
+        
+        # Local issue cache, keyed by issue ID
+        self._issues: Dict[str, Dict[str, Any]] = {}
+        # updatedAt of the newest issue seen; None until the first full sync
+        self._synced_until: Optional[str] = None
         
         if not self.mcp_caller:
             raise ValueError("mcp_function_caller is required for Linear MCP integration")
@@ -38,7 +50,7 @@ class LinearKanban(KanbanInterface):
         """Connect to Linear MCP Server"""
         try:
             # Test connection by getting teams
-            result = await self.mcp_caller('linear.get_teams', {})
+            result = await self.resilience.call(self.mcp_caller, 'linear.get_teams', {})
             return result.get('success', False)
         except Exception as e:
             print(f"Failed to connect to Linear MCP: {e}")
@@ -51,29 +63,106 @@ class LinearKanban(KanbanInterface):
         
     async def get_available_tasks(self) -> List[Task]:
         """Get unassigned tasks from backlog"""
-        # Build search filter
-        filter_obj = {
-            "assignee": {"null": True},
-            "state": {"type": {"in": ["backlog", "unstarted"]}}
-        }
+        await self.sync_issues()
+        
+        return [
+            self._linear_issue_to_task(issue) for issue in self._issues.values()
+            if not issue.get("assignee")
+            and self._state_type(issue) in ("backlog", "unstarted")
+        ]
+        
+    async def get_all_tasks(self) -> List[Task]:
+        """Get all issues of the team/project regardless of state"""
+        await self.sync_issues()
+        return [self._linear_issue_to_task(issue) for issue in self._issues.values()]
         
+    async def sync_issues(self, full: bool = False) -> int:
+        """
+        Bring the local issue cache up to date
+        
+        The first sync (or a full one) lists every issue; later syncs only
+        list issues whose updatedAt is newer than the newest one cached.
+        
+        Args:
+            full: Drop the cache and list every issue again
+            
+        Returns:
+            Number of issues received from Linear
+        """
+        if full:
+            self._issues.clear()
+            self._synced_until = None
+            
+        filter_obj = self._scope_filter()
+        if self._synced_until:
+            filter_obj["updatedAt"] = {"gt": self._synced_until}
+            
+        received = 0
+        async for issue in self.iter_issues(filter_obj):
+            self._remember_issue(issue)
+            received += 1
+        return received
+        
+    async def iter_issues(self, filter_obj: Dict[str, Any],
+                          include_relationships: bool = True) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield every issue matching a filter, following Linear's cursor pagination
+        
+        Args:
+            filter_obj: Linear issue filter
+            include_relationships: Whether to request related entities
+        """
+        after = None
+        while True:
+            args = {
+                "query": "",  # Empty query to get all matching filter
+                "filter": filter_obj,
+                "includeRelationships": include_relationships,
+                "first": self.page_size
+            }
+            if after:
+                args["after"] = after
+                
+            result = await self.resilience.call(self.mcp_caller, 'linear.search_issues', args) or {}
+            for issue in result.get('issues') or []:
+                yield issue
+                
+            page_info = result.get('pageInfo') or {}
+            after = page_info.get('endCursor')
+            if not page_info.get('hasNextPage') or not after:
+                return
+                
+    def _scope_filter(self) -> Dict[str, Any]:
+        """Filter restricting searches to the configured team and project"""
+        filter_obj = {}
         if self.team_id:
             filter_obj["team"] = {"id": {"eq": self.team_id}}
         if self.project_id:
             filter_obj["project"] = {"id": {"eq": self.project_id}}
+        return filter_obj
+        
+    def _remember_issue(self, issue: Dict[str, Any]) -> None:
+        """Store an issue in the local cache and advance the sync cursor"""
+        self._issues[issue.get("id", "")] = issue
+        updated_at = issue.get("updatedAt")
+        if isinstance(updated_at, str) and (self._synced_until is None or updated_at > self._synced_until):
+            self._synced_until = updated_at
+            
+    def _cache_if_synced(self, issue: Dict[str, Any]) -> None:
+        """
+        Write an issue returned by a mutation through to the cache
         
-        result = await self.mcp_caller('linear.search_issues', {
-            "query": "",  # Empty query to get all matching filter
-            "filter": filter_obj,
-            "includeRelationships": True
-        })
-        
-        tasks = []
-        if result.get('issues'):
-            for issue in result['issues']:
-                tasks.append(self._linear_issue_to_task(issue))
-                
-        return tasks
+        Skipped before the first sync, so that sync still lists every issue.
+        The sync cursor is left alone so other updates are not skipped.
+        """
+        if self._synced_until is not None:
+            self._issues[issue.get("id", "")] = issue
+            
+    @staticmethod
+    def _state_type(issue: Dict[str, Any]) -> str:
+        """Linear workflow state type of an issue"""
+        state = issue.get("state", {})
+        return state.get("type", "backlog") if isinstance(state, dict) else "backlog"
         
     def _linear_issue_to_task(self, issue: Dict[str, Any]) -> Task:
         """Convert Linear issue to Task model"""
@@ -95,11 +184,10 @@ class LinearKanban(KanbanInterface):
             labels = [label if isinstance(label, str) else label.get("name", "") for label in labels]
         
         # Map Linear state to TaskStatus
-        state = issue.get("state", {})
-        state_type = state.get("type", "backlog") if isinstance(state, dict) else "backlog"
+        state_type = self._state_type(issue)
         status_map = {
-            "backlog": TaskStatus.BACKLOG,
-            "unstarted": TaskStatus.READY,
+            "backlog": TaskStatus.TODO,
+            "unstarted": TaskStatus.TODO,
             "started": TaskStatus.IN_PROGRESS,
             "completed": TaskStatus.DONE,
             "canceled": TaskStatus.DONE
@@ -123,19 +211,20 @@ class LinearKanban(KanbanInterface):
             id=issue.get("id", ""),
             name=issue.get("title", "Untitled"),
             description=issue.get("description", ""),
-            status=status_map.get(state_type, TaskStatus.BACKLOG),
+            status=status_map.get(state_type, TaskStatus.TODO),
             priority=priority_map.get(linear_priority, Priority.MEDIUM),
             labels=labels,
             estimated_hours=issue.get("estimate", 0) or 8,
             assigned_to=issue.get("assignee", {}).get("id") if issue.get("assignee") else None,
             dependencies=[],
             created_at=created_at,
-            updated_at=updated_at
+            updated_at=updated_at,
+            due_date=None
         )
         
     async def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """Get specific task by ID"""
-        result = await self.mcp_caller('linear.get_issue', {
+        result = await self.resilience.call(self.mcp_caller, 'linear.get_issue', {
             "issueId": task_id,
             "includeRelationships": True
         })
@@ -167,11 +256,12 @@ class LinearKanban(KanbanInterface):
         if task_data.get("labels"):
             create_data["labelIds"] = task_data["labels"]
         
-        result = await self.mcp_caller('linear.create_issue', create_data)
+        result = await self.resilience.call_once(self.mcp_caller, 'linear.create_issue', create_data)
         
         if not result.get('issue'):
             raise Exception(f"Failed to create task: {result.get('error', 'Unknown error')}")
             
+        self._cache_if_synced(result['issue'])
         return self._linear_issue_to_task(result['issue'])
         
     async def update_task(self, task_id: str, updates: Dict[str, Any]) -> Task:
@@ -191,16 +281,17 @@ class LinearKanban(KanbanInterface):
             }
             update_data["priority"] = priority_map.get(updates["priority"], 3)
             
-        result = await self.mcp_caller('linear.update_issue', update_data)
+        result = await self.resilience.call_once(self.mcp_caller, 'linear.update_issue', update_data)
         
         if not result.get('issue'):
             raise Exception(f"Failed to update task: {result.get('error', 'Unknown error')}")
             
+        self._cache_if_synced(result['issue'])
         return self._linear_issue_to_task(result['issue'])
         
     async def assign_task(self, task_id: str, assignee_id: str) -> bool:
         """Assign task to user"""
-        result = await self.mcp_caller('linear.update_issue', {
+        result = await self.resilience.call_once(self.mcp_caller, 'linear.update_issue', {
             "issueId": task_id,
             "assigneeId": assignee_id
         })
@@ -223,7 +314,7 @@ class LinearKanban(KanbanInterface):
         status_name = state_map.get(column_name.lower(), column_name)
         
         # Update issue with new status
-        result = await self.mcp_caller('linear.update_issue', {
+        result = await self.resilience.call_once(self.mcp_caller, 'linear.update_issue', {
             "issueId": task_id,
             "status": status_name
         })
@@ -232,7 +323,7 @@ class LinearKanban(KanbanInterface):
         
     async def add_comment(self, task_id: str, comment: str) -> bool:
         """Add comment to task"""
-        result = await self.mcp_caller('linear.create_comment', {
+        result = await self.resilience.call_once(self.mcp_caller, 'linear.create_comment', {
             "issueId": task_id,
             "body": comment
         })
@@ -250,30 +341,22 @@ class LinearKanban(KanbanInterface):
             "blocked_tasks": 0
         }
         
-        # Search for different states
-        state_queries = [
-            (["backlog", "unstarted"], "backlog_tasks"),
-            (["started"], "in_progress_tasks"),
-            (["completed", "canceled"], "completed_tasks")
-        ]
+        await self.sync_issues()
         
-        for states, metric_key in state_queries:
-            filter_obj = {"state": {"type": {"in": states}}}
-            if self.team_id:
-                filter_obj["team"] = {"id": {"eq": self.team_id}}
-            if self.project_id:
-                filter_obj["project"] = {"id": {"eq": self.project_id}}
+        state_metrics = {
+            "backlog": "backlog_tasks",
+            "unstarted": "backlog_tasks",
+            "started": "in_progress_tasks",
+            "completed": "completed_tasks",
+            "canceled": "completed_tasks"
+        }
+        
+        for issue in self._issues.values():
+            metric_key = state_metrics.get(self._state_type(issue))
+            if metric_key:
+                metrics[metric_key] += 1
+                metrics["total_tasks"] += 1
                 
-            result = await self.mcp_caller('linear.search_issues', {
-                "query": "",
-                "filter": filter_obj,
-                "includeRelationships": False
-            })
-            
-            count = len(result.get('issues', []))
-            metrics[metric_key] = count
-            metrics["total_tasks"] += count
-            
         return metrics
         
     async def report_blocker(self, task_id: str, blocker_description: str, severity: str = "medium") -> bool:
@@ -9,7 +9,9 @@ from datetime import datetime
 import asyncio
 
 from src.integrations.kanban_interface import KanbanInterface, KanbanProvider
+from src.integrations.mcp_kanban_client_simple import is_read_action
 from src.integrations.mcp_kanban_client_simplified import MCPKanbanClientSimplified
+from src.core.resilience import ResilientEndpoint
 from src.core.models import Task, TaskStatus, Priority
 
 
@@ -27,10 +29,18 @@ class PlankaKanban(KanbanInterface):
         """
         super().__init__(config)
         self.provider = KanbanProvider.PLANKA
-        self.client = MCPKanbanClientSimplified(config.get('mcp_function_caller'))
+        self.resilience = ResilientEndpoint("planka-mcp")
+        self._mcp_caller = config.get('mcp_function_caller')
+        self.client = MCPKanbanClientSimplified(self._call_mcp if self._mcp_caller else None)
         self.project_name = config.get('project_name', 'Task Master Test')
         self.connected = False
         
+    async def _call_mcp(self, tool: str, arguments: Dict[str, Any]) -> Any:
+        """Call a kanban MCP tool; reads are retried on transient errors, writes are sent once"""
+        if is_read_action(arguments):
+            return await self.resilience.call(self._mcp_caller, tool, arguments)
+        return await self.resilience.call_once(self._mcp_caller, tool, arguments)
+        
     async def connect(self) -> bool:
         """Connect to Planka via MCP"""
         try:
@@ -37,6 +37,11 @@ class PlankaKanbanSimple(KanbanInterface):
     def project_id(self):
         """Get project ID from the client"""
         return self.client.project_id if self.client else None
+    
+    @property
+    def resilience(self):
+        """Get the client's circuit breaker and concurrency limit endpoint"""
+        return self.client.resilience if self.client else None
         
     async def connect(self) -> bool:
         """Connect to Planka via MCP"""
@@ -49,7 +54,8 @@ class PlankaKanbanSimple(KanbanInterface):
             return False
             
     async def disconnect(self):
-        """Disconnect from Planka"""
+        """Disconnect from Planka and close pooled MCP sessions"""
+        await self.client.close()
         self.connected = False
         
     async def get_available_tasks(self) -> List[Task]:
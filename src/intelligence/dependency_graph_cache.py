@@ -0,0 +1,195 @@
+"""
+Cached dependency graph for task assignment
+
+Inferring the dependency graph and walking its critical path is expensive,
+and the board rarely changes between two assignment requests. This module
+keeps the inferred graph, the critical-path set and a reverse index of
+explicit dependencies, and only rebuilds what a board change invalidates.
+"""
+
+import hashlib
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.core.models import Task, TaskStatus
+from src.intelligence.dependency_inferer import DependencyGraph, DependencyInferer
+
+logger = logging.getLogger(__name__)
+
+
+class DependencyGraphCache:
+    """
+    Versioned dependency graph shared across assignment requests
+
+    Each task is fingerprinted by id, every field dependency inference reads
+    (name, description, status, estimated hours, creation time) and its
+    explicit dependencies. On every sync only changed tasks are re-indexed:
+
+    - The reverse index of explicit dependencies (used to count how many TODO
+      tasks a task unblocks) is patched per changed task.
+    - The inferred graph and critical path are rebuilt only when a change can
+      affect inference (tasks added/removed, or any inference field
+      changed). Edits to explicit dependencies alone keep the graph.
+    """
+
+    def __init__(self, inferer: Optional[DependencyInferer] = None):
+        """
+        Args:
+            inferer: Inferer used to build the graph; a new DependencyInferer
+                is created if not given
+        """
+        self.inferer = inferer or DependencyInferer()
+
+        self.graph: Optional[DependencyGraph] = None
+        self.critical_path: Set[str] = set()
+        self.version = 0
+
+        # task id -> (name, description, status, estimated hours, created at,
+        #             explicit dependencies)
+        self._signatures: Dict[str, Optional[Tuple[Any, ...]]] = {}
+        # dependency id -> ids of tasks that explicitly depend on it
+        self._dependents: Dict[str, Set[str]] = defaultdict(set)
+        # dependency id -> number of TODO tasks that explicitly depend on it
+        self._todo_dependents: Dict[str, int] = defaultdict(int)
+        self._graph_inferer: Optional[Any] = None
+
+        # Metrics
+        self.hits = 0
+        self.graph_rebuilds = 0
+        self.index_updates = 0
+
+    @staticmethod
+    def _signature(task: Task) -> Tuple[Any, ...]:
+        return (
+            task.name,
+            task.description or "",
+            task.status,
+            task.estimated_hours,
+            task.created_at,
+            tuple(sorted(set(task.dependencies or []))),
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the board as last synced"""
+        digest = hashlib.sha1()
+        for task_id in sorted(self._signatures):
+            digest.update(repr((task_id, self._signatures[task_id])).encode())
+        return digest.hexdigest()
+
+    async def sync(self, tasks: List[Task], inferer: Optional[Any] = None) -> DependencyGraph:
+        """
+        Bring the cache in line with the current board
+
+        Args:
+            tasks: Every task in the project
+            inferer: Inferer to use instead of ``self.inferer``; a graph built
+                by a different inferer is never reused
+
+        Returns:
+            The (possibly cached) dependency graph
+        """
+        inferer = inferer or self.inferer
+        current = {task.id: self._signature(task) for task in tasks}
+
+        removed = [task_id for task_id in self._signatures if task_id not in current]
+        changed = [
+            task_id for task_id, signature in current.items()
+            if self._signatures.get(task_id) != signature
+        ]
+
+        graph_stale = (
+            self.graph is None
+            or inferer is not self._graph_inferer
+            or bool(removed)
+        )
+
+        for task_id in removed:
+            self._unindex(task_id, self._signatures.pop(task_id))
+
+        for task_id in changed:
+            previous = self._signatures.get(task_id)
+            signature = current[task_id]
+            if previous is None or previous[:-1] != signature[:-1]:
+                graph_stale = True
+            self._unindex(task_id, previous)
+            self._index(task_id, signature)
+            self._signatures[task_id] = signature
+
+        if removed or changed:
+            self.index_updates += 1
+            self.version += 1
+
+        if graph_stale:
+            self.graph = await inferer.infer_dependencies(tasks)
+            self.critical_path = set(self.graph.get_critical_path())
+            self._graph_inferer = inferer
+            self.graph_rebuilds += 1
+            if not (removed or changed):
+                self.version += 1
+            logger.debug(f"Rebuilt dependency graph (version {self.version}, {len(tasks)} tasks)")
+        elif not (removed or changed):
+            self.hits += 1
+
+        return self.graph
+
+    def invalidate(self, task_ids: Optional[List[str]] = None) -> None:
+        """
+        Force tasks to be re-indexed (and the graph rebuilt) on the next sync
+
+        Args:
+            task_ids: Tasks that changed; all tasks if not given
+        """
+        if task_ids is None:
+            self.graph = None
+            return
+        for task_id in task_ids:
+            if task_id in self._signatures:
+                self._unindex(task_id, self._signatures[task_id])
+                self._signatures[task_id] = None
+
+    def is_critical(self, task_id: str) -> bool:
+        """Whether the task is on the cached critical path"""
+        return task_id in self.critical_path
+
+    def unblocked_count(self, task_id: str) -> int:
+        """Number of TODO tasks that explicitly depend on this task"""
+        return self._todo_dependents.get(task_id, 0)
+
+    def dependents_of(self, task_id: str) -> Set[str]:
+        """IDs of tasks that explicitly depend on this task"""
+        return set(self._dependents.get(task_id, ()))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            "version": self.version,
+            "tasks": len(self._signatures),
+            "critical_path_length": len(self.critical_path),
+            "hits": self.hits,
+            "graph_rebuilds": self.graph_rebuilds,
+            "index_updates": self.index_updates,
+        }
+
+    def _index(self, task_id: str, signature: Tuple[Any, ...]) -> None:
+        is_todo = signature[2] == TaskStatus.TODO
+        for dep_id in signature[-1]:
+            self._dependents[dep_id].add(task_id)
+            if is_todo:
+                self._todo_dependents[dep_id] += 1
+
+    def _unindex(self, task_id: str, signature: Optional[Tuple[Any, ...]]) -> None:
+        if signature is None:
+            return
+        is_todo = signature[2] == TaskStatus.TODO
+        for dep_id in signature[-1]:
+            dependents = self._dependents.get(dep_id)
+            if dependents is not None:
+                dependents.discard(task_id)
+                if not dependents:
+                    del self._dependents[dep_id]
+            if is_todo:
+                self._todo_dependents[dep_id] -= 1
+                if self._todo_dependents[dep_id] <= 0:
+                    del self._todo_dependents[dep_id]
@@ -7,11 +7,12 @@ Smart dependency detection to prevent illogical task assignments like
 
 import logging
 import re
-from typing import List, Dict, Any, Optional, Tuple, Set
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from collections import defaultdict, deque
 
 from src.core.models import Task, TaskStatus
+from src.utils.graph_utils import find_cycle, transitive_reduction
 
 logger = logging.getLogger(__name__)
 
@@ -47,34 +48,13 @@ class DependencyGraph:
     
     def has_cycle(self) -> bool:
         """Check if the dependency graph has cycles"""
-        visited = set()
-        rec_stack = set()
-        
-        def dfs(node_id: str) -> bool:
-            if node_id in rec_stack:
-                return True
-            if node_id in visited:
-                return False
-            
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            
-            for neighbor in self.adjacency_list.get(node_id, []):
-                if dfs(neighbor):
-                    return True
-            
-            rec_stack.remove(node_id)
-            return False
-        
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs(node_id):
-                    return True
-        
-        return False
+        return find_cycle(self.nodes, self.adjacency_list) is not None
     
     def get_critical_path(self) -> List[str]:
         """Get the critical path (longest dependency chain)"""
+        if not self.nodes:
+            return []
+        
         # Topological sort to find longest path
         in_degree = defaultdict(int)
         for node_id in self.nodes:
@@ -254,20 +234,7 @@ class DependencyInferer:
         nodes = {task.id: task for task in tasks}
         
         # Infer dependencies using patterns
-        inferred_dependencies = []
-        
-        for dependent_task in tasks:
-            for dependency_task in tasks:
-                if dependent_task.id == dependency_task.id:
-                    continue
-                
-                # Check each pattern
-                for pattern in self.dependency_patterns:
-                    dependency = self._check_pattern(
-                        dependent_task, dependency_task, pattern
-                    )
-                    if dependency:
-                        inferred_dependencies.append(dependency)
+        inferred_dependencies = self._match_patterns(tasks)
         
         # Remove duplicates and conflicts
         cleaned_dependencies = self._clean_dependencies(inferred_dependencies)
@@ -297,6 +264,71 @@ class DependencyInferer:
         
         return graph
     
+    def _match_patterns(self, tasks: List[Task]) -> List[InferredDependency]:
+        """
+        Match every task pair against every dependency pattern
+        
+        Each task's text is lowered and matched against each compiled
+        condition/dependency pattern once. Tasks matching a pattern's
+        dependency side are kept as a bitset of task positions, and a task
+        is only paired with the tasks in the buckets of the patterns whose
+        condition it matched. Results come out in the same order as checking
+        every (dependent, dependency, pattern) triple with ``_check_pattern``.
+        
+        Args:
+            tasks: Tasks to analyze
+            
+        Returns:
+            Every pattern-based dependency, before cleaning
+        """
+        patterns = self.dependency_patterns
+        conditions = [re.compile(p.condition_pattern) for p in patterns]
+        requirements = [re.compile(p.dependency_pattern) for p in patterns]
+        
+        # Classification pass: one regex evaluation per task and pattern side
+        matched_conditions: List[List[int]] = []
+        dependency_buckets = [0] * len(patterns)
+        for position, task in enumerate(tasks):
+            text = f"{task.name} {task.description or ''}".lower()
+            matched_conditions.append([
+                index for index, regex in enumerate(conditions) if regex.search(text)
+            ])
+            for index, regex in enumerate(requirements):
+                if regex.search(text):
+                    dependency_buckets[index] |= 1 << position
+        
+        inferred_dependencies = []
+        for position, dependent_task in enumerate(tasks):
+            pattern_indexes = matched_conditions[position]
+            if not pattern_indexes:
+                continue
+            
+            # Candidates are the union of the matching buckets, minus self
+            candidates = 0
+            for index in pattern_indexes:
+                candidates |= dependency_buckets[index]
+            candidates &= ~(1 << position)
+            
+            # Walk candidate positions in ascending (task list) order
+            while candidates:
+                lowest = candidates & -candidates
+                candidate = lowest.bit_length() - 1
+                candidates ^= lowest
+                
+                dependency_task = tasks[candidate]
+                if dependency_task.id == dependent_task.id:
+                    continue
+                for index in pattern_indexes:
+                    if not (dependency_buckets[index] >> candidate) & 1:
+                        continue
+                    pattern = patterns[index]
+                    if self._is_logical_dependency(dependent_task, dependency_task, pattern):
+                        inferred_dependencies.append(
+                            self._create_dependency(dependent_task, dependency_task, pattern)
+                        )
+        
+        return inferred_dependencies
+    
     def _check_pattern(
         self, 
         dependent_task: Task, 
@@ -321,7 +353,15 @@ class DependencyInferer:
         if not self._is_logical_dependency(dependent_task, dependency_task, pattern):
             return None
         
-        # Create dependency
+        return self._create_dependency(dependent_task, dependency_task, pattern)
+    
+    def _create_dependency(
+        self,
+        dependent_task: Task,
+        dependency_task: Task,
+        pattern: DependencyPattern
+    ) -> InferredDependency:
+        """Create the dependency implied by a matched pattern"""
         dependency_type = "hard" if pattern.mandatory else "soft"
         
         return InferredDependency(
@@ -392,83 +432,42 @@ class DependencyInferer:
         return cleaned
     
     def _remove_transitive_dependencies(self, dependencies: List[InferredDependency]) -> List[InferredDependency]:
-        """Remove dependencies that are implied by transitive relationships"""
-        
-        # Build adjacency map
-        adjacency = defaultdict(set)
-        dep_map = {}
-        
-        for dep in dependencies:
-            adjacency[dep.dependency_task_id].add(dep.dependent_task_id)
-            dep_map[(dep.dependency_task_id, dep.dependent_task_id)] = dep
-        
-        # Find transitive closures
-        def find_transitive_paths(start: str, end: str, visited: Set[str]) -> bool:
-            if start == end:
-                return True
-            if start in visited:
-                return False
-            
-            visited.add(start)
-            for neighbor in adjacency[start]:
-                if find_transitive_paths(neighbor, end, visited.copy()):
-                    return True
-            
-            return False
-        
-        # Keep only non-transitive dependencies
-        filtered = []
-        for dep in dependencies:
-            # Check if there's an indirect path
-            has_indirect_path = False
-            for intermediate in list(adjacency):
-                if (intermediate != dep.dependency_task_id and 
-                    intermediate != dep.dependent_task_id):
-                    
-                    path_to_intermediate = find_transitive_paths(
-                        dep.dependency_task_id, intermediate, set()
-                    )
-                    path_from_intermediate = find_transitive_paths(
-                        intermediate, dep.dependent_task_id, set()
-                    )
-                    
-                    if path_to_intermediate and path_from_intermediate:
-                        has_indirect_path = True
-                        break
-            
-            # Keep if no indirect path or if it's a mandatory dependency
-            if not has_indirect_path or dep.dependency_type == "hard":
-                filtered.append(dep)
+        """
+        Remove dependencies that are implied by transitive relationships
         
-        return filtered
+        A -> C is dropped when some other task B gives A -> ... -> B -> ... -> C.
+        Hard (mandatory) dependencies are always kept.
+        """
+        return transitive_reduction(
+            dependencies,
+            edge=lambda dep: (dep.dependency_task_id, dep.dependent_task_id),
+            keep=lambda dep: dep.dependency_type == "hard"
+        )
     
     def _resolve_cycles(self, graph: DependencyGraph) -> DependencyGraph:
         """Resolve cycles in dependency graph by removing lowest confidence edges"""
         
-        while graph.has_cycle():
-            # Find cycles using DFS
+        while True:
             cycles = self._find_cycles(graph)
             
             if not cycles:
                 break
             
+            # First edge recorded for each (dependency, dependent) pair
+            edge_index = {}
+            for edge in graph.edges:
+                edge_index.setdefault((edge.dependency_task_id, edge.dependent_task_id), edge)
+            
             # Remove the lowest confidence edge from the first cycle
             cycle = cycles[0]
             min_confidence = float('inf')
             edge_to_remove = None
             
             for i in range(len(cycle)):
-                current = cycle[i]
-                next_node = cycle[(i + 1) % len(cycle)]
-                
-                # Find the edge
-                for edge in graph.edges:
-                    if (edge.dependency_task_id == current and 
-                        edge.dependent_task_id == next_node):
-                        if edge.confidence < min_confidence:
-                            min_confidence = edge.confidence
-                            edge_to_remove = edge
-                        break
+                edge = edge_index.get((cycle[i], cycle[(i + 1) % len(cycle)]))
+                if edge is not None and edge.confidence < min_confidence:
+                    min_confidence = edge.confidence
+                    edge_to_remove = edge
             
             if edge_to_remove:
                 graph.edges.remove(edge_to_remove)
@@ -491,33 +490,14 @@ class DependencyInferer:
         return graph
     
     def _find_cycles(self, graph: DependencyGraph) -> List[List[str]]:
-        """Find all cycles in the dependency graph"""
-        cycles = []
-        visited = set()
-        
-        def dfs(node: str, path: List[str], visited_in_path: Set[str]):
-            if node in visited_in_path:
-                # Found a cycle
-                cycle_start = path.index(node)
-                cycle = path[cycle_start:] + [node]
-                cycles.append(cycle)
-                return
-            
-            if node in visited:
-                return
-            
-            visited.add(node)
-            visited_in_path.add(node)
-            path.append(node)
-            
-            for neighbor in graph.adjacency_list.get(node, []):
-                dfs(neighbor, path.copy(), visited_in_path.copy())
-        
-        for node in graph.nodes:
-            if node not in visited:
-                dfs(node, [], set())
+        """
+        Find a cycle in the dependency graph
         
-        return cycles
+        Returns the first cycle a depth-first search over the tasks meets, as
+        a one-element list, or an empty list if the graph is acyclic.
+        """
+        cycle = find_cycle(graph.nodes, graph.adjacency_list)
+        return [cycle] if cycle else []
     
     async def validate_dependencies(self, graph: DependencyGraph) -> Dict[str, Any]:
         """
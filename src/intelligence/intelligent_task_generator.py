@@ -617,7 +617,7 @@ class IntelligentTaskGenerator:
             labels=labels
         )
         
-        # Add metadata as dynamic attribute for task tracking
+        # Add metadata for task tracking
         task.metadata = {
             "phase": phase,
             "generated": True,
@@ -3,15 +3,27 @@ Lightweight agent event logging for Marcus
 
 This module provides basic event logging functionality without any dependencies
 on visualization libraries like NetworkX. It's designed to be fast and safe
-for use in the core Marcus operations.
+for use in the core Marcus operations: events are queued on the shared log
+sink and written to disk by its background writer.
 """
 
-import json
-import os
-import time
 from datetime import datetime
-from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+
+from src.logging.log_sink import LogStream, get_log_sink
+
+# One JSON lines file per day, rotated by size as well
+AGENT_EVENTS_PATH = "logs/agent_events/agent_events_%Y%m%d.jsonl"
+AGENT_EVENTS_MAX_BYTES = 50 * 1024 * 1024
+
+_stream: Optional[LogStream] = None
+
+
+def _agent_events_stream() -> LogStream:
+    global _stream
+    if _stream is None:
+        _stream = get_log_sink().stream(AGENT_EVENTS_PATH, max_bytes=AGENT_EVENTS_MAX_BYTES)
+    return _stream
 
 
 def log_agent_event(event_type: str, event_data: Dict[str, Any]) -> None:
@@ -19,16 +31,14 @@ def log_agent_event(event_type: str, event_data: Dict[str, Any]) -> None:
     Log an agent event for later visualization.
     
     This is a lightweight version that doesn't trigger NetworkX imports.
+    The event is queued and written in the background, so the caller never
+    waits on disk I/O.
     
     Args:
         event_type: Type of event (e.g., "task_request", "worker_registration")
         event_data: Event details as a dictionary
     """
     try:
-        # Create logs directory if it doesn't exist
-        log_dir = Path("logs/agent_events")
-        log_dir.mkdir(parents=True, exist_ok=True)
-        
         # Create timestamped event
         event = {
             "timestamp": datetime.now().isoformat(),
@@ -36,10 +46,7 @@ def log_agent_event(event_type: str, event_data: Dict[str, Any]) -> None:
             "data": event_data
         }
         
-        # Write to a simple JSON lines file
-        log_file = log_dir / f"agent_events_{datetime.now().strftime('%Y%m%d')}.jsonl"
-        with open(log_file, 'a') as f:
-            f.write(json.dumps(event) + '\n')
+        _agent_events_stream().write(event)
             
     except Exception as e:
         # Don't let logging errors break the main functionality
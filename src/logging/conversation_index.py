@@ -0,0 +1,385 @@
+"""
+Sidecar index for conversation log files
+
+Every ``conversations_*.jsonl`` / ``decisions_*.jsonl`` file written by
+ConversationLogger gets a ``<file>.index.json`` next to it holding the file's
+time range, a byte offset checkpoint every ``checkpoint_interval`` seconds of
+log time, per-type entry counts and a few decision aggregates. Time-window
+replays seek straight to the first checkpoint that can contain the window,
+files outside the window (or without the requested type) are skipped
+unopened, and decision metrics are read from the aggregates without parsing
+a single entry.
+
+The index is built as lines are written by IndexedFileHandler. Anything the
+handler did not see (files from an older run, lines written before the index
+was last saved) is caught up by scanning only the unindexed tail of the file.
+Entries are assumed to be appended in timestamp order, which holds for one
+process logging through one handler.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+INDEX_SUFFIX = ".index.json"
+INDEX_VERSION = 1
+
+
+def parse_entry(line: Union[str, bytes]) -> Optional[Dict[str, Any]]:
+    """
+    Parse one log line.
+
+    Args:
+        line: Raw line; plain-text lines from non-structured loggers are ignored
+
+    Returns:
+        The JSON entry, or None if the line is not a JSON object
+    """
+    line = line.strip()
+    if not line or line[:1] not in ("{", b"{"):
+        return None
+    try:
+        entry = json.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+def entry_time(entry: Dict[str, Any]) -> Optional[float]:
+    """Epoch seconds of an entry's ISO timestamp, or None if it has none"""
+    timestamp = entry.get("timestamp")
+    if not isinstance(timestamp, str):
+        return None
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+def entry_type(entry: Dict[str, Any]) -> Optional[str]:
+    """Conversation type of an entry, falling back to its event type"""
+    return entry.get("conversation_type") or entry.get("event_type")
+
+
+class LogFileIndex:
+    """
+    Index of one JSONL log file.
+
+    Checkpoints are ``[max_time_before, offset]`` pairs: every entry before
+    ``offset`` has a timestamp of at most ``max_time_before``, so a window
+    starting after it can safely begin reading at ``offset``.
+    """
+
+    def __init__(self, path: Union[str, Path], checkpoint_interval: float = 60.0):
+        """
+        Args:
+            path: Log file the index describes
+            checkpoint_interval: Seconds of log time between offset checkpoints
+        """
+        self.path = Path(path)
+        self.index_path = Path(f"{self.path}{INDEX_SUFFIX}")
+        self.checkpoint_interval = checkpoint_interval
+        self._lock = threading.RLock()
+        self.save_errors = 0
+        self._reset()
+
+    def _reset(self) -> None:
+        self.indexed_bytes = 0
+        self.start: Optional[float] = None
+        self.end: Optional[float] = None
+        self.entries = 0
+        self.type_counts: Dict[str, int] = {}
+        self.checkpoints: List[List[float]] = []
+        self.last_checkpoint: Optional[float] = None
+        self.confidence_sum = 0.0
+        self.confidence_count = 0
+        self.completed_tasks = 0
+        self.unsaved = 0
+
+    @classmethod
+    def load(cls, path: Union[str, Path], checkpoint_interval: float = 60.0) -> "LogFileIndex":
+        """
+        Load a file's index from its sidecar, or start an empty one.
+
+        Args:
+            path: Log file
+            checkpoint_interval: Seconds of log time between offset checkpoints
+
+        Returns:
+            The index; call ``refresh`` to cover lines written since it was saved
+        """
+        index = cls(path, checkpoint_interval)
+        try:
+            with open(index.index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return index
+
+        if data.get("version") != INDEX_VERSION:
+            return index
+        try:
+            index.indexed_bytes = int(data["indexed_bytes"])
+            index.start = data.get("start")
+            index.end = data.get("end")
+            index.entries = int(data.get("entries", 0))
+            index.type_counts = dict(data.get("type_counts", {}))
+            index.checkpoints = [list(c) for c in data.get("checkpoints", [])]
+            index.last_checkpoint = data.get("last_checkpoint")
+            index.confidence_sum = float(data.get("confidence_sum", 0.0))
+            index.confidence_count = int(data.get("confidence_count", 0))
+            index.completed_tasks = int(data.get("completed_tasks", 0))
+        except (KeyError, TypeError, ValueError):
+            index._reset()
+        return index
+
+    def add(self, entry: Optional[Dict[str, Any]], offset: int, end_offset: int) -> bool:
+        """
+        Index a line that was just written.
+
+        Args:
+            entry: Parsed line, or None for a line that is not a JSON entry
+            offset: Byte offset where the line starts
+            end_offset: Byte offset just past the line
+
+        Returns:
+            False if the line does not directly follow the indexed bytes; it
+            is then left for ``refresh`` to pick up
+        """
+        with self._lock:
+            if offset != self.indexed_bytes or end_offset <= offset:
+                return False
+            if entry is not None:
+                self._observe(entry, offset)
+            self.indexed_bytes = end_offset
+            self.unsaved += 1
+            return True
+
+    def refresh(self) -> bool:
+        """
+        Index complete lines appended since the last indexed byte.
+
+        A file shorter than the indexed size was replaced, and is reindexed
+        from the start.
+
+        Returns:
+            True if the index changed
+        """
+        with self._lock:
+            try:
+                size = os.path.getsize(self.path)
+            except OSError:
+                return False
+            changed = size < self.indexed_bytes
+            if changed:
+                self._reset()
+            if size == self.indexed_bytes:
+                return changed
+
+            with open(self.path, "rb") as f:
+                f.seek(self.indexed_bytes)
+                offset = self.indexed_bytes
+                for line in f:
+                    if not line.endswith(b"\n"):
+                        break
+                    entry = parse_entry(line)
+                    if entry is not None:
+                        self._observe(entry, offset)
+                    offset += len(line)
+                    self.indexed_bytes = offset
+                    self.unsaved += 1
+                    changed = True
+            return changed
+
+    def _observe(self, entry: Dict[str, Any], offset: int) -> None:
+        kind = entry_type(entry)
+        if kind:
+            self.type_counts[kind] = self.type_counts.get(kind, 0) + 1
+        self.entries += 1
+
+        if kind == "decision" and isinstance(entry.get("confidence_score"), (int, float)):
+            self.confidence_sum += entry["confidence_score"]
+            self.confidence_count += 1
+        elif kind == "progress" and (entry.get("status") == "completed" or
+                                     (isinstance(entry.get("progress"), (int, float)) and
+                                      entry["progress"] >= 100)):
+            self.completed_tasks += 1
+
+        when = entry_time(entry)
+        if when is None:
+            return
+        if self.last_checkpoint is None or when >= self.last_checkpoint + self.checkpoint_interval:
+            self.checkpoints.append([self.end, offset])
+            self.last_checkpoint = when
+        self.start = when if self.start is None else min(self.start, when)
+        self.end = when if self.end is None else max(self.end, when)
+
+    def overlaps(self, start: Optional[float], end: Optional[float]) -> bool:
+        """Whether any indexed entry can fall inside [start, end]"""
+        if self.start is None:
+            return False
+        if start is not None and self.end < start:
+            return False
+        if end is not None and self.start > end:
+            return False
+        return True
+
+    def seek_offset(self, start: Optional[float]) -> int:
+        """Byte offset from which every entry at or after ``start`` is found"""
+        if start is None:
+            return 0
+        offset = 0
+        for max_before, checkpoint_offset in self.checkpoints:
+            if max_before is not None and max_before >= start:
+                break
+            offset = checkpoint_offset
+        return int(offset)
+
+    def count(self, kind: Optional[str]) -> int:
+        """Entries of one type, or all entries if ``kind`` is None"""
+        return self.entries if kind is None else self.type_counts.get(kind, 0)
+
+    def save(self) -> bool:
+        """
+        Write the sidecar atomically.
+
+        Failures are counted, not logged: this runs inside the log handler,
+        and logging from there would write back into the same file.
+
+        Returns:
+            False if the sidecar could not be written
+        """
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "indexed_bytes": self.indexed_bytes,
+                "start": self.start,
+                "end": self.end,
+                "entries": self.entries,
+                "type_counts": self.type_counts,
+                "checkpoints": self.checkpoints,
+                "last_checkpoint": self.last_checkpoint,
+                "confidence_sum": self.confidence_sum,
+                "confidence_count": self.confidence_count,
+                "completed_tasks": self.completed_tasks,
+            }
+            tmp_path = f"{self.index_path}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.index_path)
+            except OSError:
+                self.save_errors += 1
+                return False
+            self.unsaved = 0
+            return True
+
+    def iter_entries(
+        self,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        kind: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the file's entries inside a time window.
+
+        Args:
+            start: Earliest entry time (epoch seconds), unbounded if None
+            end: Latest entry time (epoch seconds), unbounded if None
+            kind: Only entries of this conversation/event type
+
+        Yields:
+            Parsed entries in file order
+        """
+        if not self.overlaps(start, end) or (kind is not None and not self.count(kind)):
+            return
+        with open(self.path, "rb") as f:
+            f.seek(self.seek_offset(start))
+            for line in f:
+                if not line.endswith(b"\n"):
+                    return
+                entry = parse_entry(line)
+                if entry is None:
+                    continue
+                when = entry_time(entry)
+                if start is not None or end is not None:
+                    if when is None or (start is not None and when < start):
+                        continue
+                    if end is not None and when > end:
+                        return
+                if kind is None or entry_type(entry) == kind:
+                    yield entry
+
+
+_indexes: Dict[str, LogFileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_file_index(path: Union[str, Path], checkpoint_interval: float = 60.0) -> LogFileIndex:
+    """
+    Get the process-wide index of a log file, loading its sidecar on first use.
+
+    Writers and readers in one process share the same index object, so lines
+    indexed by the handler are never rescanned by a replay.
+
+    Args:
+        path: Log file
+        checkpoint_interval: Seconds of log time between offset checkpoints
+
+    Returns:
+        The file's index
+    """
+    key = os.path.abspath(path)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = LogFileIndex.load(key, checkpoint_interval)
+            _indexes[key] = index
+        return index
+
+
+class IndexedFileHandler(logging.FileHandler):
+    """
+    FileHandler that indexes each line as it is written.
+
+    The sidecar is saved every ``save_every`` lines and when the handler is
+    closed; readers catch up on whatever was written in between.
+    """
+
+    def __init__(self, filename: Union[str, Path], checkpoint_interval: float = 60.0,
+                 save_every: int = 100):
+        """
+        Args:
+            filename: Log file to append to
+            checkpoint_interval: Seconds of log time between offset checkpoints
+            save_every: Lines written between sidecar saves
+        """
+        super().__init__(filename, encoding="utf-8")
+        self.save_every = max(1, save_every)
+        self.index = get_file_index(self.baseFilename, checkpoint_interval)
+        self.index.refresh()
+
+    def emit(self, record: logging.LogRecord) -> None:
+        offset = self.stream.tell() if self.stream is not None else None
+        super().emit(record)
+        if offset is None or self.stream is None:
+            return
+        try:
+            entry = parse_entry(record.getMessage())
+            if self.index.add(entry, offset, self.stream.tell()) and self.index.unsaved >= self.save_every:
+                self.index.save()
+        except Exception:
+            # Never fail the write; the line is indexed by the next refresh
+            pass
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self.index.unsaved:
+                self.index.save()
+        finally:
+            self.release()
+        super().close()
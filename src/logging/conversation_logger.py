@@ -65,10 +65,12 @@ import json
 import logging
 import structlog
 from datetime import datetime
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, Iterator, List, Union
 from enum import Enum
 from pathlib import Path
 
+from src.logging.conversation_index import IndexedFileHandler, LogFileIndex, get_file_index
+
 
 class ConversationType(Enum):
     """
@@ -145,6 +147,9 @@ class ConversationLogger:
     log_dir : str, default="logs/conversations"
         Directory path where log files will be stored. The directory will be
         created if it doesn't exist, including parent directories.
+    index_interval : float, default=60.0
+        Seconds of log time between the byte offset checkpoints recorded in
+        each log file's sidecar index.
     
     Attributes
     ----------
@@ -177,6 +182,8 @@ class ConversationLogger:
         Log overall system state for monitoring and analysis.
     get_conversation_replay(start_time=None, end_time=None, filter_type=None)
         Retrieve conversation logs for replay and analysis.
+    iter_conversation_replay(start_time=None, end_time=None, filter_type=None)
+        Stream conversation logs for replay without loading them all.
     export_decision_metrics()
         Export aggregated decision metrics for performance analysis.
     
@@ -229,6 +236,8 @@ class ConversationLogger:
     -----
     All log entries are timestamped with ISO format for consistency.
     Log files are automatically rotated with timestamp-based naming.
+    Each log file has a ``.index.json`` sidecar (time range, offset
+    checkpoints, per-type counts) kept up to date as lines are written.
     The JSON structure enables efficient parsing and analysis.
     Structured logging supports real-time dashboard integration.
     Log retention and cleanup should be managed externally.
@@ -240,9 +249,10 @@ class ConversationLogger:
     log_thinking : Utility function for internal process logging
     """
     
-    def __init__(self, log_dir: str = "logs/conversations") -> None:
+    def __init__(self, log_dir: str = "logs/conversations", index_interval: float = 60.0) -> None:
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
+        self.index_interval = index_interval
         
         # Configure structlog for structured JSON logging
         structlog.configure(
@@ -286,16 +296,19 @@ class ConversationLogger:
         
         Files are created with timestamp format: YYYYMMDD_HHMMSS
         Log rotation should be managed externally or through system tools.
+        Both handlers index every line they write into the file's sidecar.
         """
         # Main conversation log
-        conversation_handler = logging.FileHandler(
-            self.log_dir / f"conversations_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+        conversation_handler = IndexedFileHandler(
+            self.log_dir / f"conversations_{datetime.now():%Y%m%d_%H%M%S}.jsonl",
+            checkpoint_interval=self.index_interval
         )
         conversation_handler.setLevel(logging.DEBUG)
         
         # Decision log for Marcus decisions
-        decision_handler = logging.FileHandler(
-            self.log_dir / f"decisions_{datetime.now():%Y%m%d_%H%M%S}.jsonl"
+        decision_handler = IndexedFileHandler(
+            self.log_dir / f"decisions_{datetime.now():%Y%m%d_%H%M%S}.jsonl",
+            checkpoint_interval=self.index_interval
         )
         decision_handler.setLevel(logging.INFO)
         
@@ -1510,19 +1523,69 @@ class ConversationLogger:
         Notes
         -----
         This method reads from the stored JSON log files.
-        Large time ranges may return substantial amounts of data.
-        Consider implementing pagination for very large result sets.
+        Large time ranges may return substantial amounts of data; use
+        iter_conversation_replay to stream them instead.
         Log files are organized by timestamp for efficient retrieval.
         Empty list is returned if no logs match the criteria.
         
         See Also
         --------
+        iter_conversation_replay : Streaming version of this method
         export_decision_metrics : Extract decision-specific metrics
         ConversationType : Enumeration of conversation types
         """
-        # This would read from the log files and filter based on criteria
-        # For now, returning empty list as placeholder
-        return []
+        return list(self.iter_conversation_replay(start_time, end_time, filter_type))
+        
+    def iter_conversation_replay(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        filter_type: Optional[ConversationType] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream conversation logs for replay, oldest file first.
+        
+        Uses each log file's sidecar index to skip files outside the time
+        window or without the requested conversation type, and to seek to
+        the first offset checkpoint that can contain ``start_time``. Only
+        the entries from there up to ``end_time`` are read and parsed.
+        
+        Parameters
+        ----------
+        start_time : Optional[datetime], default=None
+            Start of the time range. Naive datetimes are local time.
+        end_time : Optional[datetime], default=None
+            End of the time range. Naive datetimes are local time.
+        filter_type : Optional[ConversationType], default=None
+            Only yield entries of this conversation type.
+        
+        Yields
+        ------
+        Dict[str, Any]
+            Log entries matching the filter criteria, in the order written.
+        
+        Examples
+        --------
+        >>> for entry in logger.iter_conversation_replay(
+        ...     start_time=datetime(2024, 1, 15, 9, 0),
+        ...     filter_type=ConversationType.DECISION
+        ... ):
+        ...     print(entry['decision'])
+        """
+        start = start_time.timestamp() if start_time is not None else None
+        end = end_time.timestamp() if end_time is not None else None
+        kind = filter_type.value if filter_type is not None else None
+        
+        for index in self._file_indexes("conversations_*.jsonl"):
+            yield from index.iter_entries(start, end, kind)
+            
+    def _file_indexes(self, pattern: str) -> Iterator[LogFileIndex]:
+        """Up-to-date indexes of the log files matching a pattern, oldest first"""
+        for path in sorted(self.log_dir.glob(pattern)):
+            index = get_file_index(path, self.index_interval)
+            if index.refresh():
+                index.save()
+            yield index
         
     def export_decision_metrics(self) -> Dict[str, Any]:
         """
@@ -1585,8 +1648,9 @@ class ConversationLogger:
         Notes
         -----
         Metrics are calculated from all available decision log data.
-        Large log files may require time for comprehensive analysis.
-        Metrics are cached and updated periodically for performance.
+        Counts and confidence sums come from each file's sidecar index, so
+        only lines written since the index was last updated are parsed.
+        Decision timing and task durations are not logged yet and stay 0.
         Success rates are based on task completion and quality metrics.
         Empty metrics are returned if insufficient decision data exists.
         
@@ -1596,13 +1660,30 @@ class ConversationLogger:
         log_pm_decision : Log decisions for metrics calculation
         log_task_assignment : Log assignments for success rate calculation
         """
-        # Placeholder for metrics extraction
+        total_decisions = 0
+        assignments = 0
+        completed = 0
+        confidence_sum = 0.0
+        confidence_count = 0
+        decision_types: Dict[str, int] = {}
+        
+        for index in self._file_indexes("decisions_*.jsonl"):
+            total_decisions += index.count(ConversationType.DECISION.value)
+            assignments += index.count("assignment")
+            completed += index.completed_tasks
+            confidence_sum += index.confidence_sum
+            confidence_count += index.confidence_count
+            for kind, count in index.type_counts.items():
+                decision_types[kind] = decision_types.get(kind, 0) + count
+                
         return {
-            "total_decisions": 0,
-            "successful_assignments": 0,
+            "total_decisions": total_decisions,
+            "successful_assignments": assignments,
             "average_decision_time_ms": 0,
-            "task_completion_rate": 0.0,
-            "average_task_duration_hours": 0.0
+            "average_confidence_score": confidence_sum / confidence_count if confidence_count else 0.0,
+            "task_completion_rate": min(1.0, completed / assignments) if assignments else 0.0,
+            "average_task_duration_hours": 0.0,
+            "decision_type_breakdown": decision_types
         }
 
 
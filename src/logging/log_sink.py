@@ -0,0 +1,394 @@
+"""
+Buffered background log sink for Marcus
+
+Event logging used to open, write and close a file on the event loop for
+every event. This module moves file I/O to one background writer thread:
+callers enqueue a record and return immediately, and the writer drains the
+queue in batches with a single ``write`` per file per batch.
+
+Files are rotated by time (the path may contain ``strftime`` codes, so
+``agent_events_%Y%m%d.jsonl`` rolls over daily) and by size (``max_bytes``,
+keeping ``backup_count`` numbered backups named ``<file>.1``, ``<file>.2``,
+... so readers globbing ``*.jsonl`` only see live files). The queue is bounded; when it is
+full the sink's overflow policy decides whether the new record is dropped,
+the oldest queued record is dropped, or the caller blocks for a while.
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, TextIO, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+DROP_NEWEST = "drop_newest"
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
+OVERFLOW_POLICIES = (DROP_NEWEST, DROP_OLDEST, BLOCK)
+
+Record = Union[str, Dict[str, Any]]
+
+
+def _to_line(record: Record) -> str:
+    """Render a record as one newline-terminated line"""
+    if isinstance(record, str):
+        return record if record.endswith("\n") else record + "\n"
+    return json.dumps(record, default=str) + "\n"
+
+
+class LogStream:
+    """
+    One log file written through a LogSink.
+
+    Streams are cheap handles; the file itself is opened, rotated and
+    written by the sink's writer thread.
+    """
+
+    def __init__(
+        self,
+        sink: "LogSink",
+        path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        backup_count: int = 5
+    ):
+        """
+        Args:
+            sink: Sink that writes this stream
+            path: File path; may contain strftime codes for time-based rotation
+            max_bytes: Rotate once the file reaches this size; no size limit if None
+            backup_count: Numbered backups kept by size-based rotation
+        """
+        self.sink = sink
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+
+        # Writer thread state
+        self._file: Optional[TextIO] = None
+        self._current_path: Optional[str] = None
+        self._size = 0
+
+    def write(self, record: Record) -> bool:
+        """
+        Queue a record for writing.
+
+        Args:
+            record: A line of text (written as-is) or a dict (written as one
+                JSON line). Dicts are serialized before this returns, so the
+                caller may keep mutating them.
+
+        Returns:
+            False if the record was dropped because the queue was full or
+            could not be serialized
+        """
+        return self.sink.enqueue(self, record)
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything queued so far has been written"""
+        return self.sink.flush(timeout)
+
+    def close(self) -> None:
+        """Write pending records; the shared writer keeps running"""
+        self.sink.flush()
+
+    # ------------------------------------------------------------------
+    # Writer thread only
+    # ------------------------------------------------------------------
+
+    def _resolve_path(self) -> str:
+        path = str(self.path)
+        return datetime.now().strftime(path) if "%" in path else path
+
+    def _write_batch(self, text: str) -> bool:
+        """Write text to the current file, rotating first if needed. Returns True if rotated."""
+        rotated = False
+        path = self._resolve_path()
+        if path != self._current_path:
+            rotated = self._current_path is not None
+            self._close_file()
+            self._open(path)
+        elif self.max_bytes and self._size >= self.max_bytes:
+            self._rotate_by_size()
+            rotated = True
+
+        self._file.write(text)
+        self._file.flush()
+        self._size += len(text.encode("utf-8"))
+        return rotated
+
+    def _open(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        self._current_path = path
+        self._size = self._file.tell()
+
+    def _rotate_by_size(self) -> None:
+        path = self._current_path
+        self._close_file()
+        if self.backup_count > 0:
+            for index in range(self.backup_count - 1, 0, -1):
+                source = f"{path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{path}.{index + 1}")
+            os.replace(path, f"{path}.1")
+        else:
+            os.remove(path)
+        self._open(path)
+
+    def _close_file(self) -> None:
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+
+
+class LogSink:
+    """
+    Bounded queue of log records drained by a background writer thread.
+
+    One sink serves any number of LogStreams; records are written in the
+    order they were queued. The writer thread starts on the first record.
+    """
+
+    def __init__(
+        self,
+        max_queue: int = 10000,
+        overflow: str = DROP_NEWEST,
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+        block_timeout: float = 1.0
+    ):
+        """
+        Args:
+            max_queue: Records held before the overflow policy applies
+            overflow: "drop_newest", "drop_oldest" or "block" (wait up to
+                ``block_timeout`` for space, then drop the new record)
+            batch_size: Records written per batch at most
+            flush_interval: Seconds the writer waits for more records
+                before writing a partial batch
+            block_timeout: Seconds a caller may block under the "block" policy
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        self.max_queue = max(1, max_queue)
+        self.overflow = overflow
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.block_timeout = block_timeout
+
+        self._queue: Deque[Tuple[int, LogStream, str]] = deque()
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closing = False
+        self._streams: Dict[str, LogStream] = {}
+
+        # Sequence numbers: last queued and last written (or dropped)
+        self._queued_seq = 0
+        self._done_seq = 0
+
+        # Metrics
+        self.enqueued = 0
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+    def stream(
+        self,
+        path: Union[str, Path],
+        max_bytes: Optional[int] = None,
+        backup_count: int = 5
+    ) -> LogStream:
+        """
+        Get the stream for a file, creating it on first use.
+
+        Args:
+            path: File path; may contain strftime codes for time-based rotation
+            max_bytes: Rotate once the file reaches this size
+            backup_count: Numbered backups kept by size-based rotation
+
+        Returns:
+            The stream writing to ``path``
+        """
+        key = str(path)
+        with self._condition:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = LogStream(self, path, max_bytes=max_bytes, backup_count=backup_count)
+                self._streams[key] = stream
+            return stream
+
+    def enqueue(self, stream: LogStream, record: Record) -> bool:
+        """
+        Queue a record for a stream, applying the overflow policy if full.
+
+        Dicts are serialized here, on the caller's thread, so later changes
+        to them do not reach the file.
+
+        Args:
+            stream: Stream the record belongs to
+            record: Line of text or dict to write as JSON
+
+        Returns:
+            False if the record was dropped
+        """
+        try:
+            line = _to_line(record)
+        except Exception as e:
+            logger.debug(f"Dropping unserializable log record: {e}")
+            with self._condition:
+                self.write_errors += 1
+            return False
+
+        with self._condition:
+            if self._closing:
+                self.dropped += 1
+                return False
+
+            if len(self._queue) >= self.max_queue:
+                if self.overflow == DROP_OLDEST:
+                    self._queue.popleft()
+                    self.dropped += 1
+                elif self.overflow == BLOCK:
+                    has_room = self._condition.wait_for(
+                        lambda: len(self._queue) < self.max_queue or self._closing,
+                        timeout=self.block_timeout
+                    )
+                    if not has_room or self._closing:
+                        self.dropped += 1
+                        return False
+                else:
+                    self.dropped += 1
+                    return False
+
+            self._queued_seq += 1
+            self._queue.append((self._queued_seq, stream, line))
+            self.enqueued += 1
+            self._ensure_writer()
+            self._condition.notify_all()
+            return True
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """
+        Wait until every record queued so far has been written.
+
+        Args:
+            timeout: Seconds to wait at most
+
+        Returns:
+            False if the timeout expired first
+        """
+        with self._condition:
+            target = self._queued_seq
+            if self._thread is None:
+                return self._done_seq >= target
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._done_seq >= target, timeout=timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write pending records, stop the writer thread and close every file"""
+        self.flush(timeout)
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+            thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and writer statistics"""
+        with self._condition:
+            queued = len(self._queue)
+        return {
+            "queued": queued,
+            "max_queue": self.max_queue,
+            "overflow": self.overflow,
+            "enqueued": self.enqueued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+            "streams": len(self._streams),
+        }
+
+    # ------------------------------------------------------------------
+    # Writer thread
+    # ------------------------------------------------------------------
+
+    def _ensure_writer(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="marcus-log-sink", daemon=True)
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                if not self._queue and not self._closing:
+                    self._condition.wait(self.flush_interval)
+                if not self._queue and self._closing:
+                    break
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self.batch_size, len(self._queue)))
+                ]
+                # Room was freed for callers blocked by the "block" policy
+                self._condition.notify_all()
+
+            if batch:
+                self._write(batch)
+                with self._condition:
+                    self._done_seq = max(self._done_seq, batch[-1][0])
+                    self._condition.notify_all()
+            else:
+                # Records dropped from a full queue still count as handled
+                with self._condition:
+                    self._done_seq = max(self._done_seq, self._queued_seq - len(self._queue))
+                    self._condition.notify_all()
+
+        for stream in list(self._streams.values()):
+            stream._close_file()
+
+    def _write(self, batch: List[Tuple[int, LogStream, str]]) -> None:
+        """Write one batch: lines are grouped per stream, one write per stream"""
+        lines: Dict[int, Tuple[LogStream, List[str]]] = {}
+        for _, stream, line in batch:
+            lines.setdefault(id(stream), (stream, []))[1].append(line)
+
+        for stream, stream_lines in lines.values():
+            try:
+                if stream._write_batch("".join(stream_lines)):
+                    self.rotations += 1
+                self.written += len(stream_lines)
+            except Exception as e:
+                self.write_errors += 1
+                stream._close_file()
+                stream._current_path = None
+                logger.warning(f"Failed to write {len(stream_lines)} log records to {stream.path}: {e}")
+        self.batches += 1
+
+
+# Created at import so the exit hook is registered exactly once; the writer
+# thread itself only starts when the first record is queued.
+_default_sink = LogSink()
+atexit.register(_default_sink.close)
+
+
+def get_log_sink() -> LogSink:
+    """
+    Get the process-wide log sink shared by Marcus's event logs.
+
+    Returns:
+        The shared sink; it is flushed and closed at interpreter exit
+    """
+    return _default_sink
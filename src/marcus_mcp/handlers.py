@@ -6,10 +6,11 @@ for the Marcus MCP server, organizing all tool definitions and handlers
 in a centralized location.
 """
 
-import json
 from typing import List, Dict, Any, Optional
 import mcp.types as types
 
+from .utils import encode_mcp_response
+
 from .tools import (
     # Agent tools
     register_agent,
@@ -309,14 +310,14 @@ async def handle_tool_call(
         
         return [types.TextContent(
             type="text",
-            text=json.dumps(result, indent=2)
+            text=encode_mcp_response(result)
         )]
         
     except Exception as e:
         return [types.TextContent(
             type="text",
-            text=json.dumps({
+            text=encode_mcp_response({
                 "error": f"Tool execution failed: {str(e)}",
                 "tool": name
-            }, indent=2)
+            })
         )]
\ No newline at end of file
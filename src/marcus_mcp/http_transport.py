@@ -0,0 +1,97 @@
+"""
+Network Transport for the Marcus MCP Server
+
+Serves one MCP server to many agents over HTTP instead of one server process
+per agent over stdio. Every connected agent shares the same agent registry,
+assignment lock, kanban client and AI engine.
+
+Endpoints:
+- /mcp: Streamable HTTP transport (recommended)
+- /sse and /messages/: legacy SSE transport for older MCP clients
+"""
+
+import logging
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from mcp.server import Server
+from mcp.server.sse import SseServerTransport
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Mount, Route
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+STREAMABLE_HTTP_PATH = "/mcp"
+SSE_PATH = "/sse"
+SSE_MESSAGES_PATH = "/messages/"
+
+
+class _StreamableHTTPEndpoint:
+    """ASGI endpoint handing /mcp requests to the session manager"""
+
+    def __init__(self, session_manager: StreamableHTTPSessionManager):
+        self.session_manager = session_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def create_http_app(server: Server, json_response: bool = True) -> Starlette:
+    """
+    Create the ASGI app serving an MCP server to many clients.
+
+    Args:
+        server: MCP server whose handlers every session shares
+        json_response: Answer Streamable HTTP requests with plain JSON
+            instead of a one-event SSE stream
+
+    Returns:
+        Starlette app with the Streamable HTTP and SSE endpoints
+    """
+    session_manager = StreamableHTTPSessionManager(app=server, json_response=json_response)
+    sse = SseServerTransport(SSE_MESSAGES_PATH)
+
+    async def handle_sse(request: Request) -> Response:
+        async with sse.connect_sse(request.scope, request.receive, request._send) as (read_stream, write_stream):
+            await server.run(read_stream, write_stream, server.create_initialization_options())
+        return Response()
+
+    @asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    return Starlette(
+        routes=[
+            Route(STREAMABLE_HTTP_PATH, endpoint=_StreamableHTTPEndpoint(session_manager)),
+            Route(SSE_PATH, endpoint=handle_sse, methods=["GET"]),
+            Mount(SSE_MESSAGES_PATH, app=sse.handle_post_message),
+        ],
+        lifespan=lifespan,
+    )
+
+
+async def serve_http(server: Server, host: str, port: int, **app_options: Any) -> None:
+    """
+    Serve an MCP server over HTTP until cancelled.
+
+    Args:
+        server: MCP server to serve
+        host: Interface to bind
+        port: Port to listen on
+        **app_options: Passed to create_http_app
+    """
+    import uvicorn
+
+    config = uvicorn.Config(
+        create_http_app(server, **app_options),
+        host=host,
+        port=port,
+        log_level="warning",
+    )
+    logger.info(f"Serving MCP over HTTP on http://{host}:{port}{STREAMABLE_HTTP_PATH}")
+    await uvicorn.Server(config).serve()
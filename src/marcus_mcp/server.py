@@ -24,7 +24,7 @@ from mcp.server.stdio import stdio_server
 import mcp.types as types
 
 from src.core.models import (
-    TaskStatus, Priority, RiskLevel,
+    Task, TaskStatus, Priority, RiskLevel,
     ProjectState, WorkerStatus, TaskAssignment
 )
 from src.integrations.kanban_factory import KanbanFactory
@@ -35,11 +35,16 @@ from src.monitoring.project_monitor import ProjectMonitor
 from src.communication.communication_hub import CommunicationHub
 from src.config.settings import Settings
 from src.logging.conversation_logger import conversation_logger
+from src.logging.log_sink import get_log_sink
 from src.core.assignment_persistence import AssignmentPersistence
+from src.core.board_snapshot import BoardSnapshot
 from src.monitoring.assignment_monitor import AssignmentMonitor
+from src.monitoring.event_loop_monitor import EventLoopLagMonitor
+from src.monitoring.monitoring_scheduler import BoardView, MonitoringScheduler
 from src.config.config_loader import get_config
 
 from .handlers import get_tool_definitions, handle_tool_call
+from .http_transport import SSE_PATH, STREAMABLE_HTTP_PATH, serve_http
 
 
 class MarcusServer:
@@ -55,13 +60,12 @@ class MarcusServer:
         self.provider = self.config.get('kanban.provider', 'planka')
         print(f"Initializing Marcus with {self.provider.upper()} kanban provider...")
         
-        # Create realtime log with line buffering
+        # Realtime log; events are queued and written by the shared log sink
         log_dir = Path("logs/conversations")
         log_dir.mkdir(parents=True, exist_ok=True)
-        self.realtime_log = open(
-            log_dir / f"realtime_{datetime.now():%Y%m%d_%H%M%S}.jsonl", 
-            'a', 
-            buffering=1  # Line buffering
+        self.realtime_log = get_log_sink().stream(
+            log_dir / f"realtime_{datetime.now():%Y%m%d_%H%M%S}.jsonl",
+            max_bytes=self.config.get('logging.realtime_max_bytes', 50 * 1024 * 1024)
         )
         atexit.register(self.realtime_log.close)
         
@@ -82,6 +86,21 @@ class MarcusServer:
         self.project_state: Optional[ProjectState] = None
         self.project_tasks: List[Any] = []
         
+        # Indexed board snapshot, reconciled in the background
+        self.board_snapshot = BoardSnapshot(
+            max_staleness=self.config.get('board_snapshot.max_staleness', 30)
+        )
+        self.snapshot_poll_interval = self.config.get('board_snapshot.poll_interval', 10)
+        
+        # One board fetch per tick, shared by the snapshot and every monitor
+        self.monitoring_scheduler = MonitoringScheduler(
+            self._fetch_board_tasks,
+            interval=self.snapshot_poll_interval,
+            board_snapshot=self.board_snapshot,
+            stall_threshold_hours=self.monitor.settings.get("stall_threshold_hours", 24)
+        )
+        self.monitoring_scheduler.register("board_snapshot", self._log_snapshot_changes)
+        
         # Assignment persistence and locking
         self.assignment_persistence = AssignmentPersistence()
         self.assignment_lock = asyncio.Lock()
@@ -90,6 +109,11 @@ class MarcusServer:
         # Assignment monitoring
         self.assignment_monitor = None
         
+        # Event loop responsiveness (reported by ping)
+        self.loop_monitor = EventLoopLagMonitor(
+            interval=self.config.get('monitoring.event_loop_lag_interval', 0.5)
+        )
+        
         # Log startup
         self.log_event("server_startup", {
             "provider": self.provider,
@@ -153,9 +177,20 @@ class MarcusServer:
                 if self.assignment_monitor is None:
                     self.assignment_monitor = AssignmentMonitor(
                         self.assignment_persistence,
-                        self.kanban_client
+                        self.kanban_client,
+                        scheduler=self.monitoring_scheduler
                     )
                     await self.assignment_monitor.start()
+                
+                # Project metrics and issue checks from the same snapshots
+                if self.monitor.scheduler is None:
+                    self.monitor.attach(
+                        self.monitoring_scheduler,
+                        analyze=self.config.get('monitoring.ai_health_analysis', False)
+                    )
+                
+                # Keep the board snapshot reconciled in the background
+                await self.monitoring_scheduler.start()
                     
                 print(f"✅ Kanban client initialized: {type(self.kanban_client).__name__}", file=sys.stderr)
                 
@@ -247,7 +282,7 @@ class MarcusServer:
             ) from e
     
     def log_event(self, event_type: str, data: dict):
-        """Log events immediately to realtime log"""
+        """Queue an event for the realtime log"""
         event = {
             "timestamp": datetime.now().isoformat(),
             "type": event_type,
@@ -255,20 +290,34 @@ class MarcusServer:
         }
         self.realtime_log.write(json.dumps(event) + '\n')
     
-    async def refresh_project_state(self):
-        """Refresh project state from kanban board"""
+    async def refresh_project_state(self, force: bool = False):
+        """
+        Refresh project state from the board snapshot
+        
+        The kanban board is only fetched when the snapshot is stale (or
+        ``force`` is set); otherwise state is rebuilt from the snapshot's
+        indexes, which the background poll and Marcus's own writes keep
+        up to date.
+        
+        Args:
+            force: Re-fetch the board even if the snapshot is fresh
+        """
         if not self.kanban_client:
             await self.initialize_kanban()
         
         try:
-            # Get all tasks from the board
-            self.project_tasks = await self.kanban_client.get_all_tasks()
+            if force or not self.board_snapshot.is_fresh():
+                # Get all tasks from the board
+                tasks = await self.kanban_client.get_all_tasks()
+                self.board_snapshot.reconcile(tasks)
+            
+            self.project_tasks = self.board_snapshot.all_tasks()
             
             # Update project state
             if self.project_tasks:
-                total_tasks = len(self.project_tasks)
-                completed_tasks = len([t for t in self.project_tasks if t.status == TaskStatus.DONE])
-                in_progress_tasks = len([t for t in self.project_tasks if t.status == TaskStatus.IN_PROGRESS])
+                total_tasks = self.board_snapshot.count()
+                completed_tasks = self.board_snapshot.count(TaskStatus.DONE)
+                in_progress_tasks = self.board_snapshot.count(TaskStatus.IN_PROGRESS)
                 
                 self.project_state = ProjectState(
                     board_id=self.kanban_client.board_id,
@@ -276,7 +325,7 @@ class MarcusServer:
                     total_tasks=total_tasks,
                     completed_tasks=completed_tasks,
                     in_progress_tasks=in_progress_tasks,
-                    blocked_tasks=0,  # Would need to track this separately
+                    blocked_tasks=self.board_snapshot.count(TaskStatus.BLOCKED),
                     progress_percent=(completed_tasks / total_tasks * 100) if total_tasks > 0 else 0.0,
                     overdue_tasks=[],  # Would need to check due dates
                     team_velocity=0.0,  # Would need to calculate
@@ -302,6 +351,7 @@ class MarcusServer:
             
             self.log_event("project_state_refreshed", {
                 "task_count": len(self.project_tasks),
+                "snapshot_version": self.board_snapshot.version,
                 "project_state": project_state_data
             })
             
@@ -309,13 +359,77 @@ class MarcusServer:
             self.log_event("project_state_refresh_error", {"error": str(e)})
             raise
     
-    async def run(self):
-        """Run the MCP server"""
+    def record_task_update(self, task_id: str, updates: Dict[str, Any]):
+        """
+        Apply a write Marcus made to the kanban board to the board snapshot
+        
+        Args:
+            task_id: ID of the task that was updated on the board
+            updates: The update dict that was sent to the kanban client
+        """
+        self.board_snapshot.apply_update(task_id, updates)
+    
+    async def _fetch_board_tasks(self) -> List[Task]:
+        """Fetch every task on the board for a monitoring tick"""
+        try:
+            return await self.kanban_client.get_all_tasks()
+        except Exception as e:
+            # The tick is skipped; the snapshot goes stale and requests re-fetch
+            self.log_event("board_snapshot_poll_error", {"error": str(e)})
+            raise
+    
+    async def _log_snapshot_changes(self, view: BoardView):
+        """Log what the monitoring tick's fetch changed in the board snapshot"""
+        changes = view.changes
+        if changes and any(changes.values()):
+            self.log_event("board_snapshot_reconciled", {
+                "added": len(changes["added"]),
+                "updated": len(changes["updated"]),
+                "removed": len(changes["removed"]),
+                "snapshot_version": self.board_snapshot.version
+            })
+    
+    async def run(
+        self,
+        transport: Optional[str] = None,
+        host: Optional[str] = None,
+        port: Optional[int] = None
+    ):
+        """
+        Run the MCP server
+        
+        Args:
+            transport: "stdio" to serve the process that launched Marcus, or
+                "http" to serve many agents over the network; defaults to
+                the transport.type config setting
+            host: Interface for the http transport (transport.host)
+            port: Port for the http transport (advanced.port)
+        """
+        transport = transport or self.config.get('transport.type', 'stdio')
+        if transport not in ('stdio', 'http'):
+            raise ValueError(f"Unknown MCP transport: {transport}")
+        
         print(f"\nMarcus MCP Server Running")
         print(f"Kanban Provider: {self.provider.upper()}")
         print(f"Logs: logs/conversations/")
+        
+        if transport == 'http':
+            host = host or self.config.get('transport.host', '127.0.0.1')
+            port = int(port or self.config.get('advanced.port', 8000))
+            print(f"Endpoint: http://{host}:{port}{STREAMABLE_HTTP_PATH} (SSE: {SSE_PATH})")
         print("="*50)
         
+        await self.loop_monitor.start()
+        
+        if transport == 'http':
+            await serve_http(
+                self.server,
+                host,
+                port,
+                json_response=self.config.get('transport.json_response', True)
+            )
+            return
+        
         async with stdio_server() as (read_stream, write_stream):
             await self.server.run(
                 read_stream,
@@ -324,11 +438,15 @@ class MarcusServer:
             )
 
 
-async def main():
+async def main(
+    transport: Optional[str] = None,
+    host: Optional[str] = None,
+    port: Optional[int] = None
+):
     """Main entry point"""
     server = MarcusServer()
-    await server.run()
+    await server.run(transport=transport, host=host, port=port)
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
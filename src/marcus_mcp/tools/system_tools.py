@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Dict, Any
 from src.logging.conversation_logger import conversation_logger, log_thinking
 from src.logging.agent_events import log_agent_event
+from src.core.resilience import get_resilience_stats
 from src.monitoring.assignment_monitor import AssignmentHealthChecker
 
 
@@ -50,6 +51,16 @@ async def ping(echo: str, state: Any) -> Dict[str, Any]:
         "timestamp": datetime.now().isoformat()
     }
     
+    # How responsive the server's event loop has been recently
+    loop_monitor = getattr(state, 'loop_monitor', None)
+    if loop_monitor is not None:
+        response["event_loop_lag"] = loop_monitor.get_stats()
+    
+    # Circuit breaker state and concurrency limits of kanban and LLM backends
+    resilience = get_resilience_stats()
+    if resilience:
+        response["resilience"] = resilience
+    
     # Log the response immediately
     state.log_event("ping_response", response)
     
@@ -15,7 +15,7 @@ from typing import Dict, List, Any, Optional
 from src.core.models import Task, TaskStatus, Priority, TaskAssignment
 from src.logging.conversation_logger import conversation_logger, log_thinking
 from src.logging.agent_events import log_agent_event
-from src.core.ai_powered_task_assignment import find_optimal_task_for_agent_ai_powered
+from src.core.ai_powered_task_assignment import rank_tasks_for_agent_ai_powered
 from src.marcus_mcp.utils import serialize_for_mcp, safe_serialize_task
 
 
@@ -128,10 +128,12 @@ async def request_next_task(agent_id: str, state: Any) -> Dict[str, Any]:
                 )
                 
                 # Update kanban FIRST (fail fast if kanban is down)
-                await state.kanban_client.update_task(optimal_task.id, {
+                assignment_update = {
                     "status": TaskStatus.IN_PROGRESS,
                     "assigned_to": agent_id
-                })
+                }
+                await state.kanban_client.update_task(optimal_task.id, assignment_update)
+                state.record_task_update(optimal_task.id, assignment_update)
                 
                 # If kanban update succeeded, track assignment
                 state.agent_tasks[agent_id] = assignment
@@ -329,6 +331,7 @@ async def report_task_progress(
             update_data["status"] = TaskStatus.BLOCKED
             
         await state.kanban_client.update_task(task_id, update_data)
+        state.record_task_update(task_id, update_data)
         
         # Update task progress (including checklist items)
         await state.kanban_client.update_task_progress(task_id, {
@@ -418,10 +421,12 @@ async def report_blocker(
         )
         
         # Update task status
-        await state.kanban_client.update_task(task_id, {
+        blocker_update = {
             "status": TaskStatus.BLOCKED,
             "blocker": blocker_description
-        })
+        }
+        await state.kanban_client.update_task(task_id, blocker_update)
+        state.record_task_update(task_id, blocker_update)
         
         # Add detailed comment
         comment = f"🚫 BLOCKER ({severity.upper()})\n"
@@ -469,48 +474,54 @@ async def report_blocker(
 # Helper functions for task assignment
 
 async def find_optimal_task_for_agent(agent_id: str, state: Any) -> Optional[Task]:
-    """Find the best task for an agent using AI-powered analysis"""
-    async with state.assignment_lock:
-        agent = state.agent_status.get(agent_id)
-        
-        if not agent or not state.project_state:
-            return None
-            
-        # Get available tasks
-        assigned_task_ids = [a.task_id for a in state.agent_tasks.values()]
-        persisted_assigned_ids = await state.assignment_persistence.get_all_assigned_task_ids()
-        all_assigned_ids = set(assigned_task_ids) | persisted_assigned_ids | state.tasks_being_assigned
-        
-        available_tasks = [
-            t for t in state.project_tasks
-            if t.status == TaskStatus.TODO and
-            t.id not in all_assigned_ids
-        ]
-        
-        if not available_tasks:
-            return None
-        
-        # Use AI-powered task selection if AI engine is available
-        if state.ai_engine:
-            try:
-                optimal_task = await find_optimal_task_for_agent_ai_powered(
-                    agent_id=agent_id,
-                    agent_status=agent.__dict__,
-                    project_tasks=state.project_tasks,
-                    available_tasks=available_tasks,
-                    assigned_task_ids=all_assigned_ids,
-                    ai_engine=state.ai_engine
-                )
-                
-                if optimal_task:
-                    state.tasks_being_assigned.add(optimal_task.id)
-                    return optimal_task
-            except Exception as e:
-                # Log error using log_pm_thinking instead
-                conversation_logger.log_pm_thinking(f"AI task assignment failed, falling back to basic: {e}")
+    """
+    Find the best task for an agent using AI-powered analysis
+    
+    Candidates are scored without holding state.assignment_lock, so
+    concurrent requests score in parallel against the same board snapshot.
+    The chosen task is then claimed with reserve_task; if another agent
+    reserved it while this one was scoring, the next-best candidate is tried.
+    """
+    agent = state.agent_status.get(agent_id)
+    
+    if not agent or not state.project_state:
+        return None
         
-        # Fallback to basic assignment if AI fails
+    # Get available tasks
+    assigned_task_ids = [a.task_id for a in state.agent_tasks.values()]
+    persisted_assigned_ids = await state.assignment_persistence.get_all_assigned_task_ids()
+    all_assigned_ids = set(assigned_task_ids) | persisted_assigned_ids | state.tasks_being_assigned
+    
+    available_tasks = [
+        t for t in state.board_snapshot.tasks_with_status(TaskStatus.TODO)
+        if t.id not in all_assigned_ids
+    ]
+    
+    if not available_tasks:
+        return None
+    
+    ranked_tasks = None
+    
+    # Use AI-powered task selection if AI engine is available
+    if state.ai_engine:
+        try:
+            ranked_tasks = await rank_tasks_for_agent_ai_powered(
+                agent_id=agent_id,
+                agent_status=agent.__dict__,
+                project_tasks=state.project_tasks,
+                available_tasks=available_tasks,
+                assigned_task_ids=all_assigned_ids,
+                ai_engine=state.ai_engine
+            )
+        except Exception as e:
+            # Log error using log_pm_thinking instead
+            conversation_logger.log_pm_thinking(f"AI task assignment failed, falling back to basic: {e}")
+    
+    # Fallback to basic assignment if AI fails
+    if not ranked_tasks:
         return await find_optimal_task_basic(agent_id, available_tasks, state)
+    
+    return await reserve_first_available(ranked_tasks, state)
 
 
 async def find_optimal_task_basic(agent_id: str, available_tasks: List[Task], state: Any) -> Optional[Task]:
@@ -518,11 +529,8 @@ async def find_optimal_task_basic(agent_id: str, available_tasks: List[Task], st
     agent = state.agent_status.get(agent_id)
     if not agent:
         return None
-        
-    best_task = None
-    best_score = -1
     
-    for task in available_tasks:
+    def score(task: Task) -> float:
         # Calculate skill match score
         skill_score = 0
         if agent.skills and task.labels:
@@ -538,13 +546,45 @@ async def find_optimal_task_basic(agent_id: str, available_tasks: List[Task], st
         }.get(task.priority, 0.5)
         
         # Combined score
-        total_score = (skill_score * 0.6) + (priority_score * 0.4)
-        
-        if total_score > best_score:
-            best_score = total_score
-            best_task = task
-            
-    if best_task:
-        state.tasks_being_assigned.add(best_task.id)
-        
-    return best_task
\ No newline at end of file
+        return (skill_score * 0.6) + (priority_score * 0.4)
+    
+    # Stable sort keeps equally scored tasks in board order
+    ranked_tasks = sorted(available_tasks, key=score, reverse=True)
+    return await reserve_first_available(ranked_tasks, state)
+
+
+async def reserve_first_available(ranked_tasks: List[Task], state: Any) -> Optional[Task]:
+    """Reserve the highest-ranked task no other agent has claimed"""
+    for task in ranked_tasks:
+        if await reserve_task(task.id, state):
+            return task
+        conversation_logger.log_pm_thinking(
+            f"Task {task.id} was claimed by another agent, trying next candidate"
+        )
+    return None
+
+
+async def reserve_task(task_id: str, state: Any) -> bool:
+    """
+    Claim a task for assignment if nobody holds it (compare-and-set)
+    
+    Under state.assignment_lock the task must still be TODO in the board
+    snapshot, must not be reserved, assigned in memory or held in
+    assignment persistence, and is then added to state.tasks_being_assigned.
+    Candidates were ranked from a snapshot read outside the lock, so any of
+    these may have changed since; a failed check makes the caller move on to
+    the next candidate. The reservation is released by request_next_task
+    once the assignment is persisted, or when it fails.
+    """
+    async with state.assignment_lock:
+        if task_id in state.tasks_being_assigned:
+            return False
+        if any(a.task_id == task_id for a in state.agent_tasks.values()):
+            return False
+        task = state.board_snapshot.get(task_id)
+        if task is None or task.status != TaskStatus.TODO:
+            return False
+        if await state.assignment_persistence.is_task_assigned(task_id):
+            return False
+        state.tasks_being_assigned.add(task_id)
+        return True
@@ -2,10 +2,18 @@
 Utility functions for Marcus MCP server
 """
 
+import dataclasses
 import json
 from enum import Enum
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Dict, Optional
+
+from src.core.models import ProjectState, Task, TaskAssignment, WorkerStatus
+
+try:
+    import orjson
+except ImportError:  # optional accelerator; the json module is used without it
+    orjson = None
 
 
 class MarcusJSONEncoder(json.JSONEncoder):
@@ -16,20 +24,210 @@ class MarcusJSONEncoder(json.JSONEncoder):
             return obj.value
         elif isinstance(obj, datetime):
             return obj.isoformat()
+        elif dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            # Includes slotted dataclasses such as Task, which have no __dict__
+            return to_json_native(obj)
         elif hasattr(obj, '__dict__'):
             # Handle dataclasses and other objects with __dict__
             return obj.__dict__
         return super().default(obj)
 
 
+_JSON_NATIVE = (str, int, float, bool, type(None))
+
+
+def _scalar(value: Any) -> Any:
+    """Convert an enum or datetime model field; other values pass through"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _task_to_json(task: Task) -> Dict[str, Any]:
+    data = {
+        "id": task.id,
+        "name": task.name,
+        "description": task.description,
+        "status": _scalar(task.status),
+        "priority": _scalar(task.priority),
+        "assigned_to": task.assigned_to,
+        "created_at": _scalar(task.created_at),
+        "updated_at": _scalar(task.updated_at),
+        "due_date": _scalar(task.due_date),
+        "estimated_hours": task.estimated_hours,
+        "actual_hours": task.actual_hours,
+        "dependencies": list(task.dependencies),
+        "labels": list(task.labels)
+    }
+    # Optional fields only appear when set, as they did as dynamic attributes
+    if task.acceptance_criteria is not None:
+        data["acceptance_criteria"] = to_json_native(task.acceptance_criteria)
+    if task.subtasks is not None:
+        data["subtasks"] = to_json_native(task.subtasks)
+    if task.metadata is not None:
+        data["metadata"] = to_json_native(task.metadata)
+    if task.completed_at is not None:
+        data["completed_at"] = _scalar(task.completed_at)
+    return data
+
+
+def _worker_to_json(worker: WorkerStatus) -> Dict[str, Any]:
+    return {
+        "worker_id": worker.worker_id,
+        "name": worker.name,
+        "role": worker.role,
+        "email": worker.email,
+        "current_tasks": [to_json_native(task) for task in worker.current_tasks],
+        "completed_tasks_count": worker.completed_tasks_count,
+        "capacity": worker.capacity,
+        "skills": list(worker.skills),
+        "availability": to_json_native(worker.availability),
+        "performance_score": worker.performance_score
+    }
+
+
+def _assignment_to_json(assignment: TaskAssignment) -> Dict[str, Any]:
+    return {
+        "task_id": assignment.task_id,
+        "task_name": assignment.task_name,
+        "description": assignment.description,
+        "instructions": assignment.instructions,
+        "estimated_hours": assignment.estimated_hours,
+        "priority": _scalar(assignment.priority),
+        "dependencies": list(assignment.dependencies),
+        "assigned_to": assignment.assigned_to,
+        "assigned_at": _scalar(assignment.assigned_at),
+        "due_date": _scalar(assignment.due_date),
+        "workspace_path": assignment.workspace_path,
+        "forbidden_paths": list(assignment.forbidden_paths)
+    }
+
+
+def _project_state_to_json(project: ProjectState) -> Dict[str, Any]:
+    return {
+        "board_id": project.board_id,
+        "project_name": project.project_name,
+        "total_tasks": project.total_tasks,
+        "completed_tasks": project.completed_tasks,
+        "in_progress_tasks": project.in_progress_tasks,
+        "blocked_tasks": project.blocked_tasks,
+        "progress_percent": project.progress_percent,
+        "overdue_tasks": [to_json_native(task) for task in project.overdue_tasks],
+        "team_velocity": project.team_velocity,
+        "risk_level": _scalar(project.risk_level),
+        "last_updated": _scalar(project.last_updated)
+    }
+
+
+# Dedicated converters for the models that dominate MCP responses
+_MODEL_SERIALIZERS: Dict[type, Callable[[Any], Dict[str, Any]]] = {
+    Task: _task_to_json,
+    WorkerStatus: _worker_to_json,
+    TaskAssignment: _assignment_to_json,
+    ProjectState: _project_state_to_json,
+}
+
+
+def _json_key(key: Any) -> str:
+    """Convert a dict key the way json.dumps does"""
+    if isinstance(key, str):
+        return key
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, str):
+        return key
+    if key is None:
+        return "null"
+    if isinstance(key, bool):
+        return "true" if key else "false"
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        if key != key:
+            return "NaN"
+        if key in (float("inf"), float("-inf")):
+            return "Infinity" if key > 0 else "-Infinity"
+        return float.__repr__(key)
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def to_json_native(data: Any) -> Any:
+    """
+    Convert data to JSON-native types (dict, list, str, int, float, bool, None)
+    in a single walk.
+
+    Task, WorkerStatus, TaskAssignment and ProjectState use dedicated
+    converters. Otherwise enums become their values, datetimes ISO strings,
+    and dataclasses and other objects their fields, as MarcusJSONEncoder does.
+
+    Raises:
+        TypeError: If a value has no JSON representation
+    """
+    data_type = type(data)
+    if data_type in _JSON_NATIVE:
+        return data
+    serializer = _MODEL_SERIALIZERS.get(data_type)
+    if serializer is not None:
+        return serializer(data)
+    if isinstance(data, dict):
+        return {_json_key(key): to_json_native(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [to_json_native(value) for value in data]
+    if isinstance(data, Enum):
+        return to_json_native(data.value)
+    if isinstance(data, datetime):
+        return data.isoformat()
+    if isinstance(data, _JSON_NATIVE):
+        # Subclasses of str, int and float
+        return data
+    if dataclasses.is_dataclass(data) and not isinstance(data, type):
+        return {field.name: to_json_native(getattr(data, field.name)) for field in dataclasses.fields(data)}
+    if hasattr(data, '__dict__'):
+        return to_json_native(vars(data))
+    raise TypeError(f"Object of type {data_type.__name__} is not JSON serializable")
+
+
 def serialize_for_mcp(data: Any) -> Any:
     """
     Serialize data for MCP response, handling enums and dataclasses.
-    
+
     This ensures that enums (like RiskLevel, Priority) are converted to their
-    string values and datetimes are converted to ISO format strings.
+    string values and datetimes are converted to ISO format strings. The data
+    is walked once; nothing is encoded to JSON text here.
+    """
+    return to_json_native(data)
+
+
+def encode_mcp_response(data: Any, indent: Optional[int] = 2) -> str:
+    """
+    Encode a tool result as JSON text, exactly once.
+
+    Marcus models, enums and datetimes anywhere in ``data`` are converted by
+    ``to_json_native`` as the encoder meets them. orjson is used when it is
+    installed (it supports indent 2 only; other indents use json).
+
+    Args:
+        data: Tool result
+        indent: Indentation of the output, or None for compact output
+
+    Returns:
+        The JSON document
     """
-    return json.loads(json.dumps(data, cls=MarcusJSONEncoder))
+    if orjson is not None and indent in (2, None):
+        # Dataclasses go through to_json_native so models encode the same either way
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=to_json_native, option=option).decode("utf-8")
+        except TypeError:
+            # Values orjson rejects, such as integers wider than 64 bits
+            pass
+    if indent is None:
+        return json.dumps(data, default=to_json_native, separators=(",", ":"))
+    return json.dumps(data, default=to_json_native, indent=indent)
 
 
 def safe_serialize_task(task: Any) -> dict:
@@ -6,7 +6,9 @@ task assignments like "Deploy to production" before development is complete.
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import re
+from collections import Counter
+from typing import List, Dict, Any, Optional, Set
 from datetime import datetime
 
 from src.core.models import Task, TaskStatus, Priority
@@ -14,6 +16,81 @@ from src.core.assignment_persistence import AssignmentPersistence
 
 logger = logging.getLogger(__name__)
 
+DEPLOYMENT_WORDS = ['deploy', 'production', 'release', 'launch']
+TESTING_WORDS = ['test', 'qa', 'quality']
+IMPLEMENTATION_WORDS = ['implement', 'build', 'create', 'develop']
+# Implementation words that make a test task wait for the related component
+TESTED_IMPLEMENTATION_WORDS = ['implement', 'build', 'create']
+STOPWORDS = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
+
+
+def _task_text(task: Task) -> str:
+    return f"{task.name} {task.description or ''}".lower()
+
+
+def _name_words(task: Task) -> Set[str]:
+    return set(task.name.lower().split()) - STOPWORDS
+
+
+class _TaskIndex:
+    """
+    Lookups over one snapshot of tasks for the unblock checks
+    
+    Built once per request so each unblock decision is a few dict and set
+    lookups instead of a scan of every task per dependency and pattern.
+    Candidate lists keep task order so log messages name the same blocker
+    the full scan would.
+    """
+    
+    def __init__(self, tasks: List[Task], patterns: List[Dict[str, str]]):
+        self.by_id: Dict[str, Task] = {}
+        for task in tasks:
+            self.by_id.setdefault(task.id, task)
+        self.blocked_patterns = [re.compile(p['blocks_until_complete']) for p in patterns]
+        
+        # Per pattern: incomplete tasks matching its blocking side
+        self.incomplete_blockers: List[List[Task]] = []
+        for pattern in patterns:
+            regex = re.compile(pattern['pattern'])
+            self.incomplete_blockers.append([
+                task for task in tasks
+                if task.status != TaskStatus.DONE and regex.search(_task_text(task))
+            ])
+        
+        incomplete = [task for task in tasks if task.status != TaskStatus.DONE]
+        self.incomplete_implementation = [
+            task for task in incomplete
+            if any(word in task.name.lower() for word in IMPLEMENTATION_WORDS)
+        ]
+        
+        # Token index: name word -> positions of incomplete implementation
+        # tasks a test task sharing that word may wait for
+        self.tasks = tasks
+        self.tested_by_word: Dict[str, List[int]] = {}
+        for position, task in enumerate(tasks):
+            if (task.status != TaskStatus.DONE and
+                    any(word in task.name.lower() for word in TESTED_IMPLEMENTATION_WORDS)):
+                for word in _name_words(task):
+                    self.tested_by_word.setdefault(word, []).append(position)
+        
+        self.dependent_counts = Counter(
+            dep_id for task in tasks for dep_id in set(task.dependencies)
+        )
+    
+    def first_other(self, candidates: List[Task], task: Task) -> Optional[Task]:
+        """First candidate that is not the task itself"""
+        for candidate in candidates:
+            if candidate.id != task.id:
+                return candidate
+        return None
+    
+    def implementation_candidates(self, task: Task) -> List[Task]:
+        """Incomplete implementation tasks sharing a name word with the task"""
+        positions: Set[int] = set()
+        for word in _name_words(task):
+            positions.update(self.tested_by_word.get(word, ()))
+        return [self.tasks[position] for position in sorted(positions)]
+
 
 class BasicAdaptiveMode:
     """Basic Adaptive Mode that coordinates within existing structure"""
@@ -100,10 +177,13 @@ class BasicAdaptiveMode:
         """
         logger.info(f"Finding optimal task for agent {agent_id} with {len(available_tasks)} available tasks")
         
+        index = _TaskIndex(available_tasks, self.LOGICAL_DEPENDENCY_PATTERNS)
+        
         # Filter out tasks that are blocked by dependencies
         unblocked_tasks = await self._filter_unblocked_tasks(
             available_tasks, 
-            assigned_tasks
+            assigned_tasks,
+            index
         )
         
         if not unblocked_tasks:
@@ -117,7 +197,8 @@ class BasicAdaptiveMode:
                 task=task,
                 agent_id=agent_id,
                 agent_skills=agent_skills,
-                available_tasks=available_tasks
+                available_tasks=available_tasks,
+                index=index
             )
             scored_tasks.append((task, score))
         
@@ -134,7 +215,8 @@ class BasicAdaptiveMode:
     async def _filter_unblocked_tasks(
         self,
         tasks: List[Task],
-        assigned_tasks: Dict[str, Task]
+        assigned_tasks: Dict[str, Task],
+        index: Optional[_TaskIndex] = None
     ) -> List[Task]:
         """
         Filter tasks to only include those not blocked by dependencies
@@ -142,10 +224,11 @@ class BasicAdaptiveMode:
         This is the core logic that prevents "Deploy to production" from being
         assigned before development is complete.
         """
+        index = index or _TaskIndex(tasks, self.LOGICAL_DEPENDENCY_PATTERNS)
         unblocked_tasks = []
         
         for task in tasks:
-            if await self._is_task_unblocked(task, tasks, assigned_tasks):
+            if await self._is_task_unblocked(task, tasks, assigned_tasks, index):
                 unblocked_tasks.append(task)
             else:
                 logger.debug(f"Task '{task.name}' is blocked by dependencies")
@@ -156,83 +239,78 @@ class BasicAdaptiveMode:
         self,
         task: Task,
         all_tasks: List[Task],
-        assigned_tasks: Dict[str, Task]
+        assigned_tasks: Dict[str, Task],
+        index: Optional[_TaskIndex] = None
     ) -> bool:
         """
         Check if a task is unblocked and ready for assignment
         
         Returns False for illogical assignments like deployment before development
+        
+        Pass the index built for all_tasks when checking many tasks of the
+        same snapshot; otherwise one is built for this call.
         """
+        index = index or _TaskIndex(all_tasks, self.LOGICAL_DEPENDENCY_PATTERNS)
+        
         # Check explicit dependencies first
         if task.dependencies:
             for dep_id in task.dependencies:
-                dep_task = next((t for t in all_tasks if t.id == dep_id), None)
+                dep_task = index.by_id.get(dep_id)
                 if dep_task and dep_task.status != TaskStatus.DONE:
                     logger.debug(f"Task '{task.name}' blocked by incomplete dependency '{dep_task.name}'")
                     return False
         
         # Check logical dependency patterns
-        task_text = f"{task.name} {task.description or ''}".lower()
+        task_text = _task_text(task)
         
-        for pattern in self.LOGICAL_DEPENDENCY_PATTERNS:
-            blocking_pattern = pattern['pattern']
-            blocked_pattern = pattern['blocks_until_complete']
-            
+        for blocked_regex, blockers in zip(index.blocked_patterns, index.incomplete_blockers):
             # If this task matches a blocked pattern
-            import re
-            if re.search(blocked_pattern, task_text):
+            if blocked_regex.search(task_text):
                 # Check if any blocking tasks are incomplete
-                for other_task in all_tasks:
-                    other_text = f"{other_task.name} {other_task.description or ''}".lower()
-                    
-                    if (re.search(blocking_pattern, other_text) and 
-                        other_task.status != TaskStatus.DONE and
-                        other_task.id != task.id):
-                        
-                        logger.info(
-                            f"Task '{task.name}' blocked by logical dependency: "
-                            f"'{other_task.name}' must complete first"
-                        )
-                        return False
+                other_task = index.first_other(blockers, task)
+                if other_task:
+                    logger.info(
+                        f"Task '{task.name}' blocked by logical dependency: "
+                        f"'{other_task.name}' must complete first"
+                    )
+                    return False
         
         # Check for obvious illogical patterns
-        if await self._is_obviously_illogical(task, all_tasks):
+        if await self._is_obviously_illogical(task, all_tasks, index):
             return False
         
         return True
     
-    async def _is_obviously_illogical(self, task: Task, all_tasks: List[Task]) -> bool:
+    async def _is_obviously_illogical(
+        self,
+        task: Task,
+        all_tasks: List[Task],
+        index: Optional[_TaskIndex] = None
+    ) -> bool:
         """
         Check for obviously illogical task assignments
         
         This prevents the core problem: deploying before building
         """
+        index = index or _TaskIndex(all_tasks, self.LOGICAL_DEPENDENCY_PATTERNS)
         task_lower = task.name.lower()
         
         # Deployment tasks
-        if any(word in task_lower for word in ['deploy', 'production', 'release', 'launch']):
+        if any(word in task_lower for word in DEPLOYMENT_WORDS):
             # Check if there are any incomplete implementation tasks
-            for other_task in all_tasks:
-                other_lower = other_task.name.lower()
-                if (any(word in other_lower for word in ['implement', 'build', 'create', 'develop']) and
-                    other_task.status != TaskStatus.DONE and
-                    other_task.id != task.id):
-                    
-                    logger.warning(
-                        f"Blocking deployment task '{task.name}' - implementation task "
-                        f"'{other_task.name}' is not complete"
-                    )
-                    return True
+            other_task = index.first_other(index.incomplete_implementation, task)
+            if other_task:
+                logger.warning(
+                    f"Blocking deployment task '{task.name}' - implementation task "
+                    f"'{other_task.name}' is not complete"
+                )
+                return True
         
         # Testing tasks
-        if any(word in task_lower for word in ['test', 'qa', 'quality']):
+        if any(word in task_lower for word in TESTING_WORDS):
             # Check if there are any incomplete implementation tasks for the same component
-            for other_task in all_tasks:
-                other_lower = other_task.name.lower()
-                if (any(word in other_lower for word in ['implement', 'build', 'create']) and
-                    other_task.status != TaskStatus.DONE and
-                    self._tasks_related(task, other_task)):
-                    
+            for other_task in index.implementation_candidates(task):
+                if self._tasks_related(task, other_task):
                     logger.info(
                         f"Blocking test task '{task.name}' - related implementation "
                         f"'{other_task.name}' is not complete"
@@ -243,14 +321,9 @@ class BasicAdaptiveMode:
     
     def _tasks_related(self, task1: Task, task2: Task) -> bool:
         """Check if two tasks are related (same component/feature)"""
-        # Simple heuristic: check for common words in task names
-        words1 = set(task1.name.lower().split())
-        words2 = set(task2.name.lower().split())
-        
-        # Remove common words
-        common_stopwords = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-        words1 -= common_stopwords
-        words2 -= common_stopwords
+        # Simple heuristic: check for common words in task names, minus stopwords
+        words1 = _name_words(task1)
+        words2 = _name_words(task2)
         
         # If they share significant words, they're probably related
         intersection = words1 & words2
@@ -261,7 +334,8 @@ class BasicAdaptiveMode:
         task: Task,
         agent_id: str,
         agent_skills: List[str],
-        available_tasks: List[Task]
+        available_tasks: List[Task],
+        index: Optional[_TaskIndex] = None
     ) -> float:
         """
         Calculate a score for how well a task matches an agent
@@ -284,7 +358,7 @@ class BasicAdaptiveMode:
         score += priority_scores.get(task.priority, 0.5) * 0.3
         
         # Prefer tasks that unblock others (20% of score)
-        unblocking_score = self._calculate_unblocking_value(task, available_tasks)
+        unblocking_score = self._calculate_unblocking_value(task, available_tasks, index)
         score += unblocking_score * 0.2
         
         # Agent preference (10% of score)
@@ -334,16 +408,21 @@ class BasicAdaptiveMode:
         
         return matches / max(total_possible, 1)
     
-    def _calculate_unblocking_value(self, task: Task, available_tasks: List[Task]) -> float:
+    def _calculate_unblocking_value(
+        self,
+        task: Task,
+        available_tasks: List[Task],
+        index: Optional[_TaskIndex] = None
+    ) -> float:
         """Calculate how many other tasks this task would unblock"""
         if not task.id:
             return 0.0
         
         # Count tasks that depend on this one
-        dependent_count = 0
-        for other_task in available_tasks:
-            if task.id in other_task.dependencies:
-                dependent_count += 1
+        if index:
+            dependent_count = index.dependent_counts[task.id]
+        else:
+            dependent_count = sum(1 for other_task in available_tasks if task.id in other_task.dependencies)
         
         # Normalize by total tasks
         if available_tasks:
@@ -417,14 +496,16 @@ class BasicAdaptiveMode:
         todo_tasks = [t for t in tasks if t.status == TaskStatus.TODO]
         done_tasks = [t for t in tasks if t.status == TaskStatus.DONE]
         
+        index = _TaskIndex(tasks, self.LOGICAL_DEPENDENCY_PATTERNS)
+        
         for task in todo_tasks:
-            if not await self._is_task_unblocked(task, tasks, {}):
+            if not await self._is_task_unblocked(task, tasks, {}, index):
                 # Find what's blocking it
                 blockers = []
                 
                 # Check explicit dependencies
                 for dep_id in task.dependencies:
-                    dep_task = next((t for t in tasks if t.id == dep_id), None)
+                    dep_task = index.by_id.get(dep_id)
                     if dep_task and dep_task.status != TaskStatus.DONE:
                         blockers.append({
                             "type": "explicit_dependency",
@@ -433,21 +514,19 @@ class BasicAdaptiveMode:
                         })
                 
                 # Check logical dependencies
-                task_text = f"{task.name} {task.description or ''}".lower()
-                import re
+                task_text = _task_text(task)
                 
-                for pattern in self.LOGICAL_DEPENDENCY_PATTERNS:
-                    if re.search(pattern['blocks_until_complete'], task_text):
-                        for other_task in tasks:
-                            other_text = f"{other_task.name} {other_task.description or ''}".lower()
-                            if (re.search(pattern['pattern'], other_text) and 
-                                other_task.status != TaskStatus.DONE):
-                                blockers.append({
-                                    "type": "logical_dependency",
-                                    "blocking_task": other_task.name,
-                                    "blocking_task_id": other_task.id,
-                                    "reason": f"Must complete {pattern['pattern']} before {pattern['blocks_until_complete']}"
-                                })
+                for pattern, blocked_regex, incomplete in zip(
+                    self.LOGICAL_DEPENDENCY_PATTERNS, index.blocked_patterns, index.incomplete_blockers
+                ):
+                    if blocked_regex.search(task_text):
+                        for other_task in incomplete:
+                            blockers.append({
+                                "type": "logical_dependency",
+                                "blocking_task": other_task.name,
+                                "blocking_task_id": other_task.id,
+                                "reason": f"Must complete {pattern['pattern']} before {pattern['blocks_until_complete']}"
+                            })
                 
                 if blockers:
                     blocking_analysis["blocked_tasks"].append({
@@ -10,6 +10,9 @@ Key Components
 ProjectMonitor : class
     Core monitoring system that tracks project health, analyzes metrics, and
     identifies potential risks or bottlenecks in real-time.
+MonitoringScheduler : class
+    Fetches the board once per tick and runs every registered monitoring
+    check on that shared ``BoardView``.
 
 Monitoring Capabilities
 -----------------------
@@ -57,6 +60,7 @@ src.integrations.mcp_kanban_client_simplified : Kanban board integration
 src.integrations.ai_analysis_engine_fixed : AI-powered project analysis
 """
 
+from .monitoring_scheduler import BoardView, MonitoringScheduler
 from .project_monitor import ProjectMonitor
 
-__all__ = ['ProjectMonitor']
\ No newline at end of file
+__all__ = ['BoardView', 'MonitoringScheduler', 'ProjectMonitor']
\ No newline at end of file
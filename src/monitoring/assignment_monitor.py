@@ -14,6 +14,7 @@ from src.core.models import Task, TaskStatus
 from src.core.assignment_persistence import AssignmentPersistence
 from src.integrations.kanban_interface import KanbanInterface
 from src.core.assignment_reconciliation import AssignmentReconciler
+from src.monitoring.monitoring_scheduler import BoardView, MonitoringScheduler
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,8 @@ class AssignmentMonitor:
         self,
         persistence: AssignmentPersistence,
         kanban_client: KanbanInterface,
-        check_interval: int = 30  # seconds
+        check_interval: int = 30,  # seconds
+        scheduler: Optional[MonitoringScheduler] = None
     ):
         """
         Initialize the assignment monitor.
@@ -34,11 +36,14 @@ class AssignmentMonitor:
             persistence: Assignment persistence layer
             kanban_client: Kanban board interface
             check_interval: How often to check for reversions (seconds)
+            scheduler: Shared monitoring scheduler; when given, reversions are
+                checked on its board snapshots instead of a separate fetch
         """
         self.persistence = persistence
         self.kanban_client = kanban_client
         self.reconciler = AssignmentReconciler(persistence, kanban_client)
         self.check_interval = check_interval
+        self.scheduler = scheduler
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
         
@@ -53,12 +58,18 @@ class AssignmentMonitor:
             return
             
         self._running = True
+        if self.scheduler:
+            self.scheduler.register("assignment_monitor", self.check_board, min_interval=self.check_interval)
+            logger.info(f"Assignment monitor started on shared snapshots (interval: {self.check_interval}s)")
+            return
         self._monitor_task = asyncio.create_task(self._monitor_loop())
         logger.info(f"Assignment monitor started (interval: {self.check_interval}s)")
         
     async def stop(self):
         """Stop the assignment monitor."""
         self._running = False
+        if self.scheduler:
+            self.scheduler.unregister("assignment_monitor")
         if self._monitor_task:
             self._monitor_task.cancel()
             try:
@@ -77,20 +88,30 @@ class AssignmentMonitor:
                 logger.error(f"Error in assignment monitor: {e}")
                 await asyncio.sleep(self.check_interval)
                 
-    async def _check_for_reversions(self):
-        """Check for task state reversions."""
+    async def check_board(self, view: BoardView):
+        """Check for reversions on a shared board snapshot."""
+        await self._check_for_reversions(view.tasks)
+        
+    def latest_board_tasks(self) -> Optional[List[Task]]:
+        """Tasks from the shared scheduler's latest snapshot, if it is fresh."""
+        if not self.scheduler:
+            return None
+        return self.scheduler.latest_tasks()
+        
+    async def _check_for_reversions(self, all_tasks: Optional[List[Task]] = None):
+        """
+        Check for task state reversions.
+        
+        Args:
+            all_tasks: Every task on the board; fetched from kanban if not given
+        """
         try:
             # Get current assignments from persistence
             assignments = await self.persistence.load_assignments()
             
             # Get current task states from kanban
-            try:
-                all_tasks = await self.kanban_client.get_all_tasks()
-            except AttributeError as e:
-                # Fallback: if get_all_tasks is not available, use available tasks only
-                logger.warning(f"get_all_tasks not available on {type(self.kanban_client)}: {e}")
-                logger.warning("Using get_available_tasks as fallback - health check will be limited")
-                all_tasks = await self.kanban_client.get_available_tasks()
+            if all_tasks is None:
+                all_tasks = await _fetch_all_tasks(self.kanban_client)
             
             task_map = {task.id: task for task in all_tasks}
             
@@ -195,7 +216,7 @@ class AssignmentMonitor:
     async def force_reconciliation(self):
         """Force a full reconciliation check."""
         logger.info("Forcing assignment reconciliation")
-        results = await self.reconciler.reconcile_assignments()
+        results = await self.reconciler.reconcile_assignments(self.latest_board_tasks())
         logger.info(f"Reconciliation results: {results}")
         return results
         
@@ -205,6 +226,7 @@ class AssignmentMonitor:
             "monitoring": self._running,
             "check_interval": self.check_interval,
             "tracked_tasks": len(self._last_known_states),
+            "shared_snapshots": self.scheduler is not None,
             "reversion_counts": dict(self._reversion_count),
             "last_check": datetime.now().isoformat()
         }
@@ -224,10 +246,14 @@ class AssignmentHealthChecker:
         self.monitor = monitor
         self.reconciler = AssignmentReconciler(persistence, kanban_client)
         
-    async def check_assignment_health(self) -> Dict:
+    async def check_assignment_health(self, tasks: Optional[List[Task]] = None) -> Dict:
         """
         Comprehensive health check of assignment system.
         
+        Args:
+            tasks: Every task on the board; defaults to the monitor's shared
+                snapshot when fresh, otherwise fetched from kanban
+        
         Returns:
             Dictionary with health status and any issues found
         """
@@ -244,13 +270,10 @@ class AssignmentHealthChecker:
             health["metrics"]["persisted_assignments"] = len(persisted)
             
             # Check kanban state
-            try:
-                tasks = await self.kanban_client.get_all_tasks()
-            except AttributeError as e:
-                # Fallback: if get_all_tasks is not available, use available tasks only
-                logger.warning(f"get_all_tasks not available on {type(self.kanban_client)}: {e}")
-                logger.warning("Using get_available_tasks as fallback - health check will be limited")
-                tasks = await self.kanban_client.get_available_tasks()
+            if tasks is None and self.monitor:
+                tasks = self.monitor.latest_board_tasks()
+            if tasks is None:
+                tasks = await _fetch_all_tasks(self.kanban_client)
             
             in_progress = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
             health["metrics"]["in_progress_tasks"] = len(in_progress)
@@ -312,4 +335,15 @@ class AssignmentHealthChecker:
                 "severity": "error"
             })
             
-        return health
\ No newline at end of file
+        return health
+
+
+async def _fetch_all_tasks(kanban_client: KanbanInterface) -> List[Task]:
+    """Fetch every task, falling back to available tasks for limited clients."""
+    try:
+        return await kanban_client.get_all_tasks()
+    except AttributeError as e:
+        # Fallback: if get_all_tasks is not available, use available tasks only
+        logger.warning(f"get_all_tasks not available on {type(kanban_client)}: {e}")
+        logger.warning("Using get_available_tasks as fallback - health check will be limited")
+        return await kanban_client.get_available_tasks()
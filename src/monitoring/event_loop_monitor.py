@@ -0,0 +1,112 @@
+"""
+Event loop lag monitoring.
+
+Marcus serves every agent from a single asyncio event loop. Any blocking
+call on that loop (a synchronous HTTP request, heavy CPU work) delays every
+other agent's pings and progress reports. This module measures that delay
+by scheduling a wake-up at a fixed interval and recording how late it fires.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EventLoopLagMonitor:
+    """Samples how late the event loop runs a periodically scheduled wake-up."""
+
+    def __init__(
+        self,
+        interval: float = 0.5,
+        window: int = 240,
+        warn_threshold: float = 0.25
+    ):
+        """
+        Initialize the event loop lag monitor.
+
+        Args:
+            interval: Seconds between samples
+            window: Number of recent samples kept for statistics
+            warn_threshold: Lag in seconds above which a warning is logged
+        """
+        self.interval = interval
+        self.warn_threshold = warn_threshold
+        self._samples: Deque[float] = deque(maxlen=window)
+        self._running = False
+        self._monitor_task: Optional[asyncio.Task] = None
+
+        self.max_lag = 0.0
+        self.total_samples = 0
+        self.slow_samples = 0
+
+    async def start(self):
+        """Start sampling event loop lag."""
+        if self._running:
+            return
+        self._running = True
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+        logger.info(f"Event loop lag monitor started (interval: {self.interval}s)")
+
+    async def stop(self):
+        """Stop sampling."""
+        self._running = False
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    def record(self, lag: float) -> None:
+        """Record one lag sample in seconds."""
+        lag = max(0.0, lag)
+        self._samples.append(lag)
+        self.total_samples += 1
+        self.max_lag = max(self.max_lag, lag)
+        if lag > self.warn_threshold:
+            self.slow_samples += 1
+            logger.warning(f"Event loop blocked for {lag * 1000:.0f}ms")
+
+    async def _monitor_loop(self):
+        """Sleep for ``interval`` and record how much later than that we woke up."""
+        while self._running:
+            try:
+                expected = time.perf_counter() + self.interval
+                await asyncio.sleep(self.interval)
+                self.record(time.perf_counter() - expected)
+            except asyncio.CancelledError:
+                break
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get lag statistics over the recent window, in milliseconds.
+
+        Returns:
+            Dict with current, mean, p95 and max lag plus sample counts
+        """
+        samples = sorted(self._samples)
+        if samples:
+            p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+            mean = sum(samples) / len(samples)
+            current = self._samples[-1]
+        else:
+            p95 = mean = current = 0.0
+
+        return {
+            "current_lag_ms": round(current * 1000, 2),
+            "mean_lag_ms": round(mean * 1000, 2),
+            "p95_lag_ms": round(p95 * 1000, 2),
+            "max_lag_ms": round(self.max_lag * 1000, 2),
+            "samples": self.total_samples,
+            "slow_samples": self.slow_samples,
+            "interval_ms": self.interval * 1000,
+        }
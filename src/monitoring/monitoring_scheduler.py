@@ -0,0 +1,307 @@
+"""
+Shared board snapshot for Marcus's periodic monitors.
+
+The project monitor, assignment monitor, reconciler and assignment health
+checks all look at the whole kanban board. Run on their own timers, each of
+them fetches every list and card again. The MonitoringScheduler fetches the
+board once per tick, computes the status, overdue and stall aggregates in a
+single pass (``BoardView``), and hands that view to every registered check.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.core.models import Task, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+MonitoringCheck = Callable[["BoardView"], Awaitable[Any]]
+
+
+def _local_naive(value: datetime) -> datetime:
+    """
+    Convert a timezone-aware datetime to naive local time.
+
+    Providers differ: Planka tasks carry naive local times, GitHub and
+    Linear tasks carry aware ones. Naive values are returned unchanged.
+    """
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+@dataclass
+class BoardView:
+    """
+    One fetch of the board with the aggregates monitoring checks need.
+
+    Build it with ``BoardView.build``; the checks only read it.
+    """
+    tasks: List[Task]
+    taken_at: datetime
+    stall_threshold: timedelta
+    task_map: Dict[str, Task] = field(default_factory=dict)
+    by_status: Dict[TaskStatus, List[Task]] = field(default_factory=dict)
+    overdue_tasks: List[Task] = field(default_factory=list)
+    stalled_tasks: List[Task] = field(default_factory=list)
+    completed_recently: int = 0
+    dependents: Dict[str, List[str]] = field(default_factory=dict)
+    changes: Optional[Dict[str, List[str]]] = None
+
+    @classmethod
+    def build(
+        cls,
+        tasks: List[Task],
+        now: Optional[datetime] = None,
+        stall_threshold: timedelta = timedelta(hours=24),
+        velocity_window: timedelta = timedelta(days=7)
+    ) -> "BoardView":
+        """
+        Index the board and compute every aggregate in one pass over the tasks.
+
+        Timezone-aware task times are compared as naive local times, so
+        boards mixing aware and naive datetimes do not break the checks.
+
+        Args:
+            tasks: Every task on the board
+            now: Reference time for overdue, stall and velocity checks
+            stall_threshold: In-progress tasks not updated for longer are stalled
+            velocity_window: Completed tasks updated within it count towards velocity
+
+        Returns:
+            The board view
+        """
+        now = _local_naive(now) if now else datetime.now()
+        velocity_start = now - velocity_window
+        view = cls(tasks=list(tasks), taken_at=now, stall_threshold=stall_threshold)
+        by_status: Dict[TaskStatus, List[Task]] = defaultdict(list)
+        dependents: Dict[str, List[str]] = defaultdict(list)
+
+        for task in view.tasks:
+            view.task_map[task.id] = task
+            by_status[task.status].append(task)
+            for dependency_id in task.dependencies:
+                dependents[dependency_id].append(task.id)
+
+            if task.status == TaskStatus.DONE:
+                if task.updated_at and _local_naive(task.updated_at) > velocity_start:
+                    view.completed_recently += 1
+                continue
+            if task.due_date and _local_naive(task.due_date) < now:
+                view.overdue_tasks.append(task)
+            if (task.status == TaskStatus.IN_PROGRESS and task.updated_at
+                    and now - _local_naive(task.updated_at) > stall_threshold):
+                view.stalled_tasks.append(task)
+
+        view.by_status = dict(by_status)
+        view.dependents = dict(dependents)
+        return view
+
+    def count(self, status: Optional[TaskStatus] = None) -> int:
+        """Count all tasks, or only those with the given status."""
+        if status is None:
+            return len(self.tasks)
+        return len(self.by_status.get(status, ()))
+
+    def tasks_with_status(self, status: TaskStatus) -> List[Task]:
+        """Return the tasks in the given status."""
+        return self.by_status.get(status, [])
+
+    def age(self) -> float:
+        """Seconds since the board was fetched."""
+        return (datetime.now() - self.taken_at).total_seconds()
+
+
+@dataclass
+class _RegisteredCheck:
+    check: MonitoringCheck
+    min_interval: Optional[float] = None
+    last_run: Optional[float] = None
+    runs: int = 0
+    errors: int = 0
+    last_duration: float = 0.0
+    last_error: Optional[str] = None
+
+
+class MonitoringScheduler:
+    """Fetches the board once per tick and runs every monitoring check on it."""
+
+    def __init__(
+        self,
+        fetch_tasks: Callable[[], Awaitable[List[Task]]],
+        interval: float = 30.0,
+        board_snapshot: Any = None,
+        stall_threshold_hours: float = 24
+    ):
+        """
+        Initialize the monitoring scheduler.
+
+        Args:
+            fetch_tasks: Coroutine function returning every task on the board
+            interval: Seconds between ticks
+            board_snapshot: Optional BoardSnapshot reconciled with each fetch,
+                so request handlers share the monitors' view of the board
+            stall_threshold_hours: Hours without an update before an
+                in-progress task counts as stalled
+        """
+        self.fetch_tasks = fetch_tasks
+        self.interval = interval
+        self.board_snapshot = board_snapshot
+        self.stall_threshold = timedelta(hours=stall_threshold_hours)
+
+        self._checks: Dict[str, _RegisteredCheck] = {}
+        self._running = False
+        self._monitor_task: Optional[asyncio.Task] = None
+        self.latest_view: Optional[BoardView] = None
+
+        self.ticks = 0
+        self.board_fetches = 0
+        self.fetch_errors = 0
+        self.last_fetch_duration = 0.0
+
+    def register(
+        self,
+        name: str,
+        check: MonitoringCheck,
+        min_interval: Optional[float] = None
+    ) -> None:
+        """
+        Run a check on every tick's board view.
+
+        Args:
+            name: Unique name of the check; registering it again replaces it
+            check: Coroutine function taking the BoardView
+            min_interval: Minimum seconds between runs, for checks that
+                should run less often than the scheduler ticks
+        """
+        self._checks[name] = _RegisteredCheck(check, min_interval)
+
+    def unregister(self, name: str) -> None:
+        """Stop running a check."""
+        self._checks.pop(name, None)
+
+    async def start(self):
+        """Start ticking."""
+        if self._running:
+            return
+        self._running = True
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+        logger.info(f"Monitoring scheduler started (interval: {self.interval}s)")
+
+    async def stop(self):
+        """Stop ticking."""
+        self._running = False
+        if self._monitor_task:
+            self._monitor_task.cancel()
+            try:
+                await self._monitor_task
+            except asyncio.CancelledError:
+                pass
+            self._monitor_task = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    async def _monitor_loop(self):
+        while self._running:
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep ticking; the next tick fetches a fresh board
+                logger.error(f"Monitoring tick failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def run_once(self) -> Optional[BoardView]:
+        """
+        Fetch the board once and run every due check on it.
+
+        A failing fetch skips the tick's checks; a failing check is logged
+        and does not stop the others.
+
+        Returns:
+            The new board view, or None if the board could not be fetched
+        """
+        self.ticks += 1
+        started = time.perf_counter()
+        try:
+            tasks = await self.fetch_tasks()
+        except Exception as e:
+            self.fetch_errors += 1
+            logger.error(f"Monitoring board fetch failed: {e}")
+            return None
+        self.board_fetches += 1
+        self.last_fetch_duration = time.perf_counter() - started
+
+        changes = None
+        if self.board_snapshot is not None:
+            changes = self.board_snapshot.reconcile(tasks)
+
+        view = BoardView.build(tasks, stall_threshold=self.stall_threshold)
+        view.changes = changes
+        self.latest_view = view
+
+        now = time.monotonic()
+        for name, registered in list(self._checks.items()):
+            if (registered.min_interval is not None and registered.last_run is not None
+                    and now - registered.last_run < registered.min_interval):
+                continue
+            registered.last_run = now
+            check_started = time.perf_counter()
+            try:
+                await registered.check(view)
+                registered.last_error = None
+            except Exception as e:
+                registered.errors += 1
+                registered.last_error = str(e)
+                logger.error(f"Monitoring check {name} failed: {e}")
+            registered.runs += 1
+            registered.last_duration = time.perf_counter() - check_started
+
+        return view
+
+    def latest_tasks(self, max_age: Optional[float] = None) -> Optional[List[Task]]:
+        """
+        Tasks from the latest board view, if it is recent enough.
+
+        Args:
+            max_age: Maximum age in seconds; defaults to two ticks
+
+        Returns:
+            The tasks, or None if there is no sufficiently fresh view
+        """
+        if self.latest_view is None:
+            return None
+        if max_age is None:
+            max_age = 2 * self.interval
+        if self.latest_view.age() > max_age:
+            return None
+        return self.latest_view.tasks
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Tick, fetch and per-check statistics."""
+        return {
+            "running": self._running,
+            "interval": self.interval,
+            "ticks": self.ticks,
+            "board_fetches": self.board_fetches,
+            "fetch_errors": self.fetch_errors,
+            "last_fetch_ms": round(self.last_fetch_duration * 1000, 1),
+            "last_view_age": round(self.latest_view.age(), 1) if self.latest_view else None,
+            "checks": {
+                name: {
+                    "runs": registered.runs,
+                    "errors": registered.errors,
+                    "last_duration_ms": round(registered.last_duration * 1000, 1),
+                    "last_error": registered.last_error
+                }
+                for name, registered in self._checks.items()
+            }
+        }
@@ -69,6 +69,7 @@ from src.core.models import (
 from src.integrations.mcp_kanban_client_simplified import MCPKanbanClientSimplified
 from src.integrations.ai_analysis_engine_fixed import AIAnalysisEngine
 from src.config.settings import Settings
+from src.monitoring.monitoring_scheduler import BoardView, MonitoringScheduler
 
 
 class ProjectMonitor:
@@ -99,6 +100,8 @@ class ProjectMonitor:
         Interval in seconds between monitoring checks (default: 900s/15min)
     is_monitoring : bool
         Flag indicating if continuous monitoring is active
+    scheduler : Optional[MonitoringScheduler]
+        Shared monitoring scheduler this monitor is attached to, if any
         
     Methods
     -------
@@ -108,6 +111,10 @@ class ProjectMonitor:
         Stop the continuous monitoring loop
     get_project_state()
         Get current project state with latest metrics
+    attach(scheduler)
+        Run monitoring cycles on a shared scheduler's board snapshots
+    run_cycle(view)
+        Run one monitoring cycle on a board snapshot
     record_blocker(agent_id, task_id, description)
         Record a new blocker report
     get_current_risks()
@@ -151,6 +158,10 @@ class ProjectMonitor:
         # Monitoring configuration
         self.check_interval = self.settings.get("monitoring_interval", 900)  # 15 minutes
         self.is_monitoring = False
+        
+        # Shared board snapshots, when attached to a MonitoringScheduler
+        self.scheduler: Optional[MonitoringScheduler] = None
+        self._project_name: Optional[str] = None
     
     async def start_monitoring(self) -> None:
         """Start the continuous monitoring loop.
@@ -205,17 +216,9 @@ class ProjectMonitor:
         
         while self.is_monitoring:
             try:
-                # Collect project data
-                await self._collect_project_data()
-                
-                # Analyze project health
-                await self._analyze_project_health()
-                
-                # Check for issues
-                await self._check_for_issues()
-                
-                # Store historical data
-                self._record_metrics()
+                # One board fetch per cycle, shared by every step
+                view = await self._fetch_board_view()
+                await self.run_cycle(view)
                 
             except Exception as e:
                 print(f"Error in monitoring loop: {e}")
@@ -241,6 +244,67 @@ class ProjectMonitor:
         """
         self.is_monitoring = False
     
+    def attach(
+        self,
+        scheduler: MonitoringScheduler,
+        analyze: bool = True,
+        min_interval: Optional[float] = None
+    ) -> None:
+        """Run monitoring cycles on a shared scheduler's board snapshots.
+        
+        Instead of fetching the board itself, the monitor registers a check
+        with the scheduler and works from the view the scheduler fetched for
+        all monitors. Use this instead of start_monitoring().
+        
+        Parameters
+        ----------
+        scheduler : MonitoringScheduler
+            Scheduler that fetches the board once per tick
+        analyze : bool
+            Include the AI health analysis in each cycle
+        min_interval : Optional[float]
+            Minimum seconds between cycles; defaults to check_interval
+        
+        Notes
+        -----
+        get_project_state() also refreshes from the scheduler's latest view
+        between cycles, without fetching the board.
+        """
+        self.scheduler = scheduler
+        scheduler.register(
+            "project_monitor",
+            lambda view: self.run_cycle(view, analyze=analyze),
+            min_interval=self.check_interval if min_interval is None else min_interval
+        )
+    
+    async def run_cycle(self, view: BoardView, analyze: bool = True) -> None:
+        """Run one monitoring cycle on a board snapshot.
+        
+        Collects project data, optionally analyzes project health, checks for
+        issues and records metrics, all from the same view of the board.
+        
+        Parameters
+        ----------
+        view : BoardView
+            Board snapshot with precomputed status, overdue and stall aggregates
+        analyze : bool
+            Include the AI health analysis
+        """
+        # Collect project data
+        await self._collect_project_data(view)
+        
+        # Analyze project health
+        if analyze:
+            await self._analyze_project_health()
+        else:
+            self.risks = []
+        
+        # Check for issues
+        await self._check_for_issues(view)
+        
+        # Store historical data
+        self._record_metrics()
+    
     async def get_project_state(self) -> ProjectState:
         """Get current project state with latest metrics.
         
@@ -281,11 +345,47 @@ class ProjectMonitor:
         ...     for task in state.overdue_tasks:
         ...         print(f"  - {task.name} (due: {task.due_date})")
         """
-        if not self.current_state:
+        latest_view = self.scheduler.latest_view if self.scheduler else None
+        if latest_view and (
+            not self.current_state or latest_view.taken_at > self.current_state.last_updated
+        ):
+            await self._collect_project_data(latest_view)
+        elif not self.current_state:
             await self._collect_project_data()
         return self.current_state
     
-    async def _collect_project_data(self) -> None:
+    async def _fetch_board_view(self) -> BoardView:
+        """Fetch every task once and index it for a monitoring cycle.
+        
+        Returns
+        -------
+        BoardView
+            Board snapshot using the configured stall threshold
+        """
+        tasks = await self._get_all_tasks()
+        return BoardView.build(
+            tasks,
+            stall_threshold=timedelta(hours=self.settings.get("stall_threshold_hours", 24))
+        )
+    
+    async def _get_project_name(self) -> str:
+        """Get the project name from the board summary, fetched once.
+        
+        Returns
+        -------
+        str
+            Project name, or "Unknown Project" if the summary is unavailable
+        """
+        if self._project_name is None:
+            try:
+                summary = await self.kanban_client.get_board_summary()
+            except Exception:
+                # Retried on the next cycle
+                return "Unknown Project"
+            self._project_name = summary.get("name", "Unknown Project")
+        return self._project_name
+    
+    async def _collect_project_data(self, view: Optional[BoardView] = None) -> None:
         """Collect comprehensive project data from kanban board.
         
         Gathers current project metrics including task counts, progress,
@@ -293,7 +393,7 @@ class ProjectMonitor:
         attribute with fresh data from the kanban board.
         
         The method performs the following data collection:
-        1. Retrieves board summary and all tasks from kanban system
+        1. Retrieves all tasks from kanban system, unless a view is given
         2. Calculates task distribution across status categories
         3. Identifies overdue tasks based on due dates
         4. Computes progress percentage and team velocity
@@ -311,31 +411,27 @@ class ProjectMonitor:
         This method is called automatically by the monitoring loop and when
         get_project_state() is called with no existing state. It integrates
         with the MCP Kanban client to retrieve real-time project data.
-        """
-        # Get board summary
-        summary = await self.kanban_client.get_board_summary()
         
-        # Get all tasks
-        all_tasks = await self._get_all_tasks()
-        
-        # Calculate metrics
-        total_tasks = len(all_tasks)
-        completed_tasks = len([t for t in all_tasks if t.status == TaskStatus.DONE])
-        in_progress_tasks = len([t for t in all_tasks if t.status == TaskStatus.IN_PROGRESS])
-        blocked_tasks = len([t for t in all_tasks if t.status == TaskStatus.BLOCKED])
+        Parameters
+        ----------
+        view : Optional[BoardView]
+            Board snapshot to use instead of fetching the board
+        """
+        if view is None:
+            view = await self._fetch_board_view()
         
-        # Find overdue tasks
-        overdue_tasks = []
-        now = datetime.now()
-        for task in all_tasks:
-            if task.due_date and task.due_date < now and task.status != TaskStatus.DONE:
-                overdue_tasks.append(task)
+        # Counts and overdue tasks were computed in the view's single pass
+        total_tasks = view.count()
+        completed_tasks = view.count(TaskStatus.DONE)
+        in_progress_tasks = view.count(TaskStatus.IN_PROGRESS)
+        blocked_tasks = view.count(TaskStatus.BLOCKED)
+        overdue_tasks = list(view.overdue_tasks)
         
         # Calculate progress
         progress_percent = (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
         
-        # Calculate velocity (tasks completed per week)
-        velocity = await self._calculate_velocity(all_tasks)
+        # Velocity (tasks completed per week)
+        velocity = view.completed_recently
         
         # Determine risk level
         risk_level = self._assess_risk_level(
@@ -348,7 +444,7 @@ class ProjectMonitor:
         # Update current state
         self.current_state = ProjectState(
             board_id=self.kanban_client.board_id or "unknown",
-            project_name=summary.get("name", "Unknown Project"),
+            project_name=await self._get_project_name(),
             total_tasks=total_tasks,
             completed_tasks=completed_tasks,
             in_progress_tasks=in_progress_tasks,
@@ -357,7 +453,7 @@ class ProjectMonitor:
             overdue_tasks=overdue_tasks,
             team_velocity=velocity,
             risk_level=risk_level,
-            last_updated=datetime.now()
+            last_updated=view.taken_at
         )
     
     async def _get_all_tasks(self) -> List[Task]:
@@ -599,7 +695,7 @@ class ProjectMonitor:
             )
             self.risks.append(risk)
     
-    async def _check_for_issues(self) -> None:
+    async def _check_for_issues(self, view: Optional[BoardView] = None) -> None:
         """Check for various project issues and potential problems.
         
         Performs automated detection of common project issues including
@@ -611,6 +707,11 @@ class ProjectMonitor:
         2. Capacity issues from too many concurrent in-progress tasks
         3. Dependency bottlenecks where blocked tasks affect multiple others
         
+        Parameters
+        ----------
+        view : Optional[BoardView]
+            Board snapshot shared by all checks; fetched once if not given
+        
         Raises
         ------
         Exception
@@ -625,16 +726,19 @@ class ProjectMonitor:
         if not self.current_state:
             return
         
+        if view is None:
+            view = await self._fetch_board_view()
+        
         # Check for stalled tasks
-        await self._check_stalled_tasks()
+        await self._check_stalled_tasks(view)
         
         # Check for capacity issues
-        await self._check_capacity_issues()
+        await self._check_capacity_issues(view)
         
         # Check for dependency bottlenecks
-        await self._check_dependency_bottlenecks()
+        await self._check_dependency_bottlenecks(view)
     
-    async def _check_stalled_tasks(self) -> None:
+    async def _check_stalled_tasks(self, view: BoardView) -> None:
         """Identify tasks that haven't progressed within threshold time.
         
         Analyzes in-progress tasks to find those that haven't been updated
@@ -645,11 +749,10 @@ class ProjectMonitor:
         setting (default: 24 hours). Tasks in progress longer than this
         threshold without updates are flagged as stalled.
         
-        Raises
-        ------
-        Exception
-            If there are errors retrieving task data or calculating time
-            differences
+        Parameters
+        ----------
+        view : BoardView
+            Board snapshot whose stalled tasks were found when it was built
             
         Notes
         -----
@@ -657,27 +760,23 @@ class ProjectMonitor:
         and MEDIUM severity. The risk description includes the task name
         and duration since last update.
         """
-        tasks = await self._get_all_tasks()
-        
-        stall_threshold = timedelta(hours=self.settings.get("stall_threshold_hours", 24))
+        stall_threshold = view.stall_threshold
         now = datetime.now()
         
-        for task in tasks:
-            if task.status == TaskStatus.IN_PROGRESS:
-                if now - task.updated_at > stall_threshold:
-                    # Task is stalled, create a risk
-                    risk = ProjectRisk(
-                        risk_type="stalled_task",
-                        description=f"Task '{task.name}' has been in progress for over {stall_threshold.total_seconds()/3600} hours",
-                        severity=RiskLevel.MEDIUM,
-                        probability=1.0,
-                        impact="Delays project timeline",
-                        mitigation_strategy="Check in with assigned agent",
-                        identified_at=now
-                    )
-                    self.risks.append(risk)
+        for task in view.stalled_tasks:
+            # Task is stalled, create a risk
+            risk = ProjectRisk(
+                risk_type="stalled_task",
+                description=f"Task '{task.name}' has been in progress for over {stall_threshold.total_seconds()/3600} hours",
+                severity=RiskLevel.MEDIUM,
+                probability=1.0,
+                impact="Delays project timeline",
+                mitigation_strategy="Check in with assigned agent",
+                identified_at=now
+            )
+            self.risks.append(risk)
     
-    async def _check_capacity_issues(self) -> None:
+    async def _check_capacity_issues(self, view: BoardView) -> None:
         """Check if team capacity is being exceeded.
         
         Analyzes the current workload distribution to identify potential
@@ -688,10 +787,10 @@ class ProjectMonitor:
         threshold) are in progress concurrently, suggesting potential team
         overload and recommending task prioritization.
         
-        Raises
-        ------
-        Exception
-            If there are errors retrieving or analyzing task data
+        Parameters
+        ----------
+        view : BoardView
+            Board snapshot shared by all checks
             
         Notes
         -----
@@ -702,10 +801,7 @@ class ProjectMonitor:
         # This would integrate with agent status tracking
         # For now, we'll check task distribution
         
-        tasks = await self._get_all_tasks()
-        in_progress = [t for t in tasks if t.status == TaskStatus.IN_PROGRESS]
-        
-        if len(in_progress) > 10:  # Configurable threshold
+        if view.count(TaskStatus.IN_PROGRESS) > 10:  # Configurable threshold
             risk = ProjectRisk(
                 risk_type="capacity",
                 description="Too many tasks in progress simultaneously",
@@ -717,7 +813,7 @@ class ProjectMonitor:
             )
             self.risks.append(risk)
     
-    async def _check_dependency_bottlenecks(self) -> None:
+    async def _check_dependency_bottlenecks(self, view: BoardView) -> None:
         """Identify dependency chains causing project bottlenecks.
         
         Analyzes blocked tasks to find those that are preventing multiple
@@ -728,35 +824,31 @@ class ProjectMonitor:
         If a blocked task has more than 2 dependents, it's flagged as a
         HIGH severity risk requiring immediate attention.
         
-        Raises
-        ------
-        Exception
-            If there are errors retrieving task dependency information
-            or analyzing dependency chains
+        Parameters
+        ----------
+        view : BoardView
+            Board snapshot shared by all checks
             
         Notes
         -----
-        This method relies on the kanban client's get_dependent_tasks()
-        method to identify task dependencies. Dependency bottlenecks are
+        Dependents come from the view's reverse dependency index, so no
+        per-task kanban lookups are made. Dependency bottlenecks are
         critical as they can cascade delays across multiple work streams.
         """
-        tasks = await self._get_all_tasks()
-        
         # Find blocked tasks with many dependents
-        for task in tasks:
-            if task.status == TaskStatus.BLOCKED:
-                dependents = await self.kanban_client.get_dependent_tasks(task.id)
-                if len(dependents) > 2:
-                    risk = ProjectRisk(
-                        risk_type="dependency",
-                        description=f"Task '{task.name}' is blocking {len(dependents)} other tasks",
-                        severity=RiskLevel.HIGH,
-                        probability=1.0,
-                        impact="Multiple tasks cannot proceed",
-                        mitigation_strategy="Prioritize unblocking this task",
-                        identified_at=datetime.now()
-                    )
-                    self.risks.append(risk)
+        for task in view.tasks_with_status(TaskStatus.BLOCKED):
+            dependents = view.dependents.get(task.id, [])
+            if len(dependents) > 2:
+                risk = ProjectRisk(
+                    risk_type="dependency",
+                    description=f"Task '{task.name}' is blocking {len(dependents)} other tasks",
+                    severity=RiskLevel.HIGH,
+                    probability=1.0,
+                    impact="Multiple tasks cannot proceed",
+                    mitigation_strategy="Prioritize unblocking this task",
+                    identified_at=datetime.now()
+                )
+                self.risks.append(risk)
     
     def _record_metrics(self) -> None:
         """Record current metrics for historical tracking and trend analysis.
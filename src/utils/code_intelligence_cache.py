@@ -0,0 +1,210 @@
+"""
+Code Intelligence Cache
+
+Cache of what CodeAnalyzer extracted from repository files (endpoints,
+models), keyed by repository, path and git blob SHA. A blob SHA names the
+exact file content, so entries never go stale: a file whose SHA is unchanged
+is neither refetched from GitHub nor parsed again. Entries live in an
+in-memory LRU tier and an optional on-disk SQLite tier that survives
+restarts.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, Optional
+
+from src.utils.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+
+def make_blob_key(repo: str, path: str, blob_sha: str, extractor: str = "") -> str:
+    """
+    Build the cache key of one extracted file.
+
+    Args:
+        repo: Repository as "owner/name"
+        path: File path inside the repository
+        blob_sha: Git blob SHA of the file content
+        extractor: Fingerprint of the extraction rules, so changing them
+            does not serve results produced by the old rules
+
+    Returns:
+        Hex SHA-256 digest identifying the entry
+    """
+    canonical = json.dumps([repo.lower(), path, blob_sha, extractor], separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class CodeIntelligenceCache(TieredCache):
+    """
+    Two-tier cache of per-file code extractions.
+
+    Lookups check the in-memory LRU first and fall back to SQLite; disk hits
+    are promoted into memory. Values are deep-copied on the way out so callers
+    can mutate results without corrupting the cache.
+
+    Async callers should use ``aget``/``aset``, which run SQLite reads and
+    writes in a worker thread instead of on the event loop.
+    """
+
+    table = "code_intelligence"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS code_intelligence ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+    )
+    label = "Code intelligence cache"
+
+    def __init__(self, max_entries: int = 2048, db_path: Optional[str] = None, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in the in-memory tier
+            db_path: SQLite file for the on-disk tier; memory only if not given
+            enabled: Set to False to turn every lookup into a miss
+        """
+        super().__init__(max_entries, db_path, enabled)
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> "CodeIntelligenceCache":
+        """
+        Create a cache from the ``github.code_cache`` section of the Marcus config.
+
+        Args:
+            config: ConfigLoader to read; the global config is loaded if not
+                given, and defaults are used if it cannot be loaded
+
+        Returns:
+            A configured cache
+        """
+        if config is None:
+            try:
+                from src.config.config_loader import get_config
+                config = get_config()
+            except Exception:
+                return cls()
+
+        try:
+            max_entries = int(config.get('github.code_cache.max_entries', 2048))
+        except (TypeError, ValueError):
+            max_entries = 2048
+        db_path = config.get('github.code_cache.path')
+        return cls(
+            max_entries=max_entries,
+            db_path=db_path if isinstance(db_path, str) and db_path else None,
+            enabled=config.get('github.code_cache.enabled', True) is not False
+        )
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up an extraction.
+
+        Args:
+            key: Key from ``make_blob_key``
+
+        Returns:
+            A copy of the cached extraction, or None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        value = self._memory_get(key)
+        if value is None:
+            value = self._disk_hit(key, self._disk_get(key))
+        return value
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """
+        Look up an extraction without blocking the event loop.
+
+        Same as ``get``, but a memory miss reads the SQLite tier in a worker
+        thread.
+        """
+        if not self.enabled:
+            return None
+
+        value = self._memory_get(key)
+        if value is None:
+            stored = await self._in_thread(self._disk_get, key) if self._has_disk() else None
+            value = self._disk_hit(key, stored)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store an extraction.
+
+        Args:
+            key: Key from ``make_blob_key``
+            value: JSON-serializable extraction; None is never cached
+        """
+        stored = self._store(key, value)
+        if stored is not None:
+            self._disk_set(key, stored)
+
+    async def aset(self, key: str, value: Any) -> None:
+        """
+        Store an extraction without blocking the event loop.
+
+        Same as ``set``, but the SQLite write runs in a worker thread.
+        """
+        stored = self._store(key, value)
+        if stored is not None and self._has_disk():
+            await self._in_thread(self._disk_set, key, stored)
+
+    def _memory_get(self, key: str) -> Optional[Any]:
+        """Copy of a memory entry (counted as a hit), or None"""
+        if key not in self._memory:
+            return None
+        self._memory.move_to_end(key)
+        self.memory_hits += 1
+        return copy.deepcopy(self._memory[key])
+
+    def _disk_hit(self, key: str, value: Optional[Any]) -> Optional[Any]:
+        """Promote a disk entry into memory, or count the lookup as a miss"""
+        if value is None:
+            self.misses += 1
+            return None
+        self._remember(key, value)
+        self.disk_hits += 1
+        return copy.deepcopy(value)
+
+    def _store(self, key: str, value: Any) -> Optional[Any]:
+        """Put a copy of the value in memory; returns what the disk tier should store"""
+        if not self.enabled or value is None:
+            return None
+
+        stored = copy.deepcopy(value)
+        self._remember(key, stored)
+        self.stores += 1
+        return stored
+
+    def _disk_get(self, key: str) -> Optional[Any]:
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT value FROM code_intelligence WHERE key = ?", (key,)
+                ).fetchone()
+                return json.loads(row[0]) if row else None
+            except Exception as e:
+                logger.debug(f"Code intelligence cache disk read failed: {e}")
+                return None
+
+    def _disk_set(self, key: str, value: Any) -> None:
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO code_intelligence (key, value) VALUES (?, ?)",
+                        (key, json.dumps(value))
+                    )
+            except Exception as e:
+                logger.debug(f"Code intelligence cache disk write failed: {e}")
@@ -0,0 +1,238 @@
+"""
+Graph Utilities
+
+Reachability, transitive reduction and cycle detection for dependency graphs.
+Everything is iterative, so long dependency chains cannot hit Python's
+recursion limit, and reachability is computed once per graph as bitset rows
+instead of one path search per query.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Callable, Dict, Hashable, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+Node = Hashable
+Adjacency = Mapping[Node, Iterable[Node]]
+
+
+def strongly_connected_components(nodes: Iterable[Node], adjacency: Adjacency) -> List[List[Node]]:
+    """
+    Find the strongly connected components of a directed graph (Tarjan).
+
+    Args:
+        nodes: Every node in the graph; nodes only reachable through
+            ``adjacency`` are included as well
+        adjacency: Successors of each node
+
+    Returns:
+        Components in reverse topological order: every edge between two
+        components points from a later component to an earlier one
+    """
+    index_of: Dict[Node, int] = {}
+    lowlink: Dict[Node, int] = {}
+    on_stack: Set[Node] = set()
+    stack: List[Node] = []
+    components: List[List[Node]] = []
+    counter = 0
+
+    for root in nodes:
+        if root in index_of:
+            continue
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(adjacency.get(root, ())))]
+
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for successor in successors:
+                if successor not in index_of:
+                    index_of[successor] = lowlink[successor] = counter
+                    counter += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work.append((successor, iter(adjacency.get(successor, ()))))
+                    advanced = True
+                    break
+                if successor in on_stack:
+                    lowlink[node] = min(lowlink[node], index_of[successor])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+class Reachability:
+    """
+    All-pairs reachability of a directed graph as bitset rows.
+
+    Each node gets a bit position; ``rows[node]`` has the bit of every node
+    reachable from it (including itself). Rows are built once by walking the
+    strongly connected components in reverse topological order, so cycles
+    are handled and each component row is computed exactly once.
+
+    Args:
+        nodes: Every node in the graph
+        adjacency: Successors of each node
+        bit: Bit of each node, to share one layout between several
+            Reachability objects; assigned automatically if not given
+    """
+
+    def __init__(self, nodes: Iterable[Node], adjacency: Adjacency, bit: Optional[Dict[Node, int]] = None):
+        components = strongly_connected_components(nodes, adjacency)
+
+        self.bit: Dict[Node, int] = dict(bit) if bit else {}
+        for component in components:
+            for node in component:
+                if node not in self.bit:
+                    self.bit[node] = 1 << len(self.bit)
+
+        component_of: Dict[Node, int] = {}
+        for position, component in enumerate(components):
+            for node in component:
+                component_of[node] = position
+
+        # Successor components always come earlier in ``components``
+        component_rows: List[int] = []
+        for position, component in enumerate(components):
+            row = 0
+            for node in component:
+                row |= self.bit[node]
+                for successor in adjacency.get(node, ()):
+                    successor_position = component_of[successor]
+                    if successor_position != position:
+                        row |= component_rows[successor_position]
+            component_rows.append(row)
+
+        self.rows: Dict[Node, int] = {
+            node: component_rows[component_of[node]] for node in component_of
+        }
+        self._nodes_by_bit = {bit: node for node, bit in self.bit.items()}
+
+    def reaches(self, source: Node, target: Node) -> bool:
+        """Whether ``target`` is reachable from ``source`` (always True for itself)"""
+        if source == target:
+            return True
+        row = self.rows.get(source, 0)
+        return bool(row & self.bit.get(target, 0))
+
+    def reachable_from(self, source: Node) -> Set[Node]:
+        """Every node reachable from ``source``, including itself"""
+        row = self.rows.get(source, 0)
+        nodes = set()
+        while row:
+            lowest = row & -row
+            nodes.add(self._nodes_by_bit[lowest])
+            row ^= lowest
+        return nodes
+
+
+def transitive_reduction(
+    items: Sequence[T],
+    edge: Callable[[T], Tuple[Node, Node]],
+    keep: Optional[Callable[[T], bool]] = None,
+) -> List[T]:
+    """
+    Drop edges implied by a longer path through some other node.
+
+    An edge ``u -> v`` is redundant when some node ``w`` other than ``u`` and
+    ``v`` is reachable from ``u`` and reaches ``v``. Reachability forwards
+    and backwards is computed once, so each edge is checked with a single
+    bitset intersection.
+
+    Args:
+        items: Edge objects, in the order they should be returned
+        edge: Returns the ``(source, target)`` pair of an item
+        keep: Items for which this returns True are never dropped
+
+    Returns:
+        The non-redundant items (plus every kept item), in input order
+    """
+    adjacency: Dict[Node, List[Node]] = defaultdict(list)
+    reverse_adjacency: Dict[Node, List[Node]] = defaultdict(list)
+    nodes: Dict[Node, None] = {}
+    for item in items:
+        source, target = edge(item)
+        adjacency[source].append(target)
+        reverse_adjacency[target].append(source)
+        nodes[source] = None
+        nodes[target] = None
+
+    descendants = Reachability(nodes, adjacency)
+    ancestors = Reachability(nodes, reverse_adjacency, bit=descendants.bit)
+
+    reduced = []
+    for item in items:
+        if keep is not None and keep(item):
+            reduced.append(item)
+            continue
+        source, target = edge(item)
+        endpoints = descendants.bit[source] | descendants.bit[target]
+        between = descendants.rows[source] & ancestors.rows[target]
+        if not between & ~endpoints:
+            reduced.append(item)
+
+    return reduced
+
+
+def find_cycle(nodes: Iterable[Node], adjacency: Adjacency) -> Optional[List[Node]]:
+    """
+    Find the first cycle a depth-first search meets.
+
+    Nodes are visited in the given order and successors in adjacency order.
+
+    Args:
+        nodes: Every node in the graph
+        adjacency: Successors of each node
+
+    Returns:
+        The cycle as a path that starts and ends on the same node, or None
+        if the graph is acyclic
+    """
+    visited: Set[Node] = set()
+
+    for root in nodes:
+        if root in visited:
+            continue
+        visited.add(root)
+        path = [root]
+        on_path = {root}
+        work = [iter(adjacency.get(root, ()))]
+
+        while work:
+            advanced = False
+            for successor in work[-1]:
+                if successor in on_path:
+                    return path[path.index(successor):] + [successor]
+                if successor in visited:
+                    continue
+                visited.add(successor)
+                path.append(successor)
+                on_path.add(successor)
+                work.append(iter(adjacency.get(successor, ())))
+                advanced = True
+                break
+            if not advanced:
+                work.pop()
+                on_path.discard(path.pop())
+
+    return None
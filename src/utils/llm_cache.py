@@ -0,0 +1,317 @@
+"""
+LLM Response Cache
+
+Content-addressed cache for LLM responses. Identical requests (same model,
+same method, same prompt after whitespace normalization) are answered from
+an in-memory LRU tier, then from an optional on-disk SQLite tier that
+survives restarts, before a provider is called again.
+"""
+
+import copy
+import dataclasses
+import hashlib
+import json
+import logging
+import pickle
+import re
+import sqlite3
+import time
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Optional, Tuple
+
+from src.utils.tiered_cache import TieredCache
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_prompt(prompt: str) -> str:
+    """
+    Normalize a prompt so formatting-only differences share a cache entry.
+
+    Args:
+        prompt: Raw prompt text
+
+    Returns:
+        The prompt with surrounding whitespace stripped and every run of
+        whitespace collapsed to a single space
+    """
+    return _WHITESPACE.sub(" ", prompt).strip()
+
+
+def _canonical(value: Any) -> Any:
+    """Convert request arguments into a JSON-serializable, order-independent form."""
+    if isinstance(value, str):
+        return normalize_prompt(value)
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return _canonical(value.value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _canonical(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        return {str(key): _canonical(item) for key, item in sorted(value.items(), key=lambda kv: str(kv[0]))}
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted((_canonical(item) for item in value), key=repr)
+    return str(value)
+
+
+def make_cache_key(model: str, method: str, payload: Any) -> str:
+    """
+    Build the content address of an LLM request.
+
+    Args:
+        model: Model the request is sent to
+        method: Logical operation (e.g. "analyze_blocker", "complete")
+        payload: Prompt text or request arguments
+
+    Returns:
+        Hex SHA-256 digest of the normalized request
+    """
+    canonical = json.dumps([str(model), method, _canonical(payload)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache(TieredCache):
+    """
+    Two-tier cache of LLM responses with per-method TTLs.
+
+    Lookups check the in-memory LRU first and fall back to SQLite; disk hits
+    are promoted into memory. Values are deep-copied on the way out so callers
+    can mutate results without corrupting the cache. A TTL of 0 disables
+    caching for that method.
+
+    Async callers should use ``aget``/``aset``, which run SQLite reads and
+    writes in a worker thread instead of on the event loop.
+    """
+
+    table = "llm_cache"
+    schema = (
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "key TEXT PRIMARY KEY, method TEXT NOT NULL, "
+        "expires_at REAL NOT NULL, value BLOB NOT NULL)"
+    )
+    label = "LLM cache"
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        db_path: Optional[str] = None,
+        default_ttl: float = 3600.0,
+        ttls: Optional[Dict[str, float]] = None,
+        enabled: bool = True
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in the in-memory tier
+            db_path: SQLite file for the on-disk tier; memory only if not given
+            default_ttl: Seconds an entry stays valid when its method has no TTL
+            ttls: Per-method TTLs in seconds
+            enabled: Set to False to turn every lookup into a miss
+        """
+        # Memory entries are (expires_at, value) tuples
+        super().__init__(max_entries, db_path, enabled)
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.method_stats: Dict[str, Dict[str, int]] = {}
+
+    @classmethod
+    def from_config(cls, config: Any = None) -> "LLMResponseCache":
+        """
+        Create a cache from the ``ai.cache`` section of the Marcus config.
+
+        Args:
+            config: ConfigLoader to read; the global config is loaded if not
+                given, and defaults are used if it cannot be loaded
+
+        Returns:
+            A configured cache
+        """
+        if config is None:
+            try:
+                from src.config.config_loader import get_config
+                config = get_config()
+            except Exception:
+                return cls()
+
+        def number(key: str, default: float) -> float:
+            try:
+                return float(config.get(key, default))
+            except (TypeError, ValueError):
+                return default
+
+        ttls = config.get('ai.cache.ttl', {})
+        db_path = config.get('ai.cache.path')
+        return cls(
+            max_entries=int(number('ai.cache.max_entries', 512)),
+            db_path=db_path if isinstance(db_path, str) and db_path else None,
+            default_ttl=number('ai.cache.default_ttl', 3600.0),
+            ttls={
+                method: float(ttl) for method, ttl in ttls.items()
+                if isinstance(ttl, (int, float))
+            } if isinstance(ttls, dict) else {},
+            enabled=config.get('ai.cache.enabled', True) is not False
+        )
+
+    def ttl_for(self, method: str) -> float:
+        """Seconds a response for ``method`` stays valid"""
+        return self.ttls.get(method, self.default_ttl)
+
+    def get(self, key: str, method: str) -> Optional[Any]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Key from ``make_cache_key``
+            method: Method the key was built for (for TTL and statistics)
+
+        Returns:
+            A copy of the cached response, or None on a miss
+        """
+        if not self._caches(method):
+            return None
+
+        now = time.time()
+        value = self._memory_get(key, method, now)
+        if value is None:
+            value = self._disk_hit(key, method, self._disk_get(key, now))
+        return value
+
+    async def aget(self, key: str, method: str) -> Optional[Any]:
+        """
+        Look up a cached response without blocking the event loop.
+
+        Same as ``get``, but a memory miss reads the SQLite tier in a worker
+        thread.
+        """
+        if not self._caches(method):
+            return None
+
+        now = time.time()
+        value = self._memory_get(key, method, now)
+        if value is None:
+            entry = await self._in_thread(self._disk_get, key, now) if self._has_disk() else None
+            value = self._disk_hit(key, method, entry)
+        return value
+
+    def set(self, key: str, method: str, value: Any) -> None:
+        """
+        Store a response.
+
+        Args:
+            key: Key from ``make_cache_key``
+            method: Method the key was built for
+            value: Response to cache; None is never cached
+        """
+        entry = self._store(key, method, value)
+        if entry is not None:
+            self._disk_set(key, method, *entry)
+
+    async def aset(self, key: str, method: str, value: Any) -> None:
+        """
+        Store a response without blocking the event loop.
+
+        Same as ``set``, but the SQLite write runs in a worker thread.
+        """
+        entry = self._store(key, method, value)
+        if entry is not None and self._has_disk():
+            await self._in_thread(self._disk_set, key, method, *entry)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for both tiers and each method"""
+        stats = super().get_stats()
+        stats["methods"] = {method: dict(counts) for method, counts in self.method_stats.items()}
+        return stats
+
+    def _caches(self, method: str) -> bool:
+        return self.enabled and self.ttl_for(method) > 0
+
+    def _memory_get(self, key: str, method: str, now: float) -> Optional[Any]:
+        """Copy of a live memory entry (counted as a hit), or None"""
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= now:
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        self.memory_hits += 1
+        self._count(method, "hits")
+        return copy.deepcopy(value)
+
+    def _disk_hit(self, key: str, method: str, entry: Optional[Tuple[float, Any]]) -> Optional[Any]:
+        """Promote a disk entry into memory, or count the lookup as a miss"""
+        if entry is None:
+            self.misses += 1
+            self._count(method, "misses")
+            return None
+        self._remember(key, entry)
+        self.disk_hits += 1
+        self._count(method, "hits")
+        return copy.deepcopy(entry[1])
+
+    def _store(self, key: str, method: str, value: Any) -> Optional[Tuple[float, Any]]:
+        """Put a copy of the value in memory; returns what the disk tier should store"""
+        ttl = self.ttl_for(method)
+        if not self.enabled or ttl <= 0 or value is None:
+            return None
+
+        expires_at = time.time() + ttl
+        stored = copy.deepcopy(value)
+        self._remember(key, (expires_at, stored))
+        self.stores += 1
+        return expires_at, stored
+
+    def _count(self, method: str, counter: str) -> None:
+        counts = self.method_stats.setdefault(method, {"hits": 0, "misses": 0})
+        counts[counter] += 1
+
+    def _prepare(self, db: sqlite3.Connection) -> None:
+        db.execute("DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),))
+
+    def _disk_get(self, key: str, now: float) -> Optional[Tuple[float, Any]]:
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT expires_at, value FROM llm_cache WHERE key = ?", (key,)
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[0] <= now:
+                    with db:
+                        db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    return None
+                return row[0], pickle.loads(row[1])
+            except Exception as e:
+                logger.debug(f"LLM cache disk read failed: {e}")
+                return None
+
+    def _disk_set(self, key: str, method: str, expires_at: float, value: Any) -> None:
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO llm_cache (key, method, expires_at, value) VALUES (?, ?, ?, ?)",
+                        (key, method, expires_at, blob)
+                    )
+            except Exception as e:
+                logger.debug(f"LLM cache disk write failed: {e}")
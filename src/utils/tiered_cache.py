@@ -0,0 +1,130 @@
+"""
+Two-tier cache base
+
+Shared plumbing of the Marcus caches that keep an in-memory LRU tier in front
+of an optional on-disk SQLite tier: LRU bookkeeping, hit/miss counters, lazy
+opening of the SQLite file and running disk access in a worker thread so
+async callers do not block the event loop.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TieredCache:
+    """
+    In-memory LRU tier backed by an optional SQLite tier.
+
+    Subclasses set ``table`` and ``schema`` (the CREATE TABLE statement) and
+    read and write rows through ``_connect`` while holding ``_db_lock``. The
+    connection may be used from worker threads, so every disk access must
+    hold the lock.
+    """
+
+    table = ""
+    schema = ""
+    label = "Cache"
+
+    def __init__(self, max_entries: int, db_path: Optional[str] = None, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in the in-memory tier
+            db_path: SQLite file for the on-disk tier; memory only if not given
+            enabled: Set to False to turn every lookup into a miss
+        """
+        self.max_entries = max(1, int(max_entries))
+        self.db_path = db_path
+        self.enabled = enabled
+
+        self._memory: "OrderedDict[str, Any]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_failed = False
+        # Serializes the SQLite tier, which async lookups use from worker threads
+        self._db_lock = threading.Lock()
+
+        # Metrics
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers"""
+        self._memory.clear()
+        with self._db_lock:
+            db = self._connect()
+            if db is not None:
+                with db:
+                    db.execute(f"DELETE FROM {self.table}")
+
+    def close(self) -> None:
+        """Close the SQLite connection"""
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters for both tiers"""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            "enabled": self.enabled,
+            "entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "disk_enabled": self.db_path is not None and not self._db_failed,
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def _has_disk(self) -> bool:
+        return self.db_path is not None and not self._db_failed
+
+    @staticmethod
+    async def _in_thread(func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args))
+
+    def _remember(self, key: str, entry: Any) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite tier on first use; disables it if the file cannot be opened"""
+        if self._db is not None or self.db_path is None or self._db_failed:
+            return self._db
+        try:
+            directory = os.path.dirname(self.db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            with self._db:
+                self._db.execute(self.schema)
+                self._prepare(self._db)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"{self.label} disk tier disabled ({self.db_path}): {e}")
+            self._db_failed = True
+            self._db = None
+        return self._db
+
+    def _prepare(self, db: sqlite3.Connection) -> None:
+        """Hook run once after the table is created, inside its transaction"""
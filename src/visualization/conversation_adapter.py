@@ -7,16 +7,16 @@ visualization system. It monitors the real-time log stream and converts
 task/kanban events into conversation format expected by the UI.
 
 This module is designed to be completely independent of NetworkX to avoid
-import-time dependencies on heavy visualization libraries.
+import-time dependencies on heavy visualization libraries. Events are queued
+on the shared log sink and written by its background writer.
 """
 
-import json
-import os
-import time
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 
+from src.logging.log_sink import get_log_sink
+
 
 class ConversationAdapter:
     """Converts Marcus events to visualization-compatible conversation logs"""
@@ -28,6 +28,7 @@ class ConversationAdapter:
         # Create real-time conversation log
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.conversation_file = self.log_dir / f"realtime_{timestamp}.jsonl"
+        self.log_stream = get_log_sink().stream(self.conversation_file)
         
     def log_conversation_event(
         self, 
@@ -48,11 +49,8 @@ class ConversationAdapter:
             "metadata": metadata or {}
         }
         
-        # Append to conversation log
-        with open(self.conversation_file, 'a') as f:
-            json.dump(event, f)
-            f.write('\n')
-            f.flush()
+        # Queue for the conversation log
+        self.log_stream.write(event)
             
     def _determine_conversation_type(self, source: str, target: str) -> str:
         """Determine conversation type based on source and target"""
@@ -7,11 +7,15 @@ for real-time visualization in the UI.
 
 import asyncio
 import logging
+import os
 import queue
 import json
+import time
+from collections import Counter, deque
 from datetime import datetime
+from itertools import islice
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Optional, Callable, Iterator, Union
 from dataclasses import dataclass, asdict
 from enum import Enum
 import aiofiles
@@ -37,6 +41,11 @@ class ConversationEvent:
         data = asdict(self)
         data['timestamp'] = self.timestamp.isoformat()
         return data
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ConversationEvent':
+        """Rebuild an event serialized with to_dict"""
+        return cls(**{**data, 'timestamp': datetime.fromisoformat(data['timestamp'])})
 
 
 class EventType(Enum):
@@ -52,21 +61,140 @@ class EventType(Enum):
     SYSTEM_STATE = "system_state"
 
 
+class ConversationHistory:
+    """
+    Fixed-capacity ring buffer of recent events with running aggregates
+    
+    Appending evicts the oldest event once the buffer is full, and the
+    counters behind get_conversation_summary are adjusted for both the new
+    and the evicted event, so neither appends nor summaries depend on how
+    many events have been seen. Supports len(), iteration and indexing
+    (including slices) like the list it replaces.
+    """
+    
+    def __init__(self, capacity: int = 1000):
+        self._events: deque = deque(maxlen=capacity)
+        self.event_types: Counter = Counter()
+        self.workers: Counter = Counter()
+        self.decision_count = 0
+        self.blocker_count = 0
+        self.completion_count = 0
+    
+    @property
+    def capacity(self) -> int:
+        return self._events.maxlen
+    
+    def resize(self, capacity: int):
+        """Change the capacity, dropping the oldest events if it shrinks"""
+        events = list(self._events)[-capacity:] if capacity > 0 else []
+        self.clear()
+        self._events = deque(maxlen=capacity)
+        for event in events:
+            self.append(event)
+    
+    def append(self, event: ConversationEvent):
+        """Add an event, evicting the oldest one when full"""
+        if len(self._events) == self._events.maxlen:
+            if not self._events:
+                return
+            self._count(self._events[0], -1)
+        self._events.append(event)
+        self._count(event, 1)
+    
+    def clear(self):
+        self._events.clear()
+        self.event_types.clear()
+        self.workers.clear()
+        self.decision_count = 0
+        self.blocker_count = 0
+        self.completion_count = 0
+    
+    def _count(self, event: ConversationEvent, delta: int):
+        """Apply an event to the aggregates (delta=-1 removes it)"""
+        self._adjust(self.event_types, event.event_type, delta)
+        
+        # Track active workers
+        worker = None
+        if event.source.startswith('worker_') or event.source.startswith('agent'):
+            worker = event.source
+        elif event.target.startswith('worker_') or event.target.startswith('agent'):
+            worker = event.target
+        if worker:
+            self._adjust(self.workers, worker, delta)
+        
+        # Count specific events
+        if event.event_type == EventType.PM_DECISION.value:
+            self.decision_count += delta
+        elif event.event_type == EventType.BLOCKER_REPORT.value:
+            self.blocker_count += delta
+        elif event.event_type == EventType.PROGRESS_UPDATE.value:
+            if event.metadata.get('status') == 'completed':
+                self.completion_count += delta
+    
+    @staticmethod
+    def _adjust(counter: Counter, key: str, delta: int):
+        counter[key] += delta
+        if counter[key] <= 0:
+            del counter[key]
+    
+    def __len__(self) -> int:
+        return len(self._events)
+    
+    def __bool__(self) -> bool:
+        return bool(self._events)
+    
+    def __iter__(self) -> Iterator[ConversationEvent]:
+        return iter(self._events)
+    
+    def __getitem__(self, key: Union[int, slice]):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(len(self._events))
+            return list(islice(self._events, start, stop, step)) if start < stop else []
+        return self._events[key]
+
+
 class ConversationStreamProcessor:
     """
     Processes conversation logs in real-time and streams events
     to visualization clients
     """
     
-    def __init__(self, log_dir: str = "logs/conversations"):
+    def __init__(
+        self,
+        log_dir: str = "logs/conversations",
+        max_history_size: int = 1000,
+        checkpoint_path: Optional[str] = None,
+        checkpoint_interval: float = 5.0
+    ):
+        """
+        Args:
+            log_dir: Directory holding the conversation jsonl logs
+            max_history_size: Number of recent events kept in memory
+            checkpoint_path: File recording how far each log was read and the
+                recent history, so a restart resumes instead of replaying
+                every log; defaults to .stream_checkpoint.json in log_dir
+            checkpoint_interval: Minimum seconds between checkpoint writes
+                while streaming
+        """
         self.log_dir = Path(log_dir)
         self.event_handlers: List[Callable] = []
-        self.conversation_history: List[ConversationEvent] = []
-        self.max_history_size = 1000
+        self.conversation_history = ConversationHistory(max_history_size)
         self._event_counter = 0
         self._file_positions: Dict[str, int] = {}
         self._running = False
         self._event_queue = queue.Queue()
+        self.checkpoint_path = Path(checkpoint_path) if checkpoint_path else self.log_dir / ".stream_checkpoint.json"
+        self.checkpoint_interval = checkpoint_interval
+        self._checkpoint_dirty = False
+        self._last_checkpoint = 0.0
+    
+    @property
+    def max_history_size(self) -> int:
+        return self.conversation_history.capacity
+    
+    @max_history_size.setter
+    def max_history_size(self, size: int):
+        self.conversation_history.resize(size)
         
     def add_event_handler(self, handler: Callable[[ConversationEvent], None]):
         """Add a handler to be called when new events are processed"""
@@ -107,29 +235,94 @@ class ConversationStreamProcessor:
             while self._running:
                 # Process queued file changes
                 await self._process_queue()
+                if time.monotonic() - self._last_checkpoint >= self.checkpoint_interval:
+                    await self._save_checkpoint()
                 await asyncio.sleep(0.1)
                 
         finally:
             observer.stop()
             observer.join()
+            await self._save_checkpoint()
             
     def stop_streaming(self):
         """Stop streaming events"""
         self._running = False
         
     async def _process_existing_logs(self):
-        """Process all existing log files"""
+        """
+        Process existing log files
+        
+        Logs recorded in the checkpoint are only read from where the last
+        run stopped; the recent history comes from the checkpoint instead.
+        """
+        await self._load_checkpoint()
+        
         # Include both old format and new realtime logs
         log_files = list(self.log_dir.glob("conversations_*.jsonl"))
         log_files.extend(list(self.log_dir.glob("realtime_*.jsonl")))
         log_files.sort()  # Process in chronological order
         
+        # Forget logs that were removed since the checkpoint
+        existing = {str(log_file) for log_file in log_files}
+        self._file_positions = {
+            path: position for path, position in self._file_positions.items() if path in existing
+        }
+        
         for log_file in log_files:
-            await self._process_log_file(log_file)
+            position = self._file_positions.get(str(log_file), 0)
+            await self._process_log_file(log_file, from_position=position)
+        
+        await self._save_checkpoint()
+    
+    async def _load_checkpoint(self):
+        """Restore file positions and recent history from the checkpoint"""
+        if not self.checkpoint_path.exists():
+            return
+        try:
+            async with aiofiles.open(self.checkpoint_path, 'r') as f:
+                checkpoint = json.loads(await f.read())
+            history = [ConversationEvent.from_dict(event) for event in checkpoint.get('history', [])]
+        except (OSError, ValueError, TypeError, KeyError) as e:
+            logging.warning(f"ConversationStreamProcessor: Ignoring unreadable checkpoint: {e}")
+            return
+        
+        self._file_positions = {
+            path: int(position) for path, position in checkpoint.get('file_positions', {}).items()
+        }
+        self._event_counter = checkpoint.get('event_counter', self._event_counter)
+        self.conversation_history.clear()
+        for event in history:
+            self.conversation_history.append(event)
+    
+    async def _save_checkpoint(self):
+        """Write file positions and recent history if anything changed"""
+        if not self._checkpoint_dirty:
+            return
+        checkpoint = {
+            'file_positions': self._file_positions,
+            'event_counter': self._event_counter,
+            'history': [event.to_dict() for event in self.conversation_history]
+        }
+        temp_path = self.checkpoint_path.with_suffix('.tmp')
+        try:
+            async with aiofiles.open(temp_path, 'w') as f:
+                await f.write(json.dumps(checkpoint, default=str))
+            os.replace(temp_path, self.checkpoint_path)
+            self._checkpoint_dirty = False
+            self._last_checkpoint = time.monotonic()
+        except OSError as e:
+            logging.warning(f"ConversationStreamProcessor: Could not write checkpoint: {e}")
             
     async def _process_log_file(self, file_path: Path, from_position: int = 0):
-        """Process a single log file from given position"""
+        """
+        Process a single log file from given position
+        
+        A file shorter than the position was truncated or replaced (size
+        rotation restarts the live file), so it is read from the start.
+        """
         try:
+            if from_position > os.path.getsize(file_path):
+                from_position = 0
             async with aiofiles.open(file_path, 'r') as f:
                 # Seek to last known position
                 if from_position > 0:
@@ -141,6 +334,7 @@ class ConversationStreamProcessor:
                         
                 # Update file position
                 self._file_positions[str(file_path)] = await f.tell()
+                self._checkpoint_dirty = True
                 
         except Exception as e:
             print(f"Error processing log file {file_path}: {e}")
@@ -152,10 +346,8 @@ class ConversationStreamProcessor:
             event = self._parse_log_entry(data)
             
             if event:
-                # Add to history
+                # Add to history, evicting the oldest event when full
                 self.conversation_history.append(event)
-                if len(self.conversation_history) > self.max_history_size:
-                    self.conversation_history.pop(0)
                     
                 # Notify handlers
                 for handler in self.event_handlers:
@@ -379,38 +571,16 @@ class ConversationStreamProcessor:
         )
         
     def get_conversation_summary(self) -> Dict[str, Any]:
-        """Get summary of conversation patterns"""
-        summary = {
-            'total_events': len(self.conversation_history),
-            'event_types': {},
-            'active_workers': set(),
-            'decision_count': 0,
-            'blocker_count': 0,
-            'completion_count': 0
+        """Get summary of conversation patterns in the recent history"""
+        history = self.conversation_history
+        return {
+            'total_events': len(history),
+            'event_types': dict(history.event_types),
+            'active_workers': len(history.workers),
+            'decision_count': history.decision_count,
+            'blocker_count': history.blocker_count,
+            'completion_count': history.completion_count
         }
-        
-        for event in self.conversation_history:
-            # Count event types
-            event_type = event.event_type
-            summary['event_types'][event_type] = summary['event_types'].get(event_type, 0) + 1
-            
-            # Track active workers
-            if event.source.startswith('worker_') or event.source.startswith('agent'):
-                summary['active_workers'].add(event.source)
-            elif event.target.startswith('worker_') or event.target.startswith('agent'):
-                summary['active_workers'].add(event.target)
-                
-            # Count specific events
-            if event.event_type == EventType.PM_DECISION.value:
-                summary['decision_count'] += 1
-            elif event.event_type == EventType.BLOCKER_REPORT.value:
-                summary['blocker_count'] += 1
-            elif event.event_type == EventType.PROGRESS_UPDATE.value:
-                if event.metadata.get('status') == 'completed':
-                    summary['completion_count'] += 1
-                    
-        summary['active_workers'] = len(summary['active_workers'])
-        return summary
 
 
 class LogFileHandler(FileSystemEventHandler):
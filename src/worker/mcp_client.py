@@ -58,7 +58,10 @@ Basic worker agent workflow:
 Notes
 -----
 This client requires the Marcus MCP server to be running and accessible.
-All communication is asynchronous and uses the MCP stdio transport protocol.
+All communication is asynchronous. By default the client launches its own
+Marcus server over the MCP stdio transport; given a server URL (or the
+MARCUS_SERVER_URL environment variable) it connects to a shared Marcus
+started with ``python marcus.py --http`` instead.
 Workers should handle connection failures gracefully and implement retry logic.
 """
 
@@ -70,7 +73,9 @@ from contextlib import asynccontextmanager
 from typing import Dict, Any, Optional, List, AsyncIterator
 
 from mcp import ClientSession, StdioServerParameters
+from mcp.client.sse import sse_client
 from mcp.client.stdio import stdio_client
+from mcp.client.streamable_http import streamablehttp_client
 
 
 class WorkerMCPClient:
@@ -91,6 +96,8 @@ class WorkerMCPClient:
     ----------
     session : Optional[ClientSession]
         The active MCP client session, None when disconnected
+    server_url : Optional[str]
+        URL of a shared Marcus server; None to launch a private one over stdio
         
     Methods
     -------
@@ -157,7 +164,7 @@ class WorkerMCPClient:
     - Session management is handled automatically by the context manager
     """
     
-    def __init__(self) -> None:
+    def __init__(self, server_url: Optional[str] = None) -> None:
         """
         Initialize the WorkerMCPClient.
         
@@ -167,7 +174,12 @@ class WorkerMCPClient:
         
         Parameters
         ----------
-        None
+        server_url : Optional[str]
+            URL of a Marcus server started with ``--http``, e.g.
+            ``http://127.0.0.1:8000/mcp`` (Streamable HTTP) or
+            ``http://127.0.0.1:8000/sse`` (SSE). Defaults to the
+            MARCUS_SERVER_URL environment variable; when neither is set the
+            client launches its own Marcus server over stdio.
         
         Attributes
         ----------
@@ -179,8 +191,37 @@ class WorkerMCPClient:
         >>> client = WorkerMCPClient()
         >>> print(client.session)  # None until connected
         None
+        >>> shared = WorkerMCPClient("http://127.0.0.1:8000/mcp")
         """
         self.session: Optional[ClientSession] = None
+        self.server_url: Optional[str] = server_url or os.environ.get("MARCUS_SERVER_URL") or None
+        
+    @asynccontextmanager
+    async def _open_transport(self) -> AsyncIterator[tuple]:
+        """Open the read/write streams for the configured transport"""
+        if self.server_url:
+            if self.server_url.rstrip("/").endswith("/sse"):
+                async with sse_client(self.server_url) as (read_stream, write_stream):
+                    yield read_stream, write_stream
+            else:
+                async with streamablehttp_client(self.server_url) as (read_stream, write_stream, _):
+                    yield read_stream, write_stream
+            return
+        
+        # Marcus server command
+        server_cmd = [
+            "python",
+            os.path.join(os.path.dirname(__file__), "..", "..", "marcus_mcp_server.py")
+        ]
+        
+        server_params = StdioServerParameters(
+            command=server_cmd[0],
+            args=server_cmd[1:],
+            env=None
+        )
+        
+        async with stdio_client(server_params) as (read_stream, write_stream):
+            yield read_stream, write_stream
         
     @asynccontextmanager
     async def connect_to_marcus(self) -> AsyncIterator[ClientSession]:
@@ -188,12 +229,13 @@ class WorkerMCPClient:
         Establish connection to Marcus MCP server.
         
         This async context manager handles the complete lifecycle of connecting
-        to the Marcus server using the Model Context Protocol (MCP) over stdio.
-        It spawns the server process, establishes communication streams, initializes
-        the session, and ensures proper cleanup on exit.
+        to the Marcus server using the Model Context Protocol (MCP). With a
+        ``server_url`` it joins the shared server over Streamable HTTP or SSE;
+        otherwise it spawns a private server process and talks to it over stdio.
+        Either way it establishes communication streams, initializes the
+        session, and ensures proper cleanup on exit.
         
-        The connection uses stdio pipes to communicate with the Marcus server
-        process. The server command is dynamically constructed relative to the
+        The stdio server command is dynamically constructed relative to the
         current module location to ensure portability.
         
         Yields
@@ -238,19 +280,7 @@ class WorkerMCPClient:
         - The connection verifies available tools upon successful initialization
         - Multiple concurrent connections from the same client are not supported
         """
-        # Marcus server command
-        server_cmd = [
-            "python",
-            os.path.join(os.path.dirname(__file__), "..", "..", "marcus_mcp_server.py")
-        ]
-        
-        server_params = StdioServerParameters(
-            command=server_cmd[0],
-            args=server_cmd[1:],
-            env=None
-        )
-        
-        async with stdio_client(server_params) as (read_stream, write_stream):
+        async with self._open_transport() as (read_stream, write_stream):
             async with ClientSession(read_stream, write_stream) as session:
                 self.session = session
                 await session.initialize()
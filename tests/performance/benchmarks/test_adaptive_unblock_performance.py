@@ -0,0 +1,125 @@
+"""
+Performance benchmarks for Adaptive Mode unblock checks.
+
+Measures BasicAdaptiveMode._filter_unblocked_tasks on synthetic boards of
+1,000 and 10,000 tasks, and compares it with the per-task full scan it
+replaces.
+"""
+
+import asyncio
+import random
+import re
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+from src.modes.adaptive.basic_adaptive import BasicAdaptiveMode
+
+# Mostly neutral verbs, with the verbs the logical patterns look for mixed in
+VERBS = (
+    ["Refactor", "Document", "Review", "Monitor", "Profile", "Audit", "Tune"] * 10
+    + ["Setup", "Design", "Implement", "Build", "Test", "Deploy", "Create", "Verify"]
+)
+COMPONENTS = [f"component{i}" for i in range(500)]
+AREAS = ["billing", "search", "reports", "profile", "inbox", "backend", "frontend", "schema"]
+
+
+def create_board(task_count: int, seed: int = 7) -> List[Task]:
+    """
+    Create a deterministic, mostly completed board with some explicit dependencies.
+
+    Few incomplete blockers is the expensive case for the full scan, which
+    only stops early when it finds one.
+    """
+    rng = random.Random(seed)
+    now = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(task_count):
+        verb = rng.choice(VERBS)
+        component = rng.choice(COMPONENTS)
+        area = rng.choice(AREAS)
+        dependencies = [f"task-{rng.randrange(i)}"] if i and rng.random() < 0.3 else []
+        tasks.append(Task(
+            id=f"task-{i}",
+            name=f"{verb} {component} {area}",
+            description=f"{verb} {area} for {component}",
+            status=TaskStatus.TODO if rng.random() < 0.1 else TaskStatus.DONE,
+            priority=Priority.MEDIUM,
+            assigned_to=None,
+            created_at=now,
+            updated_at=now,
+            due_date=None,
+            estimated_hours=4.0,
+            dependencies=dependencies,
+        ))
+    return tasks
+
+
+def scan_is_unblocked(mode: BasicAdaptiveMode, task: Task, all_tasks: List[Task]) -> bool:
+    """The per-task full scan that the snapshot index replaces."""
+    for dep_id in task.dependencies:
+        dep_task = next((t for t in all_tasks if t.id == dep_id), None)
+        if dep_task and dep_task.status != TaskStatus.DONE:
+            return False
+
+    task_text = f"{task.name} {task.description or ''}".lower()
+    for pattern in mode.LOGICAL_DEPENDENCY_PATTERNS:
+        if re.search(pattern['blocks_until_complete'], task_text):
+            for other_task in all_tasks:
+                other_text = f"{other_task.name} {other_task.description or ''}".lower()
+                if (re.search(pattern['pattern'], other_text) and
+                        other_task.status != TaskStatus.DONE and
+                        other_task.id != task.id):
+                    return False
+
+    task_lower = task.name.lower()
+    if any(word in task_lower for word in ['deploy', 'production', 'release', 'launch']):
+        for other_task in all_tasks:
+            other_lower = other_task.name.lower()
+            if (any(word in other_lower for word in ['implement', 'build', 'create', 'develop']) and
+                    other_task.status != TaskStatus.DONE and
+                    other_task.id != task.id):
+                return False
+    if any(word in task_lower for word in ['test', 'qa', 'quality']):
+        for other_task in all_tasks:
+            other_lower = other_task.name.lower()
+            if (any(word in other_lower for word in ['implement', 'build', 'create']) and
+                    other_task.status != TaskStatus.DONE and
+                    mode._tasks_related(task, other_task)):
+                return False
+    return True
+
+
+class TestAdaptiveUnblockPerformance:
+    """Benchmark Adaptive Mode unblock filtering against board size."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("task_count", [1000, 10000])
+    def test_filter_unblocked_scaling(self, task_count: int):
+        """
+        Time the indexed filter against the full scan.
+
+        Both must keep exactly the same tasks.
+        """
+        mode = BasicAdaptiveMode()
+        tasks = create_board(task_count)
+
+        start_time = time.perf_counter()
+        indexed = asyncio.run(mode._filter_unblocked_tasks(tasks, {}))
+        indexed_duration = time.perf_counter() - start_time
+
+        print(f"\n{task_count} tasks: indexed filter {indexed_duration * 1000:.1f}ms, "
+              f"{len(indexed)} unblocked")
+
+        start_time = time.perf_counter()
+        reference = [task for task in tasks if scan_is_unblocked(mode, task, tasks)]
+        scan_duration = time.perf_counter() - start_time
+
+        print(f"{task_count} tasks: full scan {scan_duration * 1000:.1f}ms "
+              f"({scan_duration / indexed_duration:.0f}x slower)")
+
+        assert [t.id for t in indexed] == [t.id for t in reference]
+        assert indexed_duration < scan_duration
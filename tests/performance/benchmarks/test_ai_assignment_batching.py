@@ -0,0 +1,113 @@
+"""
+Performance benchmarks for AI-powered task assignment scoring.
+
+Compares assignment latency against candidate count for the three ways
+AITaskAssignmentEngine can score candidates: serial per-task calls,
+bounded-concurrency per-task calls and batched single-prompt scoring.
+The LLM is simulated with a fixed per-call latency.
+"""
+
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.ai_powered_task_assignment import AITaskAssignmentEngine
+from src.intelligence.dependency_inferer import DependencyGraph
+from tests.fixtures.factories import TaskFactory
+
+# Simulated latency of one LLM round trip, in seconds
+LLM_LATENCY = 0.005
+
+
+def create_ai_engine(batch: bool) -> Mock:
+    """AI engine with simulated latency; exposes a raw prompt call if batch is set."""
+    engine = Mock(spec=["check_deployment_safety", "analyze_task_assignment",
+                        "predict_task_impact", "_call_claude"])
+
+    async def analyze(context):
+        await asyncio.sleep(LLM_LATENCY)
+        return {"suitability_score": 0.7, "confidence": 0.9}
+
+    async def predict(task, project_tasks, context):
+        await asyncio.sleep(LLM_LATENCY)
+        return {"timeline_reduction_days": 3, "risk_reduction": 0.2}
+
+    async def call_claude(prompt):
+        await asyncio.sleep(LLM_LATENCY)
+        task_list = prompt.split("Candidate tasks:")[1].split("For EVERY")[0]
+        return json.dumps({"scores": [
+            {
+                "task_id": t["id"],
+                "suitability_score": 0.7,
+                "confidence": 0.9,
+                "timeline_reduction_days": 3,
+                "risk_reduction": 0.2
+            }
+            for t in json.loads(task_list)
+        ]})
+
+    engine.check_deployment_safety = AsyncMock(return_value={"safe": True})
+    engine.analyze_task_assignment = AsyncMock(side_effect=analyze)
+    engine.predict_task_impact = AsyncMock(side_effect=predict)
+    engine._call_claude = call_claude if batch else None
+    return engine
+
+
+def create_assignment_engine(ai_engine, tasks, **kwargs) -> AITaskAssignmentEngine:
+    engine = AITaskAssignmentEngine(ai_engine, tasks, **kwargs)
+    graph = Mock(spec=DependencyGraph)
+    graph.get_critical_path = Mock(return_value=[])
+    engine.dependency_inferer = Mock()
+    engine.dependency_inferer.infer_dependencies = AsyncMock(return_value=graph)
+    return engine
+
+
+class TestAIAssignmentBatchingPerformance:
+    """Benchmark assignment latency against candidate count."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("candidate_count", [10, 30, 60])
+    async def test_assignment_latency_by_candidate_count(self, candidate_count: int):
+        """
+        Measure one assignment with serial, concurrent and batched scoring.
+
+        Serial scoring grows linearly with candidates (two round trips per
+        task); batched scoring stays at one round trip per prompt chunk.
+        """
+        tasks = TaskFactory.create_batch(candidate_count)
+        for task in tasks:
+            task.name = task.name.replace("Deploy", "Build")
+            task.dependencies = []
+        agent_info = {"worker_id": "agent-1", "skills": ["python"]}
+
+        modes = {
+            "serial": (create_ai_engine(batch=False), {"batch_scoring": False, "max_concurrency": 1}),
+            "concurrent": (create_ai_engine(batch=False), {"batch_scoring": False, "max_concurrency": 10}),
+            "batched": (create_ai_engine(batch=True), {}),
+        }
+
+        durations = {}
+        for mode, (ai_engine, options) in modes.items():
+            engine = create_assignment_engine(ai_engine, tasks, **options)
+            start_time = time.perf_counter()
+            best = await engine.find_optimal_task_for_agent(
+                agent_id="agent-1",
+                agent_info=agent_info,
+                available_tasks=tasks,
+                assigned_task_ids=set()
+            )
+            durations[mode] = time.perf_counter() - start_time
+            assert best is not None
+
+        print(f"\nAssignment latency for {candidate_count} candidates:")
+        for mode, duration in durations.items():
+            print(f"  {mode:>10}: {duration * 1000:8.1f}ms")
+
+        # Serial scoring pays two simulated round trips per candidate
+        assert durations["serial"] >= 2 * candidate_count * LLM_LATENCY
+        assert durations["batched"] < durations["serial"]
+        assert durations["concurrent"] < durations["serial"]
@@ -0,0 +1,139 @@
+"""
+Performance benchmarks for bulk task creation.
+
+Compares creating a project's tasks one ``create_task`` call at a time with
+the ``create_tasks_bulk`` pipeline. The kanban-mcp server is simulated by a
+pool of sessions whose tool calls each take a fixed latency.
+"""
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.integrations.kanban_client_with_create import KanbanClientWithCreate
+from src.integrations.label_manager_helper import clear_label_registries
+
+# Simulated latency of one kanban-mcp tool call, in seconds
+CALL_LATENCY = 0.002
+POOL_SIZE = 4
+
+
+class SimulatedBoardSession:
+    """Session answering kanban-mcp tool calls after a fixed latency."""
+
+    def __init__(self, board):
+        self.board = board
+
+    async def call_tool(self, tool_name, params):
+        await asyncio.sleep(CALL_LATENCY)
+        self.board["calls"] += 1
+        action = params.get("action")
+        if tool_name == "mcp_kanban_list_manager":
+            payload = [{"id": "list-1", "name": "Backlog"}]
+        elif tool_name == "mcp_kanban_card_manager":
+            self.board["cards"] += 1
+            payload = {"id": f"card-{self.board['cards']}", "name": params["name"]}
+        elif tool_name == "mcp_kanban_label_manager" and action == "get_all":
+            payload = list(self.board["labels"].values())
+        elif tool_name == "mcp_kanban_label_manager" and action == "create":
+            payload = {"id": f"label-{params['name']}", "name": params["name"], "color": params["color"]}
+            self.board["labels"][params["name"].lower()] = payload
+        else:
+            payload = {"id": "ok"}
+        return Mock(content=[Mock(text=json.dumps(payload))])
+
+
+class SimulatedSessionPool:
+    """Pool lending at most ``max_sessions`` sessions at a time."""
+
+    def __init__(self, board, max_sessions):
+        self.max_sessions = max_sessions
+        self._sessions = asyncio.Queue()
+        for _ in range(max_sessions):
+            self._sessions.put_nowait(SimulatedBoardSession(board))
+
+    @asynccontextmanager
+    async def get_session(self):
+        session = await self._sessions.get()
+        try:
+            yield session
+        finally:
+            self._sessions.put_nowait(session)
+
+
+def create_client(board):
+    # Every run starts from an empty board, so nothing may be cached for it
+    clear_label_registries()
+    with patch.dict(os.environ, {"PLANKA_BASE_URL": "http://localhost:3333"}):
+        client = KanbanClientWithCreate()
+    client.board_id = "board-1"
+    client._session_pool = SimulatedSessionPool(board, POOL_SIZE)
+    return client
+
+
+def project_tasks(count):
+    """Task data shaped like a parsed PRD: labels, criteria and subtasks."""
+    return [
+        {
+            "name": f"Task {i}",
+            "description": "Generated from PRD",
+            "priority": "medium",
+            "labels": ["backend", f"component:area-{i % 5}"],
+            "estimated_hours": 4,
+            "acceptance_criteria": ["Works", "Tested"],
+            "subtasks": ["Design", "Implement", "Review"],
+        }
+        for i in range(count)
+    ]
+
+
+class TestBulkTaskCreationPerformance:
+    """Benchmark task creation throughput."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("task_count", [20, 60])
+    async def test_bulk_vs_sequential_throughput(self, task_count: int):
+        """
+        Create the same project sequentially and in bulk.
+
+        Sequential creation pays every list lookup, label lookup and detail
+        write in series; the bulk pipeline shares lookups and overlaps cards
+        across the session pool.
+        """
+        tasks_data = project_tasks(task_count)
+        durations = {}
+
+        board = {"calls": 0, "cards": 0, "labels": {}}
+        client = create_client(board)
+        start_time = time.perf_counter()
+        sequential = []
+        for task_data in tasks_data:
+            sequential.append(await client.create_task(task_data))
+        durations["sequential"] = time.perf_counter() - start_time
+        sequential_calls = board["calls"]
+
+        board = {"calls": 0, "cards": 0, "labels": {}}
+        client = create_client(board)
+        start_time = time.perf_counter()
+        report = await client.create_tasks_bulk(tasks_data)
+        durations["bulk"] = time.perf_counter() - start_time
+        bulk_calls = board["calls"]
+
+        assert len(sequential) == task_count
+        assert len(report.created_tasks) == task_count
+        assert not report.failed
+
+        print(f"\nCreating {task_count} tasks ({POOL_SIZE} sessions, {CALL_LATENCY * 1000:.0f}ms per call):")
+        for mode, duration in durations.items():
+            calls = sequential_calls if mode == "sequential" else bulk_calls
+            print(f"  {mode:>10}: {duration * 1000:8.1f}ms  "
+                  f"{task_count / duration:7.1f} tasks/s  {calls} tool calls")
+
+        assert bulk_calls < sequential_calls
+        assert durations["bulk"] < durations["sequential"]
@@ -0,0 +1,100 @@
+"""
+Performance benchmarks for dependency inference.
+
+Measures the pattern-matching stage of DependencyInferer.infer_dependencies
+on synthetic boards of 100, 1,000 and 5,000 tasks, and compares it with the
+pairwise ``_check_pattern`` loop on the boards where that is still feasible.
+"""
+
+import random
+import time
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+from src.intelligence.dependency_inferer import DependencyInferer
+
+# Mostly neutral verbs, with the verbs the dependency patterns look for mixed in
+VERBS = (
+    ["Refactor", "Document", "Review", "Monitor", "Profile", "Audit", "Clean up", "Tune"] * 12
+    + ["Setup", "Design", "Implement", "Build", "Test", "Deploy", "Create", "Verify"]
+)
+COMPONENTS = [f"component{i}" for i in range(200)]
+AREAS = ["billing", "search", "reports", "profile", "inbox", "backend", "frontend", "schema"]
+
+
+def create_board(task_count: int, seed: int = 42) -> List[Task]:
+    """Create a deterministic synthetic board."""
+    rng = random.Random(seed)
+    now = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(task_count):
+        verb = rng.choice(VERBS)
+        component = rng.choice(COMPONENTS)
+        area = rng.choice(AREAS)
+        tasks.append(Task(
+            id=f"task-{i}",
+            name=f"{verb} {component} {area}",
+            description=f"{verb} {area} for {component}",
+            status=rng.choice([TaskStatus.TODO, TaskStatus.TODO, TaskStatus.IN_PROGRESS, TaskStatus.DONE]),
+            priority=Priority.MEDIUM,
+            assigned_to=None,
+            created_at=now,
+            updated_at=now,
+            due_date=None,
+            estimated_hours=4.0,
+        ))
+    return tasks
+
+
+def pairwise_match(inferer: DependencyInferer, tasks: List[Task]):
+    """The tasks x tasks x patterns loop that _match_patterns replaces."""
+    dependencies = []
+    for dependent_task in tasks:
+        for dependency_task in tasks:
+            if dependent_task.id == dependency_task.id:
+                continue
+            for pattern in inferer.dependency_patterns:
+                dependency = inferer._check_pattern(dependent_task, dependency_task, pattern)
+                if dependency:
+                    dependencies.append(dependency)
+    return dependencies
+
+
+class TestDependencyInferencePerformance:
+    """Benchmark dependency pattern matching against board size."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("task_count", [100, 1000, 5000])
+    def test_pattern_matching_scaling(self, task_count: int):
+        """
+        Time the indexed matching stage, and the pairwise loop up to 1k tasks.
+
+        Both must produce the same dependencies in the same order.
+        """
+        inferer = DependencyInferer()
+        tasks = create_board(task_count)
+
+        start_time = time.perf_counter()
+        indexed = inferer._match_patterns(tasks)
+        indexed_duration = time.perf_counter() - start_time
+
+        print(f"\n{task_count} tasks: indexed matching {indexed_duration * 1000:.1f}ms, "
+              f"{len(indexed)} dependencies")
+
+        if task_count <= 1000:
+            start_time = time.perf_counter()
+            reference = pairwise_match(inferer, tasks)
+            pairwise_duration = time.perf_counter() - start_time
+
+            print(f"{task_count} tasks: pairwise matching {pairwise_duration * 1000:.1f}ms "
+                  f"({pairwise_duration / indexed_duration:.0f}x slower)")
+
+            assert [
+                (d.dependent_task_id, d.dependency_task_id, d.confidence) for d in indexed
+            ] == [
+                (d.dependent_task_id, d.dependency_task_id, d.confidence) for d in reference
+            ]
+            assert indexed_duration < pairwise_duration
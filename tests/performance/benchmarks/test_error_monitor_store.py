@@ -0,0 +1,83 @@
+"""
+Performance benchmark for the bounded, indexed ErrorMonitor store.
+
+Fills the monitor past its capacity and checks that recording stays flat
+once errors start being evicted, then compares an indexed search for one
+agent against a linear scan of the history (the reference).
+"""
+
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.core.error_framework import ErrorContext, NetworkTimeoutError
+from src.core.error_monitoring import ErrorMonitor
+
+MAX_ERRORS = 10000
+AGENTS = 200
+
+
+def make_error(n):
+    return NetworkTimeoutError("svc", context=ErrorContext(
+        agent_id=f"agent-{n % AGENTS}", operation=f"op-{n % 17}", integration_name="kanban"
+    ))
+
+
+class TestErrorMonitorStore:
+    """Benchmark recording and searching errors in a full store."""
+
+    @pytest.mark.performance
+    def test_record_and_search(self):
+        """Recording stays O(1) when full; indexed search beats a scan."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            monitor = ErrorMonitor(
+                storage_path=str(Path(temp_dir) / "errors.json"), max_errors=MAX_ERRORS
+            )
+            errors = [make_error(n) for n in range(2 * MAX_ERRORS)]
+
+            start_time = time.perf_counter()
+            for error in errors[:1000]:
+                monitor.record_error(error)
+            first_duration = time.perf_counter() - start_time
+
+            for error in errors[1000:-1000]:
+                monitor.record_error(error)
+
+            start_time = time.perf_counter()
+            for error in errors[-1000:]:
+                monitor.record_error(error)
+            full_duration = time.perf_counter() - start_time
+
+            cutoff_time = datetime.now() - timedelta(hours=24)
+            start_time = time.perf_counter()
+            for _ in range(100):
+                scanned = [
+                    e for e in monitor.error_history
+                    if e['timestamp'] >= cutoff_time and e.get('agent_id') == "agent-7"
+                ]
+            scan_duration = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            for _ in range(100):
+                indexed = monitor.search_errors(agent_id="agent-7")
+            index_duration = time.perf_counter() - start_time
+
+        print(f"\n1000 records: empty store {first_duration * 1000:.0f}ms, "
+              f"full store {full_duration * 1000:.0f}ms")
+        print(f"100 searches for one agent: scan {scan_duration * 1000:.0f}ms, "
+              f"indexed {index_duration * 1000:.0f}ms")
+
+        assert len(monitor.error_history) == MAX_ERRORS
+        assert len(monitor.error_index) == MAX_ERRORS
+        assert indexed == scanned
+        # Work done, independent of machine load: every index stays bounded
+        # by the store and a search for one agent only visits its records
+        for index in monitor._indexes.values():
+            assert sum(len(records) for records in index.values()) == MAX_ERRORS
+        assert len(monitor._indexes['agent_id']["agent-7"]) == MAX_ERRORS // AGENTS
+        # Wall-clock ratios are loose; they only catch an order-of-magnitude regression
+        assert full_duration < first_duration * 10
+        assert index_duration < scan_duration / 2
@@ -0,0 +1,68 @@
+"""
+Performance benchmark for event loop responsiveness during AI calls.
+
+Compares event loop lag while Claude calls are in flight when the call
+blocks the loop (a synchronous client inside an async method, as before)
+and when it is awaited on the async client. Model latency is simulated.
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.integrations.ai_analysis_engine_fixed import AIAnalysisEngine
+from src.monitoring.event_loop_monitor import EventLoopLagMonitor
+
+# Simulated model latency per call, in seconds
+MODEL_LATENCY = 0.05
+CALLS = 6
+
+
+def blocking_create(**kwargs):
+    time.sleep(MODEL_LATENCY)
+    return Mock(content=[Mock(text="ok")])
+
+
+async def async_create(**kwargs):
+    await asyncio.sleep(MODEL_LATENCY)
+    return Mock(content=[Mock(text="ok")])
+
+
+async def measure_lag(create) -> dict:
+    """Run CALLS concurrent _call_claude calls and return loop lag stats."""
+    with patch('anthropic.AsyncAnthropic'):
+        engine = AIAnalysisEngine()
+    engine.client = Mock()
+    engine.client.messages.create = create
+
+    monitor = EventLoopLagMonitor(interval=0.005)
+    await monitor.start()
+    await asyncio.sleep(0.02)
+    await asyncio.gather(*(engine._call_claude(f"prompt {i}") for i in range(CALLS)))
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+    return monitor.get_stats()
+
+
+class TestEventLoopLag:
+    """Benchmark event loop lag for blocking vs async Claude calls."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_event_loop_lag_before_and_after(self):
+        """The async client keeps loop lag near zero while calls are in flight."""
+        async def blocking_in_async(**kwargs):
+            # What the old code did: a sync client call inside an async method
+            return blocking_create(**kwargs)
+
+        before = await measure_lag(AsyncMock(side_effect=blocking_in_async))
+        after = await measure_lag(AsyncMock(side_effect=async_create))
+
+        print(f"\nEvent loop lag with {CALLS} calls of {MODEL_LATENCY * 1000:.0f}ms:")
+        print(f"  blocking client: max {before['max_lag_ms']:.1f}ms, p95 {before['p95_lag_ms']:.1f}ms")
+        print(f"  async client:    max {after['max_lag_ms']:.1f}ms, p95 {after['p95_lag_ms']:.1f}ms")
+
+        assert before["max_lag_ms"] >= MODEL_LATENCY * 1000
+        assert after["max_lag_ms"] < before["max_lag_ms"]
@@ -0,0 +1,92 @@
+"""
+Performance benchmark for fetching a board's cards.
+
+Compares the former one-list-at-a-time card fetch (reimplemented here as the
+reference) with SimpleMCPKanbanClient's concurrent fan-out, on an 8-list board
+whose lists answer with different simulated latencies.
+"""
+
+import asyncio
+import json
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.integrations.mcp_kanban_client_simple import SimpleMCPKanbanClient
+
+LIST_LATENCIES = [0.02, 0.05, 0.03, 0.04, 0.02, 0.06, 0.03, 0.05]
+CARDS_PER_LIST = 25
+
+
+def response(data):
+    result = Mock()
+    result.content = [Mock(text=json.dumps(data))]
+    return result
+
+
+class LatencySession:
+    """Kanban session whose list requests take a fixed time each"""
+
+    lists = [{"id": f"list-{i}", "name": f"List {i}"} for i in range(len(LIST_LATENCIES))]
+
+    async def call_tool(self, tool, args):
+        if tool == "mcp_kanban_list_manager":
+            return response(self.lists)
+        index = int(args["listId"].split("-")[1])
+        await asyncio.sleep(LIST_LATENCIES[index])
+        return response([
+            {"id": f"{args['listId']}-{n}", "name": f"Card {n}"} for n in range(CARDS_PER_LIST)
+        ])
+
+
+class SingleSessionPool:
+    def __init__(self, session):
+        self.session = session
+
+    @asynccontextmanager
+    async def get_session(self):
+        yield self.session
+
+
+async def serial_get_all_tasks(client):
+    """get_all_tasks before the fan-out: one card request per list, in turn"""
+    async with client._session_pool.get_session() as session:
+        lists = await client._fetch_lists(session)
+        all_cards = []
+        for lst in lists:
+            all_cards.extend(await client._fetch_list_cards(session, lst, asyncio.Semaphore(1)))
+        return client._cards_to_tasks(all_cards)
+
+
+class TestKanbanListFanOut:
+    """Benchmark a board refresh against simulated kanban latency."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_refresh_costs_the_slowest_list(self):
+        """A refresh should take about the slowest list, not the sum of all lists."""
+        with patch('src.integrations.mcp_kanban_client_simple.os.path.exists', return_value=False), \
+             patch('src.integrations.mcp_kanban_client_simple.os.environ', {}), \
+             patch('sys.stderr'):
+            client = SimpleMCPKanbanClient()
+        client.board_id = "board"
+        client._session_pool = SingleSessionPool(LatencySession())
+
+        start_time = time.perf_counter()
+        serial_tasks = await serial_get_all_tasks(client)
+        serial_duration = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        tasks = await client.get_all_tasks()
+        concurrent_duration = time.perf_counter() - start_time
+
+        print(f"\n{len(LIST_LATENCIES)} lists: serial {serial_duration * 1000:.0f}ms "
+              f"(sum {sum(LIST_LATENCIES) * 1000:.0f}ms), "
+              f"concurrent {concurrent_duration * 1000:.0f}ms "
+              f"(slowest {max(LIST_LATENCIES) * 1000:.0f}ms)")
+
+        assert [t.id for t in tasks] == [t.id for t in serial_tasks]
+        assert concurrent_duration < max(LIST_LATENCIES) * 2
+        assert concurrent_duration < serial_duration / 2
@@ -0,0 +1,115 @@
+"""
+Performance benchmark for MCP response serialization.
+
+Compares the old response path (serialize_for_mcp as a json.dumps/json.loads
+round trip through MarcusJSONEncoder, then json.dumps again in
+handle_tool_call) with the single walk plus single encode that replaced it,
+on a get_project_status-style payload carrying 1,000 tasks.
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus, WorkerStatus
+from src.marcus_mcp import utils
+from src.marcus_mcp.utils import MarcusJSONEncoder, encode_mcp_response, serialize_for_mcp
+
+TASK_COUNT = 1000
+ROUNDS = 5
+
+
+def create_payload(task_count: int) -> dict:
+    """get_project_status response extended with the board's tasks and workers"""
+    now = datetime(2024, 1, 1)
+    statuses = list(TaskStatus)
+    priorities = list(Priority)
+    tasks = [
+        Task(
+            id=f"task-{i}",
+            name=f"Task {i}",
+            description=f"Implement part {i} of the system",
+            status=statuses[i % len(statuses)],
+            priority=priorities[i % len(priorities)],
+            assigned_to=f"agent-{i % 10}" if i % 3 else None,
+            created_at=now + timedelta(minutes=i),
+            updated_at=now + timedelta(minutes=2 * i),
+            due_date=now + timedelta(days=7) if i % 2 else None,
+            estimated_hours=float(i % 8 + 1),
+            dependencies=[f"task-{i - 1}"] if i else [],
+            labels=["backend", f"area-{i % 5}"],
+        )
+        for i in range(task_count)
+    ]
+    workers = [
+        WorkerStatus(
+            worker_id=f"agent-{n}",
+            name=f"Agent {n}",
+            role="Developer",
+            email=None,
+            current_tasks=tasks[n::100][:3],
+            completed_tasks_count=n,
+            capacity=40,
+            skills=["python"],
+            availability={"monday": True},
+        )
+        for n in range(10)
+    ]
+    completed = sum(1 for t in tasks if t.status == TaskStatus.DONE)
+    return {
+        "success": True,
+        "project": {
+            "total_tasks": task_count,
+            "completed": completed,
+            "completion_percentage": completed / task_count * 100,
+        },
+        "workers": workers,
+        "tasks": tasks,
+        "provider": "planka",
+    }
+
+
+def old_response(payload: dict) -> str:
+    serialized = json.loads(json.dumps(payload, cls=MarcusJSONEncoder))
+    return json.dumps(serialized, indent=2)
+
+
+def new_response(payload: dict) -> str:
+    return encode_mcp_response(serialize_for_mcp(payload))
+
+
+def best_time(func, payload) -> float:
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start_time = time.perf_counter()
+        func(payload)
+        best = min(best, time.perf_counter() - start_time)
+    return best
+
+
+class TestMcpSerializationPerformance:
+    """Benchmark serializing a 1k-task project status response."""
+
+    @pytest.mark.performance
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_single_pass_response(self, use_orjson: bool, monkeypatch):
+        """The single-pass path must produce the same document, faster."""
+        if use_orjson and utils.orjson is None:
+            pytest.skip("orjson is not installed")
+        if not use_orjson:
+            monkeypatch.setattr(utils, "orjson", None)
+
+        payload = create_payload(TASK_COUNT)
+        assert json.loads(new_response(payload)) == json.loads(old_response(payload))
+
+        old_duration = best_time(old_response, payload)
+        new_duration = best_time(new_response, payload)
+
+        print(f"\n{TASK_COUNT} tasks ({'orjson' if use_orjson else 'json'}): "
+              f"round trip {old_duration * 1000:.1f}ms, "
+              f"single pass {new_duration * 1000:.1f}ms "
+              f"({old_duration / new_duration:.1f}x faster)")
+
+        assert new_duration < old_duration
@@ -0,0 +1,70 @@
+"""
+Performance benchmark for failing over from a degraded backend.
+
+A primary backend that hangs until its timeout is called 50 times with a
+healthy fallback behind it, first through a plain timeout (the reference)
+and then through a ResilientEndpoint whose circuit opens after a few
+timeouts, so the remaining calls go straight to the fallback.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.core.error_strategies import CircuitBreakerConfig
+from src.core.resilience import ResilientEndpoint
+
+CALLS = 50
+TIMEOUT = 0.05
+
+
+async def degraded_backend():
+    await asyncio.sleep(10)
+
+
+async def fallback_backend():
+    await asyncio.sleep(0.001)
+    return "fallback"
+
+
+async def with_fallback(primary):
+    try:
+        return await primary()
+    except Exception:
+        return await fallback_backend()
+
+
+class TestResilienceFailFast:
+    """Benchmark serving requests while the primary backend hangs."""
+
+    @pytest.mark.performance
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_the_timeout(self):
+        """Once the circuit opens, calls cost the fallback, not the timeout."""
+        start_time = time.perf_counter()
+        for _ in range(CALLS):
+            await with_fallback(lambda: asyncio.wait_for(degraded_backend(), TIMEOUT))
+        timeout_duration = time.perf_counter() - start_time
+
+        endpoint = ResilientEndpoint(
+            "degraded",
+            breaker_config=CircuitBreakerConfig(failure_threshold=3, timeout=60.0),
+            timeout=TIMEOUT,
+            max_attempts=1
+        )
+        start_time = time.perf_counter()
+        results = [
+            await with_fallback(lambda: endpoint.call(degraded_backend))
+            for _ in range(CALLS)
+        ]
+        breaker_duration = time.perf_counter() - start_time
+
+        stats = endpoint.get_stats()
+        print(f"\n{CALLS} calls to a hung backend: timeout only {timeout_duration * 1000:.0f}ms, "
+              f"circuit breaker {breaker_duration * 1000:.0f}ms "
+              f"({stats['short_circuited']} short-circuited)")
+
+        assert results == ["fallback"] * CALLS
+        assert stats["short_circuited"] == CALLS - 3
+        assert breaker_duration < timeout_duration / 5
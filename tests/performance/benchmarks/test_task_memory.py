@@ -0,0 +1,102 @@
+"""
+Memory benchmark for the slotted Task model.
+
+Builds a 10,000-card board with the slotted Task and with the former
+__dict__-based dataclass (redefined here as the reference), and compares
+the memory tracemalloc attributes to each.
+"""
+
+import gc
+import pickle
+import tracemalloc
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+
+CARD_COUNT = 10000
+LABELS = ["backend", "frontend", "api", "database", "testing", "docs"]
+
+
+@dataclass
+class DictTask:
+    """The Task model before __slots__, for comparison."""
+    id: str
+    name: str
+    description: str
+    status: TaskStatus
+    priority: Priority
+    assigned_to: Optional[str]
+    created_at: datetime
+    updated_at: datetime
+    due_date: Optional[datetime]
+    estimated_hours: float
+    actual_hours: float = 0.0
+    dependencies: List[str] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+
+
+def build_board(model, count: int) -> list:
+    """Cards as _card_to_task builds them: label strings decoded fresh per card"""
+    base = datetime(2024, 1, 1)
+    tasks = []
+    for i in range(count):
+        # Labels parsed from board JSON are new string objects for every card
+        labels = [f"{LABELS[i % len(LABELS)]}", f"{LABELS[(i + 1) % len(LABELS)]}"]
+        labels = [label.encode().decode() for label in labels]
+        task = model(
+            id=f"card-{i}",
+            name=f"Card {i}",
+            description="",
+            status=TaskStatus.TODO,
+            priority=Priority.MEDIUM,
+            assigned_to=None,
+            created_at=base + timedelta(seconds=i),
+            updated_at=base + timedelta(seconds=i),
+            due_date=None,
+            estimated_hours=0.0,
+            dependencies=[],
+            labels=labels,
+        )
+        if i % 10 == 0:
+            # A dynamic attribute on DictTask, a declared field on Task
+            task.acceptance_criteria = ["works"]
+        tasks.append(task)
+    return tasks
+
+
+def measure(model) -> int:
+    gc.collect()
+    tracemalloc.start()
+    board = build_board(model, CARD_COUNT)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del board
+    return size
+
+
+class TestTaskMemory:
+    """Benchmark the memory held by a large board of tasks."""
+
+    @pytest.mark.performance
+    def test_slotted_task_memory(self):
+        """The slotted model must hold the same board in less memory."""
+        dict_bytes = measure(DictTask)
+        slotted_bytes = measure(Task)
+
+        print(f"\n{CARD_COUNT} cards: __dict__ model {dict_bytes / 1024:.0f} KiB, "
+              f"slotted model {slotted_bytes / 1024:.0f} KiB "
+              f"({(1 - slotted_bytes / dict_bytes) * 100:.0f}% less)")
+
+        assert slotted_bytes < dict_bytes
+
+    @pytest.mark.performance
+    def test_slotted_board_pickle_round_trip(self):
+        """A board of slotted tasks still pickles and unpickles intact."""
+        slotted = build_board(Task, 100)
+        restored = pickle.loads(pickle.dumps(slotted))
+
+        assert restored == slotted
@@ -488,4 +488,63 @@ class TestAdvancedPRDParserTaskGeneration:
         assert len(hierarchy["epic_non_functional"]) == 2  # Performance + Security
         
         # Infrastructure epic should have 3 standard tasks
-        assert len(hierarchy["epic_infrastructure"]) == 3
\ No newline at end of file
+        assert len(hierarchy["epic_infrastructure"]) == 3
+
+class TestAdvancedPRDParserStageTimings:
+    """Test suite for per-stage timings of parse_prd_to_tasks"""
+    
+    @pytest.fixture
+    def parser(self):
+        """Create parser with mocked LLM and dependency inferer"""
+        with patch('src.ai.advanced.prd.advanced_parser.LLMAbstraction'):
+            with patch('src.ai.advanced.prd.advanced_parser.DependencyInferer'):
+                parser = AdvancedPRDParser()
+        parser.dependency_inferer.infer_dependencies = AsyncMock(return_value=Mock(edges=[]))
+        return parser
+    
+    @pytest.fixture
+    def prd_analysis(self):
+        """PRD analysis with a couple of epics"""
+        from src.ai.advanced.prd.advanced_parser import PRDAnalysis
+        
+        return PRDAnalysis(
+            functional_requirements=[
+                {"id": f"feature_{n}", "name": f"Feature {n}", "description": "Feature"}
+                for n in range(2)
+            ],
+            non_functional_requirements=[],
+            technical_constraints=[],
+            business_objectives=["Ship it"],
+            user_personas=[],
+            success_metrics=[],
+            implementation_approach="agile",
+            complexity_assessment={},
+            risk_factors=[],
+            confidence=0.9
+        )
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_every_stage_is_timed(self, parser, prd_analysis):
+        """Test the result reports seconds spent in each stage and in total"""
+        parser._analyze_prd_deeply = AsyncMock(return_value=prd_analysis)
+        
+        result = await parser.parse_prd_to_tasks("PRD", ProjectConstraints())
+        
+        assert list(result.stage_timings) == [
+            "analysis", "hierarchy", "tasks", "dependencies", "risk",
+            "timeline", "resources", "success_criteria", "total"
+        ]
+        assert all(seconds >= 0 for seconds in result.stage_timings.values())
+        assert result.stage_timings["total"] >= result.stage_timings["tasks"]
+        assert result.success_criteria[0] == "Business objective met: Ship it"
+    
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failing_stage_still_fails_the_parse(self, parser, prd_analysis):
+        """Test timing a stage does not swallow its error"""
+        parser._analyze_prd_deeply = AsyncMock(return_value=prd_analysis)
+        parser._assess_implementation_risks = AsyncMock(side_effect=ValueError("risk model failed"))
+        
+        with pytest.raises(ValueError, match="risk model failed"):
+            await parser.parse_prd_to_tasks("PRD", ProjectConstraints())
@@ -11,6 +11,7 @@ external dependencies during testing.
 """
 
 import pytest
+import asyncio
 import json
 import os
 from unittest.mock import Mock, patch, AsyncMock
@@ -18,7 +19,7 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 
 from src.core.models import Task, TaskStatus, Priority, WorkerStatus, ProjectState, RiskLevel, BlockerReport, ProjectRisk
-from src.integrations.ai_analysis_engine_fixed import AIAnalysisEngine
+from src.integrations.ai_analysis_engine_fixed import AIAnalysisEngine, _get_shared_client
 
 
 class TestAIAnalysisEngine:
@@ -578,13 +579,35 @@ Remember: Take your time, test thoroughly, and ask questions!"""
             # Mock anthropic module
             with patch('src.integrations.ai_analysis_engine_fixed.anthropic') as mock_anthropic:
                 mock_client = Mock()
-                mock_anthropic.Anthropic.return_value = mock_client
+                mock_anthropic.AsyncAnthropic.return_value = mock_client
                 
-                # Create engine - should initialize client
+                # Create engine - should initialize the shared async client
                 engine = AIAnalysisEngine()
                 
                 assert engine.client == mock_client
-                mock_anthropic.Anthropic.assert_called_once_with(api_key="test-api-key")
+                mock_anthropic.AsyncAnthropic.assert_called_once_with(
+                    api_key="test-api-key",
+                    http_client=mock_anthropic.DefaultAsyncHttpxClient.return_value
+                )
+                
+                # A second engine reuses the same client and connection pool
+                assert AIAnalysisEngine().client is mock_client
+                assert mock_anthropic.AsyncAnthropic.call_count == 1
+    
+    def test_shared_client_per_event_loop(self):
+        """Each event loop gets its own client; engines on one loop share it"""
+        async def client_pair():
+            return _get_shared_client("loop-key", 2), _get_shared_client("loop-key", 8)
+        
+        with patch('src.integrations.ai_analysis_engine_fixed.anthropic') as mock_anthropic:
+            mock_anthropic.AsyncAnthropic.side_effect = lambda **kwargs: Mock()
+            
+            first, same = asyncio.run(client_pair())
+            second, _ = asyncio.run(client_pair())
+        
+        assert first is same
+        assert first is not second
+        assert mock_anthropic.AsyncAnthropic.call_count == 2
     
     @pytest.mark.asyncio
     async def test_client_initialization_failure(self, monkeypatch, capsys):
@@ -598,7 +621,7 @@ Remember: Take your time, test thoroughly, and ask questions!"""
             mock_get_config.return_value = mock_config
             
             with patch('src.integrations.ai_analysis_engine_fixed.anthropic') as mock_anthropic:
-                mock_anthropic.Anthropic.side_effect = Exception("Connection failed")
+                mock_anthropic.AsyncAnthropic.side_effect = Exception("Connection failed")
                 
                 engine = AIAnalysisEngine()
                 
@@ -780,18 +803,73 @@ Write unit tests for auth flow
         mock_response.content = [Mock(text="AI response")]
         
         ai_engine.client = Mock()
-        ai_engine.client.messages.create.return_value = mock_response
+        ai_engine.client.messages.create = AsyncMock(return_value=mock_response)
         
         result = await ai_engine._call_claude("test prompt")
         
         assert result == "AI response"
-        ai_engine.client.messages.create.assert_called_once_with(
+        ai_engine.client.messages.create.assert_awaited_once_with(
             model=ai_engine.model,
             max_tokens=2000,
             temperature=0.7,
-            messages=[{"role": "user", "content": "test prompt"}]
+            messages=[{"role": "user", "content": "test prompt"}],
+            timeout=ai_engine.request_timeout
         )
     
+    @pytest.mark.asyncio
+    async def test_call_claude_does_not_block_event_loop(self, ai_engine):
+        """Concurrent calls overlap and stay within the concurrency limit"""
+        in_flight = 0
+        peak = 0
+        
+        async def slow_create(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return Mock(content=[Mock(text="ok")])
+        
+        ai_engine.client = Mock()
+        ai_engine.client.messages.create = AsyncMock(side_effect=slow_create)
+        ai_engine._request_semaphore = asyncio.Semaphore(2)
+        
+        results = await asyncio.gather(*(ai_engine._call_claude(f"p{i}") for i in range(6)))
+        
+        assert results == ["ok"] * 6
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_call_claude_serves_repeated_prompts_from_cache(self, ai_engine):
+        """A repeated prompt for the same analysis is not sent to Claude again"""
+        ai_engine.client = Mock()
+        ai_engine.client.messages.create = AsyncMock(return_value=Mock(content=[Mock(text="cached")]))
+        
+        first = await ai_engine._call_claude("Analyze  blocker\n", method="analyze_blocker")
+        second = await ai_engine._call_claude("Analyze blocker", method="analyze_blocker")
+        await ai_engine._call_claude("Analyze blocker", method="analyze_project_risks")
+        
+        assert first == second == "cached"
+        assert ai_engine.client.messages.create.await_count == 2
+        assert ai_engine.response_cache.get_stats()["hits"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_call_claude_does_not_cache_rejected_responses(self, ai_engine):
+        """A response the caller cannot parse is not replayed from the cache"""
+        ai_engine.client = Mock()
+        ai_engine.client.messages.create = AsyncMock(side_effect=[
+            Mock(content=[Mock(text="not json")]),
+            Mock(content=[Mock(text='{"ok": true}')]),
+        ])
+        
+        with pytest.raises(json.JSONDecodeError):
+            await ai_engine._call_claude("Analyze blocker", method="analyze_blocker", validate=json.loads)
+        result = await ai_engine._call_claude("Analyze blocker", method="analyze_blocker", validate=json.loads)
+        
+        assert result == '{"ok": true}'
+        assert ai_engine.client.messages.create.await_count == 2
+        assert ai_engine.response_cache.get_stats()["stores"] == 1
+    
     @pytest.mark.asyncio
     async def test_call_claude_no_client(self, ai_engine):
         """Test Claude call when client is None"""
@@ -1094,8 +1172,8 @@ Write unit tests for auth flow
             mock_client = Mock()
             mock_response = Mock()
             mock_response.content = [Mock(text="test")]
-            mock_client.messages.create.return_value = mock_response
-            mock_anthropic.Anthropic.return_value = mock_client
+            mock_client.messages.create = AsyncMock(return_value=mock_response)
+            mock_anthropic.AsyncAnthropic.return_value = mock_client
             
             with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
                 engine = AIAnalysisEngine()
@@ -1121,8 +1199,8 @@ Write unit tests for auth flow
         """Test initialize when connection test fails"""
         with patch('src.integrations.ai_analysis_engine_fixed.anthropic') as mock_anthropic:
             mock_client = Mock()
-            mock_client.messages.create.side_effect = Exception("Connection failed")
-            mock_anthropic.Anthropic.return_value = mock_client
+            mock_client.messages.create = AsyncMock(side_effect=Exception("Connection failed"))
+            mock_anthropic.AsyncAnthropic.return_value = mock_client
             
             with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "test-key"}):
                 engine = AIAnalysisEngine()
@@ -13,6 +13,7 @@ to ensure fast, isolated unit tests.
 
 import pytest
 import asyncio
+import json
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Set, Optional
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
@@ -418,7 +419,22 @@ class TestAITaskAssignmentEngine:
         )
         
         assert best_task is None
-    
+
+    @pytest.mark.asyncio
+    async def test_rank_tasks_orders_best_first(self, assignment_engine, agent_info, sample_tasks):
+        """Test ranking returns every task ordered by combined score."""
+        tasks = [t for t in sample_tasks if t.status == TaskStatus.TODO]
+
+        dependency_scores = {"task-1": 0.8, "task-2": 0.2, "task-3": 0.5}
+        ai_scores = {"task-1": 0.9, "task-2": 0.3, "task-3": 0.7}
+        impact_scores = {"task-1": 0.6, "task-2": 0.9, "task-3": 0.4}
+
+        ranked = await assignment_engine._rank_tasks(
+            tasks, dependency_scores, ai_scores, impact_scores, agent_info
+        )
+
+        assert [t.id for t in ranked] == ["task-1", "task-3", "task-2"]
+
     @pytest.mark.asyncio
     async def test_select_best_task_skill_matching(self, assignment_engine, sample_tasks):
         """Test that skill matching influences task selection."""
@@ -619,6 +635,195 @@ class TestAITaskAssignmentEngine:
         assert score == 1.0  # All task labels match
 
 
+class TestBatchedScoring:
+    """
+    Test suite for batched single-prompt scoring of candidate tasks.
+    
+    The AI engine exposes a raw prompt coroutine (``_call_claude``) so the
+    assignment engine can score every candidate in a few structured prompts
+    instead of two LLM calls per task.
+    """
+    
+    @pytest.fixture
+    def tasks(self):
+        """Create candidate tasks."""
+        return [
+            create_task(task_id=f"task-{i}", name=f"Task {i}", labels=["backend"])
+            for i in range(6)
+        ]
+    
+    @pytest.fixture
+    def batch_ai_engine(self):
+        """AI engine whose raw prompt call scores every task id it is sent."""
+        mock = Mock()
+        mock.check_deployment_safety = AsyncMock(return_value={"safe": True})
+        mock.analyze_task_assignment = AsyncMock(return_value={
+            "suitability_score": 0.5,
+            "confidence": 1.0
+        })
+        mock.predict_task_impact = AsyncMock(return_value={
+            "timeline_reduction_days": 0,
+            "risk_reduction": 0
+        })
+        
+        async def call_claude(prompt):
+            task_list = prompt.split("Candidate tasks:")[1].split("For EVERY")[0]
+            task_ids = [t["id"] for t in json.loads(task_list)]
+            return json.dumps({"scores": [
+                {
+                    "task_id": task_id,
+                    "suitability_score": 0.9 if task_id == "task-3" else 0.4,
+                    "confidence": 0.5,
+                    "timeline_reduction_days": 5,
+                    "risk_reduction": 0.5
+                }
+                for task_id in task_ids
+            ]})
+        
+        mock._call_claude = AsyncMock(side_effect=call_claude)
+        return mock
+    
+    def _engine(self, ai_engine, tasks, **kwargs):
+        engine = AITaskAssignmentEngine(ai_engine, tasks, **kwargs)
+        mock_graph = Mock(spec=DependencyGraph)
+        mock_graph.get_critical_path = Mock(return_value=[])
+        engine.dependency_inferer = Mock()
+        engine.dependency_inferer.infer_dependencies = AsyncMock(return_value=mock_graph)
+        return engine
+    
+    @pytest.mark.asyncio
+    async def test_single_prompt_scores_all_candidates(self, batch_ai_engine, tasks):
+        """All candidates are scored by one prompt and no per-task calls"""
+        engine = self._engine(batch_ai_engine, tasks)
+        
+        best = await engine.find_optimal_task_for_agent(
+            agent_id="agent-1",
+            agent_info={"worker_id": "agent-1", "skills": ["backend"]},
+            available_tasks=tasks,
+            assigned_task_ids=set()
+        )
+        
+        assert best.id == "task-3"
+        assert batch_ai_engine._call_claude.await_count == 1
+        batch_ai_engine.analyze_task_assignment.assert_not_called()
+        batch_ai_engine.predict_task_impact.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_batched_scores_match_per_task_formula(self, batch_ai_engine, tasks):
+        """Batched analyses produce the same scores as per-task analyses"""
+        engine = self._engine(batch_ai_engine, tasks)
+        agent_info = {"worker_id": "agent-1"}
+        
+        analyses = await engine._get_batched_analyses(tasks, agent_info)
+        ai_scores = await engine._get_ai_recommendations(tasks, agent_info, analyses)
+        impact_scores = await engine._predict_task_impact(tasks, analyses)
+        
+        assert ai_scores["task-3"] == pytest.approx(0.9 * 0.5)
+        assert ai_scores["task-0"] == pytest.approx(0.4 * 0.5)
+        assert impact_scores["task-0"] == pytest.approx(0.5 * 0.6 + 0.5 * 0.4)
+    
+    @pytest.mark.asyncio
+    async def test_token_budget_splits_prompts(self, batch_ai_engine, tasks):
+        """Candidate lists larger than the token budget span several prompts"""
+        engine = self._engine(batch_ai_engine, tasks, max_prompt_tokens=100)
+        
+        analyses = await engine._get_batched_analyses(tasks, {"worker_id": "agent-1"})
+        
+        assert set(analyses) == {t.id for t in tasks}
+        assert batch_ai_engine._call_claude.await_count > 1
+    
+    @pytest.mark.asyncio
+    async def test_invalid_batch_response_falls_back_per_task(self, batch_ai_engine, tasks):
+        """An unparseable batched response falls back to per-task calls"""
+        batch_ai_engine._call_claude = AsyncMock(return_value="not json at all")
+        engine = self._engine(batch_ai_engine, tasks)
+        
+        analyses = await engine._get_batched_analyses(tasks, {"worker_id": "agent-1"})
+        scores = await engine._get_ai_recommendations(tasks, {"worker_id": "agent-1"}, analyses)
+        
+        assert analyses == {}
+        assert scores == {t.id: 0.5 for t in tasks}
+        assert batch_ai_engine.analyze_task_assignment.await_count == len(tasks)
+    
+    @pytest.mark.asyncio
+    async def test_tasks_missing_from_batch_are_scored_individually(self, batch_ai_engine, tasks):
+        """Only tasks the batched response skipped get per-task calls"""
+        batch_ai_engine._call_claude = AsyncMock(return_value=json.dumps({"scores": [
+            {"task_id": "task-0", "suitability_score": 1.0, "confidence": 1.0}
+        ]}))
+        engine = self._engine(batch_ai_engine, tasks)
+        
+        analyses = await engine._get_batched_analyses(tasks, {"worker_id": "agent-1"})
+        scores = await engine._get_ai_recommendations(tasks, {"worker_id": "agent-1"}, analyses)
+        
+        assert scores["task-0"] == 1.0
+        assert batch_ai_engine.analyze_task_assignment.await_count == len(tasks) - 1
+    
+    @pytest.mark.asyncio
+    async def test_malformed_batch_entries_are_scored_individually(self, batch_ai_engine, tasks):
+        """Non-numeric entries are dropped and out-of-range values clamped"""
+        batch_ai_engine._call_claude = AsyncMock(return_value=json.dumps({"scores": [
+            {"task_id": "task-0", "suitability_score": None, "confidence": 1.0},
+            {"task_id": "task-1", "suitability_score": "high", "confidence": 1.0},
+            {"task_id": "task-2", "suitability_score": 1.7, "confidence": "0.5"},
+            {"task_id": "task-3", "suitability_score": 0.8, "confidence": 1.0, "risk_reduction": -2}
+        ]}))
+        engine = self._engine(batch_ai_engine, tasks)
+        
+        analyses = await engine._get_batched_analyses(tasks, {"worker_id": "agent-1"})
+        scores = await engine._get_ai_recommendations(tasks, {"worker_id": "agent-1"}, analyses)
+        
+        assert set(analyses) == {"task-2", "task-3"}
+        assert scores["task-0"] == scores["task-1"] == 0.5
+        assert scores["task-2"] == pytest.approx(1.0 * 0.5)
+        assert analyses["task-3"]["risk_reduction"] == 0.0
+        assert batch_ai_engine.analyze_task_assignment.await_count == len(tasks) - 2
+    
+    @pytest.mark.asyncio
+    async def test_fallback_concurrency_is_bounded(self, tasks):
+        """Per-task fallback never exceeds max_concurrency calls in flight"""
+        in_flight = 0
+        peak = 0
+        
+        async def analyze(context):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"suitability_score": 0.5, "confidence": 1.0}
+        
+        ai_engine = Mock()
+        ai_engine.analyze_task_assignment = AsyncMock(side_effect=analyze)
+        engine = self._engine(ai_engine, tasks, max_concurrency=2)
+        
+        scores = await engine._get_ai_recommendations(tasks, {"worker_id": "agent-1"})
+        
+        assert len(scores) == len(tasks)
+        assert peak == 2
+    
+    @pytest.mark.asyncio
+    async def test_batching_disabled(self, batch_ai_engine, tasks):
+        """batch_scoring=False keeps the per-task behaviour"""
+        engine = self._engine(batch_ai_engine, tasks, batch_scoring=False)
+        
+        analyses = await engine._get_batched_analyses(tasks, {"worker_id": "agent-1"})
+        
+        assert analyses == {}
+        batch_ai_engine._call_claude.assert_not_called()
+    
+    @pytest.mark.asyncio
+    async def test_ai_disabled_skips_raw_prompts(self, batch_ai_engine, tasks):
+        """MARCUS_AI_ENABLED=false keeps scoring on the non-LLM path"""
+        batch_ai_engine.ai_enabled = False
+        engine = self._engine(batch_ai_engine, tasks)
+        
+        analyses = await engine._get_batched_analyses(tasks, {"worker_id": "agent-1"})
+        
+        assert analyses == {}
+        batch_ai_engine._call_claude.assert_not_called()
+
+
 class TestFindOptimalTaskForAgentAIPowered:
     """
     Test suite for the standalone find_optimal_task_for_agent_ai_powered function.
@@ -0,0 +1,124 @@
+"""
+Unit tests for BoardSnapshot
+"""
+
+from datetime import datetime
+
+from src.core.board_snapshot import BoardSnapshot
+from src.core.models import Priority, Task, TaskStatus
+
+
+def make_task(task_id, status=TaskStatus.TODO, assigned_to=None, updated_at=None):
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=assigned_to,
+        created_at=now,
+        updated_at=updated_at or now,
+        due_date=None,
+        estimated_hours=1.0,
+    )
+
+
+class TestBoardSnapshot:
+    """Test suite for BoardSnapshot"""
+
+    def test_empty_snapshot_is_stale(self):
+        """A snapshot that has never synced must be fetched"""
+        snapshot = BoardSnapshot()
+        assert not snapshot.is_fresh()
+        assert snapshot.count() == 0
+
+    def test_reconcile_builds_indexes(self):
+        """Full sync indexes tasks by id, status and assignee"""
+        snapshot = BoardSnapshot()
+        changes = snapshot.reconcile([
+            make_task("1"),
+            make_task("2", TaskStatus.IN_PROGRESS, "agent-1"),
+            make_task("3", TaskStatus.DONE),
+        ])
+
+        assert changes["added"] == ["1", "2", "3"]
+        assert snapshot.is_fresh()
+        assert snapshot.get("2").assigned_to == "agent-1"
+        assert [t.id for t in snapshot.tasks_with_status(TaskStatus.TODO)] == ["1"]
+        assert [t.id for t in snapshot.tasks_assigned_to("agent-1")] == ["2"]
+        assert snapshot.count(TaskStatus.DONE) == 1
+
+    def test_reconcile_only_reindexes_changed_cards(self):
+        """Cards with an unchanged updated_at are skipped; missing cards removed"""
+        snapshot = BoardSnapshot()
+        snapshot.reconcile([make_task("1"), make_task("2"), make_task("3")])
+        version = snapshot.version
+
+        later = datetime(2024, 1, 2)
+        changes = snapshot.reconcile([
+            make_task("1"),
+            make_task("2", TaskStatus.DONE, updated_at=later),
+            make_task("4"),
+        ])
+
+        assert changes == {"added": ["4"], "updated": ["2"], "removed": ["3"]}
+        assert snapshot.version == version + 1
+        assert snapshot.get("3") is None
+        assert snapshot.count(TaskStatus.DONE) == 1
+
+        # A no-op poll does not bump the version
+        snapshot.reconcile(snapshot.all_tasks())
+        assert snapshot.version == version + 1
+
+    def test_apply_update_moves_task_between_indexes(self):
+        """Marcus's own writes are reflected immediately"""
+        snapshot = BoardSnapshot()
+        snapshot.reconcile([make_task("1")])
+
+        task = snapshot.apply_update("1", {
+            "status": TaskStatus.IN_PROGRESS,
+            "assigned_to": "agent-1",
+            "progress": 10,  # not a Task field, ignored
+        })
+
+        assert task.status == TaskStatus.IN_PROGRESS
+        assert snapshot.tasks_with_status(TaskStatus.TODO) == []
+        assert snapshot.tasks_assigned_to("agent-1") == [task]
+        assert not hasattr(task, "progress")
+
+        snapshot.apply_update("1", {"status": TaskStatus.DONE, "assigned_to": None})
+        assert snapshot.tasks_assigned_to("agent-1") == []
+        assert snapshot.count(TaskStatus.DONE) == 1
+
+    def test_status_index_keeps_board_order(self):
+        """Tasks come back in a stable order, not in set order"""
+        ids = [str(n) for n in (17, 3, 42, 8, 25, 11, 30, 1, 19, 6)]
+        snapshot = BoardSnapshot()
+        snapshot.reconcile([make_task(task_id, assigned_to="agent-1") for task_id in ids])
+
+        assert [t.id for t in snapshot.tasks_with_status(TaskStatus.TODO)] == ids
+        assert [t.id for t in snapshot.tasks_assigned_to("agent-1")] == ids
+
+        # A task that leaves and re-enters a status moves to the back
+        snapshot.apply_update("3", {"status": TaskStatus.IN_PROGRESS})
+        snapshot.apply_update("3", {"status": TaskStatus.TODO})
+        assert [t.id for t in snapshot.tasks_with_status(TaskStatus.TODO)] == ids[:1] + ids[2:] + ["3"]
+
+    def test_apply_update_unknown_task(self):
+        """Updates for tasks outside the snapshot are ignored"""
+        snapshot = BoardSnapshot()
+        assert snapshot.apply_update("missing", {"status": TaskStatus.DONE}) is None
+
+    def test_staleness_bound_and_invalidate(self):
+        """Snapshots expire after max_staleness and on invalidate"""
+        snapshot = BoardSnapshot(max_staleness=0)
+        snapshot.reconcile([make_task("1")])
+        snapshot._last_synced -= 1
+        assert not snapshot.is_fresh()
+
+        snapshot = BoardSnapshot(max_staleness=60)
+        snapshot.reconcile([make_task("1")])
+        assert snapshot.is_fresh()
+        snapshot.invalidate()
+        assert not snapshot.is_fresh()
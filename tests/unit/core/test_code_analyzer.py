@@ -7,12 +7,14 @@ All external dependencies are mocked to ensure unit test isolation.
 """
 
 import pytest
+import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from datetime import datetime
 import base64
 import json
 
 from src.core.code_analyzer import CodeAnalyzer
+from src.utils.code_intelligence_cache import CodeIntelligenceCache
 from src.core.models import Task, WorkerStatus, TaskStatus, Priority
 
 
@@ -668,6 +670,72 @@ async def create_item(item: Item):
         endpoints = await analyzer._find_endpoints("owner", "repo")
         assert endpoints == []
     
+    @pytest.mark.asyncio
+    async def test_find_endpoints_reuses_cached_blobs(self, mock_mcp_caller):
+        """Test that files with an unchanged blob SHA are not fetched again."""
+        analyzer = CodeAnalyzer(mcp_caller=mock_mcp_caller, code_cache=CodeIntelligenceCache())
+        content = base64.b64encode(b'@app.get("/users")\ndef list_users():\n    pass').decode()
+        
+        async def call(tool, params):
+            if tool == 'github.search_code':
+                if 'path:api' in params['query']:
+                    return {'items': [{'path': 'api/users.py', 'sha': 'blob-1'}]}
+                return {'items': []}
+            return {'content': content}
+        
+        mock_mcp_caller.side_effect = call
+        
+        first = await analyzer._find_endpoints("owner", "repo")
+        second = await analyzer._find_endpoints("owner", "repo")
+        
+        assert first == second
+        assert first[0] == {"method": "GET", "path": "/users", "implementation": "list_users"}
+        fetches = [c for c in mock_mcp_caller.call_args_list if c.args[0] == 'github.get_file_contents']
+        assert len(fetches) == 1
+        
+    @pytest.mark.asyncio
+    async def test_empty_fetch_is_not_cached(self, mock_mcp_caller):
+        """Test that a blob whose contents were not fetched is fetched again."""
+        analyzer = CodeAnalyzer(mcp_caller=mock_mcp_caller, code_cache=CodeIntelligenceCache())
+        content = base64.b64encode(b'@app.get("/users")').decode()
+        mock_mcp_caller.side_effect = [{}, {'content': content}, {'content': content}]
+        items = [{'path': 'api/users.py', 'sha': 'blob-1'}]
+        
+        missing = await analyzer._extract_repository_files("owner", "repo", items)
+        fetched = await analyzer._extract_repository_files("owner", "repo", items)
+        cached = await analyzer._extract_repository_files("owner", "repo", items)
+        
+        assert missing == [{"endpoints": [], "models": []}]
+        assert fetched == cached
+        assert fetched[0]["endpoints"][0]["path"] == "/users"
+        assert mock_mcp_caller.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_file_fetches_are_bounded_and_ordered(self, mock_mcp_caller):
+        """Test concurrent fetches stay under the limit and keep search order."""
+        analyzer = CodeAnalyzer(
+            mcp_caller=mock_mcp_caller, code_cache=CodeIntelligenceCache(), max_concurrency=2
+        )
+        in_flight = 0
+        peak = 0
+        
+        async def call(tool, params):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            source = f'@app.get("/{params["path"]}")'.encode()
+            return {'content': base64.b64encode(source).decode()}
+        
+        mock_mcp_caller.side_effect = call
+        items = [{'path': f'file{i}', 'sha': f'sha{i}'} for i in range(6)]
+        
+        extractions = await analyzer._extract_repository_files("owner", "repo", items)
+        
+        assert peak == 2
+        assert [e["endpoints"][0]["path"] for e in extractions] == [f"/file{i}" for i in range(6)]
+    
     @pytest.mark.asyncio
     async def test_complete_workflow_integration(
         self, analyzer, mock_mcp_caller, sample_task, sample_worker
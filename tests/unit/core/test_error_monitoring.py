@@ -14,7 +14,7 @@ from unittest.mock import Mock, AsyncMock, patch, MagicMock
 from pathlib import Path
 
 from src.core.error_monitoring import (
-    ErrorMonitor, ErrorMetrics, ErrorPattern, CorrelationGroup,
+    ErrorMonitor, ErrorMetrics, ErrorPattern, CorrelationGroup, RollingWindowCounter,
     AlertSeverity, setup_error_monitoring, record_error_for_monitoring,
     get_error_health_status, error_monitor
 )
@@ -529,6 +529,156 @@ class TestErrorMonitor:
         assert len(history_short) >= 0  # Might be empty depending on timing
 
 
+class TestRollingWindowCounter:
+    """Test suite for RollingWindowCounter"""
+
+    def test_counts_within_window(self):
+        """Test that events age out of the window"""
+        counter = RollingWindowCounter(window_seconds=60, buckets=6)
+
+        counter.add("a", now=0)
+        counter.add("a", now=15)
+        counter.add("b", now=15)
+
+        assert counter.count("a", now=20) == 2
+        assert counter.count("b", now=20) == 1
+        assert counter.count("a", now=65) == 1
+        assert counter.count("a", now=80) == 0
+
+    def test_prune_drops_idle_keys(self):
+        """Test that keys without recent events are forgotten"""
+        counter = RollingWindowCounter(window_seconds=60)
+        counter.add("idle", now=0)
+        counter.add("busy", now=100)
+
+        counter.prune(now=100)
+
+        assert list(counter._totals) == ["busy"]
+
+
+class TestBoundedErrorStore:
+    """Test suite for the bounded, indexed error store and its journal"""
+
+    def setup_method(self):
+        """Set up test fixtures"""
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
+        self.temp_file.close()
+        self.monitor = ErrorMonitor(storage_path=self.temp_file.name, max_errors=5)
+
+    def teardown_method(self):
+        """Clean up test fixtures"""
+        Path(self.temp_file.name).unlink(missing_ok=True)
+
+    def record(self, agent_id="agent1", operation="sync", integration_name=None):
+        error = NetworkTimeoutError("svc", context=ErrorContext(
+            agent_id=agent_id, operation=operation, integration_name=integration_name
+        ))
+        self.monitor.record_error(error)
+        return error
+
+    def test_eviction_prunes_indexes(self):
+        """Test that evicted errors leave every index"""
+        errors = [self.record(agent_id=f"agent{n % 3}", operation=f"op{n}") for n in range(12)]
+
+        assert len(self.monitor.error_history) == 5
+        assert set(self.monitor.error_index) == {e.context.correlation_id for e in errors[-5:]}
+        assert set(self.monitor.active_correlations) == set(self.monitor.error_index)
+        assert self.monitor.get_error_details(errors[0].context.correlation_id) is None
+        assert set(self.monitor._indexes['operation']) == {f"op{n}" for n in range(7, 12)}
+        assert sum(len(records) for records in self.monitor._indexes['agent_id'].values()) == 5
+        assert len(self.monitor._sequences) == 5
+
+    def test_search_uses_indexes(self):
+        """Test searching by indexed fields"""
+        self.record(agent_id="agent1", integration_name="github")
+        self.record(agent_id="agent2", integration_name="github")
+        self.record(agent_id="agent1", integration_name="planka")
+
+        results = self.monitor.search_errors(agent_id="agent1", integration_name="github")
+
+        assert [e['agent_id'] for e in results] == ["agent1"]
+        assert len(self.monitor.search_errors(integration_name="github")) == 2
+        assert len(self.monitor.search_errors(error_code=results[0]['error_code'])) == 3
+        assert self.monitor.search_errors(agent_id="unknown") == []
+        # Internal bookkeeping stays out of the returned records
+        assert all('_seq' not in e for e in self.monitor.search_errors())
+
+    def test_cascade_only_looks_at_recent_errors(self):
+        """Test cascade detection over the last 50 errors"""
+        self.monitor = ErrorMonitor(storage_path=self.temp_file.name, max_errors=100)
+        self.monitor.pattern_thresholds['cascade_threshold'] = 3
+        for _ in range(3):
+            self.record(operation="sync")
+        for n in range(50):
+            self.record(operation=f"other{n}")
+
+        self.record(operation="sync")
+        assert not [p for p in self.monitor.detected_patterns.values() if p.pattern_type == "cascade"]
+
+        for _ in range(3):
+            self.record(operation="sync")
+        assert [p for p in self.monitor.detected_patterns.values() if p.pattern_type == "cascade"]
+
+    def test_save_appends_only_changes(self):
+        """Test that saving appends new records instead of rewriting the file"""
+        self.monitor.pattern_thresholds['frequency_threshold'] = 1
+        self.record()
+        self.monitor._save_to_storage()
+        first_save = Path(self.temp_file.name).read_text()
+
+        self.monitor._save_to_storage()
+        assert Path(self.temp_file.name).read_text() == first_save
+
+        self.monitor.metrics_history.append(ErrorMetrics(total_errors=1))
+        self.monitor._save_to_storage()
+        content = Path(self.temp_file.name).read_text()
+
+        assert content.startswith(first_save)
+        assert [json.loads(line)['type'] for line in content[len(first_save):].splitlines()] == ["metrics"]
+
+        loaded = ErrorMonitor(storage_path=self.temp_file.name)
+        assert set(loaded.detected_patterns) == set(self.monitor.detected_patterns)
+        assert loaded.metrics_history[-1].total_errors == 1
+
+    def test_journal_is_compacted(self):
+        """Test that a journal past its size limit is rewritten"""
+        self.monitor.max_journal_records = 3
+        pattern = ErrorPattern(
+            pattern_id="p1", pattern_type="frequency", description="Frequent",
+            frequency=0, first_seen=datetime.now(), last_seen=datetime.now()
+        )
+        self.monitor.detected_patterns["p1"] = pattern
+        for frequency in range(1, 6):
+            pattern.frequency = frequency
+            self.monitor._save_to_storage()
+
+        # Every update was appended until the journal was rewritten
+        lines = Path(self.temp_file.name).read_text().splitlines()
+        assert len(lines) <= 3
+
+        loaded = ErrorMonitor(storage_path=self.temp_file.name)
+        assert loaded.detected_patterns["p1"].frequency == 5
+
+    def test_loads_json_snapshot(self):
+        """Test loading a snapshot file and converting it to a journal"""
+        now = datetime.now().isoformat()
+        Path(self.temp_file.name).write_text(json.dumps({
+            'patterns': {'p1': {
+                'pattern_id': 'p1', 'pattern_type': 'burst', 'description': 'Burst',
+                'frequency': 10, 'first_seen': now, 'last_seen': now, 'severity': 'high'
+            }},
+            'metrics_history': [],
+            'last_updated': now
+        }, indent=2))
+
+        monitor = ErrorMonitor(storage_path=self.temp_file.name)
+        assert monitor.detected_patterns['p1'].severity == ErrorSeverity.HIGH
+
+        monitor._save_to_storage()
+        records = [json.loads(line) for line in Path(self.temp_file.name).read_text().splitlines()]
+        assert [r['data']['pattern_id'] for r in records] == ['p1']
+
+
 class TestGlobalFunctions:
     """Test suite for global monitoring functions"""
     
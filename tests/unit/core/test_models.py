@@ -78,6 +78,76 @@ class TestTaskModel:
         assert len(task.dependencies) == 2
         assert "TASK-001" in task.dependencies
 
+    def _make_task(self, **kwargs: Any) -> Task:
+        return Task(
+            id="TASK-003",
+            name="Write tests",
+            description="Cover the API",
+            status=TaskStatus.TODO,
+            priority=Priority.MEDIUM,
+            assigned_to=None,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2),
+            due_date=None,
+            estimated_hours=3.0,
+            **kwargs
+        )
+
+    def test_task_is_slotted(self) -> None:
+        """
+        Test that tasks carry no per-instance __dict__.
+
+        Former dynamic attributes are explicit optional fields instead.
+        """
+        task = self._make_task(acceptance_criteria=["passes"])
+
+        assert not hasattr(task, "__dict__")
+        assert task.acceptance_criteria == ["passes"]
+        assert task.subtasks is None and task.metadata is None and task.completed_at is None
+        with pytest.raises(AttributeError):
+            task.undeclared = True
+
+    def test_task_labels_are_interned(self) -> None:
+        """
+        Test that equal labels on different tasks share one string object.
+        """
+        first = self._make_task(labels=["".join(["back", "end"])])
+        second = self._make_task(labels=["".join(["back", "end"])])
+
+        assert first.labels[0] is second.labels[0]
+
+    def test_task_pickle_round_trip(self) -> None:
+        """
+        Test that tasks survive pickling with every protocol.
+        """
+        import pickle
+
+        task = self._make_task(labels=["api"], subtasks=[{"name": "step"}])
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            assert pickle.loads(pickle.dumps(task, protocol=protocol)) == task
+
+    def test_task_restores_dict_based_state(self) -> None:
+        """
+        Test unpickling state written by the former __dict__-based Task.
+
+        Missing fields take their defaults and unknown attributes are dropped.
+        """
+        task = self._make_task()
+        state = {name: getattr(task, name) for name in (
+            "id", "name", "description", "status", "priority", "assigned_to",
+            "created_at", "updated_at", "due_date", "estimated_hours",
+            "actual_hours", "dependencies", "labels"
+        )}
+        state["acceptance_criteria"] = ["done"]
+        state["task_type"] = "feature"
+
+        restored = Task.__new__(Task)
+        restored.__setstate__(state)
+
+        assert restored.acceptance_criteria == ["done"]
+        assert restored.metadata is None
+        assert restored == self._make_task(acceptance_criteria=["done"])
+
 
 class TestProjectState:
     """
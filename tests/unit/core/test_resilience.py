@@ -0,0 +1,331 @@
+"""
+Unit tests for the resilience layer: AIMD concurrency limit, retry budget
+and circuit-broken endpoints around kanban and LLM backends.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.core.error_framework import IntegrationError
+from src.core.error_strategies import CircuitBreakerConfig, CircuitBreakerState
+from src.core.resilience import (
+    DROPPED, AdaptiveConcurrencyLimiter, ResilientEndpoint, RetryBudget,
+    get_resilience_stats, is_backend_failure, is_transient_error
+)
+
+
+class StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def make_endpoint(**kwargs):
+    kwargs.setdefault("base_delay", 0)
+    kwargs.setdefault("breaker_config", CircuitBreakerConfig(
+        failure_threshold=3, success_threshold=1, timeout=60.0, monitor_window=60.0
+    ))
+    return ResilientEndpoint("test-backend", **kwargs)
+
+
+class TestErrorClassification:
+    """Test which errors are retried and which count against a backend"""
+
+    @pytest.mark.parametrize("error,transient,failure", [
+        (asyncio.TimeoutError(), True, True),
+        (ConnectionResetError(), True, True),
+        (StatusError(503), True, True),
+        (StatusError(429), True, True),
+        (StatusError(404), False, False),
+        (ValueError("bad json"), False, True),
+    ])
+    def test_classification(self, error, transient, failure):
+        assert is_transient_error(error) is transient
+        assert is_backend_failure(error) is failure
+
+    def test_httpx_transport_errors_are_transient(self):
+        import httpx
+        assert is_transient_error(httpx.ConnectError("refused"))
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test AIMD limit adjustment and queueing"""
+
+    @pytest.mark.asyncio
+    async def test_additive_increase_while_saturated(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=2, max_limit=4)
+
+        for _ in range(10):
+            slots = [await limiter.acquire() for _ in range(limiter.limit)]
+            for started in slots:
+                limiter.release(started)
+
+        assert limiter.limit == 4
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_limit_does_not_grow(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=4)
+
+        with patch("src.core.resilience.time.monotonic") as clock:
+            now = [100.0]
+            clock.side_effect = lambda: now[0]
+            for _ in range(20):
+                started = await limiter.acquire()
+                now[0] += 0.1
+                limiter.release(started)
+
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_jitter_below_latency_floor_is_not_congestion(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=8, min_samples=3, min_latency=0.05)
+
+        with patch("src.core.resilience.time.monotonic") as clock:
+            now = [100.0]
+            clock.side_effect = lambda: now[0]
+            for latency in [0.001] * 4 + [0.02]:
+                started = await limiter.acquire()
+                now[0] += latency
+                limiter.release(started)
+
+        assert limiter.slow_calls == 0
+        assert limiter.decreases == 0
+
+    @pytest.mark.asyncio
+    async def test_multiplicative_decrease_once_per_round(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=8)
+        slots = [await limiter.acquire() for _ in range(8)]
+
+        # Every call of the same round failing is one congestion signal
+        for started in slots:
+            limiter.release(started, DROPPED)
+
+        assert limiter.limit == 4
+        assert limiter.decreases == 1
+
+        limiter.release(await limiter.acquire(), DROPPED)
+        assert limiter.limit == 2
+
+    @pytest.mark.asyncio
+    async def test_slow_calls_shrink_the_limit(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=8, min_samples=3)
+
+        with patch("src.core.resilience.time.monotonic") as clock:
+            now = [100.0]
+            clock.side_effect = lambda: now[0]
+            for _ in range(4):
+                started = await limiter.acquire()
+                now[0] += 0.1
+                limiter.release(started)
+            started = await limiter.acquire()
+            now[0] += 1.0
+            limiter.release(started)
+
+        assert limiter.slow_calls == 1
+        assert limiter.limit == 4
+
+    @pytest.mark.asyncio
+    async def test_waiters_are_served_in_order(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=1)
+        held = await limiter.acquire()
+        order = []
+
+        async def waiter(n):
+            started = await limiter.acquire()
+            order.append(n)
+            limiter.release(started)
+
+        waiters = [asyncio.create_task(waiter(n)) for n in range(3)]
+        await asyncio.sleep(0)
+        assert limiter.get_stats()["queued"] == 3
+
+        limiter.release(held)
+        await asyncio.gather(*waiters)
+
+        assert order == [0, 1, 2]
+        assert limiter.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_is_bounded(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=1, max_queue_wait=0.01)
+        await limiter.acquire()
+
+        with pytest.raises(IntegrationError) as exc_info:
+            await limiter.acquire()
+
+        assert exc_info.value.operation == "concurrency_limit_exceeded"
+        assert limiter.get_stats()["rejected"] == 1
+        assert limiter.get_stats()["queued"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_the_queue(self):
+        limiter = AdaptiveConcurrencyLimiter("svc", initial_limit=1)
+        held = await limiter.acquire()
+        waiter = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        limiter.release(held)
+
+        assert limiter.in_flight == 0
+        assert limiter.get_stats()["queued"] == 0
+
+
+class TestRetryBudget:
+    """Test that retries are capped relative to requests"""
+
+    def test_budget(self):
+        budget = RetryBudget(ratio=0.5, min_retries=1)
+        for _ in range(4):
+            budget.record_request()
+
+        # 1 + 0.5 * 4 retries allowed
+        assert [budget.try_spend() for _ in range(4)] == [True, True, True, False]
+
+
+class TestResilientEndpoint:
+    """Test breaker, retries and limiter working together"""
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_errors(self):
+        endpoint = make_endpoint()
+        func = AsyncMock(side_effect=[asyncio.TimeoutError(), StatusError(503), "ok"])
+
+        assert await endpoint.call(func, "arg", key="value") == "ok"
+
+        assert func.await_count == 3
+        func.assert_awaited_with("arg", key="value")
+        assert endpoint.get_stats()["retries"] == 2
+
+    @pytest.mark.asyncio
+    async def test_non_transient_errors_are_not_retried(self):
+        endpoint = make_endpoint()
+        func = AsyncMock(side_effect=StatusError(400))
+
+        with pytest.raises(StatusError):
+            await endpoint.call(func)
+
+        func.assert_awaited_once()
+        # A client error says nothing about the backend's health
+        assert endpoint.get_stats()["failures"] == 0
+
+    @pytest.mark.asyncio
+    async def test_call_once_never_retries(self):
+        endpoint = make_endpoint()
+        func = AsyncMock(side_effect=asyncio.TimeoutError())
+
+        with pytest.raises(asyncio.TimeoutError):
+            await endpoint.call_once(func)
+
+        func.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_limits_retries(self):
+        endpoint = make_endpoint(retry_budget=RetryBudget(ratio=0, min_retries=1))
+        func = AsyncMock(side_effect=ConnectionResetError())
+
+        with pytest.raises(ConnectionResetError):
+            await endpoint.call(func)
+
+        assert func.await_count == 2
+        assert endpoint.get_stats()["retries_denied"] == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self):
+        endpoint = make_endpoint(max_attempts=1)
+        func = AsyncMock(side_effect=RuntimeError("backend down"))
+
+        for _ in range(3):
+            with pytest.raises(RuntimeError):
+                await endpoint.call(func)
+
+        assert not endpoint.is_available
+        with pytest.raises(IntegrationError) as exc_info:
+            await endpoint.call(func)
+
+        assert exc_info.value.operation == "circuit_breaker_open"
+        assert func.await_count == 3
+        stats = endpoint.get_stats()
+        assert stats["state"] == CircuitBreakerState.OPEN.value
+        assert stats["short_circuited"] == 1
+        assert stats["limiter"]["limit"] < 4
+
+    @pytest.mark.asyncio
+    async def test_timeout(self):
+        endpoint = make_endpoint(timeout=0.01, max_attempts=1)
+
+        async def hang():
+            await asyncio.sleep(1)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await endpoint.call(hang)
+
+        assert endpoint.limiter.in_flight == 0
+        assert endpoint.get_stats()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_wrap(self):
+        endpoint = make_endpoint()
+        func = AsyncMock(return_value={"items": []})
+
+        assert await endpoint.wrap(func)("tool", {}) == {"items": []}
+        assert endpoint.get_stats()["successes"] == 1
+
+    def test_stats_are_exported(self):
+        endpoint = ResilientEndpoint("exported-backend")
+
+        exported = {stats["name"]: stats for stats in get_resilience_stats()}
+
+        assert exported[endpoint.name]["state"] == "closed"
+
+
+class TestBackendsFailFast:
+    """Test that integrations route their I/O through the resilience layer"""
+
+    @pytest.mark.asyncio
+    async def test_llm_abstraction_skips_open_provider(self):
+        from src.ai.providers.llm_abstraction import LLMAbstraction
+        from src.utils.llm_cache import LLMResponseCache
+        llm = LLMAbstraction()
+        llm.response_cache = LLMResponseCache()
+        llm.current_provider = "anthropic"
+        primary, fallback = Mock(model="primary"), Mock(model="fallback")
+        primary.analyze_task = AsyncMock()
+        primary.resilience = make_endpoint()
+        primary.resilience.breaker.state.state = CircuitBreakerState.OPEN
+        fallback.analyze_task = AsyncMock(return_value="analysis")
+        fallback.resilience = make_endpoint()
+        llm.providers = {"anthropic": primary, "openai": fallback}
+        llm._providers_initialized = True
+
+        result = await llm._execute_with_fallback("analyze_task", task=None, context={})
+
+        assert result == "analysis"
+        primary.analyze_task.assert_not_awaited()
+        assert llm.provider_stats["anthropic"]["circuit_open_skips"] == 1
+        assert llm.get_provider_stats()["resilience"]["anthropic"]["state"] == "open"
+
+    @pytest.mark.asyncio
+    async def test_kanban_client_retries_reads_only(self):
+        with patch('src.integrations.mcp_kanban_client_simple.os.path.exists', return_value=False), \
+             patch('src.integrations.mcp_kanban_client_simple.os.environ', {}), \
+             patch('sys.stderr'):
+            from src.integrations.mcp_kanban_client_simple import SimpleMCPKanbanClient
+            client = SimpleMCPKanbanClient()
+        client.resilience.base_delay = 0
+        session = Mock()
+        session.call_tool = AsyncMock(side_effect=[asyncio.TimeoutError(), "lists"])
+
+        assert await client._call_tool(session, "mcp_kanban_list_manager", {"action": "get_all"}) == "lists"
+        assert session.call_tool.await_count == 2
+
+        session.call_tool = AsyncMock(side_effect=asyncio.TimeoutError())
+        with pytest.raises(asyncio.TimeoutError):
+            await client._call_tool(session, "mcp_kanban_card_manager", {"action": "create"})
+        session.call_tool.assert_awaited_once()
+        assert client.get_resilience_stats()["name"] == "kanban-mcp"
@@ -20,12 +20,21 @@ from typing import Dict, Any, List, Optional
 from contextlib import asynccontextmanager
 
 from src.integrations.kanban_client_with_create import KanbanClientWithCreate
+from src.integrations.label_manager_helper import clear_label_registries
 from src.core.models import Task, TaskStatus, Priority
 from src.core.error_framework import (
     ConfigurationError, KanbanIntegrationError, ErrorContext
 )
 
 
+@pytest.fixture(autouse=True)
+def fresh_label_registries():
+    """Each test starts with no board labels cached."""
+    clear_label_registries()
+    yield
+    clear_label_registries()
+
+
 class TestKanbanClientWithCreate:
     """
     Test suite for KanbanClientWithCreate.
@@ -132,8 +141,8 @@ class TestKanbanClientWithCreate:
         assert exc_info.value.context.custom_context["missing_field"] == "board_id"
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     @patch('src.integrations.kanban_client_with_create.LabelManagerHelper')
     async def test_create_task_successful(
         self,
@@ -224,8 +233,8 @@ class TestKanbanClientWithCreate:
         assert mock_client_session.initialize.called
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     async def test_create_task_no_suitable_list(
         self,
         mock_session_class,
@@ -261,8 +270,8 @@ class TestKanbanClientWithCreate:
         assert "No suitable list found" in exc_info.value.context.custom_context["details"]
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     async def test_create_task_card_creation_failure(
         self,
         mock_session_class,
@@ -304,8 +313,8 @@ class TestKanbanClientWithCreate:
         assert "'NoneType' object is not subscriptable" in str(exc_info.value)
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     async def test_create_task_with_minimal_data(
         self,
         mock_session_class,
@@ -455,96 +464,176 @@ class TestKanbanClientWithCreate:
         # Verify error was caught
         session.call_tool.assert_called_once()
 
+    @pytest.fixture
+    def board_session(self):
+        """
+        Create a scripted session that behaves like a small kanban board.
+        
+        Cards named in ``failing_cards`` fail to be created; every call is
+        recorded in ``calls``.
+        """
+        session = Mock()
+        session.calls = []
+        session.failing_cards = set()
+        session.labels = [{"id": "label-backend", "name": "backend", "color": "berry-red"}]
+
+        def respond(payload):
+            return Mock(content=[Mock(text=json.dumps(payload))])
+
+        async def call_tool(tool_name, params):
+            session.calls.append((tool_name, params))
+            action = params.get("action")
+            if tool_name == "mcp_kanban_list_manager":
+                return respond([{"id": "list-1", "name": "Backlog"}])
+            if tool_name == "mcp_kanban_card_manager":
+                if params["name"] in session.failing_cards:
+                    raise Exception("Task creation failed")
+                return respond({"id": f"card-{params['name']}", "name": params["name"],
+                                "description": params["description"]})
+            if tool_name == "mcp_kanban_label_manager" and action == "get_all":
+                return respond(session.labels)
+            if tool_name == "mcp_kanban_label_manager" and action == "create":
+                label = {"id": f"label-{params['name']}", "name": params["name"], "color": params["color"]}
+                session.labels.append(label)
+                return respond(label)
+            return respond({"id": "ok"})
+
+        session.call_tool = call_tool
+        return session
+
+    @pytest.fixture
+    def pooled_client(self, client, board_session):
+        """Client whose session pool always lends ``board_session``."""
+        @asynccontextmanager
+        async def get_session():
+            yield board_session
+
+        client._session_pool.get_session = get_session
+        return client
+
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
-    async def test_create_tasks_batch(
-        self,
-        mock_session_class,
-        mock_stdio,
-        client,
-        mock_stdio_client,
-        mock_session_context,
-        mock_client_session
-    ):
+    async def test_create_tasks_batch(self, pooled_client):
         """Test batch task creation."""
-        # Setup mocks for batch operation
-        mock_stdio.side_effect = [mock_stdio_client() for _ in range(3)]
-        mock_session_class.side_effect = [mock_session_context() for _ in range(3)]
+        tasks_data = [{"name": f"Task {i}"} for i in range(3)]
+        tasks = await pooled_client.create_tasks_batch(tasks_data)
         
-        # Create a mock for each task creation
-        with patch.object(client, 'create_task', new_callable=AsyncMock) as mock_create:
-            mock_create.side_effect = [
-                Task(
-                    id=f"card-{i}",
-                    name=f"Task {i}",
-                    description="",
-                    status=TaskStatus.TODO,
-                    priority=Priority.MEDIUM,
-                    assigned_to=None,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    due_date=None,
-                    estimated_hours=0.0
-                ) for i in range(3)
-            ]
-            
-            # Execute
-            tasks_data = [{"name": f"Task {i}"} for i in range(3)]
-            tasks = await client.create_tasks_batch(tasks_data)
-            
-            # Verify
-            assert len(tasks) == 3
-            for i, task in enumerate(tasks):
-                assert task.id == f"card-{i}"
-                assert task.name == f"Task {i}"
+        # Verify
+        assert len(tasks) == 3
+        for i, task in enumerate(tasks):
+            assert task.id == f"card-Task {i}"
+            assert task.name == f"Task {i}"
 
     @pytest.mark.asyncio
-    async def test_create_tasks_batch_partial_failure(self, client):
+    async def test_create_tasks_batch_partial_failure(self, pooled_client, board_session):
         """Test batch creation continues despite individual failures."""
-        # Create mock for task creation that partially fails
-        with patch.object(client, 'create_task', new_callable=AsyncMock) as mock_create:
-            # First succeeds, second fails, third succeeds
-            mock_create.side_effect = [
-                Task(
-                    id="card-1",
-                    name="Task 0",
-                    description="",
-                    status=TaskStatus.TODO,
-                    priority=Priority.MEDIUM,
-                    assigned_to=None,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    due_date=None,
-                    estimated_hours=0.0
-                ),
-                Exception("Task creation failed"),
-                Task(
-                    id="card-3",
-                    name="Task 2",
-                    description="",
-                    status=TaskStatus.TODO,
-                    priority=Priority.MEDIUM,
-                    assigned_to=None,
-                    created_at=datetime.now(),
-                    updated_at=datetime.now(),
-                    due_date=None,
-                    estimated_hours=0.0
-                )
-            ]
-            
-            # Execute
-            tasks_data = [{"name": f"Task {i}"} for i in range(3)]
-            tasks = await client.create_tasks_batch(tasks_data)
-            
-            # Verify only successful tasks returned
-            assert len(tasks) == 2
-            assert tasks[0].name == "Task 0"
-            assert tasks[1].name == "Task 2"
+        board_session.failing_cards = {"Task 1"}
+        
+        tasks_data = [{"name": f"Task {i}"} for i in range(3)]
+        tasks = await pooled_client.create_tasks_batch(tasks_data)
+        
+        # Verify only successful tasks returned
+        assert len(tasks) == 2
+        assert tasks[0].name == "Task 0"
+        assert tasks[1].name == "Task 2"
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk_report(self, pooled_client, board_session):
+        """Test the bulk report lists every task and aggregates failures."""
+        board_session.failing_cards = {"Task 1"}
+        
+        report = await pooled_client.create_tasks_bulk([{"name": f"Task {i}"} for i in range(3)])
+        
+        assert [r.succeeded for r in report.results] == [True, False, True]
+        summary = report.to_dict()
+        assert summary["operation"] == "create_tasks_bulk"
+        assert summary["successes"] == 2
+        assert summary["errors"] == 1
+        assert summary["tasks"][1]["error"] == "Task creation failed"
+        failure = summary["error_summary"]["IntegrationError"][0]
+        assert failure["item_context"] == {"index": 1, "task_name": "Task 1"}
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk_shares_list_and_label_lookups(
+        self, pooled_client, board_session, sample_task_data
+    ):
+        """Test the target list and labels are resolved once per request."""
+        tasks_data = [dict(sample_task_data, name=f"Task {i}") for i in range(4)]
+        
+        report = await pooled_client.create_tasks_bulk(tasks_data)
+        
+        assert len(report.created_tasks) == 4
+        tools = [(tool, params.get("action")) for tool, params in board_session.calls]
+        assert tools.count(("mcp_kanban_list_manager", "get_all")) == 1
+        # Labels are listed once; "backend" exists, "security" is created once
+        assert tools.count(("mcp_kanban_label_manager", "get_all")) == 1
+        assert tools.count(("mcp_kanban_label_manager", "create")) == 1
+        assert tools.count(("mcp_kanban_label_manager", "add_to_card")) == 8
+        
+        # Checklist items keep their order on each card
+        card_items = [
+            params for tool, params in board_session.calls
+            if tool == "mcp_kanban_task_manager" and params["cardId"] == "card-Task 0"
+        ]
+        assert [p["position"] for p in card_items] == [65536 * i for i in range(1, 8)]
+        assert card_items[0]["name"] == "✓ Users can register with email/password"
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk_bounds_concurrency(self, pooled_client, board_session):
+        """Test no more than max_concurrency cards are created at once."""
+        in_flight = 0
+        peak = 0
+        scripted = board_session.call_tool
+
+        async def slow_call_tool(tool_name, params):
+            nonlocal in_flight, peak
+            if tool_name != "mcp_kanban_card_manager":
+                return await scripted(tool_name, params)
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return await scripted(tool_name, params)
+
+        board_session.call_tool = slow_call_tool
+        
+        report = await pooled_client.create_tasks_bulk(
+            [{"name": f"Task {i}"} for i in range(10)], max_concurrency=3
+        )
+        
+        assert len(report.created_tasks) == 10
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk_detail_failures_do_not_fail_task(self, pooled_client, board_session):
+        """Test failed label or checklist writes are reported but keep the task."""
+        scripted = board_session.call_tool
+
+        async def flaky_call_tool(tool_name, params):
+            if tool_name == "mcp_kanban_task_manager":
+                raise Exception("Checklist error")
+            return await scripted(tool_name, params)
+
+        board_session.call_tool = flaky_call_tool
+        
+        report = await pooled_client.create_tasks_bulk([{"name": "Task", "subtasks": ["One", "Two"]}])
+        
+        result = report.results[0]
+        assert result.succeeded
+        assert result.checklist_failures == ["• One", "• Two"]
+
+    @pytest.mark.asyncio
+    async def test_create_tasks_bulk_without_board_id(self, client):
+        """Test bulk creation requires a board."""
+        client.board_id = None
+        
+        with pytest.raises(ConfigurationError):
+            await client.create_tasks_bulk([{"name": "Task"}])
+        
+        assert await client.create_tasks_batch([{"name": "Task"}]) == []
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     @patch('src.integrations.kanban_client_with_create.LabelManagerHelper')
     async def test_create_task_uses_first_list_as_fallback(
         self,
@@ -604,8 +693,8 @@ class TestKanbanClientWithCreate:
         assert task.id == "card-123"
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     async def test_create_task_with_acceptance_criteria_only(
         self,
         mock_session_class,
@@ -685,8 +774,8 @@ class TestKanbanClientWithCreate:
             assert os.environ['PLANKA_AGENT_PASSWORD'] == 'custompass'
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     async def test_create_task_with_dict_response(
         self,
         mock_session_class,
@@ -768,8 +857,8 @@ class TestKanbanClientWithCreate:
             mock_convert.assert_called_once_with(card_data)
 
     @pytest.mark.asyncio
-    @patch('src.integrations.kanban_client_with_create.stdio_client')
-    @patch('src.integrations.kanban_client_with_create.ClientSession')
+    @patch('src.integrations.mcp_kanban_client_simple.stdio_client')
+    @patch('src.integrations.mcp_kanban_client_simple.ClientSession')
     async def test_create_task_with_empty_description(
         self,
         mock_session_class,
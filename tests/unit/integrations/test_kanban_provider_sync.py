@@ -0,0 +1,138 @@
+"""
+Unit tests for paginated, incremental issue syncing in the GitHub and Linear providers
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.core.models import TaskStatus
+from src.integrations.providers.github_kanban import GitHubKanban
+from src.integrations.providers.linear_kanban import LinearKanban
+
+
+def github_issue(number, state="open", assignee=None, updated="2024-01-01T00:00:00Z", labels=None):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "",
+        "state": state,
+        "assignee": {"login": assignee} if assignee else None,
+        "labels": [{"name": name} for name in labels or []],
+        "created_at": f"2024-01-01T00:00:{number % 60:02d}Z",
+        "updated_at": updated,
+    }
+
+
+def linear_issue(issue_id, state_type="backlog", assignee=None, updated="2024-01-01T00:00:00Z"):
+    return {
+        "id": issue_id,
+        "title": f"Issue {issue_id}",
+        "description": "",
+        "state": {"type": state_type},
+        "assignee": {"id": assignee} if assignee else None,
+        "createdAt": "2024-01-01T00:00:00Z",
+        "updatedAt": updated,
+    }
+
+
+class TestGitHubKanbanSync:
+    """Test paginated, cached issue fetching for GitHub"""
+
+    @pytest.mark.asyncio
+    async def test_paginates_past_one_page(self):
+        issues = [github_issue(n) for n in range(1, 251)]
+
+        async def caller(tool, args):
+            start = (args["page"] - 1) * args["perPage"]
+            return {"issues": issues[start:start + args["perPage"]]}
+
+        mcp_caller = AsyncMock(side_effect=caller)
+        kanban = GitHubKanban({"mcp_function_caller": mcp_caller, "owner": "o", "repo": "r"})
+
+        tasks = await kanban.get_available_tasks()
+
+        assert len(tasks) == 250
+        assert [call.args[1]["page"] for call in mcp_caller.await_args_list] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_later_syncs_only_request_updated_issues(self):
+        mcp_caller = AsyncMock(return_value={"issues": [
+            github_issue(1, updated="2024-01-01T00:00:00Z"),
+            github_issue(2, assignee="alice", updated="2024-01-02T00:00:00Z"),
+            {**github_issue(3), "pull_request": {}},
+        ]})
+        kanban = GitHubKanban({"mcp_function_caller": mcp_caller, "owner": "o", "repo": "r"})
+
+        first = await kanban.get_available_tasks()
+        assert [t.id for t in first] == ["1"]
+        assert "since" not in mcp_caller.await_args.args[1]
+
+        mcp_caller.return_value = {"issues": [github_issue(1, state="closed", updated="2024-01-03T00:00:00Z")]}
+        metrics = await kanban.get_project_metrics()
+
+        assert mcp_caller.await_args.args[1]["since"] == "2024-01-02T00:00:00Z"
+        assert metrics["completed_tasks"] == 1
+        assert metrics["backlog_tasks"] == 1
+        assert metrics["total_tasks"] == 2
+        assert {t.id: t.status for t in await kanban.get_all_tasks()}["1"] == TaskStatus.DONE
+
+    @pytest.mark.asyncio
+    async def test_quiet_poll_keeps_the_cache(self):
+        issues = [github_issue(1, updated="2024-01-01T00:00:00Z")]
+        mcp_caller = AsyncMock(return_value={"issues": issues})
+        kanban = GitHubKanban({"mcp_function_caller": mcp_caller, "owner": "o", "repo": "r"})
+
+        await kanban.sync_issues()
+        mcp_caller.return_value = {"issues": []}
+        received = await kanban.sync_issues()
+
+        # Only arguments the GitHub MCP list_issues tool accepts are sent
+        assert set(mcp_caller.await_args.args[1]) == {
+            "owner", "repo", "state", "sort", "direction", "since", "page", "perPage"
+        }
+        assert received == 0
+        assert len(await kanban.get_all_tasks()) == 1
+
+
+class TestLinearKanbanSync:
+    """Test paginated, cached issue fetching for Linear"""
+
+    @pytest.mark.asyncio
+    async def test_follows_cursor_pages(self):
+        pages = {
+            None: {"issues": [linear_issue("a")], "pageInfo": {"hasNextPage": True, "endCursor": "c1"}},
+            "c1": {"issues": [linear_issue("b", assignee="u1")], "pageInfo": {"hasNextPage": True, "endCursor": "c2"}},
+            "c2": {"issues": [linear_issue("c", state_type="started")], "pageInfo": {"hasNextPage": False}},
+        }
+        mcp_caller = AsyncMock(side_effect=lambda tool, args: pages[args.get("after")])
+        kanban = LinearKanban({"mcp_function_caller": mcp_caller, "team_id": "team"})
+
+        available = await kanban.get_available_tasks()
+
+        assert [t.id for t in available] == ["a"]
+        assert mcp_caller.await_count == 3
+        assert len(await kanban.get_all_tasks()) == 3
+
+    @pytest.mark.asyncio
+    async def test_later_syncs_filter_on_updated_at(self):
+        mcp_caller = AsyncMock(return_value={"issues": [
+            linear_issue("a", updated="2024-01-01T00:00:00Z"),
+            linear_issue("b", state_type="started", updated="2024-01-05T00:00:00Z"),
+        ]})
+        kanban = LinearKanban({"mcp_function_caller": mcp_caller, "team_id": "team"})
+        await kanban.sync_issues()
+
+        mcp_caller.return_value = {"issues": [linear_issue("b", state_type="completed", updated="2024-01-06T00:00:00Z")]}
+        metrics = await kanban.get_project_metrics()
+
+        sent_filter = mcp_caller.await_args.args[1]["filter"]
+        assert sent_filter["updatedAt"] == {"gt": "2024-01-05T00:00:00Z"}
+        assert sent_filter["team"] == {"id": {"eq": "team"}}
+        assert metrics == {
+            "total_tasks": 2,
+            "backlog_tasks": 1,
+            "in_progress_tasks": 0,
+            "completed_tasks": 1,
+            "blocked_tasks": 0,
+        }
@@ -0,0 +1,201 @@
+"""
+Unit tests for LabelManagerHelper and the shared board label registry.
+"""
+
+import asyncio
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from src.integrations.label_manager_helper import (
+    BoardLabelRegistry, LabelManagerHelper, clear_label_registries, get_label_registry
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_label_registries():
+    """Each test starts with no board labels cached."""
+    clear_label_registries()
+    yield
+    clear_label_registries()
+
+
+@pytest.fixture
+def board_session():
+    """Session answering label manager calls for a small board."""
+    session = Mock()
+    session.calls = []
+    session.labels = [{"id": "label-backend", "name": "backend", "color": "berry-red"}]
+    session.failing_labels = set()
+
+    def respond(payload):
+        return Mock(content=[Mock(text=json.dumps(payload))])
+
+    async def call_tool(tool_name, params):
+        session.calls.append(params)
+        await asyncio.sleep(0.001)
+        action = params["action"]
+        if action == "get_all":
+            return respond(session.labels)
+        if action == "create":
+            label = {"id": f"label-{params['name']}", "name": params["name"], "color": params["color"]}
+            session.labels.append(label)
+            return respond(label)
+        if action == "add_to_card" and params["labelId"] in session.failing_labels:
+            raise Exception("Label not found")
+        return respond({"id": "ok"})
+
+    session.call_tool = call_tool
+    return session
+
+
+def actions(session):
+    return [params["action"] for params in session.calls]
+
+
+class TestBoardLabelRegistry:
+    """Test the board-scoped label cache"""
+
+    def test_one_registry_per_board(self):
+        assert get_label_registry("board-1") is get_label_registry("board-1")
+        assert get_label_registry("board-1") is not get_label_registry("board-2")
+
+    @pytest.mark.asyncio
+    async def test_registry_is_shared_across_sessions(self, board_session):
+        first = LabelManagerHelper(board_session, "board-1")
+        await first.ensure_label_exists("backend")
+
+        second = LabelManagerHelper(board_session, "board-1")
+        assert await second.ensure_label_exists("Backend") == "label-backend"
+
+        assert actions(board_session).count("get_all") == 1
+        assert second.registry.get_stats()["hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_listing_expires_after_ttl(self, board_session):
+        registry = BoardLabelRegistry("board-1", ttl=60)
+        helper = LabelManagerHelper(board_session, "board-1", registry=registry)
+
+        await helper.ensure_label_exists("backend")
+        registry.warmed_at -= 30
+        await helper.ensure_label_exists("backend")
+        registry.warmed_at -= 31
+        await helper.ensure_label_exists("backend")
+
+        assert actions(board_session).count("get_all") == 2
+
+    def test_expired_registries_of_other_boards_are_dropped(self):
+        old = get_label_registry("board-1")
+        old.mark_listed()
+        fresh = get_label_registry("board-2")
+        fresh.mark_listed()
+        old.warmed_at -= old.ttl + 1
+
+        get_label_registry("board-3")
+
+        assert get_label_registry("board-1") is not old
+        assert get_label_registry("board-2") is fresh
+
+    @pytest.mark.asyncio
+    async def test_concurrent_warm_lists_once(self, board_session):
+        helpers = [LabelManagerHelper(board_session, "board-1") for _ in range(5)]
+
+        await asyncio.gather(*(helper.warm() for helper in helpers))
+
+        assert actions(board_session) == ["get_all"]
+
+
+class TestLabelManagerHelper:
+    """Test label resolution and attachment"""
+
+    @pytest.mark.asyncio
+    async def test_missing_label_is_created_once(self, board_session):
+        helpers = [LabelManagerHelper(board_session, "board-1") for _ in range(3)]
+
+        label_ids = await asyncio.gather(*(helper.ensure_label_exists("security") for helper in helpers))
+
+        assert label_ids == ["label-security"] * 3
+        assert actions(board_session) == ["get_all", "create"]
+
+    @pytest.mark.asyncio
+    async def test_resolve_labels_creates_missing_concurrently(self, board_session):
+        helper = LabelManagerHelper(board_session, "board-1")
+
+        label_ids = await helper.resolve_labels(["backend", "security", "Security", "testing"])
+
+        assert label_ids == {
+            "backend": "label-backend",
+            "security": "label-security",
+            "testing": "label-testing",
+        }
+        assert actions(board_session).count("create") == 2
+
+    @pytest.mark.asyncio
+    async def test_invalid_color_is_reported(self, board_session):
+        helper = LabelManagerHelper(board_session, "board-1")
+
+        with pytest.raises(ValueError):
+            await helper.ensure_label_exists("custom", color="not-a-color")
+
+    @pytest.mark.asyncio
+    async def test_add_labels_to_card(self, board_session):
+        helper = LabelManagerHelper(board_session, "board-1")
+        await helper.warm()
+        board_session.calls.clear()
+
+        added = await helper.add_labels_to_card("card-1", ["backend", "backend", "security"])
+
+        assert added == ["label-backend", "label-security"]
+        # The miss re-lists the board once before creating the label
+        assert actions(board_session) == ["get_all", "create", "add_to_card", "add_to_card"]
+
+    @pytest.mark.asyncio
+    async def test_label_created_elsewhere_is_reused(self, board_session):
+        helper = LabelManagerHelper(board_session, "board-1")
+        await helper.warm()
+        board_session.labels.append({"id": "label-docs", "name": "docs", "color": "lagoon-blue"})
+        board_session.calls.clear()
+
+        label_ids = await asyncio.gather(
+            helper.ensure_label_exists("docs"), helper.ensure_label_exists("Docs")
+        )
+
+        assert label_ids == ["label-docs", "label-docs"]
+        assert actions(board_session) == ["get_all"]
+
+    @pytest.mark.asyncio
+    async def test_attach_in_batches(self, board_session):
+        helper = LabelManagerHelper(board_session, "board-1")
+        labels = [(f"label{n}", f"id-{n}") for n in range(5)]
+
+        added = await helper.attach_labels("card-1", labels, batch_size=2)
+
+        assert added == [f"id-{n}" for n in range(5)]
+        assert [params["labelId"] for params in board_session.calls] == added
+
+    @pytest.mark.asyncio
+    async def test_failed_attach_marks_registry_stale(self, board_session):
+        helper = LabelManagerHelper(board_session, "board-1")
+        await helper.warm()
+        board_session.failing_labels = {"label-backend"}
+
+        added = await helper.add_labels_to_card("card-1", ["backend"])
+
+        assert added == []
+        assert not helper.registry.warmed
+        await helper.ensure_label_exists("backend")
+        assert actions(board_session).count("get_all") == 2
+
+    @pytest.mark.asyncio
+    async def test_label_color_is_corrected_once(self, board_session):
+        board_session.labels = [{"id": "label-frontend", "name": "frontend", "color": "berry-red"}]
+        registry = BoardLabelRegistry("board-1")
+        helper = LabelManagerHelper(board_session, "board-1", registry=registry)
+
+        for _ in range(3):
+            await helper.ensure_label_exists("frontend")
+
+        updates = [params for params in board_session.calls if params["action"] == "update"]
+        assert len(updates) == 1
+        assert updates[0]["color"] == "lagoon-blue"
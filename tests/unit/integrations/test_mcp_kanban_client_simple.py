@@ -805,14 +805,16 @@ class TestSimpleMCPKanbanClient:
         # Mock responses for multiple operations
         # First operation: get_available_tasks needs lists + 5 card responses
         # Second operation: get_board_summary
+        # List card fetches interleave with other operations, so respond by tool
         empty_cards = Mock()
         empty_cards.content = [Mock(text="[]")]
+        responses = {
+            "mcp_kanban_list_manager": lists_response,
+            "mcp_kanban_card_manager": empty_cards,
+            "mcp_kanban_project_board_manager": summary_response
+        }
         
-        mock_client_session.call_tool.side_effect = [
-            lists_response,  # For get_available_tasks
-            empty_cards, empty_cards, empty_cards, empty_cards, empty_cards,  # 5 empty card responses
-            summary_response  # For get_board_summary
-        ]
+        mock_client_session.call_tool.side_effect = lambda tool, args: responses[tool]
         
         with patch('src.integrations.mcp_kanban_client_simple.stdio_client', mock_stdio_client), \
              patch('src.integrations.mcp_kanban_client_simple.ClientSession', mock_client_session_context), \
@@ -866,8 +868,13 @@ class TestSimpleMCPKanbanClient:
             with pytest.raises(RuntimeError):
                 await client.get_available_tasks()
             
-            # Context managers should be entered and exited even with error
+            # A tool error does not tear down the pooled session
             assert stdio_entered
+            assert not stdio_exited
+            assert client.get_session_pool_stats()["open_sessions"] == 1
+            
+            # Closing the client exits the context managers
+            await client.close()
             assert stdio_exited
 
     @pytest.mark.asyncio
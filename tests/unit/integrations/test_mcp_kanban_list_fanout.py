@@ -0,0 +1,176 @@
+"""
+Unit tests for concurrent list fetching in SimpleMCPKanbanClient.
+"""
+
+import asyncio
+import json
+from contextlib import asynccontextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.models import TaskStatus
+from src.integrations.mcp_kanban_client_simple import SimpleMCPKanbanClient
+
+LISTS = [
+    {"id": "list-1", "name": "TODO"},
+    {"id": "list-2", "name": "In Progress"},
+    {"id": "list-3", "name": "Done"},
+    {"id": "list-4", "name": "Backlog"},
+]
+
+
+def response(data):
+    result = Mock()
+    result.content = [Mock(text=json.dumps(data))]
+    return result
+
+
+class FakeBoardSession:
+    """Session answering list and card requests with per-list latency"""
+
+    def __init__(self, delays=None, fail_list=None):
+        self.delays = delays or {}
+        self.fail_list = fail_list
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.card_requests = []
+        self.cancelled = []
+
+    async def call_tool(self, tool, args):
+        if tool == "mcp_kanban_list_manager":
+            return response(LISTS)
+
+        list_id = args["listId"]
+        self.card_requests.append(list_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delays.get(list_id, 0.01))
+        except asyncio.CancelledError:
+            self.cancelled.append(list_id)
+            raise
+        finally:
+            self.in_flight -= 1
+        if list_id == self.fail_list:
+            raise RuntimeError(f"{list_id} failed")
+
+        assignee = [{"username": "agent-1"}] if list_id == "list-2" else []
+        return response({"items": [
+            {"id": f"{list_id}-card-{n}", "name": f"Card {n}", "users": assignee}
+            for n in range(2)
+        ]})
+
+
+class FakePool:
+    def __init__(self, session):
+        self.session = session
+
+    @asynccontextmanager
+    async def get_session(self):
+        yield self.session
+
+
+@pytest.fixture
+def make_client():
+    def _make(session):
+        with patch('src.integrations.mcp_kanban_client_simple.os.path.exists', return_value=False), \
+             patch('src.integrations.mcp_kanban_client_simple.os.environ', {}), \
+             patch('sys.stderr'):
+            client = SimpleMCPKanbanClient()
+        client.board_id = "board-1"
+        client._session_pool = FakePool(session)
+        return client
+    return _make
+
+
+class TestListFanOut:
+    """Test that card fetches for a board's lists run concurrently"""
+
+    @pytest.mark.asyncio
+    async def test_get_all_tasks_fetches_lists_concurrently(self, make_client):
+        session = FakeBoardSession()
+        client = make_client(session)
+
+        tasks = await client.get_all_tasks()
+
+        assert session.max_in_flight == len(LISTS)
+        assert session.card_requests == [lst["id"] for lst in LISTS]
+        # Results keep board list order regardless of completion order
+        assert [t.id for t in tasks] == [
+            f"{lst['id']}-card-{n}" for lst in LISTS for n in range(2)
+        ]
+        assert tasks[2].status == TaskStatus.IN_PROGRESS
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, make_client):
+        session = FakeBoardSession()
+        client = make_client(session)
+        client.list_fetch_concurrency = 2
+
+        tasks = await client.get_all_tasks()
+
+        assert session.max_in_flight == 2
+        assert len(tasks) == 8
+
+    @pytest.mark.asyncio
+    async def test_get_available_tasks_shares_conversion(self, make_client):
+        client = make_client(FakeBoardSession())
+
+        tasks = await client.get_available_tasks()
+
+        # Unassigned cards in TODO and Backlog only
+        assert {t.id for t in tasks} == {
+            "list-1-card-0", "list-1-card-1", "list-4-card-0", "list-4-card-1"
+        }
+
+    @pytest.mark.asyncio
+    async def test_failed_list_cancels_the_rest(self, make_client):
+        session = FakeBoardSession(delays={"list-1": 0, "list-4": 1.0}, fail_list="list-1")
+        client = make_client(session)
+
+        with pytest.raises(RuntimeError, match="list-1 failed"):
+            await client.get_all_tasks()
+
+        assert "list-4" in session.cancelled
+        assert session.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_iter_tasks_yields_lists_as_they_complete(self, make_client):
+        session = FakeBoardSession(delays={"list-1": 0.05, "list-2": 0, "list-3": 0.02, "list-4": 0.01})
+        client = make_client(session)
+
+        batches = [batch async for batch in client.iter_tasks()]
+
+        assert [batch[0].id.split("-card")[0] for batch in batches] == [
+            "list-2", "list-4", "list-3", "list-1"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_iter_tasks_available_only(self, make_client):
+        client = make_client(FakeBoardSession())
+
+        batches = [batch async for batch in client.iter_tasks(available_only=True)]
+
+        assert sorted(len(batch) for batch in batches) == [0, 0, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_closing_iter_tasks_cancels_pending_fetches(self, make_client):
+        session = FakeBoardSession(delays={"list-1": 0, "list-2": 1.0, "list-3": 1.0, "list-4": 1.0})
+        client = make_client(session)
+
+        stream = client.iter_tasks()
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        assert first[0].id == "list-1-card-0"
+        assert sorted(session.cancelled) == ["list-2", "list-3", "list-4"]
+        assert session.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_iter_tasks_requires_board(self, make_client):
+        client = make_client(FakeBoardSession())
+        client.board_id = None
+
+        with pytest.raises(RuntimeError, match="Board ID not set"):
+            await client.iter_tasks().__anext__()
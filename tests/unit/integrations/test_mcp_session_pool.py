@@ -0,0 +1,167 @@
+"""
+Unit tests for MCPSessionPool.
+
+The session factory is replaced with an in-memory async context manager so
+the tests exercise pooling, reaping and respawn logic without spawning any
+kanban-mcp processes.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.integrations.mcp_session_pool import MCPSessionPool
+
+
+class FakeSessionFactory:
+    """Session factory that records opened and closed sessions."""
+
+    def __init__(self, fail_with: Exception = None):
+        self.opened = 0
+        self.closed = 0
+        self.sessions = []
+        self.fail_with = fail_with
+
+    @asynccontextmanager
+    async def __call__(self):
+        if self.fail_with:
+            raise self.fail_with
+        self.opened += 1
+        session = AsyncMock()
+        session.name = f"session-{self.opened}"
+        self.sessions.append(session)
+        try:
+            yield session
+        finally:
+            self.closed += 1
+
+
+@pytest.fixture
+def factory():
+    return FakeSessionFactory()
+
+
+class TestMCPSessionPool:
+    """Test suite for MCPSessionPool"""
+
+    @pytest.mark.asyncio
+    async def test_sessions_are_reused(self, factory):
+        """Sequential callers share a single initialized session"""
+        pool = MCPSessionPool("test", factory, max_sessions=3)
+
+        for _ in range(5):
+            async with pool.get_session() as session:
+                await session.call_tool("noop", {})
+
+        assert factory.opened == 1
+        stats = pool.get_stats()
+        assert stats["open_sessions"] == 1
+        assert stats["total_acquisitions"] == 5
+        await pool.close()
+        assert factory.closed == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded_by_max_sessions(self, factory):
+        """Concurrent callers never open more than max_sessions"""
+        pool = MCPSessionPool("test", factory, max_sessions=2)
+        in_flight = 0
+        peak = 0
+
+        async def worker():
+            nonlocal in_flight, peak
+            async with pool.get_session():
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(worker() for _ in range(8)))
+
+        assert factory.opened == 2
+        assert peak == 2
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_startup_error_propagates(self):
+        """Errors opening a session reach the caller unchanged"""
+        pool = MCPSessionPool("test", FakeSessionFactory(ConnectionError("no server")))
+
+        with pytest.raises(ConnectionError, match="no server"):
+            async with pool.get_session():
+                pass
+
+        assert pool.get_stats()["open_sessions"] == 0
+        assert pool.get_stats()["session_errors"] == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_application_errors_keep_session(self, factory):
+        """Non-transport errors leave the session in the pool"""
+        pool = MCPSessionPool("test", factory)
+
+        with pytest.raises(ValueError):
+            async with pool.get_session():
+                raise ValueError("bad payload")
+
+        async with pool.get_session():
+            pass
+
+        assert factory.opened == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_connection_error_respawns_session(self, factory):
+        """A broken transport is discarded and replaced on next use"""
+        pool = MCPSessionPool("test", factory)
+
+        with pytest.raises(ConnectionError):
+            async with pool.get_session():
+                raise ConnectionError("pipe closed")
+
+        async with pool.get_session() as session:
+            assert session is factory.sessions[1]
+
+        assert factory.opened == 2
+        assert factory.closed == 1
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_health_check_reaps_idle_and_respawns_dead(self, factory):
+        """Idle sessions above the minimum are closed; dead ones replaced"""
+        pool = MCPSessionPool("test", factory, min_sessions=1, max_sessions=3, max_idle_time=60)
+
+        async def hold():
+            async with pool.get_session():
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(hold(), hold(), hold())
+        assert pool.get_stats()["open_sessions"] == 3
+
+        for pooled in pool.sessions.values():
+            pooled.last_used = datetime.now() - timedelta(seconds=120)
+        await pool._perform_health_check()
+        assert pool.get_stats()["open_sessions"] == 1
+
+        # Simulate the server process dying under the remaining session
+        survivor = next(iter(pool.sessions.values()))
+        survivor.task.cancel()
+        await asyncio.sleep(0)
+        await pool._perform_health_check()
+
+        assert pool.get_stats()["open_sessions"] == 1
+        assert survivor.id not in pool.sessions
+        assert factory.opened == 4
+        await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_closed_pool_rejects_requests(self, factory):
+        """Borrowing from a closed pool raises RuntimeError"""
+        pool = MCPSessionPool("test", factory)
+        await pool.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            async with pool.get_session():
+                pass
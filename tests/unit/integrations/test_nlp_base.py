@@ -0,0 +1,93 @@
+"""
+Unit tests for NaturalLanguageTaskCreator.create_tasks_on_board.
+
+Covers the bulk creation path used with KanbanClientWithCreate and the
+one-call-per-task path used with other clients.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.error_strategies import ErrorAggregator
+from src.integrations.kanban_client_with_create import BulkCreationReport, BulkTaskResult
+from src.integrations.nlp_base import NaturalLanguageTaskCreator
+from tests.fixtures.factories import TaskFactory
+
+
+class SimpleCreator(NaturalLanguageTaskCreator):
+    """Concrete creator for testing the shared base class."""
+
+    async def process_natural_language(self, description, **kwargs):
+        return []
+
+
+class BulkClient:
+    """Client exposing the bulk creation pipeline."""
+
+    board_id = "board-1"
+
+    def __init__(self, failing_index=None):
+        self.failing_index = failing_index
+        self.create_task = AsyncMock()
+        self.bulk_calls = []
+
+    async def create_tasks_bulk(self, tasks_data):
+        self.bulk_calls.append(tasks_data)
+        aggregator = ErrorAggregator("create_tasks_bulk")
+        results = []
+        for index, data in enumerate(tasks_data):
+            if index == self.failing_index:
+                results.append(BulkTaskResult(index=index, name=data["name"], error=Exception("card failed")))
+            else:
+                task = TaskFactory.create(name=data["name"])
+                results.append(BulkTaskResult(index=index, name=data["name"], task=task))
+        return BulkCreationReport(results=results, aggregator=aggregator)
+
+
+class TestCreateTasksOnBoard:
+    """Test suite for creating tasks on the board"""
+
+    @pytest.mark.asyncio
+    async def test_uses_bulk_pipeline_when_available(self):
+        """All tasks go through one bulk call, results stay in order"""
+        client = BulkClient()
+        creator = SimpleCreator(client)
+        tasks = TaskFactory.create_batch(3)
+
+        created = await creator.create_tasks_on_board(tasks, skip_validation=True)
+
+        assert [t.name for t in created] == [t.name for t in tasks]
+        assert len(client.bulk_calls) == 1
+        client.create_task.assert_not_called()
+        assert creator.last_creation_report["successes"] == 3
+
+    @pytest.mark.asyncio
+    async def test_bulk_failures_are_recorded(self):
+        """Failed cards are reported for monitoring and in the creation report"""
+        creator = SimpleCreator(BulkClient(failing_index=1))
+        tasks = TaskFactory.create_batch(3)
+
+        with patch("src.core.error_monitoring.record_error_for_monitoring") as record:
+            created = await creator.create_tasks_on_board(tasks, skip_validation=True)
+
+        assert len(created) == 2
+        record.assert_called_once()
+        report = creator.last_creation_report
+        assert report["errors"] == 1
+        failure = report["error_summary"]["KanbanIntegrationError"][0]
+        assert failure["item_context"] == {"task_name": tasks[1].name}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_create_task(self):
+        """Clients without a bulk pipeline get one create_task call per task"""
+        client = AsyncMock()
+        client.create_task = AsyncMock(side_effect=lambda data: TaskFactory.create(name=data["name"]))
+        creator = SimpleCreator(client)
+        tasks = TaskFactory.create_batch(2)
+
+        created = await creator.create_tasks_on_board(tasks, skip_validation=True)
+
+        assert len(created) == 2
+        assert client.create_task.await_count == 2
+        assert creator.last_creation_report["successes"] == 2
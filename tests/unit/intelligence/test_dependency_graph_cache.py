@@ -0,0 +1,154 @@
+"""
+Unit tests for DependencyGraphCache
+"""
+
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+from src.intelligence.dependency_graph_cache import DependencyGraphCache
+from src.intelligence.dependency_inferer import DependencyGraph
+
+
+def make_task(task_id, name=None, status=TaskStatus.TODO, dependencies=None):
+    now = datetime(2024, 1, 1)
+    return Task(
+        id=task_id,
+        name=name or f"Task {task_id}",
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+        dependencies=dependencies or [],
+    )
+
+
+@pytest.fixture
+def inferer():
+    graph = Mock(spec=DependencyGraph)
+    graph.get_critical_path = Mock(return_value=["1", "2"])
+    mock = Mock()
+    mock.infer_dependencies = AsyncMock(return_value=graph)
+    return mock
+
+
+@pytest.fixture
+def tasks():
+    return [
+        make_task("1"),
+        make_task("2", dependencies=["1"]),
+        make_task("3", dependencies=["1"]),
+        make_task("4", status=TaskStatus.DONE, dependencies=["1"]),
+    ]
+
+
+class TestDependencyGraphCache:
+    """Test suite for DependencyGraphCache"""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_board_reuses_graph(self, inferer, tasks):
+        """A second sync with the same board does not re-infer"""
+        cache = DependencyGraphCache(inferer)
+
+        await cache.sync(tasks)
+        version = cache.version
+        await cache.sync(tasks)
+
+        assert inferer.infer_dependencies.await_count == 1
+        assert cache.version == version
+        assert cache.hits == 1
+        assert cache.is_critical("1")
+        assert not cache.is_critical("3")
+
+    @pytest.mark.asyncio
+    async def test_reverse_index_counts_todo_dependents(self, inferer, tasks):
+        """Only TODO tasks count as unblocked"""
+        cache = DependencyGraphCache(inferer)
+        await cache.sync(tasks)
+
+        assert cache.unblocked_count("1") == 2
+        assert cache.dependents_of("1") == {"2", "3", "4"}
+        assert cache.unblocked_count("2") == 0
+
+    @pytest.mark.asyncio
+    async def test_explicit_dependency_change_keeps_graph(self, inferer, tasks):
+        """Editing explicit dependencies only patches the reverse index"""
+        cache = DependencyGraphCache(inferer)
+        await cache.sync(tasks)
+        fingerprint = cache.fingerprint
+
+        tasks[2].dependencies = ["2"]
+        await cache.sync(tasks)
+
+        assert inferer.infer_dependencies.await_count == 1
+        assert cache.fingerprint != fingerprint
+        assert cache.unblocked_count("1") == 1
+        assert cache.unblocked_count("2") == 1
+
+    @pytest.mark.asyncio
+    async def test_status_change_rebuilds_graph(self, inferer, tasks):
+        """Status changes affect inference and the unblocked counts"""
+        cache = DependencyGraphCache(inferer)
+        await cache.sync(tasks)
+
+        tasks[1].status = TaskStatus.IN_PROGRESS
+        await cache.sync(tasks)
+
+        assert inferer.infer_dependencies.await_count == 2
+        assert cache.unblocked_count("1") == 1
+
+    @pytest.mark.asyncio
+    async def test_inference_inputs_rebuild_graph(self, inferer, tasks):
+        """Estimates and creation times feed inference, so they rebuild the graph"""
+        cache = DependencyGraphCache(inferer)
+        await cache.sync(tasks)
+
+        tasks[0].estimated_hours = 8.0
+        await cache.sync(tasks)
+        tasks[1].created_at = datetime(2024, 2, 1)
+        await cache.sync(tasks)
+
+        assert inferer.infer_dependencies.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_removed_task_is_unindexed(self, inferer, tasks):
+        """Tasks missing from the board are dropped from every index"""
+        cache = DependencyGraphCache(inferer)
+        await cache.sync(tasks)
+
+        await cache.sync(tasks[:2])
+
+        assert cache.dependents_of("1") == {"2"}
+        assert cache.unblocked_count("1") == 1
+        assert inferer.infer_dependencies.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_invalidate_and_other_inferer_force_rebuild(self, inferer, tasks):
+        """Explicit invalidation or a different inferer rebuilds the graph"""
+        cache = DependencyGraphCache(inferer)
+        await cache.sync(tasks)
+
+        cache.invalidate(["3"])
+        await cache.sync(tasks)
+        assert inferer.infer_dependencies.await_count == 2
+        assert cache.unblocked_count("1") == 2
+
+        other = Mock()
+        other.infer_dependencies = AsyncMock(return_value=inferer.infer_dependencies.return_value)
+        await cache.sync(tasks, other)
+        assert other.infer_dependencies.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_real_inferer_on_empty_board(self):
+        """An empty board yields an empty critical path"""
+        cache = DependencyGraphCache()
+        graph = await cache.sync([])
+
+        assert graph.nodes == {}
+        assert cache.critical_path == set()
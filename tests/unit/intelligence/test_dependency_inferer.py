@@ -0,0 +1,124 @@
+"""
+Unit tests for DependencyInferer
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+from src.intelligence.dependency_inferer import DependencyGraph, DependencyInferer, InferredDependency
+
+
+def make_task(task_id, name, description="", status=TaskStatus.TODO, created_offset_days=0):
+    created = datetime(2024, 1, 1) + timedelta(days=created_offset_days)
+    return Task(
+        id=task_id,
+        name=name,
+        description=description,
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=created,
+        updated_at=created,
+        due_date=None,
+        estimated_hours=2.0,
+    )
+
+
+@pytest.fixture
+def board():
+    return [
+        make_task("setup", "Setup project repository", "Install and configure tooling"),
+        make_task("design", "Design login flow", "Wireframe and spec"),
+        make_task("impl", "Implement login API", "Build the backend endpoint"),
+        make_task("ui", "Build login UI", "Frontend interface for login"),
+        make_task("test", "Test login", "Verify login works"),
+        make_task("deploy", "Deploy to production", "Release the app"),
+        make_task("authz", "Add role permissions", "Authorization on top of login"),
+        make_task("done-impl", "Implement signup", status=TaskStatus.DONE),
+        make_task("late-setup", "Setup monitoring", created_offset_days=30),
+        make_task("docs", "Write documentation"),
+    ]
+
+
+def pairwise_dependencies(inferer, tasks):
+    """Reference result: every (dependent, dependency, pattern) triple."""
+    dependencies = []
+    for dependent_task in tasks:
+        for dependency_task in tasks:
+            if dependent_task.id == dependency_task.id:
+                continue
+            for pattern in inferer.dependency_patterns:
+                dependency = inferer._check_pattern(dependent_task, dependency_task, pattern)
+                if dependency:
+                    dependencies.append(dependency)
+    return dependencies
+
+
+class TestDependencyInferer:
+    """Test suite for DependencyInferer"""
+
+    def test_indexed_matching_matches_pairwise_check(self, board):
+        """The bucketed matcher yields exactly the pairwise results, in order"""
+        inferer = DependencyInferer()
+
+        indexed = inferer._match_patterns(board)
+        reference = pairwise_dependencies(inferer, board)
+
+        assert indexed == reference
+        assert indexed  # the board does produce dependencies
+
+    def test_matching_respects_logical_checks(self, board):
+        """Done-before-todo and late-created dependencies are rejected"""
+        inferer = DependencyInferer()
+        pairs = {(d.dependent_task_id, d.dependency_task_id) for d in inferer._match_patterns(board)}
+
+        assert ("test", "impl") in pairs
+        assert ("impl", "design") in pairs
+        assert ("test", "done-impl") not in pairs
+        assert ("impl", "late-setup") not in pairs
+        assert not any("docs" in pair for pair in pairs)
+
+    @pytest.mark.asyncio
+    async def test_infer_dependencies_builds_acyclic_graph(self, board):
+        """Inference produces a graph with adjacency lists and no cycles"""
+        graph = await DependencyInferer().infer_dependencies(board)
+
+        assert set(graph.nodes) == {t.id for t in board}
+        assert not graph.has_cycle()
+        assert "impl" in graph.reverse_adjacency["test"]
+
+    def test_resolve_cycles_drops_lowest_confidence_edge(self, board):
+        """A cycle is broken at its weakest edge"""
+        edges = [
+            InferredDependency("b", "a", "hard", 0.9, ""),
+            InferredDependency("c", "b", "soft", 0.6, ""),
+            InferredDependency("a", "c", "hard", 0.8, ""),
+        ]
+        graph = DependencyGraph(
+            nodes={t: board[0] for t in ("a", "b", "c")},
+            edges=list(edges),
+            adjacency_list={"a": ["b"], "b": ["c"], "c": ["a"]},
+            reverse_adjacency={"b": ["a"], "c": ["b"], "a": ["c"]},
+        )
+
+        resolved = DependencyInferer()._resolve_cycles(graph)
+
+        assert not resolved.has_cycle()
+        assert edges[1] not in resolved.edges
+        assert len(resolved.edges) == 2
+
+    def test_transitive_soft_dependency_removed(self):
+        """Soft shortcuts implied by a longer chain are dropped; hard ones kept"""
+        chain = [
+            InferredDependency("b", "a", "hard", 0.9, ""),
+            InferredDependency("c", "b", "hard", 0.9, ""),
+            InferredDependency("c", "a", "soft", 0.7, ""),
+            InferredDependency("c", "a2", "hard", 0.9, ""),
+        ]
+
+        reduced = DependencyInferer()._remove_transitive_dependencies(chain)
+
+        assert chain[2] not in reduced
+        assert chain[3] in reduced
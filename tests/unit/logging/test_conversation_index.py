@@ -0,0 +1,140 @@
+"""
+Unit tests for the conversation log sidecar index and indexed replay
+"""
+
+import json
+import logging
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.logging.conversation_index import IndexedFileHandler, LogFileIndex
+from src.logging.conversation_logger import ConversationLogger, ConversationType
+
+BASE = datetime(2024, 1, 15, 9, 0, tzinfo=timezone.utc)
+
+
+def entry(minute, conversation_type="worker_to_pm", **fields):
+    timestamp = (BASE + timedelta(minutes=minute)).isoformat().replace("+00:00", "Z")
+    return {"conversation_type": conversation_type, "timestamp": timestamp, "minute": minute, **fields}
+
+
+def write_log(path, entries):
+    with open(path, "w", encoding="utf-8") as f:
+        for item in entries:
+            f.write(item if isinstance(item, str) else json.dumps(item))
+            f.write("\n")
+
+
+@pytest.fixture
+def conversation_logger(tmp_path):
+    root = logging.getLogger()
+    level = root.level
+    root.setLevel(logging.DEBUG)
+    logger = ConversationLogger(log_dir=str(tmp_path), index_interval=1.0)
+    yield logger
+    for handler in list(root.handlers):
+        if getattr(handler, "baseFilename", "").startswith(str(tmp_path)):
+            root.removeHandler(handler)
+            handler.close()
+    root.setLevel(level)
+
+
+class TestLogFileIndex:
+    """Test building and using the per-file index"""
+
+    def test_refresh_indexes_complete_lines_only(self, tmp_path):
+        path = tmp_path / "conversations_1.jsonl"
+        write_log(path, [entry(0), "plain text line", entry(1, "decision", confidence_score=0.5)])
+        with open(path, "a") as f:
+            f.write('{"partial": ')
+
+        index = LogFileIndex(path)
+        assert index.refresh()
+
+        assert index.entries == 2
+        assert index.type_counts == {"worker_to_pm": 1, "decision": 1}
+        assert index.confidence_sum == 0.5
+        assert index.indexed_bytes == path.stat().st_size - len('{"partial": ')
+        assert not index.refresh()
+
+    def test_seek_skips_entries_before_window(self, tmp_path):
+        path = tmp_path / "conversations_1.jsonl"
+        write_log(path, [entry(minute) for minute in range(120)])
+        index = LogFileIndex(path, checkpoint_interval=600)
+        index.refresh()
+
+        start = (BASE + timedelta(minutes=65)).timestamp()
+        end = (BASE + timedelta(minutes=70)).timestamp()
+
+        assert index.seek_offset(start) > 0
+        assert [e["minute"] for e in index.iter_entries(start, end)] == list(range(65, 71))
+
+    def test_sidecar_round_trip_and_truncation(self, tmp_path):
+        path = tmp_path / "conversations_1.jsonl"
+        write_log(path, [entry(0), entry(1)])
+        index = LogFileIndex(path)
+        index.refresh()
+        assert index.save()
+
+        loaded = LogFileIndex.load(path)
+        assert loaded.indexed_bytes == index.indexed_bytes
+        assert loaded.checkpoints == index.checkpoints
+
+        write_log(path, [entry(5)])
+        assert loaded.refresh()
+        assert loaded.entries == 1
+        assert loaded.start == loaded.end == (BASE + timedelta(minutes=5)).timestamp()
+
+    def test_handler_indexes_as_it_writes(self, tmp_path):
+        path = tmp_path / "conversations_1.jsonl"
+        handler = IndexedFileHandler(path, save_every=2)
+        log = logging.getLogger("test_conversation_index.handler")
+        log.addHandler(handler)
+        log.propagate = False
+        try:
+            for minute in range(3):
+                log.warning(json.dumps(entry(minute)))
+        finally:
+            log.removeHandler(handler)
+            handler.close()
+
+        assert handler.index.entries == 3
+        assert handler.index.indexed_bytes == path.stat().st_size
+        saved = json.loads((tmp_path / "conversations_1.jsonl.index.json").read_text())
+        assert saved["entries"] == 3
+
+
+class TestConversationReplay:
+    """Test replay and metrics through ConversationLogger"""
+
+    def test_replay_filters_by_window_and_type(self, conversation_logger, tmp_path):
+        write_log(tmp_path / "conversations_20240115_080000.jsonl",
+                  [entry(minute, "decision" if minute % 10 == 0 else "worker_to_pm") for minute in range(60)])
+        write_log(tmp_path / "conversations_20240115_100000.jsonl",
+                  [entry(minute, "decision" if minute % 10 == 0 else "worker_to_pm") for minute in range(60, 120)])
+
+        replay = conversation_logger.iter_conversation_replay(
+            start_time=BASE + timedelta(minutes=50),
+            end_time=BASE + timedelta(minutes=80),
+            filter_type=ConversationType.DECISION
+        )
+
+        assert [e["minute"] for e in replay] == [50, 60, 70, 80]
+        assert (tmp_path / "conversations_20240115_080000.jsonl.index.json").exists()
+
+    def test_logged_entries_are_replayed_and_counted(self, conversation_logger):
+        conversation_logger.log_worker_message("worker_1", "to_pm", "hello")
+        conversation_logger.log_pm_decision("Assign task", "Best match", confidence_score=0.8)
+        conversation_logger.log_pm_decision("Reassign task", "Blocked", confidence_score=0.6)
+        conversation_logger.log_task_assignment("T-1", "worker_1", {}, 0.9)
+        conversation_logger.log_progress_update("worker_1", "T-1", 100, "completed", "done")
+
+        decisions = conversation_logger.get_conversation_replay(filter_type=ConversationType.DECISION)
+        metrics = conversation_logger.export_decision_metrics()
+
+        assert [d["decision"] for d in decisions] == ["Assign task", "Reassign task"]
+        assert metrics["total_decisions"] == 2
+        assert metrics["successful_assignments"] == 1
+        assert metrics["average_confidence_score"] == pytest.approx(0.7)
+        assert metrics["task_completion_rate"] == 1.0
@@ -0,0 +1,182 @@
+"""
+Unit tests for the buffered background log sink
+"""
+
+import json
+import threading
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.logging.log_sink import LogSink
+
+
+@pytest.fixture
+def sink():
+    sink = LogSink(flush_interval=0.01)
+    yield sink
+    sink.close()
+
+
+def read_lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestLogSink:
+    """Test queueing, batching and rotation"""
+
+    def test_records_are_written_in_order(self, sink, tmp_path):
+        first = sink.stream(tmp_path / "a.jsonl")
+        second = sink.stream(tmp_path / "nested" / "b.jsonl")
+
+        for i in range(5):
+            first.write({"n": i})
+            second.write(json.dumps({"n": i}))
+
+        assert sink.flush()
+        assert [r["n"] for r in read_lines(tmp_path / "a.jsonl")] == list(range(5))
+        assert [r["n"] for r in read_lines(tmp_path / "nested" / "b.jsonl")] == list(range(5))
+        assert sink.get_stats()["written"] == 10
+
+    def test_same_path_shares_a_stream(self, sink, tmp_path):
+        assert sink.stream(tmp_path / "a.jsonl") is sink.stream(str(tmp_path / "a.jsonl"))
+
+    def test_dicts_are_serialized_with_str_fallback(self, sink, tmp_path):
+        stream = sink.stream(tmp_path / "a.jsonl")
+
+        stream.write({"when": datetime(2024, 1, 1), "obj": object})
+
+        assert stream.flush()
+        record = read_lines(tmp_path / "a.jsonl")[0]
+        assert record["when"] == "2024-01-01 00:00:00"
+        assert record["obj"] == str(object)
+
+    def test_size_rotation_keeps_backups(self, sink, tmp_path):
+        stream = sink.stream(tmp_path / "events.jsonl", max_bytes=10, backup_count=2)
+
+        for i in range(4):
+            stream.write("x" * 10)
+            assert stream.flush()
+
+        assert (tmp_path / "events.jsonl").exists()
+        assert (tmp_path / "events.jsonl.1").exists()
+        assert (tmp_path / "events.jsonl.2").exists()
+        assert not (tmp_path / "events.jsonl.3").exists()
+        assert [p.name for p in tmp_path.glob("*.jsonl")] == ["events.jsonl"]
+        assert sink.get_stats()["rotations"] == 3
+
+    def test_time_rotation_follows_strftime_path(self, sink, tmp_path):
+        stream = sink.stream(str(tmp_path / "events_%Y%m%d.jsonl"))
+
+        with patch("src.logging.log_sink.datetime") as mock_datetime:
+            mock_datetime.now.return_value = datetime(2024, 1, 1)
+            stream.write({"day": 1})
+            assert stream.flush()
+            mock_datetime.now.return_value = datetime(2024, 1, 2)
+            stream.write({"day": 2})
+            assert stream.flush()
+
+        assert read_lines(tmp_path / "events_20240101.jsonl") == [{"day": 1}]
+        assert read_lines(tmp_path / "events_20240102.jsonl") == [{"day": 2}]
+        assert sink.rotations == 1
+
+    def test_records_are_serialized_when_written(self, sink, tmp_path):
+        stream = sink.stream(tmp_path / "a.jsonl")
+        record = {"n": 1, "tags": ["queued"]}
+
+        assert stream.write(record)
+        record["n"] = 2
+        record["tags"].append("mutated")
+        assert stream.flush()
+
+        assert read_lines(tmp_path / "a.jsonl") == [{"n": 1, "tags": ["queued"]}]
+
+    def test_unserializable_record_is_rejected(self, sink, tmp_path):
+        stream = sink.stream(tmp_path / "a.jsonl")
+        circular = {}
+        circular["self"] = circular
+
+        assert not stream.write(circular)
+        assert sink.write_errors == 1
+        assert sink.get_stats()["enqueued"] == 0
+
+    def test_write_errors_do_not_reach_the_caller(self, sink, tmp_path):
+        stream = sink.stream(tmp_path / "a.jsonl")
+
+        with patch("builtins.open", side_effect=OSError("disk full")):
+            assert stream.write({"n": 1})
+            assert stream.flush()
+
+        assert sink.write_errors == 1
+        stream.write({"n": 2})
+        assert stream.flush()
+        assert read_lines(tmp_path / "a.jsonl") == [{"n": 2}]
+
+    def test_invalid_overflow_policy(self):
+        with pytest.raises(ValueError):
+            LogSink(overflow="explode")
+
+
+class TestOverflowPolicies:
+    """Test behaviour when the queue is full"""
+
+    def blocked_sink(self, tmp_path, **kwargs):
+        """Sink whose writer is stalled so the queue fills up"""
+        sink = LogSink(max_queue=2, batch_size=1, flush_interval=0.01, **kwargs)
+        gate = threading.Event()
+        original = sink._write
+
+        def slow_write(batch):
+            gate.wait(5)
+            original(batch)
+
+        sink._write = slow_write
+        stream = sink.stream(tmp_path / "a.jsonl")
+        stream.write({"n": 0})
+        # Wait for the writer to take record 0 and stall on it
+        for _ in range(500):
+            if not sink._queue:
+                break
+            threading.Event().wait(0.001)
+        return sink, stream, gate
+
+    def test_drop_newest(self, tmp_path):
+        sink, stream, gate = self.blocked_sink(tmp_path)
+        results = [stream.write({"n": i}) for i in range(1, 4)]
+        gate.set()
+        sink.close()
+
+        assert results == [True, True, False]
+        assert [r["n"] for r in read_lines(tmp_path / "a.jsonl")] == [0, 1, 2]
+        assert sink.dropped == 1
+
+    def test_drop_oldest(self, tmp_path):
+        sink, stream, gate = self.blocked_sink(tmp_path, overflow="drop_oldest")
+        results = [stream.write({"n": i}) for i in range(1, 4)]
+        gate.set()
+        sink.close()
+
+        assert results == [True, True, True]
+        assert [r["n"] for r in read_lines(tmp_path / "a.jsonl")] == [0, 2, 3]
+        assert sink.dropped == 1
+
+    def test_block_times_out(self, tmp_path):
+        sink, stream, gate = self.blocked_sink(tmp_path, overflow="block", block_timeout=0.05)
+        results = [stream.write({"n": i}) for i in range(1, 4)]
+        gate.set()
+        sink.close()
+
+        assert results == [True, True, False]
+        assert sink.dropped == 1
+
+    def test_block_waits_for_room(self, tmp_path):
+        sink, stream, gate = self.blocked_sink(tmp_path, overflow="block", block_timeout=5)
+        stream.write({"n": 1})
+        stream.write({"n": 2})
+        threading.Timer(0.05, gate.set).start()
+
+        assert stream.write({"n": 3})
+        sink.close()
+        assert [r["n"] for r in read_lines(tmp_path / "a.jsonl")] == [0, 1, 2, 3]
+        assert sink.dropped == 0
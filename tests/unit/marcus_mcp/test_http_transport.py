@@ -0,0 +1,94 @@
+"""
+Unit tests for serving Marcus to many agents over HTTP
+"""
+
+import asyncio
+import json
+import socket
+from unittest.mock import mock_open, patch
+
+import pytest
+
+from src.marcus_mcp.http_transport import serve_http
+from src.marcus_mcp.server import MarcusServer
+from src.worker.mcp_client import WorkerMCPClient
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_for_port(port, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.close()
+            return
+        except OSError:
+            if loop.time() > deadline:
+                raise
+            await asyncio.sleep(0.05)
+
+
+class TestHTTPTransport:
+    """Test one shared server answering several agents"""
+
+    @pytest.fixture
+    def server(self):
+        """Create test server"""
+        with patch('src.marcus_mcp.server.get_config') as mock_config:
+            mock_config.return_value = {'kanban': {'provider': 'planka'}}
+            with patch('builtins.open', mock_open()):
+                with patch('src.marcus_mcp.server.Path.mkdir'):
+                    return MarcusServer()
+
+    @pytest.fixture
+    async def server_url(self, server):
+        port = free_port()
+        serving = asyncio.create_task(serve_http(server.server, "127.0.0.1", port))
+        await wait_for_port(port)
+        yield f"http://127.0.0.1:{port}"
+        serving.cancel()
+        try:
+            await serving
+        except (asyncio.CancelledError, Exception):
+            pass
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("endpoint", ["/mcp", "/sse"])
+    async def test_agents_share_server_state(self, server, server_url, endpoint):
+        """An agent registered over one connection is visible to another"""
+        first = WorkerMCPClient(server_url + endpoint)
+        second = WorkerMCPClient(server_url + endpoint)
+
+        async with first.connect_to_marcus():
+            result = await first.register_agent("agent-1", "Agent One", "Developer", ["python"])
+            assert result["success"] is True
+
+            async with second.connect_to_marcus() as session:
+                response = await session.call_tool("get_agent_status", {"agent_id": "agent-1"})
+                status = json.loads(response.content[0].text)
+
+        assert status["success"] is True
+        assert "agent-1" in server.agent_status
+
+    @pytest.mark.asyncio
+    async def test_unknown_transport(self, server):
+        with pytest.raises(ValueError):
+            await server.run(transport="carrier-pigeon")
+
+
+class TestWorkerTransportSelection:
+    """Test which transport the worker client opens"""
+
+    def test_stdio_by_default(self, monkeypatch):
+        monkeypatch.delenv("MARCUS_SERVER_URL", raising=False)
+        assert WorkerMCPClient().server_url is None
+
+    def test_server_url_from_environment(self, monkeypatch):
+        monkeypatch.setenv("MARCUS_SERVER_URL", "http://127.0.0.1:8000/mcp")
+        assert WorkerMCPClient().server_url == "http://127.0.0.1:8000/mcp"
@@ -0,0 +1,148 @@
+"""
+Unit tests for single-pass MCP response serialization
+"""
+
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.models import (
+    Priority,
+    ProjectState,
+    RiskLevel,
+    Task,
+    TaskAssignment,
+    TaskStatus,
+    WorkerStatus,
+)
+from src.marcus_mcp.handlers import handle_tool_call
+from src.marcus_mcp.utils import (
+    MarcusJSONEncoder,
+    encode_mcp_response,
+    serialize_for_mcp,
+    to_json_native,
+)
+
+
+def round_trip(data):
+    """The encode/decode round trip serialize_for_mcp used to do"""
+    return json.loads(json.dumps(data, cls=MarcusJSONEncoder))
+
+
+@pytest.fixture
+def task():
+    return Task(
+        id="task-1",
+        name="Build API",
+        description="REST endpoints",
+        status=TaskStatus.IN_PROGRESS,
+        priority=Priority.HIGH,
+        assigned_to="agent-1",
+        created_at=datetime(2024, 1, 1, 9, 30),
+        updated_at=datetime(2024, 1, 2, 10, 0, 0, 123456),
+        due_date=None,
+        estimated_hours=4.0,
+        dependencies=["task-0"],
+        labels=["backend"],
+    )
+
+
+@pytest.fixture
+def payload(task):
+    worker = WorkerStatus(
+        worker_id="agent-1",
+        name="Agent 1",
+        role="Backend",
+        email=None,
+        current_tasks=[task],
+        completed_tasks_count=3,
+        capacity=40,
+        skills=["python"],
+        availability={"monday": True},
+    )
+    assignment = TaskAssignment(
+        task_id=task.id,
+        task_name=task.name,
+        description=task.description,
+        instructions="Do it",
+        estimated_hours=4.0,
+        priority=Priority.HIGH,
+        dependencies=[],
+        assigned_to="agent-1",
+        assigned_at=datetime(2024, 1, 1, 12, 0),
+        due_date=datetime(2024, 1, 5),
+    )
+    project = ProjectState(
+        board_id="board",
+        project_name="Project",
+        total_tasks=1,
+        completed_tasks=0,
+        in_progress_tasks=1,
+        blocked_tasks=0,
+        progress_percent=0.0,
+        overdue_tasks=[task],
+        team_velocity=1.5,
+        risk_level=RiskLevel.LOW,
+        last_updated=datetime(2024, 1, 3),
+    )
+    return {
+        "success": True,
+        "tasks": [task],
+        "workers": {"agent-1": worker},
+        "assignment": assignment,
+        "project": project,
+        "counts": {1: 2, None: 0, False: 1, 2.5: 3},
+        "tuple": (Priority.LOW, "x"),
+    }
+
+
+class TestToJsonNative:
+    """Test the single-walk conversion"""
+
+    def test_matches_encoder_round_trip(self, payload):
+        assert to_json_native(payload) == round_trip(payload)
+
+    def test_serialize_does_not_encode(self, payload):
+        with patch("src.marcus_mcp.utils.json.dumps") as dumps, \
+                patch("src.marcus_mcp.utils.json.loads") as loads:
+            serialize_for_mcp(payload)
+
+        dumps.assert_not_called()
+        loads.assert_not_called()
+
+    def test_plain_objects_use_their_fields(self):
+        class Point:
+            def __init__(self):
+                self.x = 1
+                self.when = datetime(2024, 1, 1)
+
+        assert to_json_native({"p": Point()}) == {"p": {"x": 1, "when": "2024-01-01T00:00:00"}}
+
+    def test_unserializable_values_raise(self):
+        with pytest.raises(TypeError):
+            to_json_native({"s": {1, 2}})
+
+
+class TestEncodeMcpResponse:
+    """Test one-shot encoding of tool results"""
+
+    def test_encodes_models_directly(self, payload):
+        assert json.loads(encode_mcp_response(payload)) == round_trip(payload)
+
+    def test_json_fallback_matches(self, payload):
+        with patch("src.marcus_mcp.utils.orjson", None):
+            text = encode_mcp_response(payload)
+
+        assert text == json.dumps(round_trip(payload), indent=2)
+
+    def test_compact_output(self):
+        assert encode_mcp_response({"a": [1, 2]}, indent=None) == '{"a":[1,2]}'
+
+    @pytest.mark.asyncio
+    async def test_tool_results_with_models_are_encoded(self, task):
+        with patch("src.marcus_mcp.handlers.ping", AsyncMock(return_value={"task": task})):
+            content = await handle_tool_call("ping", {}, state=None)
+
+        assert json.loads(content[0].text)["task"]["status"] == "in_progress"
@@ -20,6 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
 
 import mcp.types as types
 from src.marcus_mcp.server import MarcusServer
+from src.logging.log_sink import LogStream
 from src.core.models import (
     Task, TaskStatus, Priority, RiskLevel,
     ProjectState, WorkerStatus, TaskAssignment
@@ -82,9 +83,10 @@ class TestMarcusServerInitialization:
         assert server.project_tasks == []
         assert server.assignment_monitor is None
         
-        # Verify log file creation (at least once)
+        # Verify log directory creation; the file is opened by the log sink
         assert mock_mkdir.called
-        assert mock_file.called
+        assert isinstance(server.realtime_log, LogStream)
+        assert 'realtime_' in str(server.realtime_log.path)
     
     @patch('src.marcus_mcp.server.get_config')
     @patch('builtins.open', new_callable=mock_open)
@@ -363,6 +365,28 @@ class TestProjectStateRefresh:
         assert server.project_state.board_id == 'test-board-id'
         assert server.project_state.risk_level == RiskLevel.LOW
     
+    @pytest.mark.asyncio
+    async def test_refresh_project_state_uses_fresh_snapshot(self, server):
+        """Test that a fresh board snapshot avoids re-fetching the board"""
+        server.kanban_client.get_all_tasks.return_value = [
+            Mock(id='task-1', status=TaskStatus.TODO, assigned_to=None),
+            Mock(id='task-2', status=TaskStatus.TODO, assigned_to=None),
+        ]
+        
+        await server.refresh_project_state()
+        server.record_task_update('task-1', {
+            "status": TaskStatus.IN_PROGRESS,
+            "assigned_to": "agent-1"
+        })
+        await server.refresh_project_state()
+        
+        assert server.kanban_client.get_all_tasks.call_count == 1
+        assert server.project_state.in_progress_tasks == 1
+        
+        # Forcing or invalidating goes back to the board
+        await server.refresh_project_state(force=True)
+        assert server.kanban_client.get_all_tasks.call_count == 2
+    
     @pytest.mark.asyncio
     async def test_refresh_project_state_no_tasks(self, server):
         """Test project state refresh with no tasks"""
@@ -444,6 +468,7 @@ class TestMCPHandlers:
         assert data['status'] == 'online'
         assert data['echo'] == 'test'
         assert data['success'] is True
+        assert data['event_loop_lag']['samples'] == 0
 
 
 class TestServerRunMethod:
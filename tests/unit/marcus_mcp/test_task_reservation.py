@@ -0,0 +1,172 @@
+"""
+Unit tests for optimistic task reservation in request_next_task
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.board_snapshot import BoardSnapshot
+from src.core.models import Priority, Task, TaskStatus, WorkerStatus
+from src.marcus_mcp.tools.task_tools import (
+    find_optimal_task_for_agent,
+    reserve_first_available,
+    reserve_task,
+)
+
+
+def create_task(task_id: str, priority: Priority = Priority.MEDIUM) -> Task:
+    now = datetime.now()
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=TaskStatus.TODO,
+        priority=priority,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=1.0,
+    )
+
+
+@pytest.fixture
+def tasks():
+    return [create_task("task-1", Priority.HIGH), create_task("task-2"), create_task("task-3", Priority.LOW)]
+
+
+@pytest.fixture
+def state(tasks):
+    """Minimal server state for the assignment helpers"""
+    agents = {
+        agent_id: WorkerStatus(
+            worker_id=agent_id,
+            name=agent_id,
+            role="Developer",
+            email=None,
+            current_tasks=[],
+            completed_tasks_count=0,
+            capacity=40,
+            skills=["python"],
+            availability={},
+            performance_score=1.0,
+        )
+        for agent_id in ("agent-1", "agent-2", "agent-3")
+    }
+    persisted_ids = set()
+    persistence = SimpleNamespace(
+        get_all_assigned_task_ids=AsyncMock(side_effect=lambda: set(persisted_ids)),
+        is_task_assigned=AsyncMock(side_effect=lambda task_id: task_id in persisted_ids),
+        persisted_ids=persisted_ids,
+    )
+    board_snapshot = SimpleNamespace(
+        tasks_with_status=lambda status: [t for t in tasks if t.status == status],
+        get=lambda task_id: next((t for t in tasks if t.id == task_id), None),
+    )
+    return SimpleNamespace(
+        agent_status=agents,
+        agent_tasks={},
+        project_state=object(),
+        project_tasks=tasks,
+        board_snapshot=board_snapshot,
+        assignment_persistence=persistence,
+        assignment_lock=asyncio.Lock(),
+        tasks_being_assigned=set(),
+        ai_engine=object(),
+    )
+
+
+class TestReserveTask:
+    """Test the compare-and-set reservation"""
+
+    @pytest.mark.asyncio
+    async def test_second_reservation_fails(self, state):
+        assert await reserve_task("task-1", state) is True
+        assert await reserve_task("task-1", state) is False
+        assert state.tasks_being_assigned == {"task-1"}
+
+    @pytest.mark.asyncio
+    async def test_assigned_task_cannot_be_reserved(self, state):
+        state.agent_tasks["agent-1"] = SimpleNamespace(task_id="task-2")
+        assert await reserve_task("task-2", state) is False
+
+    @pytest.mark.asyncio
+    async def test_task_no_longer_todo_cannot_be_reserved(self, state, tasks):
+        tasks[0].status = TaskStatus.IN_PROGRESS
+        assert await reserve_task("task-1", state) is False
+        assert await reserve_task("task-missing", state) is False
+        assert state.tasks_being_assigned == set()
+
+    @pytest.mark.asyncio
+    async def test_persisted_assignment_cannot_be_reserved(self, state, tasks):
+        state.assignment_persistence.persisted_ids.add("task-1")
+        assert await reserve_task("task-1", state) is False
+        task = await reserve_first_available(tasks, state)
+        assert task.id == "task-2"
+
+    @pytest.mark.asyncio
+    async def test_next_candidate_after_lost_race(self, state, tasks):
+        state.tasks_being_assigned.add("task-1")
+        task = await reserve_first_available(tasks, state)
+        assert task.id == "task-2"
+
+
+class TestConcurrentAssignment:
+    """Test that scoring runs outside the assignment lock"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_score_in_parallel(self, state, tasks):
+        """Agents scoring the same snapshot all get distinct tasks"""
+        in_flight = 0
+        peak = 0
+
+        async def rank(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            # Every agent prefers the same tasks in the same order
+            return list(kwargs["available_tasks"])
+
+        with patch(
+            "src.marcus_mcp.tools.task_tools.rank_tasks_for_agent_ai_powered",
+            side_effect=rank,
+        ):
+            chosen = await asyncio.gather(
+                *(find_optimal_task_for_agent(agent_id, state) for agent_id in state.agent_status)
+            )
+
+        assert peak == 3
+        assert sorted(t.id for t in chosen) == ["task-1", "task-2", "task-3"]
+        assert state.tasks_being_assigned == {"task-1", "task-2", "task-3"}
+
+    @pytest.mark.asyncio
+    async def test_basic_fallback_reserves(self, state):
+        with patch(
+            "src.marcus_mcp.tools.task_tools.rank_tasks_for_agent_ai_powered",
+            AsyncMock(side_effect=RuntimeError("AI down")),
+        ):
+            task = await find_optimal_task_for_agent("agent-1", state)
+
+        assert task.id == "task-1"
+        assert "task-1" in state.tasks_being_assigned
+
+    @pytest.mark.asyncio
+    async def test_equal_scores_keep_board_order(self, state):
+        """Ties are broken by board order, whatever the hash seed"""
+        board = [create_task(f"task-{n}") for n in (17, 3, 42, 8, 25, 11, 30, 1, 19, 6)]
+        state.board_snapshot = BoardSnapshot()
+        state.board_snapshot.reconcile(board)
+
+        with patch(
+            "src.marcus_mcp.tools.task_tools.rank_tasks_for_agent_ai_powered",
+            AsyncMock(side_effect=RuntimeError("AI down")),
+        ):
+            chosen = [await find_optimal_task_for_agent("agent-1", state) for _ in range(3)]
+
+        assert [t.id for t in chosen] == ["task-17", "task-3", "task-42"]
@@ -0,0 +1,88 @@
+"""
+Unit tests for BasicAdaptiveMode dependency and logical blocking checks
+"""
+
+from datetime import datetime
+from typing import List
+
+import pytest
+
+from src.core.models import Priority, Task, TaskStatus
+from src.modes.adaptive.basic_adaptive import BasicAdaptiveMode
+
+
+def create_task(task_id: str, name: str, status: TaskStatus = TaskStatus.TODO,
+                dependencies: List[str] = None) -> Task:
+    now = datetime.now()
+    return Task(
+        id=task_id,
+        name=name,
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=None,
+        created_at=now,
+        updated_at=now,
+        due_date=None,
+        estimated_hours=4.0,
+        dependencies=dependencies or [],
+    )
+
+
+class TestUnblockChecks:
+    """Test the indexed unblock decisions"""
+
+    @pytest.fixture
+    def mode(self):
+        return BasicAdaptiveMode()
+
+    @pytest.mark.asyncio
+    async def test_incomplete_explicit_dependency_blocks(self, mode):
+        tasks = [
+            create_task("1", "Write docs"),
+            create_task("2", "Review docs", dependencies=["1"]),
+            create_task("3", "Proofread docs", dependencies=["missing"]),
+        ]
+
+        unblocked = await mode._filter_unblocked_tasks(tasks, {})
+
+        assert [t.id for t in unblocked] == ["1", "3"]
+
+    @pytest.mark.asyncio
+    async def test_deploy_waits_for_implementation(self, mode):
+        tasks = [
+            create_task("1", "Implement payments"),
+            create_task("2", "Deploy payments"),
+        ]
+        assert await mode._is_task_unblocked(tasks[1], tasks, {}) is False
+
+        tasks[0].status = TaskStatus.DONE
+        assert await mode._is_task_unblocked(tasks[1], tasks, {}) is True
+
+    @pytest.mark.asyncio
+    async def test_test_task_waits_for_related_implementation_only(self, mode):
+        tasks = [
+            create_task("1", "Build search page", status=TaskStatus.DONE),
+            create_task("2", "Build billing page", status=TaskStatus.IN_PROGRESS),
+            create_task("3", "QA search page"),
+        ]
+        # Sharing one of three name words is enough to relate the tasks
+        assert await mode._is_obviously_illogical(tasks[2], tasks) is True
+
+        tasks[1].name = "Build billing export"
+        assert await mode._is_obviously_illogical(tasks[2], tasks) is False
+
+    @pytest.mark.asyncio
+    async def test_blocking_analysis_lists_blockers(self, mode):
+        tasks = [
+            create_task("1", "Setup database"),
+            create_task("2", "Implement api", dependencies=["1"]),
+        ]
+
+        analysis = await mode.get_blocking_analysis(tasks)
+
+        blocked = {entry["task_id"]: entry for entry in analysis["blocked_tasks"]}
+        assert [b["type"] for b in blocked["2"]["blocked_by"]] == [
+            "explicit_dependency", "logical_dependency"
+        ]
+        assert [r["task_id"] for r in analysis["ready_tasks"]] == ["1"]
@@ -0,0 +1,49 @@
+"""
+Unit tests for EventLoopLagMonitor
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.monitoring.event_loop_monitor import EventLoopLagMonitor
+
+
+class TestEventLoopLagMonitor:
+    """Test suite for EventLoopLagMonitor"""
+
+    def test_stats_without_samples(self):
+        """A fresh monitor reports zero lag"""
+        stats = EventLoopLagMonitor().get_stats()
+
+        assert stats["samples"] == 0
+        assert stats["max_lag_ms"] == 0
+
+    def test_record_tracks_window_and_slow_samples(self):
+        """Samples are summarised in milliseconds; slow ones are counted"""
+        monitor = EventLoopLagMonitor(window=3, warn_threshold=0.1)
+        for lag in (0.001, 0.002, 0.5, 0.003):
+            monitor.record(lag)
+
+        stats = monitor.get_stats()
+        assert stats["samples"] == 4
+        assert stats["slow_samples"] == 1
+        assert stats["max_lag_ms"] == 500.0
+        assert stats["current_lag_ms"] == 3.0
+        assert stats["p95_lag_ms"] == 500.0
+
+    @pytest.mark.asyncio
+    async def test_detects_blocking_call(self):
+        """A synchronous sleep on the loop shows up as lag"""
+        monitor = EventLoopLagMonitor(interval=0.01)
+        await monitor.start()
+        await asyncio.sleep(0.03)
+
+        time.sleep(0.1)  # blocks the event loop
+        await asyncio.sleep(0.03)
+        await monitor.stop()
+
+        stats = monitor.get_stats()
+        assert stats["max_lag_ms"] >= 50
+        assert not monitor.is_running
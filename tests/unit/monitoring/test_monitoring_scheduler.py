@@ -0,0 +1,243 @@
+"""
+Unit tests for the shared monitoring scheduler
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.core.board_snapshot import BoardSnapshot
+from src.core.models import Priority, RiskLevel, Task, TaskStatus
+from src.monitoring.assignment_monitor import AssignmentHealthChecker, AssignmentMonitor
+from src.monitoring.monitoring_scheduler import BoardView, MonitoringScheduler
+from src.monitoring.project_monitor import ProjectMonitor
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+def make_task(task_id, status, assigned_to=None, updated_hours_ago=1, due_in_hours=None, dependencies=None):
+    return Task(
+        id=task_id,
+        name=f"Task {task_id}",
+        description="",
+        status=status,
+        priority=Priority.MEDIUM,
+        assigned_to=assigned_to,
+        created_at=NOW - timedelta(days=10),
+        updated_at=NOW - timedelta(hours=updated_hours_ago),
+        due_date=NOW + timedelta(hours=due_in_hours) if due_in_hours is not None else None,
+        estimated_hours=1.0,
+        dependencies=dependencies or []
+    )
+
+
+@pytest.fixture
+def board():
+    return [
+        make_task("todo", TaskStatus.TODO, due_in_hours=-5),
+        make_task("wip", TaskStatus.IN_PROGRESS, assigned_to="agent-1", updated_hours_ago=2),
+        make_task("stalled", TaskStatus.IN_PROGRESS, assigned_to="agent-2", updated_hours_ago=30),
+        make_task("blocked", TaskStatus.BLOCKED),
+        make_task("done-recent", TaskStatus.DONE, updated_hours_ago=24, due_in_hours=-48),
+        make_task("done-old", TaskStatus.DONE, updated_hours_ago=24 * 10),
+    ] + [
+        make_task(f"dep-{n}", TaskStatus.TODO, dependencies=["blocked"]) for n in range(3)
+    ]
+
+
+class TestBoardView:
+    """Test the single-pass board aggregates"""
+
+    def test_aggregates(self, board):
+        view = BoardView.build(board, now=NOW)
+
+        assert view.count() == 9
+        assert view.count(TaskStatus.IN_PROGRESS) == 2
+        assert view.count(TaskStatus.TODO) == 4
+        # Done tasks are never overdue or stalled
+        assert [t.id for t in view.overdue_tasks] == ["todo"]
+        assert [t.id for t in view.stalled_tasks] == ["stalled"]
+        assert view.completed_recently == 1
+        assert view.dependents["blocked"] == ["dep-0", "dep-1", "dep-2"]
+        assert view.task_map["wip"].assigned_to == "agent-1"
+
+    def test_stall_threshold(self, board):
+        view = BoardView.build(board, now=NOW, stall_threshold=timedelta(hours=1))
+
+        assert {t.id for t in view.stalled_tasks} == {"wip", "stalled"}
+
+    def test_timezone_aware_tasks(self, board):
+        """Aware datetimes from GitHub or Linear compare with naive ones"""
+        for task in board:
+            if task.id in ("stalled", "done-recent"):
+                task.updated_at = task.updated_at.astimezone(timezone.utc)
+            if task.id == "todo":
+                task.due_date = task.due_date.astimezone(timezone.utc)
+
+        naive_now = BoardView.build(board, now=NOW)
+        aware_now = BoardView.build(board, now=NOW.astimezone(timezone.utc))
+
+        for view in (naive_now, aware_now):
+            assert [t.id for t in view.overdue_tasks] == ["todo"]
+            assert [t.id for t in view.stalled_tasks] == ["stalled"]
+            assert view.completed_recently == 1
+
+
+class TestMonitoringScheduler:
+    """Test one fetch per tick shared by every check"""
+
+    @pytest.mark.asyncio
+    async def test_one_fetch_shared_by_all_checks(self, board):
+        fetch = AsyncMock(return_value=board)
+        snapshot = BoardSnapshot()
+        scheduler = MonitoringScheduler(fetch, board_snapshot=snapshot)
+        seen = []
+        for name in ("a", "b", "c"):
+            scheduler.register(name, AsyncMock(side_effect=seen.append))
+
+        view = await scheduler.run_once()
+
+        fetch.assert_awaited_once()
+        assert seen == [view, view, view]
+        assert len(snapshot) == 9
+        assert len(view.changes["added"]) == 9
+        assert scheduler.latest_tasks() == board
+
+    @pytest.mark.asyncio
+    async def test_min_interval(self, board):
+        scheduler = MonitoringScheduler(AsyncMock(return_value=board))
+        frequent, slow = AsyncMock(), AsyncMock()
+        scheduler.register("frequent", frequent)
+        scheduler.register("slow", slow, min_interval=60)
+
+        for _ in range(3):
+            await scheduler.run_once()
+
+        assert frequent.await_count == 3
+        assert slow.await_count == 1
+        assert scheduler.get_stats()["board_fetches"] == 3
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated(self, board):
+        scheduler = MonitoringScheduler(AsyncMock(side_effect=[RuntimeError("down"), board]))
+        failing, healthy = AsyncMock(side_effect=ValueError("bad check")), AsyncMock()
+        scheduler.register("failing", failing)
+        scheduler.register("healthy", healthy)
+
+        # A failed fetch skips the checks rather than running them on stale data
+        assert await scheduler.run_once() is None
+        healthy.assert_not_awaited()
+
+        await scheduler.run_once()
+
+        healthy.assert_awaited_once()
+        stats = scheduler.get_stats()
+        assert stats["fetch_errors"] == 1
+        assert stats["checks"]["failing"]["errors"] == 1
+        assert stats["checks"]["failing"]["last_error"] == "bad check"
+
+    @pytest.mark.asyncio
+    async def test_loop_survives_a_failing_tick(self, board):
+        scheduler = MonitoringScheduler(AsyncMock(return_value=board), interval=0)
+        ticked = asyncio.Event()
+        ticks = 0
+
+        async def run_once():
+            nonlocal ticks
+            ticks += 1
+            if ticks == 1:
+                raise RuntimeError("snapshot reconcile failed")
+            ticked.set()
+
+        with patch.object(scheduler, "run_once", side_effect=run_once):
+            await scheduler.start()
+            await asyncio.wait_for(ticked.wait(), timeout=1)
+            await scheduler.stop()
+
+        assert ticks >= 2
+
+    def test_stale_view_is_not_shared(self, board):
+        scheduler = MonitoringScheduler(AsyncMock(), interval=10)
+        scheduler.latest_view = BoardView.build(board, now=datetime.now() - timedelta(seconds=60))
+
+        assert scheduler.latest_tasks() is None
+        assert scheduler.latest_tasks(max_age=120) is not None
+
+
+class TestMonitorsOnSharedSnapshots:
+    """Test that monitors use the scheduler's snapshot instead of fetching"""
+
+    @pytest.mark.asyncio
+    async def test_assignment_monitor_checks_shared_view(self, board):
+        kanban = Mock()
+        kanban.get_all_tasks = AsyncMock()
+        persistence = Mock()
+        persistence.load_assignments = AsyncMock(return_value={
+            "agent-1": {"task_id": "wip"},
+            "agent-3": {"task_id": "todo"},
+        })
+        persistence.remove_assignment = AsyncMock()
+        scheduler = MonitoringScheduler(AsyncMock(return_value=board))
+        monitor = AssignmentMonitor(persistence, kanban, scheduler=scheduler)
+
+        await monitor.start()
+        await scheduler.run_once()
+
+        kanban.get_all_tasks.assert_not_awaited()
+        # The task assigned to agent-3 was reverted to TODO
+        persistence.remove_assignment.assert_awaited_once_with("agent-3")
+        assert monitor._monitor_task is None
+
+        health = await AssignmentHealthChecker(persistence, kanban, monitor).check_assignment_health()
+        kanban.get_all_tasks.assert_not_awaited()
+        assert health["metrics"]["in_progress_tasks"] == 2
+
+        await monitor.stop()
+        assert "assignment_monitor" not in scheduler.get_stats()["checks"]
+
+    @pytest.mark.asyncio
+    async def test_project_monitor_cycle_uses_view(self, board):
+        with patch("src.monitoring.project_monitor.AIAnalysisEngine"):
+            monitor = ProjectMonitor()
+        monitor.kanban_client = Mock()
+        monitor.kanban_client.board_id = "board-1"
+        monitor.kanban_client.get_board_summary = AsyncMock(return_value={"name": "Demo"})
+        monitor._get_all_tasks = AsyncMock()
+
+        view = BoardView.build(board, now=NOW)
+        await monitor.run_cycle(view, analyze=False)
+
+        monitor._get_all_tasks.assert_not_awaited()
+        state = monitor.current_state
+        assert state.project_name == "Demo"
+        assert (state.total_tasks, state.completed_tasks, state.in_progress_tasks, state.blocked_tasks) == (9, 2, 2, 1)
+        assert [t.id for t in state.overdue_tasks] == ["todo"]
+        assert state.team_velocity == 1
+        assert {r.risk_type for r in monitor.risks} == {"stalled_task", "dependency"}
+        assert monitor.historical_data[-1]["total_tasks"] == 9
+
+        # The board summary is only fetched once for the project name
+        await monitor.run_cycle(view, analyze=False)
+        monitor.kanban_client.get_board_summary.assert_awaited_once()
+        assert len(monitor.risks) == 2
+
+    @pytest.mark.asyncio
+    async def test_project_state_follows_latest_view(self, board):
+        with patch("src.monitoring.project_monitor.AIAnalysisEngine"):
+            monitor = ProjectMonitor()
+        monitor.kanban_client = Mock(board_id="board-1")
+        monitor.kanban_client.get_board_summary = AsyncMock(return_value={})
+        monitor._get_all_tasks = AsyncMock()
+        scheduler = MonitoringScheduler(AsyncMock(return_value=board))
+        monitor.attach(scheduler, analyze=False)
+
+        await scheduler.run_once()
+        board.append(make_task("new", TaskStatus.DONE))
+        await scheduler.run_once()
+        state = await monitor.get_project_state()
+
+        monitor._get_all_tasks.assert_not_awaited()
+        assert state.total_tasks == 10
+        assert state.risk_level in RiskLevel
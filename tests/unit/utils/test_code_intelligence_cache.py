@@ -0,0 +1,111 @@
+"""
+Unit tests for the code intelligence cache
+"""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.code_intelligence_cache import CodeIntelligenceCache, make_blob_key
+
+
+class TestBlobKey:
+    """Test keys of extracted files"""
+
+    def test_every_part_is_part_of_the_key(self):
+        base = make_blob_key("owner/repo", "api/users.py", "abc123", "v1")
+        assert make_blob_key("owner/other", "api/users.py", "abc123", "v1") != base
+        assert make_blob_key("owner/repo", "api/items.py", "abc123", "v1") != base
+        assert make_blob_key("owner/repo", "api/users.py", "def456", "v1") != base
+        assert make_blob_key("owner/repo", "api/users.py", "abc123", "v2") != base
+
+    def test_repo_case_is_ignored(self):
+        assert make_blob_key("Owner/Repo", "a.py", "sha") == make_blob_key("owner/repo", "a.py", "sha")
+
+
+class TestCodeIntelligenceCache:
+    """Test memory and disk tiers"""
+
+    def test_miss_then_hit(self):
+        cache = CodeIntelligenceCache()
+        assert cache.get("key") is None
+
+        cache.set("key", {"endpoints": [{"path": "/users"}], "models": []})
+
+        assert cache.get("key") == {"endpoints": [{"path": "/users"}], "models": []}
+        assert cache.get_stats()["hits"] == 1
+        assert cache.get_stats()["misses"] == 1
+
+    def test_returned_values_are_copies(self):
+        cache = CodeIntelligenceCache()
+        cache.set("key", {"endpoints": []})
+
+        cache.get("key")["endpoints"].append("mutated")
+
+        assert cache.get("key") == {"endpoints": []}
+
+    def test_lru_eviction(self):
+        cache = CodeIntelligenceCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        db_path = str(tmp_path / "code.sqlite")
+        first = CodeIntelligenceCache(db_path=db_path)
+        first.set("key", {"models": [{"name": "User"}]})
+        first.close()
+
+        second = CodeIntelligenceCache(db_path=db_path)
+
+        assert second.get("key") == {"models": [{"name": "User"}]}
+        assert second.get_stats()["disk_hits"] == 1
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_async_disk_access_runs_off_the_loop(self, tmp_path):
+        db_path = str(tmp_path / "code.sqlite")
+        cache = CodeIntelligenceCache(db_path=db_path)
+        loop_thread = threading.get_ident()
+        disk_threads = []
+        disk_get = cache._disk_get
+
+        def record_disk_get(*args):
+            disk_threads.append(threading.get_ident())
+            return disk_get(*args)
+
+        await cache.aset("key", {"endpoints": [{"path": "/users"}]})
+        cache.close()
+
+        restarted = CodeIntelligenceCache(db_path=db_path)
+        with patch.object(restarted, "_disk_get", side_effect=record_disk_get):
+            assert await restarted.aget("key") == {"endpoints": [{"path": "/users"}]}
+            assert await restarted.aget("key") == {"endpoints": [{"path": "/users"}]}
+            assert await restarted.aget("missing") is None
+
+        assert restarted.get_stats()["disk_hits"] == 1
+        assert restarted.get_stats()["memory_hits"] == 1
+        assert len(disk_threads) == 2 and loop_thread not in disk_threads
+        restarted.close()
+
+    def test_disabled_cache_never_hits(self):
+        cache = CodeIntelligenceCache(enabled=False)
+        cache.set("key", 1)
+        assert cache.get("key") is None
+
+    def test_from_config(self, tmp_path):
+        values = {
+            'github.code_cache.max_entries': 10,
+            'github.code_cache.path': str(tmp_path / "code.sqlite"),
+        }
+        cache = CodeIntelligenceCache.from_config(type("Config", (), {"get": lambda self, k, d=None: values.get(k, d)})())
+
+        assert cache.max_entries == 10
+        assert cache.db_path == str(tmp_path / "code.sqlite")
+        assert cache.enabled is True
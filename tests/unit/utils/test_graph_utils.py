@@ -0,0 +1,115 @@
+"""
+Unit tests for graph utilities
+"""
+
+import random
+from collections import defaultdict
+
+import pytest
+
+from src.utils.graph_utils import (
+    Reachability,
+    find_cycle,
+    strongly_connected_components,
+    transitive_reduction,
+)
+
+
+def path_search_reduction(edges, keep):
+    """Reference: the per-edge, per-intermediate path search it replaces."""
+    adjacency = defaultdict(set)
+    for source, target in edges:
+        adjacency[source].add(target)
+
+    def reaches(start, end, visited):
+        if start == end:
+            return True
+        if start in visited:
+            return False
+        visited.add(start)
+        return any(reaches(n, end, set(visited)) for n in adjacency[start])
+
+    nodes = {n for edge in edges for n in edge}
+    reduced = []
+    for source, target in edges:
+        indirect = any(
+            reaches(source, w, set()) and reaches(w, target, set())
+            for w in nodes if w not in (source, target)
+        )
+        if not indirect or keep((source, target)):
+            reduced.append((source, target))
+    return reduced
+
+
+class TestTransitiveReduction:
+    """Test transitive reduction"""
+
+    def test_chain_shortcut_removed(self):
+        """A -> C is dropped when A -> B -> C exists"""
+        edges = [("a", "b"), ("b", "c"), ("a", "c")]
+        assert transitive_reduction(edges, edge=lambda e: e) == [("a", "b"), ("b", "c")]
+
+    def test_kept_edges_survive(self):
+        """Edges selected by keep are never dropped"""
+        edges = [("a", "b"), ("b", "c"), ("a", "c")]
+        reduced = transitive_reduction(edges, edge=lambda e: e, keep=lambda e: e == ("a", "c"))
+        assert reduced == edges
+
+    def test_two_node_cycle_is_not_reduced(self):
+        """Without a third node there is no indirect path"""
+        edges = [("a", "b"), ("b", "a")]
+        assert transitive_reduction(edges, edge=lambda e: e) == edges
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_matches_path_search_on_random_graphs(self, seed):
+        """Same result as exhaustive path search, cycles included"""
+        rng = random.Random(seed)
+        nodes = list(range(8))
+        edges = list({
+            (rng.choice(nodes), rng.choice(nodes))
+            for _ in range(rng.randint(5, 20))
+        })
+        edges = [e for e in edges if e[0] != e[1]]
+        keep = lambda e: (e[0] + e[1]) % 5 == 0
+
+        assert transitive_reduction(edges, edge=lambda e: e, keep=keep) == path_search_reduction(edges, keep)
+
+
+class TestReachability:
+    """Test reachability rows and components"""
+
+    def test_reachability_through_cycle(self):
+        adjacency = {"a": ["b"], "b": ["c"], "c": ["b", "d"]}
+        reach = Reachability(["a", "b", "c", "d"], adjacency)
+
+        assert reach.reachable_from("a") == {"a", "b", "c", "d"}
+        assert reach.reachable_from("c") == {"b", "c", "d"}
+        assert reach.reaches("d", "d")
+        assert not reach.reaches("d", "a")
+
+    def test_components_in_reverse_topological_order(self):
+        adjacency = {"a": ["b"], "b": ["c"], "c": ["b", "d"]}
+        components = strongly_connected_components(["a"], adjacency)
+
+        assert [sorted(c) for c in components] == [["d"], ["b", "c"], ["a"]]
+
+    def test_long_chain_does_not_recurse(self):
+        """Iterative traversal handles chains beyond the recursion limit"""
+        size = 5000
+        adjacency = {i: [i + 1] for i in range(size)}
+        reach = Reachability(range(size + 1), adjacency)
+
+        assert reach.reaches(0, size)
+        assert find_cycle(range(size + 1), adjacency) is None
+
+
+class TestFindCycle:
+    """Test cycle detection"""
+
+    def test_returns_first_cycle_closed_on_start(self):
+        adjacency = {"a": ["b"], "b": ["c"], "c": ["a"]}
+        assert find_cycle(["a", "b", "c"], adjacency) == ["a", "b", "c", "a"]
+
+    def test_acyclic_graph(self):
+        adjacency = {"a": ["b", "c"], "b": ["c"]}
+        assert find_cycle(["a", "b", "c"], adjacency) is None
@@ -0,0 +1,218 @@
+"""
+Unit tests for the LLM response cache
+"""
+
+import threading
+from dataclasses import dataclass
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.ai.providers.anthropic_provider import AnthropicProvider
+from src.ai.providers.llm_abstraction import LLMAbstraction
+from src.core.models import Priority, Task, TaskStatus
+from src.utils.llm_cache import LLMResponseCache, make_cache_key, normalize_prompt
+
+
+@dataclass
+class Analysis:
+    summary: str
+    fallback_used: bool = False
+
+
+class TestCacheKey:
+    """Test content addressing of requests"""
+
+    def test_whitespace_differences_share_a_key(self):
+        assert normalize_prompt("  Analyze\n\n  this   task ") == "Analyze this task"
+        assert make_cache_key("m", "complete", "Analyze  this\ttask") == make_cache_key("m", "complete", "Analyze this task")
+
+    def test_model_and_method_are_part_of_the_key(self):
+        base = make_cache_key("model-a", "complete", "prompt")
+        assert make_cache_key("model-b", "complete", "prompt") != base
+        assert make_cache_key("model-a", "analyze_blocker", "prompt") != base
+
+    def test_argument_order_does_not_matter(self):
+        assert make_cache_key("m", "x", {"a": 1, "b": {2, 1}}) == make_cache_key("m", "x", {"b": {1, 2}, "a": 1})
+
+
+class TestLLMResponseCache:
+    """Test memory and disk tiers"""
+
+    def test_miss_then_hit(self):
+        cache = LLMResponseCache()
+        key = make_cache_key("m", "complete", "prompt")
+
+        assert cache.get(key, "complete") is None
+        cache.set(key, "complete", "response")
+
+        assert cache.get(key, "complete") == "response"
+        stats = cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["methods"]["complete"] == {"hits": 1, "misses": 1}
+
+    def test_lru_eviction(self):
+        cache = LLMResponseCache(max_entries=2)
+        cache.set("a", "m", 1)
+        cache.set("b", "m", 2)
+        cache.get("a", "m")
+        cache.set("c", "m", 3)
+
+        assert cache.get("b", "m") is None
+        assert cache.get("a", "m") == 1
+        assert cache.evictions == 1
+
+    def test_per_method_ttl(self):
+        cache = LLMResponseCache(default_ttl=60, ttls={"volatile": 1, "disabled": 0})
+
+        with patch("src.utils.llm_cache.time.time", return_value=1000.0):
+            cache.set("k1", "volatile", "v")
+            cache.set("k2", "stable", "v")
+            cache.set("k3", "disabled", "v")
+
+        with patch("src.utils.llm_cache.time.time", return_value=1030.0):
+            assert cache.get("k1", "volatile") is None
+            assert cache.get("k2", "stable") == "v"
+            assert cache.get("k3", "disabled") is None
+
+    def test_hits_are_copies(self):
+        cache = LLMResponseCache()
+        cache.set("k", "analyze", Analysis(summary="s"))
+
+        first = cache.get("k", "analyze")
+        first.fallback_used = True
+
+        assert cache.get("k", "analyze").fallback_used is False
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        db_path = str(tmp_path / "cache" / "llm.sqlite")
+        cache = LLMResponseCache(db_path=db_path)
+        cache.set("k", "analyze", Analysis(summary="persisted"))
+        cache.close()
+
+        restarted = LLMResponseCache(db_path=db_path)
+        assert restarted.get("k", "analyze") == Analysis(summary="persisted")
+        assert restarted.disk_hits == 1
+
+        # Promoted into memory
+        assert restarted.get("k", "analyze") == Analysis(summary="persisted")
+        assert restarted.memory_hits == 1
+        restarted.close()
+
+    @pytest.mark.asyncio
+    async def test_async_disk_access_runs_off_the_loop(self, tmp_path):
+        db_path = str(tmp_path / "llm.sqlite")
+        cache = LLMResponseCache(db_path=db_path)
+        loop_thread = threading.get_ident()
+        disk_threads = []
+        disk_set = cache._disk_set
+
+        def record_disk_set(*args):
+            disk_threads.append(threading.get_ident())
+            disk_set(*args)
+
+        with patch.object(cache, "_disk_set", side_effect=record_disk_set):
+            await cache.aset("k", "analyze", Analysis(summary="persisted"))
+        cache.close()
+
+        restarted = LLMResponseCache(db_path=db_path)
+        assert await restarted.aget("k", "analyze") == Analysis(summary="persisted")
+        assert restarted.disk_hits == 1
+        assert await restarted.aget("missing", "analyze") is None
+        assert restarted.misses == 1
+        assert disk_threads and loop_thread not in disk_threads
+        restarted.close()
+
+    def test_unusable_disk_path_falls_back_to_memory(self, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = LLMResponseCache(db_path=str(blocker / "llm.sqlite"))
+
+        cache.set("k", "m", "v")
+
+        assert cache.get("k", "m") == "v"
+        assert cache.get_stats()["disk_enabled"] is False
+
+    def test_from_config(self):
+        config = Mock()
+        values = {
+            "ai.cache.max_entries": 10,
+            "ai.cache.default_ttl": 120,
+            "ai.cache.ttl": {"analyze_blocker": 30},
+            "ai.cache.enabled": True,
+        }
+        config.get.side_effect = lambda key, default=None: values.get(key, default)
+
+        cache = LLMResponseCache.from_config(config)
+
+        assert cache.max_entries == 10
+        assert cache.db_path is None
+        assert cache.ttl_for("analyze_blocker") == 30
+        assert cache.ttl_for("other") == 120
+
+
+class TestLLMAbstractionCache:
+    """Test the cache under the provider fallback chain"""
+
+    @pytest.mark.asyncio
+    async def test_repeated_request_skips_providers(self):
+        llm = LLMAbstraction()
+        llm.response_cache = LLMResponseCache()
+        provider = Mock()
+        provider.model = "test-model"
+        provider.complete = AsyncMock(return_value="answer")
+        llm.providers = {"anthropic": provider}
+        llm.current_provider = "anthropic"
+        llm._providers_initialized = True
+
+        first = await llm._execute_with_fallback("complete", prompt="Describe the task", max_tokens=100)
+        second = await llm._execute_with_fallback("complete", prompt="Describe  the task\n", max_tokens=100)
+        other = await llm._execute_with_fallback("complete", prompt="Describe the task", max_tokens=200)
+
+        assert first == second == other == "answer"
+        assert provider.complete.await_count == 2
+        assert llm.get_provider_stats()["cache"]["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self):
+        llm = LLMAbstraction()
+        llm.response_cache = LLMResponseCache()
+        provider = Mock()
+        provider.complete = AsyncMock(side_effect=[Exception("down"), "answer"])
+        llm.providers = {"anthropic": provider}
+        llm.current_provider = "anthropic"
+        llm._providers_initialized = True
+
+        with pytest.raises(Exception, match="All LLM providers failed"):
+            await llm._execute_with_fallback("complete", prompt="p")
+
+        assert await llm._execute_with_fallback("complete", prompt="p") == "answer"
+
+    @pytest.mark.asyncio
+    async def test_outage_placeholder_is_not_cached(self):
+        llm = LLMAbstraction()
+        llm.response_cache = LLMResponseCache()
+        provider = AnthropicProvider.__new__(AnthropicProvider)
+        provider.model = "test-model"
+        provider._call_claude = AsyncMock(side_effect=[
+            Exception("outage"),
+            '{"task_intent": "build the API", "confidence": 0.9}',
+        ])
+        llm.providers = {"anthropic": provider}
+        llm.current_provider = "anthropic"
+        llm._providers_initialized = True
+        task = Task(
+            id="task-1", name="Build API", description="", status=TaskStatus.TODO,
+            priority=Priority.HIGH, assigned_to=None, created_at=None, updated_at=None,
+            due_date=None, estimated_hours=4.0
+        )
+
+        during = await llm.analyze_task_semantics(task, {})
+        after = await llm.analyze_task_semantics(task, {})
+        cached = await llm.analyze_task_semantics(task, {})
+
+        assert during.risk_factors == ["ai_analysis_failed"]
+        assert after.task_intent == cached.task_intent == "build the API"
+        assert provider._call_claude.await_count == 2
+        assert llm.get_provider_stats()["cache"]["hits"] == 1
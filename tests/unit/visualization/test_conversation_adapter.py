@@ -7,10 +7,9 @@ Marcus events to visualization-compatible conversation logs.
 """
 
 import json
-import pytest
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open, MagicMock, call, ANY
+from unittest.mock import Mock, patch, MagicMock, call, ANY
 from typing import Dict, Any, List
 
 from src.visualization.conversation_adapter import (
@@ -68,39 +67,38 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                mock_file = mock_open()
                 
-                with patch('builtins.open', mock_file):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        adapter.log_conversation_event(
-                            source="worker1",
-                            target="marcus",
-                            message="Test message",
-                            event_type="test_event",
-                            metadata={"key": "value"}
-                        )
-                        
-                        # Verify file was opened in append mode
-                        mock_file.assert_called_once_with(adapter.conversation_file, 'a')
-                        
-                        # Check the captured JSON data
-                        assert len(captured) == 1
-                        json_data = captured[0]
-                        
-                        assert json_data["timestamp"] == "2024-01-01T12:00:00"
-                        assert json_data["event"] == "test_event"
-                        assert json_data["source"] == "worker1"
-                        assert json_data["target"] == "marcus"
-                        assert json_data["message"] == "Test message"
-                        assert json_data["metadata"] == {"key": "value"}
-                        assert json_data["conversation_type"] == "worker_to_pm"
-                        
-                        # Check newline was written
-                        handle = mock_file()
-                        handle.write.assert_called_with('\n')
-                        
-                        # Check flush was called
-                        handle.flush.assert_called_once()
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    adapter.log_conversation_event(
+                        source="worker1",
+                        target="marcus",
+                        message="Test message",
+                        event_type="test_event",
+                        metadata={"key": "value"}
+                    )
+                    
+                    # Check the queued JSON data
+                    assert len(captured) == 1
+                    json_data = captured[0]
+                    
+                    assert json_data["timestamp"] == "2024-01-01T12:00:00"
+                    assert json_data["event"] == "test_event"
+                    assert json_data["source"] == "worker1"
+                    assert json_data["target"] == "marcus"
+                    assert json_data["message"] == "Test message"
+                    assert json_data["metadata"] == {"key": "value"}
+                    assert json_data["conversation_type"] == "worker_to_pm"
+
+    def test_log_stream_writes_to_conversation_file(self, tmp_path):
+        """Test that queued events end up as JSON lines in the conversation file"""
+        adapter = ConversationAdapter(str(tmp_path))
+        
+        adapter.log_conversation_event("worker1", "marcus", "First")
+        adapter.log_conversation_event("marcus", "worker1", "Second")
+        assert adapter.log_stream.flush()
+        
+        lines = adapter.conversation_file.read_text().splitlines()
+        assert [json.loads(line)["message"] for line in lines] == ["First", "Second"]
 
     def test_log_conversation_event_with_empty_metadata(self):
         """Test log_conversation_event with no metadata provided"""
@@ -109,17 +107,16 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        adapter.log_conversation_event(
-                            source="marcus",
-                            target="worker1",
-                            message="Test message"
-                        )
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    adapter.log_conversation_event(
+                        source="marcus",
+                        target="worker1",
+                        message="Test message"
+                    )
                         
-                        json_data = captured[0]
-                        assert json_data["metadata"] == {}
-                        assert json_data["event"] == "message"  # Default event type
+                    json_data = captured[0]
+                    assert json_data["metadata"] == {}
+                    assert json_data["event"] == "message"  # Default event type
 
     def test_determine_conversation_type_worker_to_pm(self):
         """Test conversation type detection for worker to PM"""
@@ -167,36 +164,35 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "worker_id": "worker1",
-                            "name": "Test Worker",
-                            "skills": ["python", "testing"],
-                            "role": "developer"
-                        }
-                        
-                        adapter.convert_worker_registration(event_data)
-                        
-                        # Should capture two events
-                        assert len(captured) == 2
-                        
-                        # First event - worker registration
-                        json_data1 = captured[0]
-                        assert json_data1["source"] == "worker1"
-                        assert json_data1["target"] == "marcus"
-                        assert json_data1["message"] == "Worker Test Worker registering with skills: python, testing"
-                        assert json_data1["event"] == "worker_registration"
-                        assert json_data1["metadata"]["capabilities"] == ["python", "testing"]
-                        assert json_data1["metadata"]["role"] == "developer"
-                        
-                        # Second event - acknowledgment
-                        json_data2 = captured[1]
-                        assert json_data2["source"] == "marcus"
-                        assert json_data2["target"] == "worker1"
-                        assert json_data2["message"] == "Registration confirmed for Test Worker"
-                        assert json_data2["event"] == "registration_ack"
-                        assert json_data2["metadata"]["status"] == "registered"
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "worker_id": "worker1",
+                        "name": "Test Worker",
+                        "skills": ["python", "testing"],
+                        "role": "developer"
+                    }
+                        
+                    adapter.convert_worker_registration(event_data)
+                        
+                    # Should capture two events
+                    assert len(captured) == 2
+                        
+                    # First event - worker registration
+                    json_data1 = captured[0]
+                    assert json_data1["source"] == "worker1"
+                    assert json_data1["target"] == "marcus"
+                    assert json_data1["message"] == "Worker Test Worker registering with skills: python, testing"
+                    assert json_data1["event"] == "worker_registration"
+                    assert json_data1["metadata"]["capabilities"] == ["python", "testing"]
+                    assert json_data1["metadata"]["role"] == "developer"
+                        
+                    # Second event - acknowledgment
+                    json_data2 = captured[1]
+                    assert json_data2["source"] == "marcus"
+                    assert json_data2["target"] == "worker1"
+                    assert json_data2["message"] == "Registration confirmed for Test Worker"
+                    assert json_data2["event"] == "registration_ack"
+                    assert json_data2["metadata"]["status"] == "registered"
 
     def test_convert_worker_registration_minimal(self):
         """Test worker registration conversion with minimal fields"""
@@ -205,18 +201,17 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {}
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {}
                         
-                        adapter.convert_worker_registration(event_data)
+                    adapter.convert_worker_registration(event_data)
                         
-                        # First event with defaults
-                        json_data1 = captured[0]
-                        assert json_data1["source"] == "unknown_worker"
-                        assert json_data1["message"] == "Worker unknown_worker registering with skills: "
-                        assert json_data1["metadata"]["capabilities"] == []
-                        assert json_data1["metadata"]["role"] == "worker"
+                    # First event with defaults
+                    json_data1 = captured[0]
+                    assert json_data1["source"] == "unknown_worker"
+                    assert json_data1["message"] == "Worker unknown_worker registering with skills: "
+                    assert json_data1["metadata"]["capabilities"] == []
+                    assert json_data1["metadata"]["role"] == "worker"
 
     def test_convert_task_request(self):
         """Test task request conversion"""
@@ -225,17 +220,16 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {"worker_id": "worker1"}
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {"worker_id": "worker1"}
                         
-                        adapter.convert_task_request(event_data)
+                    adapter.convert_task_request(event_data)
                         
-                        json_data = captured[0]
-                        assert json_data["source"] == "worker1"
-                        assert json_data["target"] == "marcus"
-                        assert json_data["message"] == "Requesting next available task"
-                        assert json_data["event"] == "task_request"
+                    json_data = captured[0]
+                    assert json_data["source"] == "worker1"
+                    assert json_data["target"] == "marcus"
+                    assert json_data["message"] == "Requesting next available task"
+                    assert json_data["event"] == "task_request"
 
     def test_convert_task_request_no_worker_id(self):
         """Test task request conversion without worker ID"""
@@ -244,14 +238,13 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {}
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {}
                         
-                        adapter.convert_task_request(event_data)
+                    adapter.convert_task_request(event_data)
                         
-                        json_data = captured[0]
-                        assert json_data["source"] == "unknown_worker"
+                    json_data = captured[0]
+                    assert json_data["source"] == "unknown_worker"
 
     def test_convert_task_assignment_complete(self):
         """Test task assignment conversion with all fields"""
@@ -260,40 +253,39 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        task_data = {
-                            "name": "Implement feature X",
-                            "id": "task123",
-                            "priority": "high",
-                            "estimated_hours": 8
-                        }
-                        
-                        adapter.convert_task_assignment("worker1", task_data)
-                        
-                        # Should capture two events
-                        assert len(captured) == 2
-                        
-                        # First event - task assignment
-                        json_data1 = captured[0]
-                        assert json_data1["source"] == "marcus"
-                        assert json_data1["target"] == "worker1"
-                        assert json_data1["message"] == "Assigned task: Implement feature X"
-                        assert json_data1["event"] == "task_assignment"
-                        assert json_data1["metadata"]["task_id"] == "task123"
-                        assert json_data1["metadata"]["priority"] == "high"
-                        assert json_data1["metadata"]["estimated_hours"] == 8
-                        
-                        # Second event - kanban update
-                        json_data2 = captured[1]
-                        assert json_data2["source"] == "marcus"
-                        assert json_data2["target"] == "kanban_board"
-                        assert json_data2["message"] == "Moving task Implement feature X to In Progress"
-                        assert json_data2["event"] == "kanban_interaction"
-                        assert json_data2["metadata"]["task_id"] == "task123"
-                        assert json_data2["metadata"]["from_status"] == "todo"
-                        assert json_data2["metadata"]["to_status"] == "in_progress"
-                        assert json_data2["metadata"]["assigned_to"] == "worker1"
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    task_data = {
+                        "name": "Implement feature X",
+                        "id": "task123",
+                        "priority": "high",
+                        "estimated_hours": 8
+                    }
+                        
+                    adapter.convert_task_assignment("worker1", task_data)
+                        
+                    # Should capture two events
+                    assert len(captured) == 2
+                        
+                    # First event - task assignment
+                    json_data1 = captured[0]
+                    assert json_data1["source"] == "marcus"
+                    assert json_data1["target"] == "worker1"
+                    assert json_data1["message"] == "Assigned task: Implement feature X"
+                    assert json_data1["event"] == "task_assignment"
+                    assert json_data1["metadata"]["task_id"] == "task123"
+                    assert json_data1["metadata"]["priority"] == "high"
+                    assert json_data1["metadata"]["estimated_hours"] == 8
+                        
+                    # Second event - kanban update
+                    json_data2 = captured[1]
+                    assert json_data2["source"] == "marcus"
+                    assert json_data2["target"] == "kanban_board"
+                    assert json_data2["message"] == "Moving task Implement feature X to In Progress"
+                    assert json_data2["event"] == "kanban_interaction"
+                    assert json_data2["metadata"]["task_id"] == "task123"
+                    assert json_data2["metadata"]["from_status"] == "todo"
+                    assert json_data2["metadata"]["to_status"] == "in_progress"
+                    assert json_data2["metadata"]["assigned_to"] == "worker1"
 
     def test_convert_task_assignment_minimal(self):
         """Test task assignment conversion with minimal fields"""
@@ -302,17 +294,16 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        task_data = {}
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    task_data = {}
                         
-                        adapter.convert_task_assignment("worker1", task_data)
+                    adapter.convert_task_assignment("worker1", task_data)
                         
-                        json_data1 = captured[0]
-                        assert json_data1["message"] == "Assigned task: Unknown Task"
-                        assert json_data1["metadata"]["task_id"] == "unknown"
-                        assert json_data1["metadata"]["priority"] == "medium"
-                        assert json_data1["metadata"]["estimated_hours"] == 0
+                    json_data1 = captured[0]
+                    assert json_data1["message"] == "Assigned task: Unknown Task"
+                    assert json_data1["metadata"]["task_id"] == "unknown"
+                    assert json_data1["metadata"]["priority"] == "medium"
+                    assert json_data1["metadata"]["estimated_hours"] == 0
 
     def test_convert_progress_update_in_progress(self):
         """Test progress update conversion for in-progress task"""
@@ -321,29 +312,28 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "agent_id": "worker1",
-                            "task_id": "task123",
-                            "status": "in_progress",
-                            "progress": 50,
-                            "message": "Halfway done"
-                        }
-                        
-                        adapter.convert_progress_update(event_data)
-                        
-                        # Should only capture one event (no kanban update for in_progress)
-                        assert len(captured) == 1
-                        
-                        json_data = captured[0]
-                        assert json_data["source"] == "worker1"
-                        assert json_data["target"] == "marcus"
-                        assert json_data["message"] == "Task progress: 50% - Halfway done"
-                        assert json_data["event"] == "progress_update"
-                        assert json_data["metadata"]["task_id"] == "task123"
-                        assert json_data["metadata"]["status"] == "in_progress"
-                        assert json_data["metadata"]["progress"] == 50
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "agent_id": "worker1",
+                        "task_id": "task123",
+                        "status": "in_progress",
+                        "progress": 50,
+                        "message": "Halfway done"
+                    }
+                        
+                    adapter.convert_progress_update(event_data)
+                        
+                    # Should only capture one event (no kanban update for in_progress)
+                    assert len(captured) == 1
+                        
+                    json_data = captured[0]
+                    assert json_data["source"] == "worker1"
+                    assert json_data["target"] == "marcus"
+                    assert json_data["message"] == "Task progress: 50% - Halfway done"
+                    assert json_data["event"] == "progress_update"
+                    assert json_data["metadata"]["task_id"] == "task123"
+                    assert json_data["metadata"]["status"] == "in_progress"
+                    assert json_data["metadata"]["progress"] == 50
 
     def test_convert_progress_update_completed(self):
         """Test progress update conversion for completed task"""
@@ -352,29 +342,28 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "agent_id": "worker1",
-                            "task_id": "task123",
-                            "status": "completed",
-                            "progress": 100,
-                            "message": "Task completed"
-                        }
-                        
-                        adapter.convert_progress_update(event_data)
-                        
-                        # Should capture two events
-                        assert len(captured) == 2
-                        
-                        # Second event - kanban update
-                        json_data2 = captured[1]
-                        assert json_data2["source"] == "marcus"
-                        assert json_data2["target"] == "kanban_board"
-                        assert json_data2["message"] == "Moving task task123 to Done"
-                        assert json_data2["event"] == "kanban_interaction"
-                        assert json_data2["metadata"]["from_status"] == "in_progress"
-                        assert json_data2["metadata"]["to_status"] == "done"
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "agent_id": "worker1",
+                        "task_id": "task123",
+                        "status": "completed",
+                        "progress": 100,
+                        "message": "Task completed"
+                    }
+                        
+                    adapter.convert_progress_update(event_data)
+                        
+                    # Should capture two events
+                    assert len(captured) == 2
+                        
+                    # Second event - kanban update
+                    json_data2 = captured[1]
+                    assert json_data2["source"] == "marcus"
+                    assert json_data2["target"] == "kanban_board"
+                    assert json_data2["message"] == "Moving task task123 to Done"
+                    assert json_data2["event"] == "kanban_interaction"
+                    assert json_data2["metadata"]["from_status"] == "in_progress"
+                    assert json_data2["metadata"]["to_status"] == "done"
 
     def test_convert_progress_update_minimal(self):
         """Test progress update conversion with minimal fields"""
@@ -383,18 +372,17 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {}
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {}
                         
-                        adapter.convert_progress_update(event_data)
+                    adapter.convert_progress_update(event_data)
                         
-                        json_data = captured[0]
-                        assert json_data["source"] == "unknown_worker"
-                        assert json_data["message"] == "Task progress: 0% - Progress update"
-                        assert json_data["metadata"]["task_id"] == "unknown"
-                        assert json_data["metadata"]["status"] == "unknown"
-                        assert json_data["metadata"]["progress"] == 0
+                    json_data = captured[0]
+                    assert json_data["source"] == "unknown_worker"
+                    assert json_data["message"] == "Task progress: 0% - Progress update"
+                    assert json_data["metadata"]["task_id"] == "unknown"
+                    assert json_data["metadata"]["status"] == "unknown"
+                    assert json_data["metadata"]["progress"] == 0
 
     def test_convert_ping_complete(self):
         """Test ping conversion with all fields"""
@@ -403,34 +391,33 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "echo": "test-echo",
-                            "source": "monitoring"
-                        }
-                        
-                        adapter.convert_ping(event_data)
-                        
-                        # Should capture two events
-                        assert len(captured) == 2
-                        
-                        # First event - ping
-                        json_data1 = captured[0]
-                        assert json_data1["source"] == "monitoring"
-                        assert json_data1["target"] == "marcus"
-                        assert json_data1["message"] == "Ping: test-echo"
-                        assert json_data1["event"] == "ping"
-                        assert json_data1["metadata"]["echo"] == "test-echo"
-                        
-                        # Second event - pong
-                        json_data2 = captured[1]
-                        assert json_data2["source"] == "marcus"
-                        assert json_data2["target"] == "monitoring"
-                        assert json_data2["message"] == "Pong: test-echo"
-                        assert json_data2["event"] == "ping_response"
-                        assert json_data2["metadata"]["echo"] == "test-echo"
-                        assert json_data2["metadata"]["status"] == "online"
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "echo": "test-echo",
+                        "source": "monitoring"
+                    }
+                        
+                    adapter.convert_ping(event_data)
+                        
+                    # Should capture two events
+                    assert len(captured) == 2
+                        
+                    # First event - ping
+                    json_data1 = captured[0]
+                    assert json_data1["source"] == "monitoring"
+                    assert json_data1["target"] == "marcus"
+                    assert json_data1["message"] == "Ping: test-echo"
+                    assert json_data1["event"] == "ping"
+                    assert json_data1["metadata"]["echo"] == "test-echo"
+                        
+                    # Second event - pong
+                    json_data2 = captured[1]
+                    assert json_data2["source"] == "marcus"
+                    assert json_data2["target"] == "monitoring"
+                    assert json_data2["message"] == "Pong: test-echo"
+                    assert json_data2["event"] == "ping_response"
+                    assert json_data2["metadata"]["echo"] == "test-echo"
+                    assert json_data2["metadata"]["status"] == "online"
 
     def test_convert_ping_minimal(self):
         """Test ping conversion with minimal fields"""
@@ -439,16 +426,15 @@ class TestConversationAdapter:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {}
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {}
                         
-                        adapter.convert_ping(event_data)
+                    adapter.convert_ping(event_data)
                         
-                        json_data1 = captured[0]
-                        assert json_data1["source"] == "system"
-                        assert json_data1["message"] == "Ping: ping"
-                        assert json_data1["metadata"]["echo"] == "ping"
+                    json_data1 = captured[0]
+                    assert json_data1["source"] == "system"
+                    assert json_data1["message"] == "Ping: ping"
+                    assert json_data1["metadata"]["echo"] == "ping"
 
 
 class TestLogAgentEvent:
@@ -550,35 +536,38 @@ class TestGlobalConversationAdapter:
 class TestEdgeCasesAndErrorHandling:
     """Test suite for edge cases and error scenarios"""
 
-    def test_log_conversation_event_handles_file_write_error(self):
-        """Test that file write errors propagate correctly"""
+    def test_log_conversation_event_does_not_raise_on_file_write_error(self):
+        """Test that file write errors happen in the background, not in the caller"""
         with patch('src.visualization.conversation_adapter.Path'):
             with patch('src.visualization.conversation_adapter.datetime'):
                 adapter = ConversationAdapter()
+                errors_before = adapter.log_stream.sink.write_errors
                 
                 with patch('builtins.open', side_effect=IOError("Disk full")):
-                    with pytest.raises(IOError, match="Disk full"):
-                        adapter.log_conversation_event("source", "target", "message")
-
-    def test_log_conversation_event_handles_json_serialization_error(self):
-        """Test handling of non-serializable metadata"""
-        with patch('src.visualization.conversation_adapter.Path'):
-            with patch('src.visualization.conversation_adapter.datetime'):
-                adapter = ConversationAdapter()
+                    adapter.log_conversation_event("source", "target", "message")
+                    assert adapter.log_stream.flush()
                 
-                # Create a non-serializable object
-                class NonSerializable:
-                    pass
-                
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=TypeError("Object not serializable")):
-                        with pytest.raises(TypeError, match="Object not serializable"):
-                            adapter.log_conversation_event(
-                                source="worker1",
-                                target="marcus",
-                                message="Test",
-                                metadata={"bad": NonSerializable()}
-                            )
+                assert adapter.log_stream.sink.write_errors == errors_before + 1
+
+    def test_log_conversation_event_with_non_serializable_metadata(self, tmp_path):
+        """Test that non-serializable metadata is written as text"""
+        adapter = ConversationAdapter(str(tmp_path))
+        
+        # Create a non-serializable object
+        class NonSerializable:
+            def __str__(self):
+                return "non-serializable"
+        
+        adapter.log_conversation_event(
+            source="worker1",
+            target="marcus",
+            message="Test",
+            metadata={"bad": NonSerializable()}
+        )
+        assert adapter.log_stream.flush()
+        
+        event = json.loads(adapter.conversation_file.read_text())
+        assert event["metadata"] == {"bad": "non-serializable"}
 
     def test_convert_worker_registration_empty_skills_list(self):
         """Test worker registration with empty skills list"""
@@ -587,18 +576,17 @@ class TestEdgeCasesAndErrorHandling:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "worker_id": "worker1",
-                            "name": "Test Worker",
-                            "skills": []
-                        }
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "worker_id": "worker1",
+                        "name": "Test Worker",
+                        "skills": []
+                    }
                         
-                        adapter.convert_worker_registration(event_data)
+                    adapter.convert_worker_registration(event_data)
                         
-                        json_data = captured[0]
-                        assert json_data["message"] == "Worker Test Worker registering with skills: "
+                    json_data = captured[0]
+                    assert json_data["message"] == "Worker Test Worker registering with skills: "
 
     def test_convert_progress_update_zero_progress(self):
         """Test progress update with zero progress"""
@@ -607,21 +595,20 @@ class TestEdgeCasesAndErrorHandling:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "agent_id": "worker1",
-                            "task_id": "task123",
-                            "status": "in_progress",
-                            "progress": 0,
-                            "message": "Just started"
-                        }
-                        
-                        adapter.convert_progress_update(event_data)
-                        
-                        json_data = captured[0]
-                        assert json_data["message"] == "Task progress: 0% - Just started"
-                        assert json_data["metadata"]["progress"] == 0
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "agent_id": "worker1",
+                        "task_id": "task123",
+                        "status": "in_progress",
+                        "progress": 0,
+                        "message": "Just started"
+                    }
+                        
+                    adapter.convert_progress_update(event_data)
+                        
+                    json_data = captured[0]
+                    assert json_data["message"] == "Task progress: 0% - Just started"
+                    assert json_data["metadata"]["progress"] == 0
 
     def test_determine_conversation_type_case_sensitivity(self):
         """Test that conversation type detection is case sensitive"""
@@ -641,28 +628,23 @@ class TestEdgeCasesAndErrorHandling:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()) as mock_file:
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        # Log multiple events
-                        for i in range(3):
-                            adapter.log_conversation_event(
-                                source=f"worker{i}",
-                                target="marcus",
-                                message=f"Message {i}"
-                            )
-                        
-                        # Should open file 3 times (once per event)
-                        assert mock_file.call_count == 3
-                        
-                        # Each call should be in append mode
-                        for call in mock_file.call_args_list:
-                            assert call[0] == (adapter.conversation_file, 'a')
-                        
-                        # Should have captured 3 JSON objects
-                        assert len(captured) == 3
-                        for i, json_data in enumerate(captured):
-                            assert json_data["source"] == f"worker{i}"
-                            assert json_data["message"] == f"Message {i}"
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append) as write:
+                    # Log multiple events
+                    for i in range(3):
+                        adapter.log_conversation_event(
+                            source=f"worker{i}",
+                            target="marcus",
+                            message=f"Message {i}"
+                        )
+                    
+                    # Each event is one queued record
+                    assert write.call_count == 3
+                    
+                    # Should have captured 3 JSON objects
+                    assert len(captured) == 3
+                    for i, json_data in enumerate(captured):
+                        assert json_data["source"] == f"worker{i}"
+                        assert json_data["message"] == f"Message {i}"
 
     def test_convert_worker_registration_with_special_characters(self):
         """Test worker registration with special characters in data"""
@@ -671,21 +653,20 @@ class TestEdgeCasesAndErrorHandling:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        event_data = {
-                            "worker_id": "worker-1",
-                            "name": "Test \"Worker\" <1>",
-                            "skills": ["python/django", "node.js", "C++"],
-                            "role": "full-stack developer"
-                        }
-                        
-                        adapter.convert_worker_registration(event_data)
-                        
-                        json_data = captured[0]
-                        assert json_data["source"] == "worker-1"
-                        assert "Test \"Worker\" <1>" in json_data["message"]
-                        assert json_data["metadata"]["capabilities"] == ["python/django", "node.js", "C++"]
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    event_data = {
+                        "worker_id": "worker-1",
+                        "name": "Test \"Worker\" <1>",
+                        "skills": ["python/django", "node.js", "C++"],
+                        "role": "full-stack developer"
+                    }
+                        
+                    adapter.convert_worker_registration(event_data)
+                        
+                    json_data = captured[0]
+                    assert json_data["source"] == "worker-1"
+                    assert "Test \"Worker\" <1>" in json_data["message"]
+                    assert json_data["metadata"]["capabilities"] == ["python/django", "node.js", "C++"]
 
     def test_convert_task_assignment_with_long_task_name(self):
         """Test task assignment with very long task name"""
@@ -694,18 +675,17 @@ class TestEdgeCasesAndErrorHandling:
                 adapter = ConversationAdapter()
                 
                 captured = []
-                with patch('builtins.open', mock_open()):
-                    with patch('json.dump', side_effect=lambda d, f: captured.append(d)):
-                        long_name = "Implement " + "very " * 50 + "long feature"
-                        task_data = {
-                            "name": long_name,
-                            "id": "task123"
-                        }
-                        
-                        adapter.convert_task_assignment("worker1", task_data)
-                        
-                        json_data = captured[0]
-                        assert json_data["message"] == f"Assigned task: {long_name}"
+                with patch.object(adapter.log_stream, 'write', side_effect=captured.append):
+                    long_name = "Implement " + "very " * 50 + "long feature"
+                    task_data = {
+                        "name": long_name,
+                        "id": "task123"
+                    }
+                        
+                    adapter.convert_task_assignment("worker1", task_data)
+                        
+                    json_data = captured[0]
+                    assert json_data["message"] == f"Assigned task: {long_name}"
 
     def test_conversation_file_path_handling(self):
         """Test that conversation file path is properly constructed"""